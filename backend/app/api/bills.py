@@ -11,7 +11,7 @@ import logging
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from supabase import Client
 
-from app.core.database import get_supabase
+from app.core.database import get_supabase, run_query
 from app.schemas.bill import BillCreate, BillMentionCreate
 
 logger = logging.getLogger(__name__)
@@ -51,7 +51,7 @@ async def get_bills(
         count_query = count_query.eq("status", bill_status)
     if q:
         count_query = count_query.ilike("title", f"%{q}%")
-    count_result = count_query.execute()
+    count_result = await run_query(count_query)
     total = count_result.count or 0
 
     # 데이터 쿼리
@@ -64,7 +64,7 @@ async def get_bills(
         data_query = data_query.ilike("title", f"%{q}%")
     data_query = data_query.order("proposed_date", desc=True)
     data_query = data_query.range(offset, offset + limit - 1)
-    result = data_query.execute()
+    result = await run_query(data_query)
 
     return {
         "items": result.data,
@@ -95,12 +95,11 @@ async def get_bill(
     4. mentions에 meeting_title, meeting_date 추가
     """
     # 1. 의안 조회
-    bill_result = (
+    bill_result = await run_query(
         supabase.table("bills")
         .select("*")
         .eq("id", bill_id)
         .limit(1)
-        .execute()
     )
     if not bill_result.data:
         raise HTTPException(
@@ -110,12 +109,11 @@ async def get_bill(
     bill = bill_result.data[0]
 
     # 2. mentions 조회
-    mentions_result = (
+    mentions_result = await run_query(
         supabase.table("bill_mentions")
         .select("*")
         .eq("bill_id", bill_id)
         .order("created_at", desc=True)
-        .execute()
     )
     mentions = mentions_result.data
 
@@ -124,12 +122,11 @@ async def get_bill(
         meeting_ids = list({m["meeting_id"] for m in mentions})
         meetings_map: dict[str, dict] = {}
         for mid in meeting_ids:
-            meeting_result = (
+            meeting_result = await run_query(
                 supabase.table("meetings")
                 .select("id,title,meeting_date")
                 .eq("id", mid)
                 .limit(1)
-                .execute()
             )
             if meeting_result.data:
                 meetings_map[mid] = meeting_result.data[0]
@@ -164,12 +161,11 @@ async def create_bill(
     - 생성된 의안 정보 반환
     """
     # bill_number 중복 체크
-    existing = (
+    existing = await run_query(
         supabase.table("bills")
         .select("id")
         .eq("bill_number", data.bill_number)
         .limit(1)
-        .execute()
     )
     if existing.data:
         raise HTTPException(
@@ -191,7 +187,7 @@ async def create_bill(
         insert_data["proposed_date"] = data.proposed_date.isoformat()
 
     # 생성
-    result = supabase.table("bills").insert(insert_data).execute()
+    result = await run_query(supabase.table("bills").insert(insert_data))
 
     logger.info("의안 등록 완료: bill_number=%s, title=%s", data.bill_number, data.title)
     return result.data[0]
@@ -219,12 +215,11 @@ async def create_bill_mention(
     - 연결 정보 생성
     """
     # bill_id 존재 확인
-    bill_result = (
+    bill_result = await run_query(
         supabase.table("bills")
         .select("id")
         .eq("id", bill_id)
         .limit(1)
-        .execute()
     )
     if not bill_result.data:
         raise HTTPException(
@@ -233,12 +228,11 @@ async def create_bill_mention(
         )
 
     # meeting_id 존재 확인
-    meeting_result = (
+    meeting_result = await run_query(
         supabase.table("meetings")
         .select("id")
         .eq("id", str(data.meeting_id))
         .limit(1)
-        .execute()
     )
     if not meeting_result.data:
         raise HTTPException(
@@ -261,7 +255,7 @@ async def create_bill_mention(
         insert_data["note"] = data.note
 
     # 생성
-    result = supabase.table("bill_mentions").insert(insert_data).execute()
+    result = await run_query(supabase.table("bill_mentions").insert(insert_data))
 
     logger.info(
         "의안-회의 연결 등록: bill_id=%s, meeting_id=%s",
@@ -290,12 +284,11 @@ async def get_bill_mentions(
     - bill_mentions 조회 + meeting 정보 포함
     """
     # bill_id 존재 확인
-    bill_result = (
+    bill_result = await run_query(
         supabase.table("bills")
         .select("id")
         .eq("id", bill_id)
         .limit(1)
-        .execute()
     )
     if not bill_result.data:
         raise HTTPException(
@@ -304,12 +297,11 @@ async def get_bill_mentions(
         )
 
     # mentions 조회
-    mentions_result = (
+    mentions_result = await run_query(
         supabase.table("bill_mentions")
         .select("*")
         .eq("bill_id", bill_id)
         .order("created_at", desc=True)
-        .execute()
     )
     mentions = mentions_result.data
 
@@ -318,12 +310,11 @@ async def get_bill_mentions(
         meeting_ids = list({m["meeting_id"] for m in mentions})
         meetings_map: dict[str, dict] = {}
         for mid in meeting_ids:
-            meeting_result = (
+            meeting_result = await run_query(
                 supabase.table("meetings")
                 .select("id,title,meeting_date")
                 .eq("id", mid)
                 .limit(1)
-                .execute()
             )
             if meeting_result.data:
                 meetings_map[mid] = meeting_result.data[0]
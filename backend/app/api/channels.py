@@ -92,6 +92,12 @@ async def start_channel_stt(channel_id: str) -> dict:
     if channel is None:
         raise HTTPException(status_code=404, detail=f"Channel {channel_id} not found")
 
+    # 멀티 워커에서는 선출된 STT 생산자 프로세스만 실행 (중복 자막 방지)
+    if not get_auto_stt_manager().is_producer:
+        raise HTTPException(
+            status_code=409, detail="STT는 다른 워커 프로세스에서 실행됩니다."
+        )
+
     service = get_channel_stt_service()
 
     if service.is_running(channel_id):
@@ -9,7 +9,7 @@ from fastapi.responses import Response
 from supabase import Client
 
 from app.api.meetings import get_meeting_by_id_service
-from app.core.database import get_supabase
+from app.core.database import get_supabase, run_query
 from app.services.transcript_export import export_json, export_markdown, export_official, export_srt
 
 router = APIRouter(prefix="/api/meetings", tags=["exports"])
@@ -22,20 +22,19 @@ class ExportFormat(str, Enum):
     OFFICIAL = "official"
 
 
-def _fetch_all_subtitles(supabase: Client, meeting_id: str) -> list[dict]:
+async def _fetch_all_subtitles(supabase: Client, meeting_id: str) -> list[dict]:
     """회의의 전체 자막을 시간순으로 조회합니다."""
     all_subtitles = []
     offset = 0
     page_size = 1000
 
     while True:
-        result = (
+        result = await run_query(
             supabase.table("subtitles")
             .select("*")
             .eq("meeting_id", meeting_id)
             .order("start_time")
             .range(offset, offset + page_size - 1)
-            .execute()
         )
         if not result.data:
             break
@@ -59,20 +58,19 @@ async def export_meeting_transcript(
     ),
     supabase: Client = Depends(get_supabase),
 ):
-    meeting = get_meeting_by_id_service(supabase, meeting_id)
+    meeting = await get_meeting_by_id_service(supabase, meeting_id)
     if meeting is None:
         raise HTTPException(status_code=404, detail="회의를 찾을 수 없습니다.")
 
-    subtitles = _fetch_all_subtitles(supabase, meeting_id)
+    subtitles = await _fetch_all_subtitles(supabase, meeting_id)
 
     # AI 요약 조회 (있으면 포함)
     summary = None
     try:
-        result = (
+        result = await run_query(
             supabase.table("meeting_summaries")
             .select("*")
             .eq("meeting_id", meeting_id)
-            .execute()
         )
         if result.data:
             summary = result.data[0]
@@ -3,7 +3,6 @@
 meetings 테이블이 없으면 channels 정적 데이터로 폴백합니다.
 """
 
-import asyncio
 from datetime import date
 from typing import Optional
 
@@ -11,7 +10,8 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from supabase import Client
 
 from app.core.channels import get_all_channels, get_channel
-from app.core.database import get_supabase
+from app.core.config import settings
+from app.core.database import get_supabase, run_query
 from app.schemas.meeting import (
     AgendaCreate,
     AgendaUpdate,
@@ -33,8 +33,9 @@ from app.services.summary_service import (
     generate_meeting_summary,
     get_summary,
 )
+from app.services.vod_reconcile import find_live_meeting
+from app.services.vod_stt_queue import VodSttJobConflictError, get_vod_stt_queue
 from app.services.vod_stt_service import (
-    VodSttService,
     get_task_by_meeting,
     is_processing,
 )
@@ -63,7 +64,7 @@ def _channel_to_meeting(ch: dict, meeting_status: str = "live") -> dict:
 # =============================================================================
 
 
-def get_meetings_service(
+async def get_meetings_service(
     supabase: Client,
     statuses: Optional[list[MeetingStatus]] = None,
     limit: int = 10,
@@ -77,7 +78,7 @@ def get_meetings_service(
             query = query.in_("status", status_values)
         query = query.order("meeting_date", desc=True)
         query = query.range(offset, offset + limit - 1)
-        result = query.execute()
+        result = await run_query(query)
         return result.data
     except Exception:
         # meetings 테이블이 없으면 채널 데이터로 폴백
@@ -89,7 +90,7 @@ def get_meetings_service(
         return meetings[offset:offset + limit]
 
 
-def get_live_meeting_service(
+async def get_live_meeting_service(
     supabase: Client,
     channel: Optional[str] = None,
 ) -> Optional[dict]:
@@ -101,19 +102,18 @@ def get_live_meeting_service(
         return None
 
     try:
-        result = (
+        result = await run_query(
             supabase.table("meetings")
             .select("*")
             .eq("status", "live")
             .limit(1)
-            .execute()
         )
         return result.data[0] if result.data else None
     except Exception:
         return None
 
 
-def get_meeting_by_id_service(
+async def get_meeting_by_id_service(
     supabase: Client,
     meeting_id: str,
 ) -> Optional[dict]:
@@ -124,19 +124,18 @@ def get_meeting_by_id_service(
         return _channel_to_meeting(ch)
 
     try:
-        result = (
+        result = await run_query(
             supabase.table("meetings")
             .select("*")
             .eq("id", meeting_id)
             .limit(1)
-            .execute()
         )
         return result.data[0] if result.data else None
     except Exception:
         return None
 
 
-def create_meeting_service(supabase: Client, meeting_data: MeetingCreate) -> dict:
+async def create_meeting_service(supabase: Client, meeting_data: MeetingCreate) -> dict:
     """새 회의를 생성합니다."""
     data = {
         "title": meeting_data.title,
@@ -146,7 +145,7 @@ def create_meeting_service(supabase: Client, meeting_data: MeetingCreate) -> dic
         "status": meeting_data.status.value,
         "duration_seconds": meeting_data.duration_seconds,
     }
-    result = supabase.table("meetings").insert(data).execute()
+    result = await run_query(supabase.table("meetings").insert(data))
     return result.data[0]
 
 
@@ -175,7 +174,7 @@ async def get_meetings(
                 status_code=422,
                 detail="Invalid status value",
             )
-    return get_meetings_service(supabase, statuses=statuses, limit=limit, offset=offset)
+    return await get_meetings_service(supabase, statuses=statuses, limit=limit, offset=offset)
 
 
 @router.get("/live")
@@ -184,7 +183,7 @@ async def get_live_meeting(
     supabase: Client = Depends(get_supabase),
 ) -> Optional[dict]:
     """현재 실시간 회의를 조회합니다. 채널로 필터 가능."""
-    return get_live_meeting_service(supabase, channel=channel)
+    return await get_live_meeting_service(supabase, channel=channel)
 
 
 @router.get("/{meeting_id}")
@@ -193,7 +192,7 @@ async def get_meeting_by_id(
     supabase: Client = Depends(get_supabase),
 ) -> dict:
     """회의 ID로 회의를 조회합니다."""
-    meeting = get_meeting_by_id_service(supabase, meeting_id)
+    meeting = await get_meeting_by_id_service(supabase, meeting_id)
 
     if meeting is None:
         raise HTTPException(
@@ -221,12 +220,11 @@ async def create_meeting_from_url(
 
     # 2. 중복 체크 (vod_url 기준)
     try:
-        result = (
+        result = await run_query(
             supabase.table("meetings")
             .select("id")
             .eq("vod_url", metadata["vod_url"])
             .limit(1)
-            .execute()
         )
         if result.data:
             raise HTTPException(
@@ -246,7 +244,7 @@ async def create_meeting_from_url(
         status=MeetingStatus.ENDED,
         duration_seconds=metadata["duration_seconds"],
     )
-    return create_meeting_service(supabase, meeting_data)
+    return await create_meeting_service(supabase, meeting_data)
 
 
 @router.post("", status_code=status.HTTP_201_CREATED)
@@ -263,7 +261,7 @@ async def create_meeting(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                 detail=f"KMS VOD URL 변환 실패: {e}",
             )
-    return create_meeting_service(supabase, meeting_data)
+    return await create_meeting_service(supabase, meeting_data)
 
 
 # =============================================================================
@@ -274,16 +272,25 @@ async def create_meeting(
 @router.post("/{meeting_id}/stt")
 async def start_stt_processing(
     meeting_id: str,
+    live_meeting_id: Optional[str] = Query(
+        None, description="재사용할 실시간 자막 회의 ID (생략 시 같은 날 같은 채널 자동 탐색)"
+    ),
+    offset_seconds: Optional[float] = Query(
+        None, description="VOD 시각 - 실시간 자막 시각 (생략 시 자동 정렬)"
+    ),
+    priority: int = Query(0, ge=-10, le=10, description="처리 우선순위 (클수록 먼저)"),
     supabase: Client = Depends(get_supabase),
 ) -> dict:
-    """VOD STT 처리를 시작합니다 (백그라운드).
+    """VOD STT 처리를 작업 큐에 등록합니다 (백그라운드).
 
     - meeting이 존재하고 vod_url이 있어야 함
-    - 이미 처리 중이면 409 Conflict
+    - 이미 대기/처리 중이면 409 Conflict
+    - 실시간 자막이 있으면 재사용하고 빈 구간만 전사
+    - 동시 처리 수(VOD_STT_CONCURRENCY)를 넘으면 우선순위 순으로 대기
     - 즉시 task_id와 status를 반환
     """
     # 1. meeting 존재 확인
-    meeting = get_meeting_by_id_service(supabase, meeting_id)
+    meeting = await get_meeting_by_id_service(supabase, meeting_id)
     if meeting is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -305,18 +312,35 @@ async def start_stt_processing(
             detail="이미 STT 처리가 진행 중입니다.",
         )
 
-    # 4. 백그라운드 태스크 실행
-    service = VodSttService()
-    asyncio.create_task(service.process(meeting_id, vod_url, supabase))
+    # 4. 재사용할 실시간 자막 (같은 날 같은 채널의 live 회의)
+    if live_meeting_id is None and settings.vod_reuse_live_transcript:
+        try:
+            live_meeting_id = await find_live_meeting(supabase, meeting)
+        except Exception:
+            live_meeting_id = None
 
-    # 5. 즉시 응답 (태스크가 아직 등록 안됐을 수 있으므로 짧은 대기)
-    await asyncio.sleep(0.05)
-    task = get_task_by_meeting(meeting_id)
+    # 5. 작업 큐에 등록 (vod_stt_jobs에 저장, 워커가 순서대로 처리)
+    #    다른 프로세스에 등록된 작업은 DB 유니크 인덱스로 걸러냄
+    try:
+        task = await get_vod_stt_queue().submit(
+            meeting_id,
+            vod_url,
+            live_meeting_id=live_meeting_id,
+            offset_seconds=offset_seconds,
+            duration_hint=meeting.get("duration_seconds"),
+            priority=priority,
+        )
+    except VodSttJobConflictError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="이미 STT 처리가 진행 중입니다.",
+        ) from None
     return {
-        "task_id": task.task_id if task else None,
+        "task_id": task.task_id,
         "meeting_id": meeting_id,
-        "status": task.status if task else "pending",
-        "message": "STT 처리가 시작되었습니다.",
+        "status": task.status,
+        "message": "STT 처리가 등록되었습니다.",
+        "live_meeting_id": live_meeting_id,
     }
 
 
@@ -324,10 +348,20 @@ async def start_stt_processing(
 async def get_stt_status(
     meeting_id: str,
 ) -> dict:
-    """VOD STT 처리 상태를 조회합니다."""
+    """VOD STT 처리 상태를 조회합니다 (메모리에 없으면 작업 테이블 조회)."""
     task = get_task_by_meeting(meeting_id)
 
     if task is None:
+        job = await get_vod_stt_queue().latest_job(meeting_id)
+        if job is not None:
+            return {
+                "task_id": job["id"],
+                "meeting_id": meeting_id,
+                "status": "pending" if job["status"] == "queued" else job["status"],
+                "progress": 1.0 if job["status"] == "completed" else 0.0,
+                "message": f"마지막 완료 단계: {job.get('stage') or '없음'}",
+                "error": job.get("error"),
+            }
         return {
             "meeting_id": meeting_id,
             "status": "none",
@@ -343,6 +377,10 @@ async def get_stt_status(
         "progress": task.progress,
         "message": task.message,
         "error": task.error,
+        "reconcile": task.reconcile,
+        "timings": task.timings,
+        "upload": task.upload,
+        "queue": get_vod_stt_queue().get_metrics(),
     }
 
 
@@ -371,11 +409,10 @@ async def update_meeting(
     if "status" in update_data:
         update_data["status"] = update_data["status"].value
 
-    result = (
+    result = await run_query(
         supabase.table("meetings")
         .update(update_data)
         .eq("id", meeting_id)
-        .execute()
     )
 
     if not result.data:
@@ -398,12 +435,11 @@ async def get_participants(
     supabase: Client = Depends(get_supabase),
 ) -> list[dict]:
     """회의 참석자 목록을 조회합니다."""
-    result = (
+    result = await run_query(
         supabase.table("meeting_participants")
         .select("*")
         .eq("meeting_id", meeting_id)
         .order("created_at")
-        .execute()
     )
     return result.data
 
@@ -416,7 +452,7 @@ async def add_participant(
 ) -> dict:
     """회의 참석자를 추가합니다."""
     # 회의 존재 확인
-    meeting = get_meeting_by_id_service(supabase, meeting_id)
+    meeting = await get_meeting_by_id_service(supabase, meeting_id)
     if meeting is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -431,7 +467,7 @@ async def add_participant(
     }
 
     try:
-        result = supabase.table("meeting_participants").insert(data).execute()
+        result = await run_query(supabase.table("meeting_participants").insert(data))
     except Exception as e:
         if "unique" in str(e).lower() or "duplicate" in str(e).lower():
             raise HTTPException(
@@ -450,12 +486,11 @@ async def remove_participant(
     supabase: Client = Depends(get_supabase),
 ) -> dict:
     """회의 참석자를 제거합니다."""
-    result = (
+    result = await run_query(
         supabase.table("meeting_participants")
         .delete()
         .eq("id", participant_id)
         .eq("meeting_id", meeting_id)
-        .execute()
     )
 
     if not result.data:
@@ -478,12 +513,11 @@ async def get_agendas(
     supabase: Client = Depends(get_supabase),
 ) -> list[dict]:
     """회의 안건 목록을 조회합니다."""
-    result = (
+    result = await run_query(
         supabase.table("meeting_agendas")
         .select("*")
         .eq("meeting_id", meeting_id)
         .order("order_num")
-        .execute()
     )
     return result.data
 
@@ -495,7 +529,7 @@ async def add_agenda(
     supabase: Client = Depends(get_supabase),
 ) -> dict:
     """안건을 추가합니다."""
-    meeting = get_meeting_by_id_service(supabase, meeting_id)
+    meeting = await get_meeting_by_id_service(supabase, meeting_id)
     if meeting is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -508,7 +542,7 @@ async def add_agenda(
         "title": body.title,
         "description": body.description,
     }
-    result = supabase.table("meeting_agendas").insert(data).execute()
+    result = await run_query(supabase.table("meeting_agendas").insert(data))
     return result.data[0]
 
 
@@ -527,12 +561,11 @@ async def update_agenda(
             detail="수정할 필드가 없습니다.",
         )
 
-    result = (
+    result = await run_query(
         supabase.table("meeting_agendas")
         .update(update_data)
         .eq("id", agenda_id)
         .eq("meeting_id", meeting_id)
-        .execute()
     )
 
     if not result.data:
@@ -551,12 +584,11 @@ async def delete_agenda(
     supabase: Client = Depends(get_supabase),
 ) -> dict:
     """안건을 삭제합니다."""
-    result = (
+    result = await run_query(
         supabase.table("meeting_agendas")
         .delete()
         .eq("id", agenda_id)
         .eq("meeting_id", meeting_id)
-        .execute()
     )
 
     if not result.data:
@@ -580,11 +612,10 @@ async def update_transcript_status(
     supabase: Client = Depends(get_supabase),
 ) -> dict:
     """회의록 상태를 변경합니다 (draft → reviewing → final)."""
-    result = (
+    result = await run_query(
         supabase.table("meetings")
         .update({"transcript_status": body.transcript_status.value})
         .eq("id", meeting_id)
-        .execute()
     )
 
     if not result.data:
@@ -603,7 +634,7 @@ async def create_publication(
     supabase: Client = Depends(get_supabase),
 ) -> dict:
     """회의록 확정/공개 이력을 등록합니다."""
-    meeting = get_meeting_by_id_service(supabase, meeting_id)
+    meeting = await get_meeting_by_id_service(supabase, meeting_id)
     if meeting is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -616,7 +647,7 @@ async def create_publication(
         "published_by": body.published_by,
         "notes": body.notes,
     }
-    result = supabase.table("transcript_publications").insert(data).execute()
+    result = await run_query(supabase.table("transcript_publications").insert(data))
     return result.data[0]
 
 
@@ -626,12 +657,11 @@ async def get_publications(
     supabase: Client = Depends(get_supabase),
 ) -> list[dict]:
     """회의록 확정/공개 이력을 조회합니다."""
-    result = (
+    result = await run_query(
         supabase.table("transcript_publications")
         .select("*")
         .eq("meeting_id", meeting_id)
         .order("created_at", desc=True)
-        .execute()
     )
     return result.data
 
@@ -15,7 +15,7 @@ import logging
 from fastapi import APIRouter, Depends, Query
 from supabase import Client
 
-from app.core.database import get_supabase
+from app.core.database import get_supabase, run_query
 
 logger = logging.getLogger(__name__)
 
@@ -56,7 +56,7 @@ async def global_search(
         if date_to:
             meetings_query = meetings_query.lte("meeting_date", date_to)
 
-        meetings_for_filter = meetings_query.execute()
+        meetings_for_filter = await run_query(meetings_query)
         meeting_id_filter = [m["id"] for m in meetings_for_filter.data]
 
         # 날짜 범위에 해당하는 회의가 없으면 빈 결과 즉시 반환
@@ -82,7 +82,7 @@ async def global_search(
     if meeting_id_filter is not None:
         count_query = count_query.in_("meeting_id", meeting_id_filter)
 
-    count_result = count_query.execute()
+    count_result = await run_query(count_query)
     total = count_result.count or 0
 
     # ------------------------------------------------------------------
@@ -99,7 +99,7 @@ async def global_search(
         data_query = data_query.in_("meeting_id", meeting_id_filter)
 
     data_query = data_query.order("start_time").range(offset, offset + limit - 1)
-    subtitle_result = data_query.execute()
+    subtitle_result = await run_query(data_query)
 
     # 결과가 없으면 빈 응답
     if not subtitle_result.data:
@@ -116,11 +116,10 @@ async def global_search(
     # ------------------------------------------------------------------
     unique_meeting_ids = list({sub["meeting_id"] for sub in subtitle_result.data})
 
-    meetings_result = (
+    meetings_result = await run_query(
         supabase.table("meetings")
         .select("id, title, meeting_date")
         .in_("id", unique_meeting_ids)
-        .execute()
     )
     meetings_map: dict[str, dict] = {
         m["id"]: m for m in meetings_result.data
@@ -10,7 +10,7 @@ from typing import Annotated
 from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
 from supabase import Client
 
-from app.core.database import get_supabase
+from app.core.database import get_supabase, run_query
 from app.schemas.subtitle import SubtitleBatchUpdate, SubtitleUpdate
 from app.services.grammar_checker import check_grammar_batch
 from app.services.history_tracker import get_subtitle_history, record_changes_for_update
@@ -40,22 +40,20 @@ async def get_subtitles(
 ) -> dict:
     """회의별 자막 목록을 조회합니다."""
     # 전체 개수
-    count_result = (
+    count_result = await run_query(
         supabase.table("subtitles")
         .select("id", count="exact")
         .eq("meeting_id", meeting_id)
-        .execute()
     )
     total = count_result.count or 0
 
     # 자막 목록 (시간순)
-    result = (
+    result = await run_query(
         supabase.table("subtitles")
         .select("*")
         .eq("meeting_id", meeting_id)
         .order("start_time")
         .range(offset, offset + limit - 1)
-        .execute()
     )
 
     return {
@@ -87,23 +85,21 @@ async def update_subtitle(
         )
 
     # 원본 조회 (이력 기록용)
-    original_result = (
+    original_result = await run_query(
         supabase.table("subtitles")
         .select("*")
         .eq("id", subtitle_id)
         .eq("meeting_id", meeting_id)
         .limit(1)
-        .execute()
     )
     original = original_result.data[0] if original_result.data else None
 
     # Supabase UPDATE + 필터링
-    result = (
+    result = await run_query(
         supabase.table("subtitles")
         .update(update_data)
         .eq("id", subtitle_id)
         .eq("meeting_id", meeting_id)
-        .execute()
     )
 
     if not result.data:
@@ -114,7 +110,7 @@ async def update_subtitle(
 
     # 변경 이력 기록
     if original:
-        record_changes_for_update(supabase, subtitle_id, original, update_data)
+        await record_changes_for_update(supabase, subtitle_id, original, update_data)
 
     logger.info(
         "자막 수정 완료: meeting_id=%s, subtitle_id=%s, fields=%s",
@@ -154,29 +150,27 @@ async def update_subtitles_batch(
             continue
 
         # 원본 조회 (이력 기록용)
-        original_result = (
+        original_result = await run_query(
             supabase.table("subtitles")
             .select("*")
             .eq("id", item.id)
             .eq("meeting_id", meeting_id)
             .limit(1)
-            .execute()
         )
         original = original_result.data[0] if original_result.data else None
 
-        result = (
+        result = await run_query(
             supabase.table("subtitles")
             .update(update_data)
             .eq("id", item.id)
             .eq("meeting_id", meeting_id)
-            .execute()
         )
 
         if result.data:
             updated_items.append(result.data[0])
             # 변경 이력 기록
             if original:
-                record_changes_for_update(supabase, item.id, original, update_data)
+                await record_changes_for_update(supabase, item.id, original, update_data)
 
     logger.info(
         "자막 배치 수정 완료: meeting_id=%s, 요청=%d건, 수정=%d건",
@@ -205,7 +199,7 @@ async def get_history(
     supabase: Client = Depends(get_supabase),
 ) -> list[dict]:
     """자막의 변경 이력을 조회합니다."""
-    return get_subtitle_history(supabase, subtitle_id)
+    return await get_subtitle_history(supabase, subtitle_id)
 
 
 # =============================================================================
@@ -222,12 +216,11 @@ async def detect_pii_in_subtitles(
     supabase: Client = Depends(get_supabase),
 ) -> dict:
     """회의의 모든 자막에서 개인정보(PII)를 감지합니다."""
-    result = (
+    result = await run_query(
         supabase.table("subtitles")
         .select("id, text")
         .eq("meeting_id", meeting_id)
         .order("start_time")
-        .execute()
     )
 
     if not result.data:
@@ -253,7 +246,7 @@ async def apply_pii_mask(
     query = supabase.table("subtitles").select("id, text").eq("meeting_id", meeting_id)
     if subtitle_ids:
         query = query.in_("id", subtitle_ids)
-    result = query.order("start_time").execute()
+    result = await run_query(query.order("start_time"))
 
     if not result.data:
         return {"updated": 0, "items": []}
@@ -265,11 +258,13 @@ async def apply_pii_mask(
             continue
 
         # 원본 기록 후 업데이트
-        record_changes_for_update(
+        await record_changes_for_update(
             supabase, item["id"], {"text": item["text"]}, {"text": masked_text}, "system:pii_mask"
         )
 
-        supabase.table("subtitles").update({"text": masked_text}).eq("id", item["id"]).execute()
+        await run_query(
+            supabase.table("subtitles").update({"text": masked_text}).eq("id", item["id"])
+        )
         updated_items.append({
             "id": item["id"],
             "original_text": item["text"],
@@ -294,12 +289,11 @@ async def check_terminology_endpoint(
     supabase: Client = Depends(get_supabase),
 ) -> dict:
     """자막의 용어 표기 일관성을 점검합니다."""
-    result = (
+    result = await run_query(
         supabase.table("subtitles")
         .select("id, text")
         .eq("meeting_id", meeting_id)
         .order("start_time")
-        .execute()
     )
 
     if not result.data:
@@ -329,12 +323,11 @@ async def apply_terminology_endpoint(
     supabase: Client = Depends(get_supabase),
 ) -> dict:
     """자막의 용어를 사전 기반으로 일괄 교정합니다."""
-    result = (
+    result = await run_query(
         supabase.table("subtitles")
         .select("id, text")
         .eq("meeting_id", meeting_id)
         .order("start_time")
-        .execute()
     )
 
     if not result.data:
@@ -344,13 +337,17 @@ async def apply_terminology_endpoint(
 
     # 실제 업데이트 적용
     for fix in fixes:
-        record_changes_for_update(
+        await record_changes_for_update(
             supabase, fix["id"],
             {"text": fix["original_text"]},
             {"text": fix["corrected_text"]},
             "system:terminology",
         )
-        supabase.table("subtitles").update({"text": fix["corrected_text"]}).eq("id", fix["id"]).execute()
+        await run_query(
+            supabase.table("subtitles")
+            .update({"text": fix["corrected_text"]})
+            .eq("id", fix["id"])
+        )
 
     return {"updated": len(fixes), "items": fixes}
 
@@ -369,12 +366,11 @@ async def check_grammar_endpoint(
     supabase: Client = Depends(get_supabase),
 ) -> dict:
     """AI를 사용하여 자막의 맞춤법/문법을 검사합니다."""
-    result = (
+    result = await run_query(
         supabase.table("subtitles")
         .select("id, text")
         .eq("meeting_id", meeting_id)
         .order("start_time")
-        .execute()
     )
 
     if not result.data:
@@ -421,13 +417,12 @@ async def apply_grammar_endpoint(
             continue
 
         # 원본 조회
-        original_result = (
+        original_result = await run_query(
             supabase.table("subtitles")
             .select("text")
             .eq("id", subtitle_id)
             .eq("meeting_id", meeting_id)
             .limit(1)
-            .execute()
         )
         if not original_result.data:
             continue
@@ -437,13 +432,15 @@ async def apply_grammar_endpoint(
             continue
 
         # 이력 기록 + 업데이트
-        record_changes_for_update(
+        await record_changes_for_update(
             supabase, subtitle_id,
             {"text": original_text},
             {"text": corrected_text},
             "system:grammar",
         )
-        supabase.table("subtitles").update({"text": corrected_text}).eq("id", subtitle_id).execute()
+        await run_query(
+            supabase.table("subtitles").update({"text": corrected_text}).eq("id", subtitle_id)
+        )
         updated += 1
 
     return {"updated": updated}
@@ -468,7 +465,7 @@ async def get_subtitle_verification_stats(
 
     verified / unverified / flagged 비율과 진행률을 반환합니다.
     """
-    return get_verification_stats(supabase, meeting_id)
+    return await get_verification_stats(supabase, meeting_id)
 
 
 # @TASK P7-T1.3 - 미검증/저신뢰 자막 큐 조회
@@ -487,7 +484,7 @@ async def get_subtitle_review_queue(
 
     verification_status가 'verified'가 아닌 자막을 신뢰도 오름차순으로 반환합니다.
     """
-    return get_review_queue(supabase, meeting_id, confidence_threshold, limit, offset)
+    return await get_review_queue(supabase, meeting_id, confidence_threshold, limit, offset)
 
 
 # @TASK P7-T1.3 - 개별 자막 검증 상태 변경
@@ -511,7 +508,7 @@ async def verify_subtitle(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="status must be 'verified', 'flagged', or 'unverified'",
         )
-    result = update_verification_status(supabase, meeting_id, subtitle_id, status_val)
+    result = await update_verification_status(supabase, meeting_id, subtitle_id, status_val)
     if result is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -546,7 +543,7 @@ async def batch_verify_subtitles(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid status",
         )
-    return batch_verify(supabase, meeting_id, subtitle_ids, status_val)
+    return await batch_verify(supabase, meeting_id, subtitle_ids, status_val)
 
 
 @router.get(
@@ -566,24 +563,22 @@ async def search_subtitles(
         raise HTTPException(status_code=422, detail="검색어는 비어있을 수 없습니다")
 
     # 전체 개수
-    count_result = (
+    count_result = await run_query(
         supabase.table("subtitles")
         .select("id", count="exact")
         .eq("meeting_id", meeting_id)
         .ilike("text", f"%{search_term}%")
-        .execute()
     )
     total = count_result.count or 0
 
     # 검색 결과
-    result = (
+    result = await run_query(
         supabase.table("subtitles")
         .select("*")
         .eq("meeting_id", meeting_id)
         .ilike("text", f"%{search_term}%")
         .order("start_time")
         .range(offset, offset + limit - 1)
-        .execute()
     )
 
     return {
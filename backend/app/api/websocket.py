@@ -4,14 +4,202 @@
   - meeting_id: UUID meeting ID 또는 channel ID (예: ch8)
 """
 
+import asyncio
+import json
 import logging
+import time
+from collections import deque
+from collections.abc import Iterator
+from dataclasses import dataclass, replace
 from typing import Any
 
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
+
+from app.core.config import settings
+from app.services.broadcast_bus import (
+    BUS_RESYNC,
+    HISTORY_CLEARED,
+    SEQUENCED_TYPES,
+    BroadcastBus,
+    create_broadcast_bus,
+)
 
 router = APIRouter(tags=["websocket"])
 logger = logging.getLogger(__name__)
 
+# 큐가 가득 찼을 때 우선적으로 버릴 수 있는 메시지 (다음 인터림/확정 자막이 대체)
+_DROPPABLE_TYPES = frozenset({"subtitle_interim", "subtitle_interim_delta"})
+
+# 느린 클라이언트 강제 종료 시 close code (1013: Try Again Later)
+_SLOW_CONSUMER_CLOSE_CODE = 1013
+
+
+@dataclass(frozen=True, slots=True)
+class _Frame:
+    """한 번 직렬화된 WebSocket 메시지 (방의 모든 클라이언트가 같은 문자열을 공유)
+
+    인터림 프레임은 방별 인터림 순번(iseq)을 가지며, 델타 프레임은 이어 붙일 기준(base)과
+    기준을 받지 못한 클라이언트에게 대신 보낼 전체 텍스트 프레임(full)을 함께 가집니다.
+    """
+
+    type: str
+    text: str
+    iseq: int | None = None
+    base: int | None = None
+    full: "_Frame | None" = None
+
+
+def _encode(message: dict[str, Any]) -> _Frame:
+    """메시지를 JSON 텍스트 프레임으로 직렬화합니다 (Starlette send_json과 동일한 형식)."""
+    return _Frame(
+        type=message["type"],
+        text=json.dumps(message, separators=(",", ":"), ensure_ascii=False),
+    )
+
+
+class _RoomInterims:
+    """방 하나의 인터림 전송 상태 (초당 전송 수 제한 + 델타 인코딩)
+
+    제한 간격 안에 들어온 인터림은 pending에 최신 것만 남기고(coalesce),
+    간격이 지나면 타이머로 전송합니다. text/iseq는 마지막으로 전송한 인터림입니다.
+    """
+
+    __slots__ = ("iseq", "text", "sent_at", "pending", "timer", "sent", "coalesced", "deltas")
+
+    def __init__(self) -> None:
+        self.iseq = 0
+        self.text = ""
+        self.sent_at = float("-inf")
+        self.pending: dict[str, Any] | None = None
+        self.timer: asyncio.TimerHandle | None = None
+        self.sent = 0
+        self.coalesced = 0
+        self.deltas = 0
+
+    def reset_chain(self) -> None:
+        """확정 자막이 인터림을 대체 → 대기 중인 인터림을 버리고 다음 인터림은 전체 전송"""
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        self.pending = None
+        self.text = ""
+
+
+class _RoomHistory:
+    """방 하나의 자막 히스토리 링 버퍼
+
+    deque(maxlen)에 최근 자막을 보관하고 자막 id → 항목 색인을 함께 유지합니다.
+    오래된 항목이 밀려날 때 색인에서도 제거하므로 추가/교정 조회가 O(1)입니다.
+    """
+
+    def __init__(self, maxlen: int) -> None:
+        self.entries: deque[dict[str, Any]] = deque(maxlen=max(1, maxlen))
+        self._by_id: dict[str, dict[str, Any]] = {}
+
+    @property
+    def maxlen(self) -> int:
+        return self.entries.maxlen or 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        return iter(self.entries)
+
+    @staticmethod
+    def _subtitle_id(item: dict[str, Any]) -> str | None:
+        subtitle = item.get("subtitle")
+        return subtitle.get("id") if isinstance(subtitle, dict) else None
+
+    def _unindex(self, item: dict[str, Any]) -> None:
+        sub_id = self._subtitle_id(item)
+        if sub_id is not None and self._by_id.get(sub_id) is item:
+            del self._by_id[sub_id]
+
+    def append(self, item: dict[str, Any]) -> None:
+        """항목을 추가합니다. 가득 차 있으면 가장 오래된 항목이 밀려납니다."""
+        if len(self.entries) == self.entries.maxlen:
+            self._unindex(self.entries[0])
+        self.entries.append(item)
+        sub_id = self._subtitle_id(item)
+        if sub_id is not None:
+            self._by_id[sub_id] = item
+
+    def get(self, sub_id: str) -> dict[str, Any] | None:
+        """자막 id로 항목을 찾습니다."""
+        return self._by_id.get(sub_id)
+
+    def resize(self, maxlen: int) -> None:
+        """보관 크기를 바꿉니다. 줄어들면 오래된 항목부터 버립니다."""
+        maxlen = max(1, maxlen)
+        while len(self.entries) > maxlen:
+            self._unindex(self.entries.popleft())
+        self.entries = deque(self.entries, maxlen=maxlen)
+
+
+class _ClientSender:
+    """클라이언트 1개의 송신 큐
+
+    브로드캐스트는 offer()로 직렬화된 프레임을 큐에 넣기만 하고,
+    실제 send_text는 클라이언트별 writer 태스크가 순서대로 수행합니다.
+    """
+
+    def __init__(self, websocket: WebSocket, maxsize: int) -> None:
+        self.websocket = websocket
+        self.maxsize = max(1, maxsize)
+        self.pending: deque[_Frame] = deque()
+        self.dropped = 0
+        # 이 클라이언트가 마지막으로 받은 인터림 순번 (델타 기준 확인용)
+        self.interim_iseq: int | None = None
+        self.task: asyncio.Task | None = None
+        self._ready = asyncio.Event()
+
+    def offer(self, frame: _Frame, policy: str) -> bool:
+        """프레임을 큐에 넣습니다.
+
+        Returns:
+            False면 큐가 가득 차 더 이상 받을 수 없음 (연결 종료 대상)
+        """
+        if len(self.pending) >= self.maxsize:
+            if policy != "drop_interim":
+                return False
+            if not self._drop_oldest_interim():
+                if frame.type not in _DROPPABLE_TYPES:
+                    return False
+                # 비울 인터림이 없으면 새 인터림을 버림
+                self.dropped += 1
+                return True
+
+        self.pending.append(frame)
+        self._ready.set()
+        return True
+
+    def _drop_oldest_interim(self) -> bool:
+        """큐에서 가장 오래된 인터림 1건을 버립니다. 없으면 False"""
+        for i, queued in enumerate(self.pending):
+            if queued.type in _DROPPABLE_TYPES:
+                del self.pending[i]
+                self.dropped += 1
+                return True
+        return False
+
+    async def run(self, send_timeout: float) -> None:
+        """큐의 프레임을 순서대로 전송합니다. 전송 실패 시 예외를 그대로 올립니다."""
+        while True:
+            if not self.pending:
+                self._ready.clear()
+                await self._ready.wait()
+                continue
+            frame = self.pending.popleft()
+            if frame.base is not None and frame.base != self.interim_iseq and frame.full:
+                # 기준 인터림을 받지 못함 (접속 직후 / 큐에서 버려짐) → 전체 텍스트로 전송
+                frame = frame.full
+            # wait_for는 3.11에서 전송 완료와 겹친 취소를 삼킬 수 있어 timeout()을 사용
+            async with asyncio.timeout(send_timeout):
+                await self.websocket.send_text(frame.text)
+            if frame.iseq is not None:
+                self.interim_iseq = frame.iseq
+
 
 class ConnectionManager:
     """WebSocket 연결 관리자
@@ -21,19 +209,93 @@ class ConnectionManager:
     room_id는 meeting UUID 또는 channel ID(str) 모두 가능합니다.
 
     자막 히스토리:
-    - 채널별로 최근 HISTORY_SIZE개의 자막을 메모리에 보관
+    - 채널별로 최근 history_size개(기본 WS_HISTORY_SIZE, 방별 WS_HISTORY_SIZES)의
+      자막을 링 버퍼에 보관하고, 교정 시 자막 id 색인으로 바로 찾음
     - 새 클라이언트 접속 시 히스토리를 일괄 전송 (늦게 들어와도 이전 자막 확인 가능)
-    """
 
-    HISTORY_SIZE = 200  # 채널당 보관할 최대 자막 수
+    이어받기 (?since=<seq>):
+    - subtitle_created / subtitle_corrected 이벤트에 방별로 단조 증가하는 seq를 붙이고
+      최근 이벤트 프레임을 이벤트 로그에 보관 (인터림은 seq 없음)
+    - 재접속 시 since 이후 이벤트만 재전송하고, 로그 범위를 벗어나면
+      전체 스냅샷(subtitle_history, seq 포함)으로 대체
+
+    송신 큐:
+    - 클라이언트마다 제한된 크기의 송신 큐와 writer 태스크를 둠
+    - 브로드캐스트는 큐에 넣기만 하므로 느린 클라이언트가
+      다른 시청자나 호출한 STT 수신 루프를 막지 않음
+    - 큐가 가득 차면 full_queue_policy에 따라 인터림부터 버리고,
+      그래도 넣을 수 없으면 해당 클라이언트 연결을 종료
+    - 메시지는 브로드캐스트당 한 번만 직렬화하고 같은 문자열을 모든 클라이언트에 전송
+      (히스토리 프레임도 변경 전까지 캐시해 접속하는 클라이언트끼리 재사용)
+
+    인터림 전송 제한 / 델타:
+    - 방별로 초당 interim_rate개(기본 WS_INTERIM_MAX_PER_SECOND, 방별 WS_INTERIM_RATES)까지만
+      인터림을 보내고, 그 사이에 온 인터림은 최신 것 하나로 합침
+    - 직전에 보낸 인터림을 이어 쓰는 경우 추가된 부분만 subtitle_interim_delta
+      (iseq, base, payload.append)로 보냄. 기준을 받지 못한 클라이언트는 writer가
+      같은 내용의 전체 subtitle_interim으로 바꿔 보냄
+    - 확정 자막(subtitle_created)이 오면 대기 중인 인터림을 버리고 다음 인터림은 전체 전송
+
+    브로드캐스트 버스:
+    - broadcast_*/clear_history는 이벤트를 버스에 발행하기만 하고,
+      히스토리 저장·seq·전송은 버스가 전달한 이벤트를 _apply()에서 처리
+    - 기본 InProcessBus는 바로 _apply()를 호출하고, BROADCAST_BUS_URL을 설정하면
+      브로커를 거쳐 모든 워커가 같은 seq/히스토리를 가짐 (멀티 워커 배포)
+    """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        queue_size: int | None = None,
+        send_timeout: float | None = None,
+        full_queue_policy: str | None = None,
+        history_size: int | None = None,
+        bus: BroadcastBus | None = None,
+        interim_rate: float | None = None,
+        interim_delta: bool | None = None,
+    ) -> None:
         """ConnectionManager 초기화"""
         self.active_connections: dict[str, list[WebSocket]] = {}
-        self.subtitle_history: dict[str, list[dict[str, Any]]] = {}
+        self.subtitle_history: dict[str, _RoomHistory] = {}
+        self.history_size = history_size if history_size is not None else settings.ws_history_size
+        self._history_sizes: dict[str, int] = dict(settings.ws_history_sizes)
+        self.queue_size = queue_size if queue_size is not None else settings.ws_send_queue_size
+        self.send_timeout = (
+            send_timeout if send_timeout is not None else settings.ws_send_timeout
+        )
+        self.full_queue_policy = full_queue_policy or settings.ws_full_queue_policy
+        self.interim_rate = (
+            interim_rate if interim_rate is not None else settings.ws_interim_max_per_second
+        )
+        self._interim_rates: dict[str, float] = dict(settings.ws_interim_rates)
+        self.interim_delta = (
+            interim_delta if interim_delta is not None else settings.ws_interim_delta
+        )
+        self._interims: dict[str, _RoomInterims] = {}
+        self._senders: dict[WebSocket, _ClientSender] = {}
+        self._history_frames: dict[str, _Frame] = {}
+        self._last_seq: dict[str, int] = {}
+        self._event_log: dict[str, deque[tuple[int, _Frame]]] = {}
+        self._evicted: dict[str, int] = {}
+        self._closing: set[asyncio.Task] = set()
+        self.bus = bus if bus is not None else create_broadcast_bus(settings.broadcast_bus_url)
+        self.bus.set_handler(self._apply)
+
+    async def start(self) -> None:
+        """브로드캐스트 버스 시작 (브로커 접속)"""
+        await self.bus.start()
+
+    async def stop(self) -> None:
+        """브로드캐스트 버스 종료"""
+        await self.bus.stop()
+
+    async def connect(
+        self, websocket: WebSocket, room_id: str, since: int | None = None
+    ) -> None:
+        """WebSocket 연결을 방에 추가하고, 기존 자막 히스토리를 전송
 
-    async def connect(self, websocket: WebSocket, room_id: str) -> None:
-        """WebSocket 연결을 방에 추가하고, 기존 자막 히스토리를 전송"""
+        since가 주어지면 그 이후 놓친 이벤트만 전송하고,
+        이벤트 로그로 메울 수 없으면 전체 히스토리를 전송합니다.
+        """
         if hasattr(websocket, "accept") and callable(websocket.accept):
             try:
                 await websocket.accept()
@@ -44,29 +306,99 @@ class ConnectionManager:
             self.active_connections[room_id] = []
 
         self.active_connections[room_id].append(websocket)
+        sender = _ClientSender(websocket, self.queue_size)
+        sender.task = asyncio.create_task(self._writer(sender, room_id))
+        self._senders[websocket] = sender
         count = len(self.active_connections[room_id])
         logger.info("connection open: room=%s, total=%d", room_id, count)
 
-        # 히스토리가 있으면 새 클라이언트에 일괄 전송
-        history = self.subtitle_history.get(room_id, [])
-        if history:
-            try:
-                await websocket.send_json({
-                    "type": "subtitle_history",
-                    "payload": {
-                        "subtitles": [
-                            item["subtitle"]
-                            for item in history
-                            if "subtitle" in item
-                        ],
-                    },
-                })
+        # 재접속: 놓친 이벤트만 재전송
+        if since is not None:
+            missed = self._events_since(room_id, since)
+            if missed is not None:
+                for frame in missed:
+                    sender.offer(frame, self.full_queue_policy)
                 logger.info(
-                    "sent %d history subtitles to new client: room=%s",
-                    len(history), room_id,
+                    "resumed client from seq=%d with %d events: room=%s",
+                    since, len(missed), room_id,
                 )
-            except Exception:
-                logger.warning("failed to send history to client: room=%s", room_id)
+                return
+
+        # 히스토리가 있으면 새 클라이언트에 일괄 전송
+        history = self.subtitle_history.get(room_id)
+        if history:
+            sender.offer(self._history_frame(room_id), self.full_queue_policy)
+            logger.info(
+                "queued %d history subtitles for new client: room=%s",
+                len(history), room_id,
+            )
+
+    def _history_frame(self, room_id: str) -> _Frame:
+        """방의 subtitle_history 프레임 (히스토리가 바뀔 때까지 캐시)"""
+        frame = self._history_frames.get(room_id)
+        if frame is None:
+            frame = _encode({
+                "type": "subtitle_history",
+                "seq": self._last_seq.get(room_id, 0),
+                "payload": {
+                    "subtitles": [
+                        item["subtitle"]
+                        for item in self.subtitle_history.get(room_id, ())
+                        if "subtitle" in item
+                    ],
+                },
+            })
+            self._history_frames[room_id] = frame
+        return frame
+
+    def _events_since(self, room_id: str, since: int) -> list[_Frame] | None:
+        """since 이후 이벤트 프레임 목록. 로그로 메울 수 없으면 None (스냅샷 필요)"""
+        last = self._last_seq.get(room_id)
+        if last is None or since > last:
+            # 처음 보는 방이거나 서버 재시작 등으로 seq가 맞지 않음
+            return None
+        if since == last:
+            return []
+
+        log = self._event_log.get(room_id)
+        if not log or log[0][0] > since + 1:
+            return None
+        missed = [frame for seq, frame in log if seq > since]
+        if len(missed) >= self.queue_size:
+            return None
+        return missed
+
+    def _sequenced_frame(
+        self,
+        room_id: str,
+        message_type: str,
+        payload: dict[str, Any],
+        seq: int | None = None,
+    ) -> _Frame:
+        """seq를 붙여 직렬화하고 이벤트 로그에 기록합니다.
+
+        seq가 없으면(프로세스 내부 버스) 방의 다음 번호를 부여합니다.
+        """
+        last = self._last_seq.get(room_id)
+        if seq is None:
+            if last is None:
+                # 프로세스 재시작 후에도 이전 seq보다 커지도록 현재 시각(ms)에서 시작
+                last = int(time.time() * 1000)
+            seq = last + 1
+        self._last_seq[room_id] = seq if last is None else max(last, seq)
+
+        frame = _encode({"type": message_type, "seq": seq, "payload": payload})
+        log = self._event_log.get(room_id)
+        if log is None:
+            log = deque(maxlen=self._event_log_size(room_id))
+            self._event_log[room_id] = log
+        log.append((seq, frame))
+        self._history_frames.pop(room_id, None)
+        return frame
+
+    def _event_log_size(self, room_id: str) -> int:
+        # 자막 1건당 생성 + 교정 이벤트를 고려해 히스토리의 2배를 보관
+        return max(1, self.get_history_size(room_id) * 2)
 
     def disconnect(self, websocket: WebSocket, room_id: str) -> None:
         """WebSocket 연결을 방에서 제거"""
@@ -76,36 +408,214 @@ class ConnectionManager:
 
             if not self.active_connections[room_id]:
                 del self.active_connections[room_id]
+                interims = self._interims.pop(room_id, None)
+                if interims is not None:
+                    interims.reset_chain()
+
+        sender = self._senders.pop(websocket, None)
+        if sender is not None and sender.task is not None:
+            try:
+                current = asyncio.current_task()
+            except RuntimeError:
+                current = None
+            if sender.task is not current:
+                sender.task.cancel()
+
+    async def _writer(self, sender: _ClientSender, room_id: str) -> None:
+        """클라이언트 송신 큐를 비우는 writer 태스크"""
+        try:
+            await sender.run(self.send_timeout)
+        except asyncio.CancelledError:
+            raise
+        except TimeoutError:
+            logger.warning(
+                "send timed out after %.1fs, evicting client: room=%s",
+                self.send_timeout, room_id,
+            )
+            self._evict(sender.websocket, room_id)
+        except Exception:
+            # 이미 끊긴 클라이언트
+            self.disconnect(sender.websocket, room_id)
+
+    def _evict(self, websocket: WebSocket, room_id: str) -> None:
+        """느린 클라이언트를 방에서 제거하고 연결을 닫습니다."""
+        self.disconnect(websocket, room_id)
+        self._evicted[room_id] = self._evicted.get(room_id, 0) + 1
+
+        close = getattr(websocket, "close", None)
+        if close is None or not callable(close):
+            return
+
+        async def _close() -> None:
+            try:
+                await asyncio.wait_for(
+                    close(code=_SLOW_CONSUMER_CLOSE_CODE), self.send_timeout
+                )
+            except Exception:
+                pass
+
+        task = asyncio.create_task(_close())
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    def _fanout(self, room_id: str, frame: _Frame) -> None:
+        """직렬화된 프레임을 방의 모든 클라이언트 송신 큐에 넣습니다 (블로킹 없음)."""
+        if room_id not in self.active_connections:
+            return
+
+        overflowed = []
+        for websocket in self.active_connections[room_id]:
+            sender = self._senders.get(websocket)
+            if sender is None:
+                continue
+            if not sender.offer(frame, self.full_queue_policy):
+                overflowed.append(websocket)
+
+        for websocket in overflowed:
+            logger.warning(
+                "send queue full (%d), evicting slow client: room=%s",
+                self.queue_size, room_id,
+            )
+            self._evict(websocket, room_id)
+
+    def _apply(self, event: dict[str, Any]) -> None:
+        """버스가 전달한 이벤트를 히스토리/이벤트 로그에 반영하고 클라이언트에 전송합니다."""
+        event_type = event.get("type")
+        if event_type == BUS_RESYNC:
+            self._reset_for_resync()
+            return
+
+        room_id = event.get("room")
+        if not room_id:
+            return
+        payload = event.get("payload") or {}
+
+        if event_type == HISTORY_CLEARED:
+            self._clear_local_history(room_id)
+            self._reset_interims(room_id)
+        elif event_type == "subtitle_interim":
+            if room_id in self.active_connections:
+                self._offer_interim(room_id, payload)
+        elif event_type in SEQUENCED_TYPES:
+            seq = event.get("seq")
+            # 브로커 재접속 후 재생되는, 이미 전송한 이벤트는 상태만 다시 쌓음
+            replayed = seq is not None and seq <= self._last_seq.get(room_id, seq - 1)
+            if event_type == "subtitle_created":
+                self._store_subtitle(room_id, payload)
+                self._reset_interims(room_id)
+            else:
+                self._apply_correction(room_id, payload)
+            frame = self._sequenced_frame(room_id, event_type, payload, seq)
+            if not replayed:
+                self._fanout(room_id, frame)
+
+    def _offer_interim(self, room_id: str, payload: dict[str, Any]) -> None:
+        """인터림을 바로 보내거나, 제한 간격 안이면 최신 것만 남겨 두었다가 보냅니다."""
+        state = self._interims.get(room_id)
+        if state is None:
+            state = _RoomInterims()
+            self._interims[room_id] = state
+
+        if state.timer is not None:
+            if state.pending is not None:
+                state.coalesced += 1
+            state.pending = payload
+            return
+
+        rate = self.get_interim_rate(room_id)
+        loop = asyncio.get_running_loop()
+        wait = state.sent_at + 1 / rate - loop.time() if rate > 0 else 0.0
+        if wait <= 0:
+            self._send_interim(room_id, state, payload)
+            return
+        state.pending = payload
+        state.timer = loop.call_later(wait, self._flush_interim, room_id, state)
+
+    def _flush_interim(self, room_id: str, state: _RoomInterims) -> None:
+        state.timer = None
+        payload, state.pending = state.pending, None
+        if payload is not None and self._interims.get(room_id) is state:
+            self._send_interim(room_id, state, payload)
+
+    def _send_interim(self, room_id: str, state: _RoomInterims, payload: dict[str, Any]) -> None:
+        """인터림 프레임을 만들어 전송합니다 (직전 인터림을 이어 쓰면 델타)."""
+        text = payload.get("text", "")
+        if not isinstance(text, str):
+            text = ""
+        if state.text and text == state.text:
+            return  # 바뀐 내용 없음
+
+        base = state.iseq
+        state.iseq += 1
+        full = replace(
+            _encode({"type": "subtitle_interim", "iseq": state.iseq, "payload": payload}),
+            iseq=state.iseq,
+        )
+        frame = full
+        if self.interim_delta and state.text and text.startswith(state.text):
+            delta = {k: v for k, v in payload.items() if k != "text"}
+            delta["append"] = text[len(state.text):]
+            frame = replace(
+                _encode({
+                    "type": "subtitle_interim_delta",
+                    "iseq": state.iseq,
+                    "base": base,
+                    "payload": delta,
+                }),
+                iseq=state.iseq,
+                base=base,
+                full=full,
+            )
+            state.deltas += 1
+
+        state.text = text
+        state.sent_at = asyncio.get_running_loop().time()
+        state.sent += 1
+        self._fanout(room_id, frame)
+
+    def _reset_interims(self, room_id: str) -> None:
+        state = self._interims.get(room_id)
+        if state is not None:
+            state.reset_chain()
+
+    def _store_subtitle(self, room_id: str, subtitle_data: dict[str, Any]) -> None:
+        """자막을 히스토리에 저장 (가득 차면 가장 오래된 자막이 밀려남)"""
+        history = self.subtitle_history.get(room_id)
+        if history is None:
+            history = _RoomHistory(self.get_history_size(room_id))
+            self.subtitle_history[room_id] = history
+        history.append(subtitle_data)
+
+    def _apply_correction(self, room_id: str, correction_data: dict[str, Any]) -> None:
+        """히스토리에서 해당 자막을 찾아 교정된 텍스트로 바꿈"""
+        sub_id = correction_data.get("id", "")
+        corrected_text = correction_data.get("corrected_text", "")
+        history = self.subtitle_history.get(room_id)
+        item = history.get(sub_id) if history is not None and sub_id and corrected_text else None
+        if item is not None:
+            subtitle = item["subtitle"]
+            subtitle["original_text"] = subtitle.get("text", "")
+            subtitle["text"] = corrected_text
+            subtitle["is_corrected"] = True
+
+    def _clear_local_history(self, room_id: str) -> None:
+        self._history_frames.pop(room_id, None)
+        self._event_log.pop(room_id, None)
+        if room_id in self.subtitle_history:
+            del self.subtitle_history[room_id]
+            logger.info("cleared subtitle history: room=%s", room_id)
+
+    def _reset_for_resync(self) -> None:
+        """브로커 (재)접속: 보관 이벤트 재생으로 다시 채우도록 히스토리를 비움 (seq는 유지)"""
+        self.subtitle_history.clear()
+        self._event_log.clear()
+        self._history_frames.clear()
 
     async def broadcast_subtitle(
         self, room_id: str, subtitle_data: dict[str, Any]
     ) -> None:
         """자막을 히스토리에 저장하고 해당 방의 모든 클라이언트에 브로드캐스트"""
-        # 히스토리에 저장
-        if room_id not in self.subtitle_history:
-            self.subtitle_history[room_id] = []
-        self.subtitle_history[room_id].append(subtitle_data)
-        # 크기 제한
-        if len(self.subtitle_history[room_id]) > self.HISTORY_SIZE:
-            self.subtitle_history[room_id] = self.subtitle_history[room_id][-self.HISTORY_SIZE:]
-
-        # 실시간 브로드캐스트
-        message = {
-            "type": "subtitle_created",
-            "payload": subtitle_data,
-        }
-
-        if room_id in self.active_connections:
-            disconnected = []
-
-            for websocket in self.active_connections[room_id]:
-                try:
-                    await websocket.send_json(message)
-                except Exception:
-                    disconnected.append(websocket)
-
-            for websocket in disconnected:
-                self.disconnect(websocket, room_id)
+        self.bus.publish({"room": room_id, "type": "subtitle_created", "payload": subtitle_data})
 
     async def broadcast_interim_subtitle(
         self, room_id: str, interim_data: dict[str, Any]
@@ -116,20 +626,7 @@ class ConnectionManager:
         히스토리에는 저장하지 않으며, 확정 자막(subtitle_created)이
         도착하면 프론트엔드에서 교체합니다.
         """
-        message = {
-            "type": "subtitle_interim",
-            "payload": interim_data,
-        }
-
-        if room_id in self.active_connections:
-            disconnected = []
-            for websocket in self.active_connections[room_id]:
-                try:
-                    await websocket.send_json(message)
-                except Exception:
-                    disconnected.append(websocket)
-            for websocket in disconnected:
-                self.disconnect(websocket, room_id)
+        self.bus.publish({"room": room_id, "type": "subtitle_interim", "payload": interim_data})
 
     async def broadcast_corrected_subtitle(
         self, room_id: str, correction_data: dict[str, Any]
@@ -139,57 +636,105 @@ class ConnectionManager:
         기존 자막의 텍스트를 교정된 텍스트로 업데이트합니다.
         히스토리에서도 해당 자막을 찾아 교정합니다.
         """
-        # 히스토리에서 해당 자막 업데이트
-        sub_id = correction_data.get("id", "")
-        corrected_text = correction_data.get("corrected_text", "")
-        if room_id in self.subtitle_history and sub_id and corrected_text:
-            for item in self.subtitle_history[room_id]:
-                subtitle = item.get("subtitle", {})
-                if subtitle.get("id") == sub_id:
-                    subtitle["original_text"] = subtitle.get("text", "")
-                    subtitle["text"] = corrected_text
-                    subtitle["is_corrected"] = True
-                    break
-
-        message = {
-            "type": "subtitle_corrected",
-            "payload": correction_data,
+        self.bus.publish(
+            {"room": room_id, "type": "subtitle_corrected", "payload": correction_data}
+        )
+
+    def get_history_size(self, room_id: str) -> int:
+        """방의 히스토리 보관 크기"""
+        return self._history_sizes.get(room_id, self.history_size)
+
+    def set_history_size(self, room_id: str, size: int) -> None:
+        """방의 히스토리 보관 크기를 바꿉니다 (장시간 회의 등)."""
+        self._history_sizes[room_id] = size
+        history = self.subtitle_history.get(room_id)
+        if history is not None and history.maxlen != size:
+            history.resize(size)
+            self._history_frames.pop(room_id, None)
+        log = self._event_log.get(room_id)
+        if log is not None and log.maxlen != self._event_log_size(room_id):
+            self._event_log[room_id] = deque(log, maxlen=self._event_log_size(room_id))
+
+    def get_interim_rate(self, room_id: str) -> float:
+        """방의 초당 인터림 전송 상한 (0이면 제한 없음)"""
+        return self._interim_rates.get(room_id, self.interim_rate)
+
+    def set_interim_rate(self, room_id: str, rate: float) -> None:
+        """방의 초당 인터림 전송 상한을 바꿉니다 (다음 인터림부터 적용)."""
+        self._interim_rates[room_id] = rate
+
+    def get_interim_metrics(self, room_id: str) -> dict[str, Any]:
+        """방의 인터림 전송 상태를 반환합니다."""
+        state = self._interims.get(room_id)
+        return {
+            "rate": self.get_interim_rate(room_id),
+            "sent": state.sent if state else 0,
+            "deltas": state.deltas if state else 0,
+            "coalesced": state.coalesced if state else 0,
         }
 
-        if room_id in self.active_connections:
-            disconnected = []
-            for websocket in self.active_connections[room_id]:
-                try:
-                    await websocket.send_json(message)
-                except Exception:
-                    disconnected.append(websocket)
-            for websocket in disconnected:
-                self.disconnect(websocket, room_id)
+    def get_queue_metrics(self, room_id: str) -> dict[str, Any]:
+        """방의 송신 큐 상태를 반환합니다."""
+        depths = [
+            len(self._senders[ws].pending)
+            for ws in self.active_connections.get(room_id, [])
+            if ws in self._senders
+        ]
+        dropped = sum(
+            self._senders[ws].dropped
+            for ws in self.active_connections.get(room_id, [])
+            if ws in self._senders
+        )
+        return {
+            "clients": len(depths),
+            "queued_total": sum(depths),
+            "queued_max": max(depths, default=0),
+            "queue_size": self.queue_size,
+            "dropped_interims": dropped,
+            "evicted_clients": self._evicted.get(room_id, 0),
+        }
+
+    def get_all_queue_metrics(self) -> dict[str, dict[str, Any]]:
+        """전체 방의 송신 큐 상태를 반환합니다."""
+        rooms = set(self.active_connections) | set(self._evicted)
+        return {room_id: self.get_queue_metrics(room_id) for room_id in sorted(rooms)}
 
     def clear_history(self, room_id: str) -> None:
-        """특정 방의 자막 히스토리를 초기화합니다."""
-        if room_id in self.subtitle_history:
-            del self.subtitle_history[room_id]
-            logger.info("cleared subtitle history: room=%s", room_id)
+        """특정 방의 자막 히스토리를 초기화합니다 (모든 워커).
+
+        이벤트 로그도 비우므로 이전 seq로 재접속하면 (빈) 스냅샷을 받습니다.
+        seq는 계속 증가합니다.
+        """
+        self.bus.publish({"room": room_id, "type": HISTORY_CLEARED, "payload": {}})
 
 
 # 전역 ConnectionManager 인스턴스
 manager = ConnectionManager()
 
 
-async def _handle_ws(websocket: WebSocket, room_id: str) -> None:
+async def _handle_ws(websocket: WebSocket, room_id: str, since: int | None = None) -> None:
     """WebSocket 연결을 처리하는 공통 로직."""
-    await manager.connect(websocket, room_id)
+    await manager.connect(websocket, room_id, since=since)
     try:
         while True:
-            data = await websocket.receive_text()
+            await websocket.receive_text()
     except WebSocketDisconnect:
+        pass
+    finally:
         manager.disconnect(websocket, room_id)
 
 
 @router.websocket("/ws/meetings/{meeting_id}/subtitles")
 async def websocket_subtitle_endpoint(
-    websocket: WebSocket, meeting_id: str
+    websocket: WebSocket,
+    meeting_id: str,
+    since: int | None = Query(None, description="마지막으로 받은 seq (재접속 시 이어받기)"),
 ) -> None:
     """실시간 자막 WebSocket 엔드포인트 (meeting UUID 또는 channel ID)"""
-    await _handle_ws(websocket, meeting_id)
+    await _handle_ws(websocket, meeting_id, since)
+
+
+@router.get("/ws/metrics")
+async def websocket_metrics() -> dict[str, dict[str, Any]]:
+    """방별 WebSocket 송신 큐 상태 (클라이언트 수, 대기 메시지, 버린 인터림, 강제 종료 수)"""
+    return manager.get_all_queue_metrics()
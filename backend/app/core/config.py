@@ -17,6 +17,8 @@ class Settings(BaseSettings):
     # Supabase
     supabase_url: str = ""
     supabase_key: str = ""
+    # PostgREST 호출용 스레드 풀 크기 (동시 DB 왕복 수 상한)
+    db_max_workers: int = 16
 
     # OpenAI Whisper
     openai_api_key: str = ""
@@ -30,6 +32,63 @@ class Settings(BaseSettings):
     subtitle_correction_batch_size: int = 3
     subtitle_correction_interval: float = 10.0  # 초
 
+    # Kiwi 띄어쓰기 교정 워커 풀
+    spacing_executor: str = "process"  # process | thread
+    spacing_workers: int = 1  # Kiwi 인스턴스(워커) 수, 인스턴스당 메모리 약 450MB
+    spacing_batch_window: float = 0.005  # 여러 채널 요청을 모으는 시간 (초)
+    spacing_max_batch: int = 64  # 배치 최대 문장 수
+
+    # 용어 사전 DB 버전 확인 주기 (초, 0이면 DB 리로드 비활성화)
+    dictionary_reload_interval: float = 60.0
+
+    # VOD STT: 같은 날 같은 채널의 실시간 자막이 있으면 재사용하고 빈 구간만 전사 (ffmpeg 필요)
+    vod_reuse_live_transcript: bool = True
+    vod_reconcile_min_gap: float = 15.0  # 자막 없는 구간이 이 길이(초) 이상이면 재전사
+    vod_reconcile_min_confidence: float = 0.6  # 이보다 신뢰도가 낮은 실시간 자막은 재전사
+
+    # VOD STT 작업 큐 (vod_stt_jobs 테이블에 저장, 재시작 시 마지막 완료 단계부터 이어서 처리)
+    vod_stt_concurrency: int = 2  # 동시에 처리하는 VOD 수 (다운로드/Deepgram 전송)
+    vod_stt_max_attempts: int = 3  # 실패 시 재시도 포함 최대 시도 횟수
+    vod_stt_retry_base: float = 30.0  # 재시도 대기 (초, 시도마다 2배)
+    vod_stt_retry_max: float = 600.0  # 재시도 대기 상한 (초)
+    vod_stt_work_dir: str = ""  # 다운로드/Deepgram 응답 보관 경로 (빈 값이면 시스템 임시 폴더)
+    vod_stt_task_ttl: float = 3600.0  # 끝난 작업 상태를 메모리에 보관하는 시간 (초)
+    vod_stt_heartbeat_interval: float = 30.0  # 하트비트/작업 조회 주기 (초)
+    vod_stt_stale_after: float = 120.0  # 하트비트가 끊긴 작업을 이어받는 기준 (초)
+    # KMS 다운로드 스트림을 임시 파일 없이 Deepgram 업로드로 바로 중계
+    # (Content-Length가 없거나 재시도/실시간 자막 재사용 시에는 임시 파일 경로 사용)
+    vod_stt_relay: bool = False
+    vod_stt_relay_buffer_mb: int = 16  # 다운로드와 업로드 사이 버퍼 상한 (MB)
+    # 업로드 전에 ffmpeg로 오디오만 16kHz mono로 압축 (영상 MP4 대비 업로드 10~50배 이상 감소)
+    # ffmpeg가 없거나 변환에 실패하면 MP4를 그대로 전송
+    vod_stt_audio_transcode: bool = False
+    vod_stt_audio_codec: str = "opus"  # opus (Ogg, 24kbps) | flac (무손실)
+
+    # 실시간 자막 DB 저장 (브로드캐스트와 분리된 write-behind 배치 INSERT/교정 UPDATE)
+    live_subtitle_persist: bool = True
+    live_subtitle_queue_size: int = 5000  # 저장 대기 상한 (가득 차면 버리고 dropped로 집계)
+    live_subtitle_batch_size: int = 50  # 한 번에 쓰는 최대 행 수
+    live_subtitle_flush_interval: float = 0.3  # 배치를 모으는 시간 (초)
+
+    # WebSocket 송신 큐 (클라이언트별)
+    ws_send_queue_size: int = 256  # 클라이언트당 대기 메시지 상한
+    ws_send_timeout: float = 10.0  # 메시지 1건 전송 제한 시간 (초)
+    # 큐가 가득 찼을 때: drop_interim(인터림부터 버리고 그래도 차면 연결 종료) | disconnect
+    ws_full_queue_policy: str = "drop_interim"
+    # 새 클라이언트에 재전송할 방별 자막 히스토리 크기 (WS_HISTORY_SIZES='{"ch8": 2000}')
+    ws_history_size: int = 200
+    ws_history_sizes: dict[str, int] = {}
+    # 방별 초당 인터림 전송 상한 (0: 제한 없음, WS_INTERIM_RATES='{"ch8": 2}')
+    ws_interim_max_per_second: float = 5.0
+    ws_interim_rates: dict[str, float] = {}
+    # 직전 인터림을 이어 쓰면 추가된 부분만 전송 (subtitle_interim_delta)
+    ws_interim_delta: bool = True
+
+    # 자막 브로드캐스트 버스 (멀티 워커/호스트 배포)
+    # 빈 값: 프로세스 내부 / unix:///tmp/ggc-subtitle-bus.sock, tcp://host:6390: 브로커 접속
+    broadcast_bus_url: str = ""
+    broadcast_bus_replay_size: int = 1000  # 브로커가 방별로 보관해 새 워커에 재생할 이벤트 수
+
     # CORS
     cors_origins: list[str] = [
         "http://localhost:3000",
@@ -44,6 +103,30 @@ class Settings(BaseSettings):
     # STT 자동 시작 (방송중 채널 감지 시 자동 STT)
     stt_auto_start: bool = True
 
+    # 채널 STT 워커 프로세스 수 (0: API와 같은 프로세스에서 실행)
+    stt_worker_processes: int = 0
+    # 채널 배정: load(담당 채널이 가장 적은 워커) | hash(채널 ID 해시로 항상 같은 워커)
+    stt_worker_assignment: str = "load"
+    # Deepgram 전송 전 세그먼트 오디오 추출: ts(오디오만 남긴 TS) | adts(AAC 엘리멘터리) | off
+    stt_segment_audio: str = "ts"
+    # 서버가 지원하면 LL-HLS 차단 요청(_HLS_msn/_HLS_part)과 부분 세그먼트(#EXT-X-PART) 사용
+    stt_ll_hls: bool = True
+    # 세그먼트 동시 다운로드 수 (전송 순서는 플레이리스트 순서 유지)
+    stt_segment_downloads: int = 3
+    # Deepgram 전송 방식: segment(세그먼트 통째로)
+    #   | pcm(채널별 상시 ffmpeg로 16kHz PCM 디코딩 후 프레임 단위 전송)
+    stt_audio_mode: str = "segment"
+    stt_pcm_frame_ms: int = 100
+    # PCM 프레임을 실시간보다 앞서 보낼 수 있는 시간 (초, 0이면 정확히 실시간 속도)
+    # 세그먼트 길이 이상이면 도착한 세그먼트를 지연 없이 프레임으로 보냄
+    # (benchmarks/bench_pcm_first_interim.py: 0이면 첫 인터림이 평균 1초 이상 늦어짐)
+    stt_pcm_max_lead: float = 2.0
+    # PCM 모드에서 무음 구간 전송 생략 (Deepgram 과금 분량 절감, 차단 중 KeepAlive)
+    stt_vad: bool = True
+    stt_vad_threshold_db: float = -45.0  # 10ms 창 RMS가 이 레벨(dBFS)을 넘으면 말소리
+    # Deepgram 재연결 시 다시 보내기 위해 보관할 최근 세그먼트 수 (0: 재전송 안 함)
+    stt_replay_segments: int = 10
+
     # 서버
     debug: bool = False
 
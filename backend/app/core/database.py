@@ -2,8 +2,16 @@
 
 SQLAlchemy/asyncpg 대신 Supabase REST 클라이언트를 사용합니다.
 (Windows 한글 사용자명 환경에서 asyncpg SSL 인증서 로딩 오류 방지)
+
+Supabase 쿼리 빌더의 .execute()는 동기 HTTP 호출이므로,
+async 핸들러/서비스에서는 반드시 run_query()로 실행합니다.
+전용 스레드 풀에서 실행되어 실시간 STT/WebSocket 이벤트 루프를 막지 않습니다.
 """
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
 from sqlalchemy.orm import declarative_base
 from supabase import Client, create_client
 
@@ -15,6 +23,9 @@ Base = declarative_base()
 # Supabase Client (싱글톤)
 _supabase_client: Client | None = None
 
+# PostgREST 왕복 전용 스레드 풀 (기본 executor와 분리하여 다른 to_thread 작업과 경합 방지)
+_db_executor: ThreadPoolExecutor | None = None
+
 
 def get_supabase_client() -> Client:
     """Supabase 클라이언트 인스턴스를 반환합니다.
@@ -49,6 +60,43 @@ def get_supabase() -> Client:
 get_db = get_supabase
 
 
+def _get_db_executor() -> ThreadPoolExecutor:
+    """DB 전용 스레드 풀을 반환합니다 (최초 호출 시 생성)."""
+    global _db_executor
+
+    if _db_executor is None:
+        _db_executor = ThreadPoolExecutor(
+            max_workers=settings.db_max_workers,
+            thread_name_prefix="db",
+        )
+    return _db_executor
+
+
+async def run_query(query: Any) -> Any:
+    """Supabase 쿼리 빌더를 이벤트 루프 밖에서 실행합니다.
+
+    쿼리 체이닝(.table().select().eq()...)은 호출 측에서 그대로 구성하고,
+    마지막 .execute()만 DB 전용 스레드 풀에서 수행합니다.
+
+    Args:
+        query: .execute()를 가진 Supabase 쿼리 빌더
+
+    Returns:
+        .execute()의 반환값 (data, count 속성을 가진 응답)
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_db_executor(), query.execute)
+
+
+def shutdown_db_executor() -> None:
+    """DB 전용 스레드 풀을 종료합니다 (애플리케이션 shutdown 시 호출)."""
+    global _db_executor
+
+    if _db_executor is not None:
+        _db_executor.shutdown(wait=False, cancel_futures=True)
+        _db_executor = None
+
+
 async def test_supabase_connection() -> bool:
     """Supabase 연결을 테스트합니다.
 
@@ -57,7 +105,7 @@ async def test_supabase_connection() -> bool:
     """
     try:
         client = get_supabase_client()
-        client.table("meetings").select("id").limit(1).execute()
+        await run_query(client.table("meetings").select("id").limit(1))
         return True
     except Exception as e:
         print(f"Supabase 연결 실패: {e}")
@@ -20,10 +20,16 @@ from app.api.exports import router as exports_router
 from app.api.meetings import router as meetings_router
 from app.api.search import router as search_router
 from app.api.subtitles import router as subtitles_router
+from app.api.websocket import manager as ws_manager
 from app.api.websocket import router as websocket_router
 from app.core.config import settings
+from app.core.database import shutdown_db_executor
 from app.services.auto_stt import get_auto_stt_manager
+from app.services.dictionary import get_dictionary_reloader
+from app.services.live_subtitle_store import get_live_subtitle_writer
+from app.services.spacing import get_spacing_service
 from app.services.subtitle_corrector import get_subtitle_corrector
+from app.services.vod_stt_queue import get_vod_stt_queue
 
 logger = logging.getLogger(__name__)
 
@@ -46,19 +52,35 @@ async def _self_ping() -> None:
 async def lifespan(app: FastAPI):
     """애플리케이션 수명주기 관리 (startup/shutdown)."""
     # --- Startup ---
+    await ws_manager.start()
+
+    dictionary_reloader = get_dictionary_reloader()
+    await dictionary_reloader.start()
+
+    subtitle_writer = get_live_subtitle_writer()
+    await subtitle_writer.start()
+
     auto_stt = get_auto_stt_manager()
     await auto_stt.start()
 
     corrector = get_subtitle_corrector()
     await corrector.start()
 
+    # 재시작 전에 남은 VOD STT 작업은 마지막 완료 단계부터 이어서 처리
+    vod_stt_queue = get_vod_stt_queue()
+    await vod_stt_queue.start()
+
     # Railway 환경에서 App Sleeping 방지용 self-ping
     self_ping_task = None
     if os.environ.get("PORT"):
         self_ping_task = asyncio.create_task(_self_ping(), name="self-ping")
         logger.info("Self-ping task started (PORT=%s)", os.environ.get("PORT"))
 
-    logger.info("Application startup complete (auto_stt enabled=%s)", auto_stt.enabled)
+    logger.info(
+        "Application startup complete (auto_stt enabled=%s, producer=%s)",
+        auto_stt.enabled,
+        auto_stt.is_producer,
+    )
 
     yield
 
@@ -71,10 +93,21 @@ async def lifespan(app: FastAPI):
             pass
 
     await auto_stt.stop()
+    await vod_stt_queue.stop()
+    await get_spacing_service().stop()
+
+    await dictionary_reloader.stop()
 
     corrector_shutdown = get_subtitle_corrector()
     await corrector_shutdown.stop()
 
+    # STT/교정 중지 후 남은 자막과 회의 종료를 저장 (DB 스레드 풀 종료 전)
+    await subtitle_writer.stop()
+
+    await ws_manager.stop()
+
+    shutdown_db_executor()
+
     logger.info("Application shutdown complete")
 
 
@@ -11,6 +11,8 @@
 - Deepgram API 키 미설정 시 비활성화
 - stt_auto_start 설정으로 on/off 제어
 - 이미 실행 중인 채널은 중복 시작 방지
+- 멀티 워커(BROADCAST_BUS_URL)에서는 브로커가 선출한 리더 프로세스만 STT를 실행
+  (리더를 잃으면 모든 채널 STT를 중지하고, 새 리더가 방송중 채널을 이어서 시작)
 """
 
 from __future__ import annotations
@@ -18,8 +20,10 @@ from __future__ import annotations
 import asyncio
 import logging
 
+from app.api.websocket import manager
 from app.core.channels import CHANNELS, get_channel_by_code
 from app.core.config import settings
+from app.services.broadcast_bus import BroadcastBus, InProcessBus
 from app.services.channel_status import ChannelStatusService, get_channel_status_service
 from app.services.channel_stt import ChannelSttService, get_channel_stt_service
 
@@ -41,22 +45,34 @@ class AutoSttManager:
         self,
         status_service: ChannelStatusService,
         stt_service: ChannelSttService,
+        bus: BroadcastBus | None = None,
     ) -> None:
         self._status_service = status_service
         self._stt_service = stt_service
+        self._bus = bus if bus is not None else InProcessBus()
         self._monitor_task: asyncio.Task | None = None  # type: ignore[type-arg]
+        self._leadership_task: asyncio.Task | None = None  # type: ignore[type-arg]
+        self._leadership_lock = asyncio.Lock()
         self._enabled = settings.stt_auto_start and bool(settings.deepgram_api_key)
 
     @property
     def enabled(self) -> bool:
         return self._enabled
 
+    @property
+    def is_producer(self) -> bool:
+        """이 프로세스가 채널 STT를 실행하는지 (멀티 워커에서는 리더만)"""
+        return self._bus.is_leader
+
     async def start(self) -> None:
         """자동 STT 매니저를 시작합니다.
 
-        1. 현재 방송중인 채널에 STT 자동 시작
-        2. SSE 구독으로 상태 변경 모니터링 시작
+        1. STT 생산자 선출에 참여 (리더가 바뀌면 _on_leadership)
+        2. 리더이면 현재 방송중인 채널에 STT 자동 시작
+        3. SSE 구독으로 상태 변경 모니터링 시작
         """
+        self._bus.set_leader_handler(self._on_leadership)
+
         if not self._enabled:
             if not settings.deepgram_api_key:
                 logger.warning("AutoSttManager disabled: Deepgram API key not configured")
@@ -64,6 +80,17 @@ class AutoSttManager:
                 logger.info("AutoSttManager disabled: stt_auto_start=False")
             return
 
+        if not self.is_producer:
+            logger.info("AutoSttManager standby: waiting for STT producer leadership")
+            return
+
+        async with self._leadership_lock:
+            await self._start_producing()
+
+    async def _start_producing(self) -> None:
+        if self._monitor_task is not None and not self._monitor_task.done():
+            return
+
         logger.info("AutoSttManager starting: auto-start STT for broadcasting channels")
 
         # 1. 현재 방송중인 채널에 STT 시작
@@ -77,15 +104,50 @@ class AutoSttManager:
 
     async def stop(self) -> None:
         """자동 STT 매니저를 중지합니다."""
+        if self._leadership_task and not self._leadership_task.done():
+            self._leadership_task.cancel()
+            try:
+                await self._leadership_task
+            except asyncio.CancelledError:
+                pass
+        await self._stop_producing()
+        logger.info("AutoSttManager stopped (all channel STT cleaned up)")
+
+    async def _stop_producing(self) -> None:
         if self._monitor_task and not self._monitor_task.done():
             self._monitor_task.cancel()
             try:
                 await self._monitor_task
             except asyncio.CancelledError:
                 pass
+        self._monitor_task = None
         # 모든 활성 채널 STT 정리
         await self._stt_service.stop_all()
-        logger.info("AutoSttManager stopped (all channel STT cleaned up)")
+
+    def _on_leadership(self, leader: bool) -> None:
+        """버스가 리더 여부 변경을 알리면 STT를 시작/중지합니다 (이전 전환이 끝난 뒤 순서대로)."""
+        previous = self._leadership_task
+        self._leadership_task = asyncio.create_task(
+            self._apply_leadership(leader, previous), name="auto-stt-leadership"
+        )
+
+    async def _apply_leadership(
+        self,
+        leader: bool,
+        previous: asyncio.Task | None,  # type: ignore[type-arg]
+    ) -> None:
+        if previous is not None:
+            await asyncio.gather(previous, return_exceptions=True)
+        async with self._leadership_lock:
+            if leader != self.is_producer:
+                return  # 그 사이 다시 바뀜 (다음 전환이 처리)
+            if leader:
+                logger.info("AutoSTT: became STT producer")
+                if self._enabled:
+                    await self._start_producing()
+            else:
+                logger.info("AutoSTT: lost STT producer leadership -> stopping all channel STT")
+                await self._stop_producing()
 
     async def ensure_stt_for_live_channels(self) -> list[str]:
         """방송중인데 STT가 꺼진 채널을 보정합니다.
@@ -96,7 +158,7 @@ class AutoSttManager:
         Returns:
             새로 STT를 시작한 채널 ID 목록
         """
-        if not self._enabled:
+        if not self._enabled or not self.is_producer:
             return []
 
         started = []
@@ -224,5 +286,6 @@ def get_auto_stt_manager() -> AutoSttManager:
         _auto_stt_manager = AutoSttManager(
             status_service=get_channel_status_service(),
             stt_service=get_channel_stt_service(),
+            bus=manager.bus,
         )
     return _auto_stt_manager
@@ -0,0 +1,441 @@
+"""자막 브로드캐스트 버스
+
+ConnectionManager가 발행한 자막 이벤트를 각 워커의 WebSocket 팬아웃으로 전달합니다.
+
+- InProcessBus: 기본값. 같은 프로세스의 핸들러를 바로 호출 (uvicorn 워커 1개)
+- BrokerBus: BroadcastBroker에 Unix 소켓/TCP로 접속해 이벤트를 주고받음.
+  브로커가 방별 seq를 부여하고 최근 이벤트를 보관하므로, 여러 워커(또는 호스트)가
+  같은 순서·seq로 히스토리를 쌓고 새로 뜬 워커도 보관 이벤트로 동기화됩니다.
+
+이벤트 형식 (dict):
+    {"room": str, "type": str, "payload": dict, "seq": int (브로커/매니저가 부여)}
+
+브로커 프로토콜 (줄 단위 JSON):
+    워커 → 브로커: 이벤트 (seq 없음)
+    브로커 → 워커: 접속 직후 보관 이벤트 재생, 이후 실시간 이벤트 (seq 포함)
+
+STT 생산자 선출:
+    워커가 여러 개여도 채널 STT는 한 프로세스만 실행해야 합니다 (중복 자막/Deepgram 비용).
+    set_leader_handler()를 호출한 워커는 접속할 때마다 {"type": "leader_claim"}을 보내고,
+    브로커는 먼저 요청한 워커 하나에 {"type": "bus_leader", "leader": true}를 보냅니다.
+    리더와의 연결이 끊기면 다음 후보를 리더로 지정하고, 워커는 브로커와 끊기는 즉시
+    리더가 아닌 것으로 간주합니다 (InProcessBus는 항상 리더).
+
+브로커 실행:
+    cd backend
+    python -m app.services.broadcast_bus unix:///tmp/ggc-subtitle-bus.sock
+    (워커는 BROADCAST_BUS_URL=unix:///tmp/ggc-subtitle-bus.sock 으로 접속)
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# seq를 부여하고 히스토리/이벤트 로그에 남기는 이벤트
+SEQUENCED_TYPES = frozenset({"subtitle_created", "subtitle_corrected"})
+# 방 히스토리 초기화 (클라이언트에는 전송하지 않음)
+HISTORY_CLEARED = "history_cleared"
+# 브로커 (재)접속 직후 보관 이벤트 재생 전에 핸들러에 전달하는 로컬 이벤트
+BUS_RESYNC = "bus_resync"
+# STT 생산자 선출 (워커 → 브로커 요청, 브로커 → 워커 결과)
+LEADER_CLAIM = "leader_claim"
+BUS_LEADER = "bus_leader"
+
+# 한 줄(이벤트) 최대 크기
+_LINE_LIMIT = 1024 * 1024
+# 브로커가 구독 워커별로 쌓아둘 수 있는 미전송 바이트 (넘으면 끊고 재접속 시 재생)
+_SUBSCRIBER_BUFFER_LIMIT = 8 * 1024 * 1024
+
+EventHandler = Callable[[dict[str, Any]], None]
+LeaderHandler = Callable[[bool], None]
+
+
+def _encode_line(event: dict[str, Any]) -> bytes:
+    return json.dumps(event, separators=(",", ":"), ensure_ascii=False).encode() + b"\n"
+
+
+def parse_bus_url(url: str) -> tuple[str, Any]:
+    """버스 주소를 (scheme, address)로 변환합니다.
+
+    unix:///tmp/bus.sock → ("unix", "/tmp/bus.sock")
+    tcp://127.0.0.1:6390 → ("tcp", ("127.0.0.1", 6390))
+    """
+    parts = urlsplit(url)
+    if parts.scheme == "unix" and parts.path:
+        return "unix", parts.path
+    if parts.scheme == "tcp" and parts.hostname and parts.port:
+        return "tcp", (parts.hostname, parts.port)
+    raise ValueError(f"Unsupported broadcast bus url: {url!r}")
+
+
+async def _open_connection(url: str) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    scheme, address = parse_bus_url(url)
+    if scheme == "unix":
+        return await asyncio.open_unix_connection(address, limit=_LINE_LIMIT)
+    host, port = address
+    return await asyncio.open_connection(host, port, limit=_LINE_LIMIT)
+
+
+class BroadcastBus(ABC):
+    """브로드캐스트 버스 인터페이스"""
+
+    def __init__(self) -> None:
+        self._handler: EventHandler | None = None
+        self._leader_handler: LeaderHandler | None = None
+        self.is_leader = False  # 이 프로세스가 STT 생산자인지
+
+    def set_handler(self, handler: EventHandler) -> None:
+        """버스가 전달하는 이벤트를 받을 핸들러 (ConnectionManager._apply)"""
+        self._handler = handler
+
+    def set_leader_handler(self, handler: LeaderHandler) -> None:
+        """STT 생산자 선출에 참여하고 리더 여부가 바뀔 때 받을 핸들러 (AutoSttManager)"""
+        self._leader_handler = handler
+
+    @abstractmethod
+    def publish(self, event: dict[str, Any]) -> None:
+        """이벤트를 발행합니다 (블로킹 없음)."""
+
+    @abstractmethod
+    async def start(self) -> None:
+        """버스를 시작합니다."""
+
+    @abstractmethod
+    async def stop(self) -> None:
+        """버스를 종료합니다."""
+
+    def _set_leader(self, leader: bool) -> None:
+        if leader == self.is_leader:
+            return
+        self.is_leader = leader
+        logger.info("STT producer leadership %s", "acquired" if leader else "released")
+        if self._leader_handler is None:
+            return
+        try:
+            self._leader_handler(leader)
+        except Exception:
+            logger.exception("leader handler failed")
+
+    def _deliver(self, event: dict[str, Any]) -> None:
+        if self._handler is None:
+            return
+        try:
+            self._handler(event)
+        except Exception:
+            logger.exception("broadcast handler failed: type=%s", event.get("type"))
+
+
+class InProcessBus(BroadcastBus):
+    """같은 프로세스 안에서 바로 전달하는 버스 (기본값, 프로세스가 1개이므로 항상 리더)"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.is_leader = True
+
+    def publish(self, event: dict[str, Any]) -> None:
+        self._deliver(event)
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+
+class BrokerBus(BroadcastBus):
+    """BroadcastBroker에 접속하는 워커 측 버스
+
+    발행한 이벤트도 브로커를 한 바퀴 돌아 seq가 붙은 뒤 핸들러에 전달됩니다.
+    브로커와 끊겨 있는 동안 발행한 이벤트는 max_pending개까지 보관했다가 재접속 시 전송합니다.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        max_pending: int = 1000,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+    ) -> None:
+        super().__init__()
+        parse_bus_url(url)  # 잘못된 주소는 시작 전에 실패
+        self.url = url
+        self.max_pending = max_pending
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.connected = False
+        self.dropped = 0
+        self._pending: deque[bytes] = deque()
+        self._ready = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def publish(self, event: dict[str, Any]) -> None:
+        if len(self._pending) >= self.max_pending:
+            self.dropped += 1
+            if event.get("type") in SEQUENCED_TYPES:
+                logger.warning(
+                    "broadcast bus backlog full (%d), dropping %s: room=%s",
+                    self.max_pending, event.get("type"), event.get("room"),
+                )
+            return
+        self._pending.append(_encode_line(event))
+        self._ready.set()
+
+    def set_leader_handler(self, handler: LeaderHandler) -> None:
+        super().set_leader_handler(handler)
+        if self.connected:
+            # 이미 접속한 뒤라면 바로 요청 (접속 전이면 _run()이 접속 직후 요청)
+            self._pending.append(_encode_line({"type": LEADER_CLAIM}))
+            self._ready.set()
+
+    async def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="broadcast-bus")
+            logger.info("BrokerBus started: %s", self.url)
+
+    async def stop(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        self.connected = False
+        self._set_leader(False)
+        logger.info("BrokerBus stopped")
+
+    async def _run(self) -> None:
+        """브로커 접속 유지 루프 (지수 백오프 재접속)"""
+        delay = self.reconnect_delay
+        while True:
+            writer: asyncio.StreamWriter | None = None
+            try:
+                reader, writer = await _open_connection(self.url)
+                self.connected = True
+                delay = self.reconnect_delay
+                logger.info("connected to broadcast broker: %s", self.url)
+                if self._leader_handler is not None:
+                    writer.write(_encode_line({"type": LEADER_CLAIM}))
+                # 보관 이벤트 재생 전에 로컬 상태를 다시 맞추도록 알림
+                self._deliver({"type": BUS_RESYNC})
+                await self._pump(reader, writer)
+            except asyncio.CancelledError:
+                raise
+            except (OSError, ConnectionError, asyncio.IncompleteReadError, ValueError) as e:
+                logger.warning("broadcast broker connection lost (%s), retry in %.1fs", e, delay)
+            finally:
+                self.connected = False
+                # 끊긴 동안 브로커가 다른 워커를 리더로 지정할 수 있으므로 바로 내려놓음
+                self._set_leader(False)
+                if writer is not None:
+                    writer.close()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    async def _pump(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        sender = asyncio.create_task(self._send_loop(writer))
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    raise ConnectionError("broker closed the connection")
+                if sender.done():
+                    sender.result()  # 전송 실패 예외 전파
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning("invalid broadcast event from broker: %r", line[:200])
+                    continue
+                if event.get("type") == BUS_LEADER:
+                    self._set_leader(bool(event.get("leader")))
+                    continue
+                self._deliver(event)
+        finally:
+            sender.cancel()
+
+    async def _send_loop(self, writer: asyncio.StreamWriter) -> None:
+        while True:
+            if not self._pending:
+                self._ready.clear()
+                await self._ready.wait()
+                continue
+            writer.write(self._pending[0])
+            await writer.drain()
+            # 전송이 끝난 뒤에 제거 (도중에 끊기면 재접속 후 다시 전송)
+            self._pending.popleft()
+
+
+class BroadcastBroker:
+    """워커 간 자막 이벤트 중계 브로커
+
+    - 모든 워커의 이벤트를 한 곳에서 순서대로 받아 방별 seq를 부여
+    - 방별로 최근 replay_size개의 seq 이벤트를 보관하고, 접속한 워커에 먼저 재생
+    - 쓰기 버퍼가 쌓인 느린 워커는 끊음 (재접속 시 보관 이벤트로 다시 동기화)
+    - leader_claim을 보낸 워커 중 가장 먼저 요청한 워커를 STT 생산자로 지정
+    """
+
+    def __init__(self, url: str, replay_size: int = 1000) -> None:
+        parse_bus_url(url)
+        self.url = url
+        self.replay_size = max(1, replay_size)
+        self._last_seq: dict[str, int] = {}
+        self._log: dict[str, deque[bytes]] = {}
+        self._subscribers: set[asyncio.StreamWriter] = set()
+        self._candidates: list[asyncio.StreamWriter] = []  # 리더 후보 (요청 순, 첫 번째가 리더)
+        self._server: asyncio.AbstractServer | None = None
+
+    async def start(self) -> None:
+        scheme, address = parse_bus_url(self.url)
+        if scheme == "unix":
+            if os.path.exists(address):
+                os.unlink(address)  # 이전 실행이 남긴 소켓 파일
+            self._server = await asyncio.start_unix_server(
+                self._handle, address, limit=_LINE_LIMIT
+            )
+        else:
+            host, port = address
+            self._server = await asyncio.start_server(
+                self._handle, host, port, limit=_LINE_LIMIT
+            )
+        logger.info("BroadcastBroker listening on %s", self.url)
+
+    async def stop(self) -> None:
+        for writer in list(self._subscribers):
+            writer.close()
+        self._subscribers.clear()
+        self._candidates.clear()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        logger.info("BroadcastBroker stopped")
+
+    async def serve_forever(self) -> None:
+        await self.start()
+        assert self._server is not None
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        # 보관 이벤트 재생 후 구독 등록 (사이에 await가 없으므로 순서가 섞이지 않음)
+        for log in self._log.values():
+            for line in log:
+                writer.write(line)
+        self._subscribers.add(writer)
+        logger.info("broker subscriber connected: total=%d", len(self._subscribers))
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning("invalid event from worker: %r", line[:200])
+                    continue
+                if not isinstance(event, dict):
+                    continue
+                if event.get("type") == LEADER_CLAIM:
+                    self._claim_leader(writer)
+                elif event.get("room"):
+                    self._dispatch(event)
+        except (OSError, ConnectionError, ValueError):
+            pass
+        finally:
+            self._subscribers.discard(writer)
+            self._release_leader(writer)
+            writer.close()
+            logger.info("broker subscriber disconnected: total=%d", len(self._subscribers))
+
+    def _claim_leader(self, writer: asyncio.StreamWriter) -> None:
+        if writer not in self._candidates:
+            self._candidates.append(writer)
+        leader = self._candidates[0] is writer
+        writer.write(_encode_line({"type": BUS_LEADER, "leader": leader}))
+        if leader:
+            logger.info("STT producer elected: candidates=%d", len(self._candidates))
+
+    def _release_leader(self, writer: asyncio.StreamWriter) -> None:
+        if writer not in self._candidates:
+            return
+        was_leader = self._candidates[0] is writer
+        self._candidates.remove(writer)
+        if was_leader and self._candidates:
+            self._candidates[0].write(_encode_line({"type": BUS_LEADER, "leader": True}))
+            logger.info("STT producer handed over: candidates=%d", len(self._candidates))
+
+    def _dispatch(self, event: dict[str, Any]) -> None:
+        room_id = event["room"]
+        event_type = event.get("type")
+
+        if event_type in SEQUENCED_TYPES:
+            last = self._last_seq.get(room_id)
+            if last is None:
+                # 브로커 재시작 후에도 이전 seq보다 커지도록 현재 시각(ms)에서 시작
+                last = int(time.time() * 1000)
+            event["seq"] = last + 1
+            self._last_seq[room_id] = last + 1
+            line = _encode_line(event)
+            log = self._log.get(room_id)
+            if log is None:
+                log = deque(maxlen=self.replay_size)
+                self._log[room_id] = log
+            log.append(line)
+        else:
+            if event_type == HISTORY_CLEARED:
+                self._log.pop(room_id, None)
+            line = _encode_line(event)
+
+        for writer in list(self._subscribers):
+            if writer.transport.get_write_buffer_size() > _SUBSCRIBER_BUFFER_LIMIT:
+                logger.warning("dropping slow broker subscriber")
+                self._subscribers.discard(writer)
+                self._release_leader(writer)
+                writer.close()
+                continue
+            writer.write(line)
+
+
+def create_broadcast_bus(url: str) -> BroadcastBus:
+    """설정값에 맞는 버스를 만듭니다 (빈 값이면 프로세스 내부 버스)."""
+    if not url:
+        return InProcessBus()
+    return BrokerBus(url)
+
+
+def main() -> None:
+    from app.core.config import settings
+
+    parser = argparse.ArgumentParser(description="자막 브로드캐스트 브로커")
+    parser.add_argument(
+        "url",
+        nargs="?",
+        default=settings.broadcast_bus_url or "unix:///tmp/ggc-subtitle-bus.sock",
+        help="unix:///path/to.sock 또는 tcp://host:port",
+    )
+    parser.add_argument("--replay-size", type=int, default=settings.broadcast_bus_replay_size)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s:     %(name)s - %(message)s")
+    broker = BroadcastBroker(args.url, replay_size=args.replay_size)
+    try:
+        asyncio.run(broker.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
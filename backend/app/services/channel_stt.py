@@ -4,9 +4,12 @@
 WebSocket으로 브라우저에 브로드캐스트합니다.
 
 파이프라인:
-  m3u8 fetch → 새 세그먼트 감지 → TS 다운로드
+  m3u8 fetch → 새 세그먼트 감지 → TS 다운로드 → 오디오만 추출 (영상 패킷 제거)
+  (감시/다운로드/전송은 segment_pipeline에서 큐로 분리)
        → Deepgram WebSocket으로 바이트 스트리밍 → 실시간 텍스트 수신
        → 브라우저 WebSocket broadcast
+  재연결 시 확정 결과를 못 받은 최근 세그먼트를 다시 보내고 (segment_ring),
+  이미 내보낸 구간의 결과는 스트림 시각으로 걸러냅니다.
 """
 
 from __future__ import annotations
@@ -14,67 +17,40 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-import os
 import re
-import shutil
-import sys
 import time
 import uuid
 from datetime import datetime, timezone
+from typing import TYPE_CHECKING
 
 import httpx
 import websockets
 
-from kiwipiepy import Kiwi
-
 from app.api.websocket import manager
 from app.core.config import settings
 from app.services.dictionary import get_default_dictionary
 from app.services.subtitle_corrector import get_subtitle_corrector
 from app.services.hls_parser import HlsPlaylistParser
+from app.services.live_subtitle_store import get_live_subtitle_writer
+from app.services.pcm_stream import PcmStreamer, ffmpeg_pcm_command
+from app.services.segment_pipeline import SegmentPipeline
+from app.services.segment_ring import SegmentRing
+from app.services.spacing import get_spacing_service
 from app.services.speaker_utils import group_words_by_speaker
+from app.services.ts_demux import TsAudioExtractor
+from app.services.vad import SilenceGate
 
-logger = logging.getLogger(__name__)
-
-
-def _create_kiwi() -> Kiwi:
-    """Kiwi 인스턴스를 생성합니다.
-
-    Windows에서 사용자명에 한글 등 비ASCII 문자가 포함된 경우
-    kiwipiepy C++ 엔진이 모델 파일을 열지 못하는 문제를 우회합니다.
-    기본 경로로 먼저 시도하고, 실패 시 모델을 ASCII-safe 경로로 복사합니다.
-    """
-    try:
-        return Kiwi()
-    except Exception:
-        logger.warning("Kiwi default init failed (non-ASCII path?), copying model to safe path")
-
-    try:
-        import kiwipiepy_model
-
-        src = os.path.dirname(kiwipiepy_model.__file__)
-        # Windows의 %TEMP%도 비ASCII 경로일 수 있으므로 ASCII-safe 경로 사용
-        if sys.platform == "win32":
-            safe_dir = os.path.join("C:\\", "tmp", "kiwi_model")
-        else:
-            safe_dir = os.path.join("/tmp", "kiwi_model")
-        if not os.path.exists(safe_dir):
-            os.makedirs(os.path.dirname(safe_dir), exist_ok=True)
-            shutil.copytree(src, safe_dir)
-        return Kiwi(model_path=safe_dir)
-    except Exception:
-        logger.error("Kiwi init failed even with safe path, spacing will be disabled")
-        return None  # type: ignore[return-value]
+if TYPE_CHECKING:
+    from app.services.stt_workers import SttWorkerSupervisor
 
+logger = logging.getLogger(__name__)
 
-# 한국어 띄어쓰기 교정을 위한 Kiwi 싱글톤 인스턴스
-_kiwi: Kiwi | None = _create_kiwi()
 
 # 의회 용어 사전 (STT 오인식 보정)
 _dictionary = get_default_dictionary()
 
-# m3u8 폴링 간격 (초) - 낮을수록 자막 지연 감소 (최소 HLS 세그먼트 주기 이상 권장)
-POLL_INTERVAL = 2.0
+# PCM 모드 샘플레이트 (Hz)
+PCM_SAMPLE_RATE = 16000
 # Deepgram KeepAlive 간격 (초)
 KEEPALIVE_INTERVAL = 8.0
 # Deepgram WebSocket URL
@@ -149,6 +125,83 @@ class _SentenceBuffer:
         self.conf_count = 0
 
 
+class _InterimProcessor:
+    """발화 1개의 인터림 결과를 증분 처리합니다.
+
+    Deepgram 인터림은 같은 발화의 앞부분이 유지된 채 길어지므로,
+    띄어쓰기가 끝난 안정 구간(앞부분)을 캐시하고 바뀐 끝부분만 다시 Kiwi로 처리합니다.
+    끝의 STABLE_MARGIN_WORDS 단어는 Deepgram이 고칠 수 있어 캐시하지 않으며,
+    구간은 원문의 공백에서만 나눕니다. 사전 교정은 구간 경계에 걸친 용어도 고치도록
+    합친 전체 문장에 적용합니다 (Aho-Corasick 1회 순회라 Kiwi에 비해 비용이 작음).
+    원문이나 처리 결과가 직전과 같으면 None을 반환해 중복 브로드캐스트를 막습니다.
+    """
+
+    STABLE_MARGIN_WORDS = 2
+
+    def __init__(self) -> None:
+        self.received = 0
+        self.duplicates = 0
+        self.chars_received = 0
+        self.chars_processed = 0
+        self.reset()
+
+    def reset(self) -> None:
+        """발화가 끝나면(is_final) 캐시를 비웁니다."""
+        self._raw_prefix = ""
+        self._spaced_prefix = ""
+        self._last_raw: str | None = None
+        self._last_text: str | None = None
+
+    async def process(self, raw: str) -> str | None:
+        self.received += 1
+        self.chars_received += len(raw)
+        if raw == self._last_raw:
+            self.duplicates += 1
+            return None
+        self._last_raw = raw
+
+        if not raw.startswith(self._raw_prefix):
+            # 앞부분이 수정됨 → 처음부터 다시 처리
+            self._raw_prefix = ""
+            self._spaced_prefix = ""
+
+        rest = raw[len(self._raw_prefix):]
+        gaps = list(_WHITESPACE.finditer(rest))
+        cut = gaps[-self.STABLE_MARGIN_WORDS].end() if len(gaps) >= self.STABLE_MARGIN_WORDS else 0
+        stable, tail = rest[:cut], rest[cut:]
+
+        parts = [part for part in (stable, tail) if part.strip()]
+        self.chars_processed += sum(len(part) for part in parts)
+        spaced = await get_spacing_service().space_many(parts)
+
+        if stable:
+            self._raw_prefix += stable
+            if stable.strip():
+                self._spaced_prefix = _join_words(self._spaced_prefix, spaced.pop(0))
+        text = _dictionary.correct(_join_words(self._spaced_prefix, spaced[0] if spaced else ""))
+
+        if text == self._last_text:
+            self.duplicates += 1
+            return None
+        self._last_text = text
+        return text
+
+    def get_metrics(self) -> dict:
+        return {
+            "received": self.received,
+            "duplicates": self.duplicates,
+            "chars_received": self.chars_received,
+            "chars_processed": self.chars_processed,
+        }
+
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _join_words(head: str, tail: str) -> str:
+    return f"{head} {tail}" if head and tail else head or tail
+
+
 class ChannelSttService:
     """채널 HLS 스트림을 모니터링하며 실시간 자막을 생성합니다.
 
@@ -165,6 +218,12 @@ class ChannelSttService:
         self._parsers: dict[str, HlsPlaylistParser] = {}
         self._subtitle_counter: dict[str, int] = {}
         self._sentence_buffers: dict[str, _SentenceBuffer] = {}
+        self._interim_processors: dict[str, _InterimProcessor] = {}
+        self._audio_extractors: dict[str, TsAudioExtractor] = {}
+        self._pipelines: dict[str, SegmentPipeline] = {}
+        self._pcm_streamers: dict[str, PcmStreamer] = {}
+        self._vad_gates: dict[str, SilenceGate] = {}
+        self._rings: dict[str, SegmentRing] = {}
         self._last_receive_time: dict[str, float] = {}
         self._last_error: dict[str, str] = {}
         self._reconnect_count: dict[str, int] = {}
@@ -182,10 +241,13 @@ class ChannelSttService:
             return
 
         logger.info("Starting STT for channel %s: %s", channel_id, stream_url)
+        # Kiwi 워커 풀 워밍업 (첫 자막 전에 모델 로딩 완료)
+        get_spacing_service().start()
 
-        parser = HlsPlaylistParser()
+        parser = HlsPlaylistParser(ll_hls=settings.stt_ll_hls)
         self._parsers[channel_id] = parser
         self._subtitle_counter[channel_id] = 0
+        self._rings[channel_id] = SegmentRing(settings.stt_replay_segments)
         self._last_receive_time[channel_id] = time.monotonic()
 
         task = asyncio.create_task(
@@ -213,8 +275,14 @@ class ChannelSttService:
         buf = self._sentence_buffers.pop(channel_id, None)
         if buf:
             buf.clear()
+        self._interim_processors.pop(channel_id, None)
+        self._audio_extractors.pop(channel_id, None)
+        self._pipelines.pop(channel_id, None)
+        self._pcm_streamers.pop(channel_id, None)
+        self._vad_gates.pop(channel_id, None)
+        self._rings.pop(channel_id, None)
         # 자막 히스토리 정리 (방송 종료 시 이전 자막 초기화)
-        manager.clear_history(channel_id)
+        self._on_stopped(channel_id)
         logger.info("Stopped STT for channel %s", channel_id)
 
     async def stop_all(self) -> None:
@@ -247,8 +315,37 @@ class ChannelSttService:
             "subtitle_count": subtitle_count,
             "buffer_text": buf.text[:100] if buf and buf.parts else None,
             "active_ws_rooms": list(manager.active_connections.keys()),
+            "ws_queue": manager.get_queue_metrics(channel_id),
+            "ws_interim": manager.get_interim_metrics(channel_id),
             "last_error": self._last_error.get(channel_id),
             "reconnect_count": self._reconnect_count.get(channel_id, 0),
+            "spacing": get_spacing_service().get_metrics(),
+            "persist": get_live_subtitle_writer().get_metrics(),
+            "interim": (
+                self._interim_processors[channel_id].get_metrics()
+                if channel_id in self._interim_processors else None
+            ),
+            "hls": (
+                self._parsers[channel_id].get_metrics() if channel_id in self._parsers else None
+            ),
+            "pipeline": (
+                self._pipelines[channel_id].get_metrics() if channel_id in self._pipelines else None
+            ),
+            "pcm": (
+                self._pcm_streamers[channel_id].get_metrics()
+                if channel_id in self._pcm_streamers else None
+            ),
+            "vad": (
+                self._vad_gates[channel_id].get_metrics()
+                if channel_id in self._vad_gates else None
+            ),
+            "replay": (
+                self._rings[channel_id].get_metrics() if channel_id in self._rings else None
+            ),
+            "segment_audio": (
+                self._audio_extractors[channel_id].get_metrics()
+                if channel_id in self._audio_extractors else None
+            ),
         }
 
     async def _run_with_reconnect(
@@ -298,6 +395,9 @@ class ChannelSttService:
             f"&endpointing=300"
             f"&diarize=true"
         )
+        if settings.stt_audio_mode == "pcm":
+            # 세그먼트 대신 ffmpeg로 디코딩한 PCM 프레임 전송
+            ws_url += f"&encoding=linear16&sample_rate={PCM_SAMPLE_RATE}&channels=1"
         headers = {"Authorization": f"Token {settings.deepgram_api_key}"}
         http_client = httpx.AsyncClient(timeout=30.0)
 
@@ -343,41 +443,84 @@ class ChannelSttService:
         http_client: httpx.AsyncClient,
         dg_ws: websockets.ClientConnection,
     ) -> None:
-        """HLS 세그먼트를 다운로드하여 Deepgram WebSocket에 전송합니다."""
-        while True:
-            try:
-                all_segments = await parser.fetch_segments(stream_url)
-                new_segments = parser.get_new_segments(all_segments)
-
-                for segment_url in new_segments:
-                    try:
-                        response = await http_client.get(segment_url)
-                        response.raise_for_status()
-                        ts_bytes = response.content
-
-                        logger.info(
-                            "Channel %s: sending segment %s (%d bytes)",
-                            channel_id,
-                            segment_url.split("/")[-1],
-                            len(ts_bytes),
-                        )
-
-                        # TS 바이트를 Deepgram WebSocket에 전송
-                        await dg_ws.send(ts_bytes)
+        """HLS 세그먼트를 다운로드하여 Deepgram WebSocket에 전송합니다.
 
-                    except Exception as e:
-                        logger.warning(
-                            "Channel %s: segment download/send failed: %s",
-                            channel_id,
-                            e,
-                        )
-
-            except asyncio.CancelledError:
-                raise
-            except Exception as e:
-                logger.warning("Channel %s: poll failed: %s", channel_id, e)
+        플레이리스트 감시, 다운로드(순서 유지 동시 다운로드), 전송을 분리한 파이프라인으로
+        느린 다운로드가 앞 세그먼트 전송이나 폴링을 지연시키지 않습니다.
+        이전 세션에서 확정 결과를 받지 못한 세그먼트는 새 세그먼트보다 먼저 다시 보냅니다.
+        """
+        ring = self._rings.setdefault(channel_id, SegmentRing(settings.stt_replay_segments))
+        replay = ring.start_session()
+        extractor = None
+        if settings.stt_segment_audio != "off":
+            # PAT/PMT 상태는 재연결 후에도 유지 (PAT 없이 시작하는 세그먼트 대비)
+            extractor = self._audio_extractors.setdefault(
+                channel_id, TsAudioExtractor(output=settings.stt_segment_audio)
+            )
+        if settings.stt_audio_mode != "pcm":
+            pipeline = SegmentPipeline(
+                channel_id,
+                stream_url,
+                parser,
+                http_client,
+                dg_ws.send,
+                extractor=extractor,
+                downloads=settings.stt_segment_downloads,
+                ring=ring,
+                replay=replay,
+            )
+            self._pipelines[channel_id] = pipeline
+            await pipeline.run()
+            return
 
-            await asyncio.sleep(POLL_INTERVAL)
+        # PCM 모드: 세그먼트 → 상시 ffmpeg → 실시간 페이싱 PCM 프레임
+        # TS 세그먼트를 그대로(오디오만 남긴 TS) 보낼 때만 형식을 지정하고,
+        # packed audio 렌디션, adts 출력(AAC가 아니면 TS로 대체), 첫 연결은 ffmpeg가 판별
+        input_format = None
+        if parser.playlist is not None and parser.playlist.container == "ts":
+            if not (extractor and extractor.output == "adts"):
+                input_format = "mpegts"
+        send = dg_ws.send
+        self._vad_gates.pop(channel_id, None)
+        if settings.stt_vad:
+            # 무음 프레임은 보내지 않고 KeepAlive로 연결 유지 (타임스탬프는 수신 시 보정)
+            gate = SilenceGate(
+                dg_ws.send,
+                threshold_db=settings.stt_vad_threshold_db,
+                sample_rate=PCM_SAMPLE_RATE,
+            )
+            self._vad_gates[channel_id] = gate
+            send = gate.send
+        streamer = PcmStreamer(
+            send,
+            sample_rate=PCM_SAMPLE_RATE,
+            frame_ms=settings.stt_pcm_frame_ms,
+            max_lead=settings.stt_pcm_max_lead,
+            command=ffmpeg_pcm_command(PCM_SAMPLE_RATE, input_format),
+        )
+        # 재전송분은 실시간 페이싱 없이 몰아서
+        streamer.burst(sum(entry.duration for entry in replay))
+        pipeline = SegmentPipeline(
+            channel_id,
+            stream_url,
+            parser,
+            http_client,
+            streamer.feed,
+            extractor=extractor,
+            downloads=settings.stt_segment_downloads,
+            ring=ring,
+            replay=replay,
+        )
+        self._pipelines[channel_id] = pipeline
+        self._pcm_streamers[channel_id] = streamer
+        await streamer.start()
+        try:
+            # 디코더나 파이프라인 중 하나라도 실패하면 둘 다 종료 → 재연결
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(pipeline.run())
+                tg.create_task(streamer.run())
+        finally:
+            await streamer.close()
 
     async def _receive_transcripts(
         self,
@@ -392,6 +535,8 @@ class ChannelSttService:
         """
         buffer = self._sentence_buffers.setdefault(channel_id, _SentenceBuffer())
         buffer.clear()
+        interim = self._interim_processors.setdefault(channel_id, _InterimProcessor())
+        interim.reset()
 
         async for message in dg_ws:
             try:
@@ -413,7 +558,16 @@ class ChannelSttService:
                     continue
 
                 # 인터림 결과 처리 (확정 전 미리보기 자막)
+                ring = self._rings.get(channel_id)
+                result_start = self._to_stream_time(channel_id, data.get("start", 0.0))
+                result_end = self._to_stream_time(
+                    channel_id, data.get("start", 0.0) + data.get("duration", 0.0)
+                )
+
                 if not data.get("is_final", False):
+                    if ring is not None and ring.is_duplicate(result_start, result_end):
+                        # 재전송분 중 이미 자막으로 내보낸 구간
+                        continue
                     alt_interim = alternatives[0]
                     interim_transcript = alt_interim.get("transcript", "").strip()
                     logger.debug(
@@ -421,32 +575,30 @@ class ChannelSttService:
                         channel_id, interim_transcript[:60], len(interim_transcript),
                     )
                     if interim_transcript and len(interim_transcript) > 2:
-                        # 한국어 띄어쓰기 교정 적용
-                        if _kiwi is not None:
-                            try:
-                                interim_transcript = _kiwi.space(interim_transcript)
-                                interim_transcript = re.sub(r"\s{2,}", " ", interim_transcript).strip()
-                            except Exception:
-                                pass
-                        # 의회 용어 사전 보정
-                        interim_transcript = _dictionary.correct(interim_transcript)
-                        await manager.broadcast_interim_subtitle(channel_id, {
-                            "text": interim_transcript,
-                            "channel_id": channel_id,
-                        })
+                        # 띄어쓰기/사전 교정 (안정 구간은 캐시, 바뀐 끝부분만 처리)
+                        interim_text = await interim.process(interim_transcript)
+                        if interim_text is not None:
+                            await self._publish_interim(channel_id, {
+                                "text": interim_text,
+                                "channel_id": channel_id,
+                            })
                     continue
 
+                # 확정 결과 → 다음 인터림은 새 발화
+                interim.reset()
+
                 alt = alternatives[0]
 
                 # words 배열에서 화자 경계별로 분할하여 처리
                 words = alt.get("words", [])
+                transcript = alt.get("transcript", "").strip()
                 if words:
-                    speaker_groups = group_words_by_speaker(words)
-                else:
+                    words = self._drop_replayed_words(channel_id, words)
+                    speaker_groups = group_words_by_speaker(words) if words else []
+                elif transcript and not (
+                    ring is not None and ring.is_duplicate(result_start, result_end)
+                ):
                     # words가 없는 경우 폴백
-                    transcript = alt.get("transcript", "").strip()
-                    if not transcript:
-                        continue
                     start_time = data.get("start", 0.0)
                     duration = data.get("duration", 5.0)
                     speaker_groups = [{
@@ -456,13 +608,16 @@ class ChannelSttService:
                         "start": start_time,
                         "end": start_time + duration,
                     }]
+                else:
+                    speaker_groups = []
 
                 for group in speaker_groups:
                     transcript = group["text"]
                     speaker = group["speaker"]
                     confidence = group["confidence"]
-                    start_time = group["start"]
-                    end_time = group["end"]
+                    # VAD로 건너뛴 무음과 세션 시작 위치만큼 보정한 스트림 시각
+                    start_time = self._to_stream_time(channel_id, group["start"])
+                    end_time = self._to_stream_time(channel_id, group["end"])
 
                     if not transcript:
                         continue
@@ -488,14 +643,46 @@ class ChannelSttService:
                         await self._emit_subtitle(channel_id, buffer)
                         buffer.clear()
 
+                if ring is not None:
+                    # 버퍼에 남은 (아직 자막으로 안 나간) 구간은 재연결 시 다시 받도록 그 앞까지만
+                    ring.ack(buffer.start_time if buffer.parts else result_end)
+
             except json.JSONDecodeError:
                 logger.warning("Channel %s: invalid JSON from Deepgram", channel_id)
 
         # 연결 종료 시 남은 버퍼 플러시
         if buffer.parts:
             await self._emit_subtitle(channel_id, buffer)
+            ring = self._rings.get(channel_id)
+            if ring is not None:
+                ring.ack(buffer.end_time)
             buffer.clear()
 
+    def _to_stream_time(self, channel_id: str, seconds: float) -> float:
+        """Deepgram 타임스탬프(현재 세션이 받은 오디오 기준) → 채널 스트림 시각"""
+        gate = self._vad_gates.get(channel_id)
+        if gate is not None:
+            seconds = gate.to_stream_time(seconds)
+        ring = self._rings.get(channel_id)
+        if ring is not None:
+            seconds = ring.to_stream_time(seconds)
+        return seconds
+
+    def _drop_replayed_words(self, channel_id: str, words: list[dict]) -> list[dict]:
+        """재전송한 오디오 중 이미 자막으로 내보낸 구간의 단어를 제거합니다."""
+        ring = self._rings.get(channel_id)
+        if ring is None or not ring.acked:
+            return words
+        kept = [
+            word for word in words
+            if not ring.is_duplicate(
+                self._to_stream_time(channel_id, word.get("start", 0.0)),
+                self._to_stream_time(channel_id, word.get("end", 0.0)),
+            )
+        ]
+        ring.duplicates_dropped += len(words) - len(kept)
+        return kept
+
     async def _emit_subtitle(
         self, channel_id: str, buffer: _SentenceBuffer
     ) -> None:
@@ -511,17 +698,8 @@ class ChannelSttService:
         )
 
         # 한국어 띄어쓰기 교정 (Deepgram 한국어 스트리밍에서 띄어쓰기가 누락되는 문제 해결)
-        raw_text = buffer.text
-        if _kiwi is not None:
-            try:
-                spaced_text = _kiwi.space(raw_text)
-                # 연속 공백 정리 (kiwi가 과도한 공백을 삽입할 수 있음)
-                spaced_text = re.sub(r"\s{2,}", " ", spaced_text).strip()
-            except Exception:
-                logger.warning("Channel %s: kiwi.space() failed, using raw text", channel_id)
-                spaced_text = raw_text
-        else:
-            spaced_text = raw_text
+        # (Kiwi 워커 풀에서 실행, 실패 시 원문 사용)
+        spaced_text = await get_spacing_service().space(buffer.text)
 
         # 의회 용어 사전 보정 (STT 오인식 교정)
         spaced_text = _dictionary.correct(spaced_text)
@@ -547,17 +725,19 @@ class ChannelSttService:
             speaker_label or "?",
         )
 
-        await manager.broadcast_subtitle(channel_id, subtitle_data)
+        await self._publish_subtitle(channel_id, subtitle_data)
 
-        # OpenAI 자막 교정 큐에 추가 (비동기, 논블로킹)
-        corrector = get_subtitle_corrector()
-        if corrector.enabled:
-            await corrector.enqueue(
-                subtitle_id=subtitle_data["subtitle"]["id"],
-                channel_id=channel_id,
-                text=spaced_text,
-                speaker=speaker_label,
-            )
+    # --- 웹 계층으로 결과 전달 (STT 워커 프로세스에서는 supervisor로 전달하도록 재정의) ---
+
+    async def _publish_interim(self, channel_id: str, interim_data: dict) -> None:
+        await manager.broadcast_interim_subtitle(channel_id, interim_data)
+
+    async def _publish_subtitle(self, channel_id: str, subtitle_data: dict) -> None:
+        await publish_subtitle(channel_id, subtitle_data)
+
+    def _on_stopped(self, channel_id: str) -> None:
+        manager.clear_history(channel_id)
+        get_live_subtitle_writer().end_meeting(channel_id)
 
     async def _send_keepalive(
         self,
@@ -595,13 +775,41 @@ class ChannelSttService:
                 return
 
 
+async def publish_subtitle(channel_id: str, subtitle_data: dict) -> None:
+    """확정 자막을 브라우저에 브로드캐스트하고 DB 저장/OpenAI 교정 큐에 추가합니다."""
+    await manager.broadcast_subtitle(channel_id, subtitle_data)
+
+    # DB 저장은 큐에 넣기만 함 (write-behind, 브로드캐스트 경로에 DB 왕복 없음)
+    get_live_subtitle_writer().enqueue(channel_id, subtitle_data["subtitle"])
+
+    # OpenAI 자막 교정 큐에 추가 (비동기, 논블로킹)
+    corrector = get_subtitle_corrector()
+    if corrector.enabled:
+        subtitle = subtitle_data["subtitle"]
+        await corrector.enqueue(
+            subtitle_id=subtitle["id"],
+            channel_id=channel_id,
+            text=subtitle["text"],
+            speaker=subtitle["speaker"],
+        )
+
+
 # 전역 싱글톤 인스턴스
-_channel_stt_service: ChannelSttService | None = None
+_channel_stt_service: ChannelSttService | SttWorkerSupervisor | None = None
 
 
-def get_channel_stt_service() -> ChannelSttService:
-    """ChannelSttService 싱글톤 인스턴스를 반환합니다."""
+def get_channel_stt_service() -> ChannelSttService | SttWorkerSupervisor:
+    """채널 STT 서비스 싱글톤 인스턴스를 반환합니다.
+
+    STT_WORKER_PROCESSES > 0이면 채널 파이프라인을 별도 워커 프로세스에서 실행하는
+    SttWorkerSupervisor를, 아니면 API와 같은 이벤트 루프의 ChannelSttService를 사용합니다.
+    """
     global _channel_stt_service
     if _channel_stt_service is None:
-        _channel_stt_service = ChannelSttService()
+        if settings.stt_worker_processes > 0:
+            from app.services.stt_workers import SttWorkerSupervisor
+
+            _channel_stt_service = SttWorkerSupervisor(settings.stt_worker_processes)
+        else:
+            _channel_stt_service = ChannelSttService()
     return _channel_stt_service
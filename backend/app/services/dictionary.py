@@ -1,11 +1,27 @@
 """용어 사전 기반 후처리 서비스
 
 용어 교정 및 의원 이름 교정을 위한 서비스입니다.
+
+교정은 사전 항목을 Aho-Corasick 오토마톤으로 컴파일하여 텍스트를 한 번만 훑습니다.
+겹치는 후보가 있으면 가장 왼쪽에서 시작하는 것 중 가장 긴 항목이 우선합니다
+(leftmost-longest). 따라서 결과가 사전 등록 순서와 무관합니다.
+
+기본 사전은 프로세스 전역 싱글톤이며, DictionaryReloader가 DB dictionary 테이블을
+주기적으로 확인하여 버전이 바뀌면 백그라운드에서 다시 읽고 재컴파일합니다.
 """
 
-from dataclasses import dataclass, field
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
 from typing import Literal
 
+from app.core.config import settings
+from app.core.database import get_supabase_client, run_query
+
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class DictionaryEntry:
@@ -22,12 +38,115 @@ class DictionaryEntry:
     category: Literal["councilor", "term", "general"] | None = None
 
 
+class _AhoCorasickMatcher:
+    """wrong_text → correct_text 치환용 leftmost-longest Aho-Corasick 오토마톤
+
+    노드는 배열 인덱스로 표현합니다.
+    - _goto[n]: 문자 → 자식 노드
+    - _fail[n]: 실패 링크
+    - _depth[n]: 루트로부터의 문자열 길이
+    - _longest[n]: n의 문자열 접미사 중 가장 긴 패턴의 인덱스 (-1이면 없음)
+    """
+
+    def __init__(self, patterns: list[tuple[str, str]]) -> None:
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._depth: list[int] = [0]
+        self._longest: list[int] = [-1]
+        self._patterns = [(w, c) for w, c in patterns if w]
+        self._lengths = [len(w) for w, _ in self._patterns]
+
+        for idx, (wrong, _) in enumerate(self._patterns):
+            node = 0
+            for ch in wrong:
+                nxt = self._goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._depth.append(self._depth[node] + 1)
+                    self._longest.append(-1)
+                node = nxt
+            self._longest[node] = idx
+
+        # BFS로 실패 링크 구성 (깊이 순이므로 부모의 fail이 항상 먼저 확정됨)
+        queue = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                f = self._fail[node]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                self._fail[child] = self._goto[f].get(ch, 0)
+                if self._longest[child] == -1:
+                    self._longest[child] = self._longest[self._fail[child]]
+
+    def replace(self, text: str) -> str:
+        """겹치지 않는 leftmost-longest 매치를 모두 치환합니다."""
+        goto = self._goto
+        fail = self._fail
+        depth = self._depth
+        longest = self._longest
+        lengths = self._lengths
+
+        parts: list[str] = []
+        emitted = 0  # text[:emitted]는 이미 parts에 반영됨
+        best_start = -1
+        best_idx = -1
+        node = 0
+        i = 0
+        n = len(text)
+
+        while True:
+            if i < n:
+                ch = text[i]
+                while node and ch not in goto[node]:
+                    node = fail[node]
+                node = goto[node].get(ch, 0)
+
+                idx = longest[node]
+                if idx != -1:
+                    start = i + 1 - lengths[idx]
+                    if (
+                        best_idx == -1
+                        or start < best_start
+                        or (start == best_start and lengths[idx] > lengths[best_idx])
+                    ):
+                        best_start, best_idx = start, idx
+
+                i += 1
+                # 이후 매치는 i - depth 이후에서만 시작할 수 있으므로 그보다 앞선 후보는 확정
+                if best_idx == -1 or best_start >= i - depth[node]:
+                    continue
+            elif best_idx == -1:
+                break
+
+            parts.append(text[emitted:best_start])
+            parts.append(self._patterns[best_idx][1])
+            emitted = best_start + lengths[best_idx]
+            # 확정된 매치 직후부터 다시 스캔 (최대 패턴 길이 이내만 재방문)
+            i = emitted
+            node = 0
+            best_start = best_idx = -1
+
+        if not parts:
+            return text
+        parts.append(text[emitted:])
+        return "".join(parts)
+
+
 class DictionaryService:
     """사전 기반 텍스트 교정 서비스
 
     용어 사전을 기반으로 텍스트를 교정합니다.
     - wrong_text -> correct_text 변환
     - 의원 이름, 의회 용어 등 교정
+
+    항목은 최초 교정 시 오토마톤으로 컴파일되며, 항목이 바뀔 때만 다시 컴파일됩니다.
     """
 
     def __init__(self, entries: list[DictionaryEntry] | None = None):
@@ -37,6 +156,7 @@ class DictionaryService:
             entries: 초기 사전 항목 목록
         """
         self._entries: dict[str, DictionaryEntry] = {}
+        self._matcher: _AhoCorasickMatcher | None = None
         if entries:
             for entry in entries:
                 self._entries[entry.wrong_text] = entry
@@ -45,6 +165,8 @@ class DictionaryService:
         """텍스트 교정
 
         사전에 등록된 잘못된 텍스트를 올바른 텍스트로 교정합니다.
+        텍스트를 한 번만 훑으며, 겹치는 항목은 leftmost-longest 규칙으로 선택합니다.
+        치환 결과는 다시 교정 대상이 되지 않습니다.
 
         Args:
             text: 교정할 텍스트
@@ -52,14 +174,33 @@ class DictionaryService:
         Returns:
             교정된 텍스트
         """
-        if not text:
+        if not text or not self._entries:
             return text
 
-        result = text
-        for wrong_text, entry in self._entries.items():
-            result = result.replace(wrong_text, entry.correct_text)
+        return self._get_matcher().replace(text)
+
+    def _get_matcher(self) -> _AhoCorasickMatcher:
+        """컴파일된 오토마톤을 반환합니다 (항목 변경 후 첫 호출 시 재컴파일)."""
+        matcher = self._matcher
+        if matcher is None:
+            matcher = _AhoCorasickMatcher(
+                [(wrong, entry.correct_text) for wrong, entry in self._entries.items()]
+            )
+            self._matcher = matcher
+        return matcher
+
+    def compile(self) -> None:
+        """오토마톤을 즉시 컴파일합니다 (스레드에서 미리 컴파일할 때 사용)."""
+        self._get_matcher()
 
-        return result
+    def load_from(self, other: DictionaryService) -> None:
+        """다른 서비스의 항목과 컴파일된 오토마톤을 그대로 가져옵니다.
+
+        기존 참조(모듈 전역 등)를 유지한 채 사전 내용을 교체할 때 사용합니다.
+        """
+        matcher = other._get_matcher()
+        self._entries = dict(other._entries)
+        self._matcher = matcher
 
     def add_entry(self, entry: DictionaryEntry) -> None:
         """사전 항목 추가
@@ -68,6 +209,7 @@ class DictionaryService:
             entry: 추가할 사전 항목
         """
         self._entries[entry.wrong_text] = entry
+        self._matcher = None
 
     def remove_entry(self, wrong_text: str) -> bool:
         """사전 항목 제거
@@ -80,6 +222,7 @@ class DictionaryService:
         """
         if wrong_text in self._entries:
             del self._entries[wrong_text]
+            self._matcher = None
             return True
         return False
 
@@ -109,6 +252,7 @@ class DictionaryService:
     def clear(self) -> None:
         """모든 사전 항목 제거"""
         self._entries.clear()
+        self._matcher = None
 
     def __len__(self) -> int:
         """사전 항목 개수"""
@@ -147,6 +291,120 @@ _PARLIAMENT_ENTRIES = [
 ]
 
 
+# 프로세스 전역 기본 사전 (DictionaryReloader가 내용을 교체)
+_default_dictionary: DictionaryService | None = None
+
+
 def get_default_dictionary() -> DictionaryService:
-    """경기도의회 기본 사전이 탑재된 DictionaryService 싱글톤을 반환합니다."""
-    return DictionaryService(entries=_PARLIAMENT_ENTRIES)
+    """경기도의회 기본 사전이 탑재된 DictionaryService 싱글톤을 반환합니다.
+
+    반환된 인스턴스는 공유되므로 호출 측에서 항목을 추가/삭제하지 마세요.
+    추가 항목이 필요하면 get_entries()로 새 DictionaryService를 만드세요.
+    """
+    global _default_dictionary
+    if _default_dictionary is None:
+        _default_dictionary = DictionaryService(entries=_PARLIAMENT_ENTRIES)
+    return _default_dictionary
+
+
+class DictionaryReloader:
+    """DB dictionary 테이블 → 기본 사전 핫 리로드
+
+    - dictionary_version.version을 주기적으로 조회 (쿼리 1회, 행 1개)
+    - 버전이 바뀌었을 때만 전체 항목을 읽고 스레드에서 오토마톤을 컴파일
+    - 컴파일이 끝난 뒤 싱글톤 내용을 한 번에 교체 (자막 경로에는 비용 없음)
+    - DB 항목은 내장 _PARLIAMENT_ENTRIES 위에 덮어씁니다 (같은 wrong_text는 DB 우선)
+    """
+
+    def __init__(
+        self,
+        dictionary: DictionaryService | None = None,
+        interval: float | None = None,
+    ) -> None:
+        self._dictionary = dictionary if dictionary is not None else get_default_dictionary()
+        self._interval = (
+            interval if interval is not None else settings.dictionary_reload_interval
+        )
+        self._version: int | None = None
+        self._task: asyncio.Task | None = None  # type: ignore[type-arg]
+
+    @property
+    def version(self) -> int | None:
+        """마지막으로 반영한 DB 사전 버전"""
+        return self._version
+
+    async def start(self) -> None:
+        """백그라운드 리로드 루프를 시작합니다."""
+        if self._interval <= 0 or (self._task and not self._task.done()):
+            return
+        if not settings.supabase_url or not settings.supabase_key:
+            logger.info("DictionaryReloader disabled (Supabase not configured)")
+            return
+        self._task = asyncio.create_task(self._loop(), name="dictionary-reloader")
+        logger.info("DictionaryReloader started (interval=%.0fs)", self._interval)
+
+    async def stop(self) -> None:
+        """백그라운드 리로드 루프를 중지합니다."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await self.reload_if_changed()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("사전 리로드 실패: %s", e)
+            await asyncio.sleep(self._interval)
+
+    async def reload_if_changed(self) -> bool:
+        """DB 사전 버전이 바뀌었으면 다시 읽어 교체합니다.
+
+        Returns:
+            사전을 교체했는지 여부
+        """
+        supabase = get_supabase_client()
+        version_result = await run_query(
+            supabase.table("dictionary_version").select("version").eq("id", 1).limit(1)
+        )
+        version = version_result.data[0]["version"] if version_result.data else 0
+        if version == self._version:
+            return False
+
+        rows_result = await run_query(
+            supabase.table("dictionary").select("wrong_text, correct_text, category")
+        )
+        entries = list(_PARLIAMENT_ENTRIES)
+        for row in rows_result.data or []:
+            wrong_text = row.get("wrong_text")
+            correct_text = row.get("correct_text")
+            if wrong_text and correct_text is not None:
+                entries.append(DictionaryEntry(wrong_text, correct_text, row.get("category")))
+
+        staged = DictionaryService(entries=entries)
+        await asyncio.to_thread(staged.compile)
+        self._dictionary.load_from(staged)
+
+        logger.info(
+            "사전 리로드 완료: version %s -> %s (%d개 항목)",
+            self._version, version, len(self._dictionary),
+        )
+        self._version = version
+        return True
+
+
+_reloader: DictionaryReloader | None = None
+
+
+def get_dictionary_reloader() -> DictionaryReloader:
+    """DictionaryReloader 싱글톤 인스턴스를 반환합니다."""
+    global _reloader
+    if _reloader is None:
+        _reloader = DictionaryReloader()
+    return _reloader
@@ -7,10 +7,12 @@ import logging
 
 from supabase import Client
 
+from app.core.database import run_query
+
 logger = logging.getLogger(__name__)
 
 
-def record_subtitle_change(
+async def record_subtitle_change(
     supabase: Client,
     subtitle_id: str,
     field_name: str,
@@ -31,14 +33,14 @@ def record_subtitle_change(
     }
 
     try:
-        result = supabase.table("subtitle_history").insert(data).execute()
+        result = await run_query(supabase.table("subtitle_history").insert(data))
         return result.data[0] if result.data else None
     except Exception as e:
         logger.warning("이력 기록 실패 (subtitle_id=%s): %s", subtitle_id, e)
         return None
 
 
-def record_changes_for_update(
+async def record_changes_for_update(
     supabase: Client,
     subtitle_id: str,
     original: dict,
@@ -50,7 +52,7 @@ def record_changes_for_update(
     for field_name, new_value in update_data.items():
         old_value = original.get(field_name)
         if str(old_value) != str(new_value) if old_value is not None else new_value is not None:
-            record = record_subtitle_change(
+            record = await record_subtitle_change(
                 supabase, subtitle_id, field_name, str(old_value) if old_value is not None else None, str(new_value), changed_by
             )
             if record:
@@ -58,18 +60,17 @@ def record_changes_for_update(
     return records
 
 
-def get_subtitle_history(
+async def get_subtitle_history(
     supabase: Client,
     subtitle_id: str,
 ) -> list[dict]:
     """자막의 변경 이력을 조회합니다."""
     try:
-        result = (
+        result = await run_query(
             supabase.table("subtitle_history")
             .select("*")
             .eq("subtitle_id", subtitle_id)
             .order("created_at", desc=True)
-            .execute()
         )
         return result.data
     except Exception as e:
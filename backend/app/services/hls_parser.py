@@ -1,92 +1,470 @@
 """HLS 플레이리스트 파서
 
-m3u8 플레이리스트에서 TS 세그먼트 URL을 추출하고,
-새로 추가된 세그먼트만 필터링합니다.
+m3u8 플레이리스트에서 TS 세그먼트를 추출하고,
+#EXT-X-MEDIA-SEQUENCE 기준으로 새로 추가된 세그먼트만 필터링합니다.
+채널당 상태는 다음 시퀀스 번호와 마지막 세그먼트 URI뿐이라 방송 시간과 무관하게 일정합니다.
 
-마스터 플레이리스트 (#EXT-X-STREAM-INF) 감지 시
-첫 번째 미디어 플레이리스트로 자동 리다이렉트합니다.
+마스터 플레이리스트 (#EXT-X-STREAM-INF) 감지 시 STT에 필요한 오디오만 받도록
+렌디션을 골라 미디어 플레이리스트로 자동 리다이렉트합니다.
+  1. 오디오 전용 렌디션 (#EXT-X-MEDIA TYPE=AUDIO URI=..., DEFAULT=YES 우선)
+     fMP4(#EXT-X-MAP)면 세그먼트를 단독으로 디코딩할 수 없으므로 건너뜀
+  2. CODECS가 오디오뿐인 변형 (#EXT-X-STREAM-INF)
+  3. BANDWIDTH가 가장 낮은 변형
+
+폴링 간격은 #EXT-X-TARGETDURATION과 마지막 갱신 시각으로 다음 세그먼트 예상 시각에 맞추고,
+내용이 그대로면 짧게 재시도 후 점점 늘립니다. LL-HLS 서버(CAN-BLOCK-RELOAD=YES)에는
+_HLS_msn/_HLS_part 차단 요청을 보내고, #EXT-X-PART 부분 세그먼트를 완성 전에 넘겨줍니다.
 """
 
 from __future__ import annotations
 
 import logging
-from urllib.parse import urljoin
+import re
+import time
+import zlib
+from dataclasses import dataclass, field
+from datetime import datetime
+from urllib.parse import urljoin, urlsplit
 
 import httpx
 
 logger = logging.getLogger(__name__)
 
+# KEY=VALUE 또는 KEY="VALUE, 쉼표 포함"
+_ATTRIBUTE = re.compile(r'([A-Z0-9-]+)=("[^"]*"|[^,]*)')
+_AUDIO_CODECS = ("mp4a", "ac-3", "ec-3", "opus", "mp3", "flac")
+# 세그먼트 확장자 → 컨테이너 (그 외는 ts)
+_SEGMENT_CONTAINERS = {
+    ".aac": "aac", ".mp3": "mp3", ".ac3": "ac3", ".ec3": "eac3",
+    ".m4s": "fmp4", ".mp4": "fmp4", ".m4a": "fmp4",
+}
+
+DEFAULT_POLL_INTERVAL = 2.0  # TARGETDURATION을 모를 때 (초)
+MIN_POLL_INTERVAL = 0.5
+
+
+def parse_attributes(line: str) -> dict[str, str]:
+    """#EXT-X-...: 태그의 속성 목록을 dict로 변환합니다 (따옴표 제거)."""
+    _, _, attrs = line.partition(":")
+    return {key: value.strip('"') for key, value in _ATTRIBUTE.findall(attrs)}
+
+
+def _is_audio_only(codecs: str) -> bool:
+    names = [c.strip().lower() for c in codecs.split(",") if c.strip()]
+    return bool(names) and all(n.startswith(_AUDIO_CODECS) for n in names)
+
+
+def _segment_container(uri: str) -> str:
+    path = urlsplit(uri).path.lower()
+    dot = path.rfind(".")
+    return _SEGMENT_CONTAINERS.get(path[dot:], "ts") if dot > path.rfind("/") else "ts"
+
+
+@dataclass
+class HlsSegment:
+    """미디어 플레이리스트의 세그먼트 1개
+
+    Attributes:
+        uri: 절대 URL
+        sequence: 미디어 시퀀스 번호
+        duration: #EXTINF 길이 (초)
+        discontinuity: 앞에 #EXT-X-DISCONTINUITY가 있었는지
+        program_date_time: #EXT-X-PROGRAM-DATE-TIME (없으면 None)
+        part: LL-HLS 부분 세그먼트(#EXT-X-PART)면 세그먼트 안의 순번
+    """
+
+    uri: str
+    sequence: int
+    duration: float
+    discontinuity: bool = False
+    program_date_time: datetime | None = None
+    part: int | None = None
+
+
+@dataclass
+class MediaPlaylist:
+    """미디어 플레이리스트 파싱 결과"""
+
+    media_sequence: int = 0
+    target_duration: float | None = None
+    discontinuity_sequence: int = 0
+    ended: bool = False
+    segments: list[HlsSegment] = field(default_factory=list)
+    # 세그먼트 컨테이너: ts | fmp4 | aac | mp3 | ac3 | eac3 (packed audio)
+    container: str = "ts"
+    # LL-HLS
+    can_block_reload: bool = False
+    part_target: float | None = None
+    parts: list[HlsSegment] = field(default_factory=list)
+
+
+def parse_media_playlist(text: str, base_url: str) -> MediaPlaylist:
+    """미디어 플레이리스트를 한 번 순회하며 태그와 세그먼트를 해석합니다."""
+    playlist = MediaPlaylist()
+    part_index = 0
+    duration = 0.0
+    discontinuity = False
+    program_date_time: datetime | None = None
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        # 다음에 나올 세그먼트의 시퀀스 (부분 세그먼트도 이 번호에 속함)
+        sequence = playlist.media_sequence + len(playlist.segments)
+        if not line.startswith("#"):
+            playlist.segments.append(HlsSegment(
+                uri=urljoin(base_url, line),
+                sequence=sequence,
+                duration=duration,
+                discontinuity=discontinuity,
+                program_date_time=program_date_time,
+            ))
+            part_index = 0
+            duration = 0.0
+            discontinuity = False
+            program_date_time = None
+            continue
+        tag, _, value = line.partition(":")
+        try:
+            if tag == "#EXTINF":
+                duration = float(value.split(",", 1)[0])
+            elif tag == "#EXT-X-MEDIA-SEQUENCE":
+                playlist.media_sequence = int(value)
+            elif tag == "#EXT-X-TARGETDURATION":
+                playlist.target_duration = float(value)
+            elif tag == "#EXT-X-DISCONTINUITY-SEQUENCE":
+                playlist.discontinuity_sequence = int(value)
+            elif tag == "#EXT-X-DISCONTINUITY":
+                discontinuity = True
+            elif tag == "#EXT-X-PROGRAM-DATE-TIME":
+                program_date_time = datetime.fromisoformat(value.replace("Z", "+00:00"))
+            elif tag == "#EXT-X-ENDLIST":
+                playlist.ended = True
+            elif tag == "#EXT-X-MAP":
+                playlist.container = "fmp4"
+            elif tag == "#EXT-X-SERVER-CONTROL":
+                playlist.can_block_reload = parse_attributes(line).get("CAN-BLOCK-RELOAD") == "YES"
+            elif tag == "#EXT-X-PART-INF":
+                playlist.part_target = float(parse_attributes(line)["PART-TARGET"])
+            elif tag == "#EXT-X-PART":
+                attrs = parse_attributes(line)
+                playlist.parts.append(HlsSegment(
+                    uri=urljoin(base_url, attrs["URI"]),
+                    sequence=sequence,
+                    duration=float(attrs.get("DURATION", 0)),
+                    part=part_index,
+                ))
+                part_index += 1
+        except (KeyError, ValueError):
+            logger.debug("Ignoring malformed playlist tag: %s", line)
+    if playlist.container != "fmp4" and playlist.segments:
+        playlist.container = _segment_container(playlist.segments[0].uri)
+    return playlist
+
+
+def _bandwidth(variant: dict[str, str]) -> float:
+    try:
+        return int(variant["BANDWIDTH"])
+    except (KeyError, ValueError):
+        return float("inf")
+
 
 class HlsPlaylistParser:
-    """m3u8 플레이리스트를 파싱하여 세그먼트 URL을 추출합니다.
+    """m3u8 플레이리스트를 파싱하여 세그먼트를 추출합니다.
 
     - 마스터 플레이리스트 → 미디어 플레이리스트 자동 해석
     - 상대 경로 → 절대 URL 변환
-    - 이미 처리한 세그먼트 추적 (중복 방지)
+    - 미디어 시퀀스로 이미 처리한 세그먼트 추적 (중복 방지, 메모리 일정)
+    - 플레이리스트 재시작(시퀀스 되감기, 인코더 재시작) 감지
+    - 다음 세그먼트 예상 시각에 맞춘 폴링 간격, LL-HLS 차단 요청/부분 세그먼트
+
+    Args:
+        ll_hls: 서버가 지원하면 차단 요청과 부분 세그먼트 사용
     """
 
-    def __init__(self) -> None:
-        self._seen_segments: set[str] = set()
+    def __init__(self, ll_hls: bool = True) -> None:
+        self.ll_hls = ll_hls
         self._client = httpx.AsyncClient(timeout=10.0)
         self._media_playlist_url: str | None = None
+        self.rendition: dict[str, str] | None = None  # 선택한 렌디션 (디버그용)
+        self.playlist: MediaPlaylist | None = None  # 마지막으로 받은 플레이리스트
+        self._playlist_crc: int | None = None
+        # 다음에 넘겨줄 시퀀스와 마지막으로 넘겨준 세그먼트
+        self._next_sequence: int | None = None
+        self._next_part = 0  # _next_sequence 세그먼트에서 이미 넘겨준 부분 세그먼트 수
+        self._last_uri: str | None = None
+        # 폴링 스케줄
+        self._changed_at = 0.0
+        self._unchanged_polls = 0
+        self._blocking = False
+        # 지표
+        self.requests = 0
+        self.blocking_requests = 0
+        self.restarts = 0
+        self.skipped = 0
+        self.discontinuities = 0
+        self.last_delay: float | None = None
 
-    async def fetch_segments(self, playlist_url: str) -> list[str]:
-        """m3u8 URL을 다운로드하여 세그먼트 URL 목록을 반환합니다.
+    async def fetch_playlist(self, playlist_url: str) -> MediaPlaylist:
+        """m3u8 URL을 다운로드하여 미디어 플레이리스트를 반환합니다.
 
-        마스터 플레이리스트인 경우 첫 번째 미디어 플레이리스트를 따라갑니다.
+        마스터 플레이리스트인 경우 오디오 전용(없으면 최저 비트레이트) 렌디션을 따라갑니다.
         """
         # 이미 미디어 플레이리스트 URL을 알고 있으면 바로 사용
         url = self._media_playlist_url or playlist_url
 
-        response = await self._client.get(url)
+        self.requests += 1
+        response = await self._client.get(url, **self._blocking_reload())
         response.raise_for_status()
         text = response.text
 
         # 마스터 플레이리스트 감지 (#EXT-X-STREAM-INF 존재)
         if "#EXT-X-STREAM-INF" in text and self._media_playlist_url is None:
-            media_url = self._extract_media_playlist(text, url)
+            master = text
+            media_url = self._extract_media_playlist(master, url)
             if media_url:
-                logger.info("Master playlist detected, using media: %s", media_url)
+                response = await self._fetch_media_playlist(media_url)
+                if (
+                    self.rendition is not None
+                    and self.rendition.get("TYPE") == "AUDIO"
+                    and parse_media_playlist(response.text, media_url).container == "fmp4"
+                ):
+                    # fMP4 세그먼트는 초기화 세그먼트 없이 디코딩할 수 없음 → 변형 중에서 다시 고름
+                    fallback = self._extract_media_playlist(master, url, media_renditions=False)
+                    if fallback:
+                        logger.info("Audio rendition is fMP4, falling back to variants")
+                        media_url = fallback
+                        response = await self._fetch_media_playlist(media_url)
+                logger.info(
+                    "Master playlist detected, using %s rendition: %s",
+                    self.rendition.get("kind") if self.rendition else None,
+                    media_url,
+                )
                 self._media_playlist_url = media_url
-                # 미디어 플레이리스트 다시 fetch
-                response = await self._client.get(media_url)
-                response.raise_for_status()
                 text = response.text
 
-        return self._parse_segments(text, self._media_playlist_url or playlist_url)
+        # 내용이 그대로면 다시 파싱하지 않음 (새 세그먼트 없음)
+        crc = zlib.crc32(response.content)
+        if crc != self._playlist_crc or self.playlist is None:
+            self.playlist = parse_media_playlist(text, self._media_playlist_url or playlist_url)
+            self._playlist_crc = crc
+            self._changed_at = time.monotonic()
+            self._unchanged_polls = 0
+        else:
+            self._unchanged_polls += 1
+        self._blocking = self.ll_hls and self.playlist.can_block_reload
+        return self.playlist
 
-    def _extract_media_playlist(self, text: str, base_url: str) -> str | None:
-        """마스터 플레이리스트에서 첫 번째 미디어 플레이리스트 URL을 추출합니다."""
-        for line in text.splitlines():
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            # 첫 번째 비주석 라인이 미디어 플레이리스트
-            return urljoin(base_url, line)
-        return None
+    async def _fetch_media_playlist(self, media_url: str) -> httpx.Response:
+        self.requests += 1
+        response = await self._client.get(media_url)
+        response.raise_for_status()
+        return response
+
+    def next_poll_delay(self) -> float:
+        """다음 플레이리스트 요청까지 기다릴 시간 (초)
 
-    def _parse_segments(self, text: str, base_url: str) -> list[str]:
-        """미디어 플레이리스트 텍스트에서 세그먼트 URL을 추출합니다."""
-        segments: list[str] = []
+        - 갱신 직후: 마지막 세그먼트(LL-HLS는 부분 세그먼트) 길이만큼 뒤, 즉 다음 예상 시각
+        - 그대로면: 0.5초부터 두 배씩 늘려 TARGETDURATION의 절반까지
+        - 차단 요청: 서버가 다음 세그먼트까지 응답을 미루므로 바로 요청
+        """
+        playlist = self.playlist
+        if playlist is None or playlist.target_duration is None:
+            delay = DEFAULT_POLL_INTERVAL
+        elif self._blocking and self._unchanged_polls == 0:
+            delay = 0.0
+        elif playlist.ended:
+            delay = playlist.target_duration
+        elif self._unchanged_polls == 0:
+            expected = playlist.target_duration
+            if self.ll_hls and playlist.parts and playlist.part_target:
+                expected = playlist.part_target
+            elif playlist.segments and playlist.segments[-1].duration:
+                expected = playlist.segments[-1].duration
+            delay = max(self._changed_at + expected - time.monotonic(), MIN_POLL_INTERVAL)
+        else:
+            delay = min(
+                MIN_POLL_INTERVAL * 2 ** (self._unchanged_polls - 1),
+                max(playlist.target_duration / 2, MIN_POLL_INTERVAL),
+            )
+        self.last_delay = delay
+        return delay
+
+    def _blocking_reload(self) -> dict:
+        """LL-HLS 차단 요청 인자 (_HLS_msn/_HLS_part 쿼리와 늘린 타임아웃)"""
+        playlist = self.playlist
+        if not self._blocking or playlist is None:
+            return {}
+        next_msn = playlist.media_sequence + len(playlist.segments)
+        params = {"_HLS_msn": next_msn}
+        if playlist.parts:
+            last = playlist.parts[-1]
+            if last.sequence == next_msn:
+                params["_HLS_part"] = (last.part or 0) + 1
+            else:
+                params["_HLS_part"] = 0
+        self.blocking_requests += 1
+        # 서버는 최대 TARGETDURATION의 3배까지 응답을 미룰 수 있음
+        return {"params": params, "timeout": max(10.0, (playlist.target_duration or 0) * 3)}
+
+    def _extract_media_playlist(
+        self, text: str, base_url: str, media_renditions: bool = True
+    ) -> str | None:
+        """마스터 플레이리스트에서 STT에 쓸 미디어 플레이리스트 URL을 고릅니다.
+
+        media_renditions가 False면 #EXT-X-MEDIA 오디오 렌디션을 건너뛰고 변형 중에서 고릅니다.
+        """
+        audio_media: list[dict[str, str]] = []
+        variants: list[dict[str, str]] = []
+        pending: dict[str, str] | None = None
         for line in text.splitlines():
             line = line.strip()
-            if not line or line.startswith("#"):
+            if not line:
                 continue
-            # .ts 세그먼트만 필터링
-            absolute_url = urljoin(base_url, line)
-            segments.append(absolute_url)
+            if line.startswith("#EXT-X-MEDIA:"):
+                attrs = parse_attributes(line)
+                if media_renditions and attrs.get("TYPE") == "AUDIO" and attrs.get("URI"):
+                    audio_media.append(attrs)
+            elif line.startswith("#EXT-X-STREAM-INF:"):
+                pending = parse_attributes(line)
+            elif not line.startswith("#"):
+                # STREAM-INF 다음 비주석 라인이 변형의 URI
+                variant = pending if pending is not None else {}
+                variant["URI"] = line
+                variants.append(variant)
+                pending = None
+
+        chosen: dict[str, str] | None = None
+        if audio_media:
+            # 같은 그룹에 여러 언어가 있으면 기본 렌디션
+            chosen = next((m for m in audio_media if m.get("DEFAULT") == "YES"), audio_media[0])
+            chosen = {**chosen, "kind": "audio"}
+        else:
+            audio_only = [v for v in variants if _is_audio_only(v.get("CODECS", ""))]
+            candidates = audio_only or variants
+            if candidates:
+                # BANDWIDTH가 없으면 가장 뒤로, 같으면 먼저 나온 변형
+                chosen = min(candidates, key=_bandwidth)
+                chosen = {**chosen, "kind": "audio" if audio_only else "lowest"}
+
+        self.rendition = chosen
+        return urljoin(base_url, chosen["URI"]) if chosen else None
+
+    def get_new_segments(self, playlist: MediaPlaylist) -> list[HlsSegment]:
+        """이전에 처리하지 않은 새 세그먼트만 반환합니다.
+
+        LL-HLS면 아직 완성되지 않은 세그먼트의 부분 세그먼트도 포함하고,
+        부분을 이미 넘겨준 세그먼트는 완성본 대신 남은 부분만 넘겨줍니다.
+        """
+        full = self._select_new(playlist) if playlist.segments else []
+        if full and full[0].sequence != self._next_sequence:
+            self._next_part = 0  # 재시작/건너뜀 → 진행 중이던 부분 세그먼트 무효
+
+        use_parts = self.ll_hls and bool(playlist.parts)
+        new: list[HlsSegment] = []
+        for segment in full:
+            if use_parts and segment.sequence == self._next_sequence and self._next_part:
+                rest = [
+                    p for p in playlist.parts
+                    if p.sequence == segment.sequence and (p.part or 0) >= self._next_part
+                ]
+                if not any(p.sequence == segment.sequence for p in playlist.parts):
+                    # 부분 목록이 이미 빠짐 → 완성본을 보내면 앞부분이 중복되므로 건너뜀
+                    self.skipped += 1
+                    logger.warning("Parts of segment %d expired, skipping", segment.sequence)
+                new.extend(rest)
+            else:
+                new.append(segment)
+            self._next_part = 0
+        if full:
+            self._next_sequence = full[-1].sequence + 1
+            self._last_uri = full[-1].uri
+            self.discontinuities += sum(1 for s in full if s.discontinuity)
+
+        if use_parts:
+            # 마지막 완성 세그먼트 뒤 진행 중인 세그먼트의 부분들
+            in_progress = playlist.media_sequence + len(playlist.segments)
+            if self._next_sequence is None or self._next_sequence < in_progress:
+                self._next_sequence, self._next_part = in_progress, 0
+            if self._next_sequence == in_progress:
+                parts = [
+                    p for p in playlist.parts
+                    if p.sequence == in_progress and (p.part or 0) >= self._next_part
+                ]
+                if parts:
+                    new.extend(parts)
+                    self._next_part = (parts[-1].part or 0) + 1
+        return new
+
+    def _select_new(self, playlist: MediaPlaylist) -> list[HlsSegment]:
+        segments = playlist.segments
+        if self._next_sequence is None:
+            return segments
+        if self._last_uri is None:
+            # 부분 세그먼트만 넘겨준 상태
+            return [s for s in segments if s.sequence >= self._next_sequence]
+
+        last_index = self._next_sequence - 1 - playlist.media_sequence
+        if 0 <= last_index < len(segments) and segments[last_index].uri == self._last_uri:
+            return segments[last_index + 1:]
+
+        # 시퀀스로 찾지 못하면 마지막 URI로 재동기화 (MEDIA-SEQUENCE를 안 주는 서버)
+        for i, segment in enumerate(segments):
+            if segment.uri == self._last_uri:
+                return segments[i + 1:]
+
+        if playlist.media_sequence >= self._next_sequence:
+            # 폴링이 늦어 창 밖으로 밀려난 세그먼트
+            skipped = playlist.media_sequence - self._next_sequence
+            if skipped:
+                self.skipped += skipped
+                logger.warning("Playlist moved past %d unprocessed segments", skipped)
+            return segments
+
+        # 시퀀스가 되감겼거나 같은 번호에 다른 세그먼트 → 플레이리스트 재시작
+        self.restarts += 1
+        logger.info(
+            "Playlist restarted (sequence %d → %d)",
+            self._next_sequence,
+            playlist.media_sequence,
+        )
         return segments
 
-    def get_new_segments(self, all_segments: list[str]) -> list[str]:
-        """이전에 처리하지 않은 새 세그먼트만 반환합니다."""
-        new_segments = [s for s in all_segments if s not in self._seen_segments]
-        self._seen_segments.update(new_segments)
-        return new_segments
+    def get_metrics(self) -> dict:
+        playlist = self.playlist
+        last = playlist.segments[-1] if playlist and playlist.segments else None
+        return {
+            "rendition": self.rendition,
+            "media_sequence": playlist.media_sequence if playlist else None,
+            "target_duration": playlist.target_duration if playlist else None,
+            "segments": len(playlist.segments) if playlist else 0,
+            "ended": playlist.ended if playlist else False,
+            "next_sequence": self._next_sequence,
+            "next_part": self._next_part,
+            "parts": len(playlist.parts) if playlist else 0,
+            "blocking_reload": self._blocking,
+            "requests": self.requests,
+            "blocking_requests": self.blocking_requests,
+            "last_delay": round(self.last_delay, 3) if self.last_delay is not None else None,
+            "program_date_time": (
+                last.program_date_time.isoformat() if last and last.program_date_time else None
+            ),
+            "discontinuities": self.discontinuities,
+            "restarts": self.restarts,
+            "skipped": self.skipped,
+        }
 
     def reset(self) -> None:
         """추적 상태를 초기화합니다."""
-        self._seen_segments.clear()
         self._media_playlist_url = None
+        self.rendition = None
+        self.playlist = None
+        self._playlist_crc = None
+        self._next_sequence = None
+        self._next_part = 0
+        self._last_uri = None
+        self._unchanged_polls = 0
+        self._blocking = False
 
     async def close(self) -> None:
         """HTTP 클라이언트를 종료합니다."""
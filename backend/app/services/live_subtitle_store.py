@@ -0,0 +1,361 @@
+"""실시간 자막 DB 저장 (write-behind)
+
+확정 자막은 브로드캐스트 후 크기 제한 큐에 넣기만 하고(대기 없음), 별도 태스크가
+flush_interval초 또는 batch_size행 단위로 모아 subtitles 테이블에 한 번에 INSERT합니다.
+DB가 느리거나 실패해도 브로드캐스트 경로에는 지연이 없으며, 실패한 배치는 백오프로 재시도합니다.
+이전 시도가 커밋된 뒤 응답만 잃은 경우 재시도 INSERT는 기본 키 중복(23505)이 되는데,
+배치 INSERT는 한 문장이라 전부 저장된 상태이므로 성공으로 처리합니다.
+
+  publish_subtitle → enqueue() ─┐
+  OpenAI 교정     → enqueue_correction() ─┼→ [큐] → 배치 INSERT / 교정 UPSERT / 회의 종료
+  STT 중지        → end_meeting() ─┘
+
+실시간 자막의 meeting_id는 채널 ID(ch14 등)이므로, 채널마다 status='live' 회의 행을
+찾거나 만들어 그 UUID로 저장합니다 (프로세스 재시작 시 같은 날 live 회의 행을 이어서 사용).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import OrderedDict
+from datetime import UTC, date, datetime
+
+from app.core.channels import get_channel
+from app.core.config import settings
+from app.core.database import get_supabase_client, run_query
+
+logger = logging.getLogger(__name__)
+
+# 배치 저장 재시도 (지수 백오프)
+MAX_ATTEMPTS = 5
+RETRY_BASE = 0.5  # 초
+RETRY_MAX = 10.0  # 초
+# 교정 UPSERT용으로 기억하는 최근 저장 행 수
+_WRITTEN_CACHE_SIZE = 2000
+# 종료 시 남은 큐를 저장하는 제한 시간 (초)
+DRAIN_TIMEOUT = 5.0
+# 저장 태스크 종료 표시 (stop()이 큐에 넣음)
+_STOP = ("stop",)
+_UNIQUE_VIOLATION = "23505"  # PostgreSQL unique_violation
+
+
+class LiveSubtitleWriter:
+    """실시간 자막 write-behind 저장소
+
+    Args:
+        queue_size: 저장 대기 상한 (가득 차면 버림)
+        batch_size: 한 번에 처리하는 최대 항목 수
+        flush_interval: 첫 항목 이후 배치를 모으는 시간 (초)
+    """
+
+    def __init__(
+        self,
+        queue_size: int | None = None,
+        batch_size: int | None = None,
+        flush_interval: float | None = None,
+    ) -> None:
+        self._queue: asyncio.Queue[tuple] = asyncio.Queue(
+            queue_size if queue_size is not None else settings.live_subtitle_queue_size
+        )
+        self._batch_size = max(
+            1, batch_size if batch_size is not None else settings.live_subtitle_batch_size
+        )
+        self._flush_interval = (
+            flush_interval if flush_interval is not None
+            else settings.live_subtitle_flush_interval
+        )
+        self._enabled = (
+            settings.live_subtitle_persist
+            and bool(settings.supabase_url)
+            and bool(settings.supabase_key)
+        )
+        self._task: asyncio.Task | None = None  # type: ignore[type-arg]
+        self._meetings: dict[str, str] = {}  # 채널 ID → live 회의 UUID
+        self._written: OrderedDict[str, dict] = OrderedDict()  # 자막 ID → 저장한 행
+        # 지표
+        self.rows_written = 0
+        self.corrections_written = 0
+        self.batches = 0
+        self.retries = 0
+        self.dropped = 0
+        self.failed = 0
+        self.last_error: str | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    async def start(self) -> None:
+        """저장 태스크를 시작합니다."""
+        if not self._enabled:
+            logger.info("LiveSubtitleWriter disabled")
+            return
+        if self._task and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._worker_loop(), name="live-subtitle-writer")
+        logger.info(
+            "LiveSubtitleWriter started (batch=%d, interval=%.1fs)",
+            self._batch_size,
+            self._flush_interval,
+        )
+
+    async def stop(self) -> None:
+        """저장 태스크를 중지합니다.
+
+        종료 표시를 큐에 넣어 워커가 모으던 배치까지 저장하고 끝나게 한 뒤,
+        그 뒤에 들어온 항목을 저장합니다 (전체 DRAIN_TIMEOUT 제한).
+        """
+        task, self._task = self._task, None
+        if task is None:
+            return
+        try:
+            async with asyncio.timeout(DRAIN_TIMEOUT):
+                await self._queue.put(_STOP)
+                await task
+                while not self._queue.empty():
+                    await self._write_batch(self._take_ready(), attempts=1)
+        except TimeoutError:
+            logger.warning("LiveSubtitleWriter: %d items not saved", self._queue.qsize())
+        finally:
+            if not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        logger.info("LiveSubtitleWriter stopped")
+
+    def enqueue(self, channel_id: str, subtitle: dict) -> None:
+        """확정 자막을 저장 큐에 넣습니다 (대기하지 않음)."""
+        self._put(("insert", channel_id, subtitle))
+
+    def enqueue_correction(self, subtitle_id: str, text: str) -> None:
+        """교정된 자막 텍스트를 저장 큐에 넣습니다 (대기하지 않음)."""
+        self._put(("correct", subtitle_id, text))
+
+    def end_meeting(self, channel_id: str) -> None:
+        """채널 STT 종료 시 live 회의를 ended로 바꿉니다 (앞서 넣은 자막 저장 후)."""
+        self._put(("end", channel_id))
+
+    def get_metrics(self) -> dict:
+        return {
+            "enabled": self._enabled,
+            "queued": self._queue.qsize(),
+            "rows_written": self.rows_written,
+            "corrections_written": self.corrections_written,
+            "batches": self.batches,
+            "retries": self.retries,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "last_error": self.last_error,
+        }
+
+    # --- 내부 ---
+
+    def _put(self, item: tuple) -> None:
+        if not self._enabled:
+            return
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 100 == 0:
+                logger.warning("LiveSubtitleWriter: queue full, dropped %d items", self.dropped)
+
+    def _take_ready(self) -> list[tuple]:
+        batch: list[tuple] = []
+        while len(batch) < self._batch_size and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _worker_loop(self) -> None:
+        """배치 수집 및 저장 워커. 종료 표시를 받으면 모으던 배치를 저장하고 끝납니다."""
+        loop = asyncio.get_running_loop()
+        while True:
+            # 첫 항목은 대기, 나머지는 flush_interval 안에서 batch_size까지 수집
+            item = await self._queue.get()
+            if item is _STOP:
+                return
+            batch = [item]
+            stopping = False
+            deadline = loop.time() + self._flush_interval
+            while len(batch) < self._batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    async with asyncio.timeout(remaining):
+                        item = await self._queue.get()
+                except TimeoutError:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            await self._write_batch(batch)
+            if stopping:
+                return
+
+    async def _write_batch(self, batch: list[tuple], attempts: int = MAX_ATTEMPTS) -> None:
+        """배치를 저장합니다. 실패하면 백오프 후 재시도하고, 끝내 실패하면 버립니다."""
+        inserts: dict[str, dict] = {}  # 자막 ID → 행 (순서 유지)
+        corrections: dict[str, str] = {}
+        ended: list[str] = []
+        for item in batch:
+            kind = item[0]
+            if kind == "insert":
+                _, channel_id, subtitle = item
+                inserts[subtitle["id"]] = {"_channel_id": channel_id, **subtitle}
+            elif kind == "correct":
+                _, subtitle_id, text = item
+                if subtitle_id in inserts:
+                    # 아직 저장 전 → INSERT 행에 반영
+                    inserts[subtitle_id]["text"] = text
+                else:
+                    corrections[subtitle_id] = text
+            elif kind == "end":
+                ended.append(item[1])
+
+        for attempt in range(1, attempts + 1):
+            try:
+                # 성공한 단계는 비워서 재시도 시 중복 저장하지 않음
+                if inserts:
+                    await self._insert(list(inserts.values()))
+                    inserts.clear()
+                if corrections:
+                    await self._correct(corrections)
+                    corrections.clear()
+                while ended:
+                    await self._end(ended[0])
+                    ended.pop(0)
+                self.batches += 1
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.last_error = f"{type(e).__name__}: {e}"
+                if attempt == attempts:
+                    break
+                self.retries += 1
+                delay = min(RETRY_BASE * 2 ** (attempt - 1), RETRY_MAX)
+                logger.warning(
+                    "LiveSubtitleWriter: write failed (%s), retry %d in %.1fs",
+                    e, attempt, delay,
+                )
+                await asyncio.sleep(delay)
+
+        self.failed += len(inserts) + len(corrections) + len(ended)
+        logger.error(
+            "LiveSubtitleWriter: giving up on %d rows, %d corrections: %s",
+            len(inserts), len(corrections), self.last_error,
+        )
+
+    async def _insert(self, items: list[dict]) -> None:
+        rows = []
+        for item in items:
+            meeting_id = await self._meeting_id(item["_channel_id"])
+            rows.append(_subtitle_row(item, meeting_id))
+        try:
+            await run_query(get_supabase_client().table("subtitles").insert(rows))
+        except Exception as e:
+            if getattr(e, "code", None) != _UNIQUE_VIOLATION:
+                raise
+            logger.info("LiveSubtitleWriter: %d rows already saved by previous attempt", len(rows))
+        for row in rows:
+            self._written[row["id"]] = row
+            self._written.move_to_end(row["id"])
+        while len(self._written) > _WRITTEN_CACHE_SIZE:
+            self._written.popitem(last=False)
+        self.rows_written += len(rows)
+
+    async def _correct(self, corrections: dict[str, str]) -> None:
+        supabase = get_supabase_client()
+        known = []
+        for subtitle_id, text in corrections.items():
+            row = self._written.get(subtitle_id)
+            if row is not None:
+                known.append({**row, "text": text})
+        if known:
+            # 행 전체를 알고 있으면 UPSERT 한 번으로 여러 행 갱신
+            await run_query(supabase.table("subtitles").upsert(known, on_conflict="id"))
+            for row in known:
+                self._written[row["id"]] = row
+        for subtitle_id, text in corrections.items():
+            if subtitle_id not in self._written:
+                await run_query(
+                    supabase.table("subtitles").update({"text": text}).eq("id", subtitle_id)
+                )
+        self.corrections_written += len(corrections)
+
+    async def _end(self, channel_id: str) -> None:
+        meeting_id = self._meetings.get(channel_id)
+        if meeting_id is None:
+            return
+        await run_query(
+            get_supabase_client().table("meetings").update({
+                "status": "ended",
+                "updated_at": datetime.now(UTC).isoformat(),
+            }).eq("id", meeting_id)
+        )
+        self._meetings.pop(channel_id, None)
+        logger.info("LiveSubtitleWriter: meeting %s ended (channel %s)", meeting_id, channel_id)
+
+    async def _meeting_id(self, channel_id: str) -> str:
+        """채널의 live 회의 UUID (없으면 같은 날 live 회의를 찾거나 새로 만듦)"""
+        meeting_id = self._meetings.get(channel_id)
+        if meeting_id is not None:
+            return meeting_id
+
+        channel = get_channel(channel_id) or {"name": channel_id, "stream_url": None}
+        supabase = get_supabase_client()
+        today = date.today().isoformat()
+        query = supabase.table("meetings").select("id").eq("status", "live")
+        query = query.eq("meeting_date", today)
+        if channel["stream_url"]:
+            query = query.eq("stream_url", channel["stream_url"])
+        else:
+            query = query.eq("title", channel["name"])
+        result = await run_query(query.order("created_at", desc=True).limit(1))
+        if result.data:
+            meeting_id = result.data[0]["id"]
+        else:
+            result = await run_query(supabase.table("meetings").insert({
+                "title": channel["name"],
+                "meeting_date": today,
+                "stream_url": channel["stream_url"],
+                "status": "live",
+            }))
+            meeting_id = result.data[0]["id"]
+            logger.info(
+                "LiveSubtitleWriter: created live meeting %s (channel %s)", meeting_id, channel_id
+            )
+        self._meetings[channel_id] = meeting_id
+        return meeting_id
+
+
+def _subtitle_row(item: dict, meeting_id: str) -> dict:
+    confidence = item.get("confidence")
+    if confidence is not None:
+        confidence = min(max(float(confidence), 0.0), 1.0)
+    return {
+        "id": item["id"],
+        "meeting_id": meeting_id,
+        "start_time": item.get("start_time", 0.0),
+        "end_time": item.get("end_time", 0.0),
+        "text": item["text"],
+        "speaker": item.get("speaker"),
+        "confidence": confidence,
+        "created_at": item.get("created_at") or datetime.now(UTC).isoformat(),
+    }
+
+
+# 싱글톤
+_writer: LiveSubtitleWriter | None = None
+
+
+def get_live_subtitle_writer() -> LiveSubtitleWriter:
+    global _writer
+    if _writer is None:
+        _writer = LiveSubtitleWriter()
+    return _writer
@@ -0,0 +1,209 @@
+"""세그먼트 오디오 → 16kHz PCM 프레임 스트리밍
+
+채널마다 ffmpeg 프로세스 1개를 계속 띄워 두고 세그먼트 오디오를 stdin으로 이어 붙입니다
+(세그먼트마다 ffmpeg를 새로 띄우지 않음). stdout의 s16le PCM을 frame_ms 단위로 잘라
+실시간 속도에 맞춰 보내며, 실시간보다 max_lead초까지 앞서 보낼 수 있습니다.
+
+  feed(segment) → ffmpeg stdin → PCM → [frame_ms 프레임, 실시간 페이싱] → send(frame)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_WIDTH = 2  # s16le
+# 실시간보다 이만큼 뒤처지면 (세그먼트 지연 등) 기준 시각을 다시 잡음 (초)
+RESYNC_THRESHOLD = 1.0
+
+
+class PcmStreamError(Exception):
+    """디코더(ffmpeg) 프로세스 오류"""
+
+
+def ffmpeg_pcm_command(
+    sample_rate: int = 16000, input_format: str | None = "mpegts"
+) -> list[str]:
+    """stdin의 세그먼트를 mono s16le PCM으로 stdout에 내보내는 ffmpeg 명령
+
+    input_format이 None이면 ffmpeg가 첫 입력으로 형식을 판별합니다.
+    """
+    # 입력 형식을 지정하고 탐색을 줄여 첫 PCM이 바로 나오도록
+    input_args = ["-f", input_format] if input_format else []
+    return [
+        "ffmpeg",
+        "-hide_banner",
+        "-loglevel", "error",
+        "-fflags", "nobuffer",
+        "-probesize", "32768",
+        "-analyzeduration", "0",
+        *input_args,
+        "-i", "pipe:0",
+        "-vn",
+        "-ac", "1",
+        "-ar", str(sample_rate),
+        "-f", "s16le",
+        "pipe:1",
+    ]
+
+
+class PcmStreamer:
+    """채널 1개의 상시 디코더와 페이싱된 PCM 프레임 전송
+
+    Args:
+        send: 프레임 전송 함수 (Deepgram WebSocket send 등)
+        sample_rate: 출력 샘플레이트 (mono)
+        frame_ms: 프레임 길이 (밀리초)
+        max_lead: 실시간보다 앞서 보낼 수 있는 최대 시간 (초)
+        command: 디코더 명령 (기본: ffmpeg_pcm_command())
+    """
+
+    def __init__(
+        self,
+        send: Callable[[bytes], Awaitable[None]],
+        sample_rate: int = 16000,
+        frame_ms: int = 100,
+        max_lead: float = 0.0,
+        command: list[str] | None = None,
+    ) -> None:
+        self.send = send
+        self.sample_rate = sample_rate
+        self.frame_ms = frame_ms
+        self.frame_bytes = sample_rate * SAMPLE_WIDTH * frame_ms // 1000
+        self.max_lead = max_lead
+        self.command = command or ffmpeg_pcm_command(sample_rate)
+        self._process: asyncio.subprocess.Process | None = None
+        self._stderr_task: asyncio.Task | None = None  # type: ignore[type-arg]
+        self._anchor: float | None = None  # 스트림 0초에 해당하는 monotonic 시각
+        self._burst_until = 0.0  # 이 시각(seconds_sent)까지는 페이싱 없이 전송
+        # 지표
+        self.frames = 0
+        self.bytes_in = 0
+        self.seconds_sent = 0.0
+        self.resyncs = 0
+        self.first_frame_delay: float | None = None  # 첫 feed → 첫 프레임 전송 (초)
+        self._first_feed: float | None = None
+
+    async def start(self) -> None:
+        """디코더 프로세스를 시작합니다."""
+        try:
+            self._process = await asyncio.create_subprocess_exec(
+                *self.command,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except FileNotFoundError as e:
+            raise PcmStreamError(
+                "FFmpeg not found. Please install FFmpeg and add it to PATH."
+            ) from e
+        self._stderr_task = asyncio.create_task(self._log_stderr(self._process))
+
+    async def feed(self, data: bytes) -> None:
+        """세그먼트 오디오를 디코더에 이어 붙입니다."""
+        process = self._process
+        if process is None or process.stdin is None or process.returncode is not None:
+            raise PcmStreamError("PCM decoder is not running")
+        if self._first_feed is None:
+            self._first_feed = time.monotonic()
+        self.bytes_in += len(data)
+        try:
+            process.stdin.write(data)
+            await process.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError) as e:
+            raise PcmStreamError(f"PCM decoder stdin closed: {e}") from e
+
+    def burst(self, seconds: float) -> None:
+        """다음 seconds초 분량을 페이싱 없이 보냅니다 (재연결 후 재전송분).
+
+        다 보내면 그 시점을 기준으로 다시 실시간 페이싱합니다.
+        """
+        self._burst_until = self.seconds_sent + seconds
+
+    async def run(self) -> None:
+        """PCM을 프레임으로 잘라 실시간 속도로 전송합니다. 디코더가 끝나면 예외로 종료."""
+        process = self._process
+        if process is None or process.stdout is None:
+            raise PcmStreamError("PCM decoder is not running")
+        frame_seconds = self.frame_ms / 1000
+        while True:
+            try:
+                frame = await process.stdout.readexactly(self.frame_bytes)
+            except asyncio.IncompleteReadError as e:
+                if e.partial:
+                    await self._send(e.partial, len(e.partial) / self.frame_bytes * frame_seconds)
+                code = await process.wait()
+                raise PcmStreamError(f"PCM decoder exited with code {code}") from None
+            await self._send(frame, frame_seconds)
+
+    async def close(self) -> None:
+        """디코더 프로세스를 종료합니다."""
+        process, self._process = self._process, None
+        if process is not None and process.returncode is None:
+            if process.stdin is not None:
+                process.stdin.close()
+            try:
+                async with asyncio.timeout(2):
+                    await process.wait()
+            except TimeoutError:
+                process.kill()
+                await process.wait()
+        if self._stderr_task is not None:
+            self._stderr_task.cancel()
+            self._stderr_task = None
+
+    def get_metrics(self) -> dict:
+        lead = None
+        if self._anchor is not None:
+            lead = round(self.seconds_sent - (time.monotonic() - self._anchor), 3)
+        return {
+            "sample_rate": self.sample_rate,
+            "frame_ms": self.frame_ms,
+            "max_lead": self.max_lead,
+            "frames": self.frames,
+            "bytes_in": self.bytes_in,
+            "seconds_sent": round(self.seconds_sent, 3),
+            "lead": lead,
+            "resyncs": self.resyncs,
+            "first_frame_delay_ms": (
+                round(self.first_frame_delay * 1000, 1)
+                if self.first_frame_delay is not None else None
+            ),
+        }
+
+    # --- 내부 ---
+
+    async def _send(self, frame: bytes, seconds: float) -> None:
+        now = time.monotonic()
+        if self._anchor is None:
+            self._anchor = now
+            if self._first_feed is not None:
+                self.first_frame_delay = now - self._first_feed
+        bursting = self.seconds_sent < self._burst_until
+        if not bursting:
+            behind = (now - self._anchor) - self.seconds_sent
+            if behind > RESYNC_THRESHOLD:
+                # 오디오가 늦게 도착함 (세그먼트 지연) → 밀린 만큼 몰아 보내지 않고 지금을 기준으로
+                self._anchor = now - self.seconds_sent
+                self.resyncs += 1
+            else:
+                due = self._anchor + self.seconds_sent - self.max_lead
+                if due > now:
+                    await asyncio.sleep(due - now)
+        await self.send(frame)
+        self.frames += 1
+        self.seconds_sent += seconds
+        if bursting:
+            # 재전송분은 지금 보낸 것으로 간주 → 끝나면 이 시점부터 실시간 페이싱
+            self._anchor = time.monotonic() - self.seconds_sent
+
+    @staticmethod
+    async def _log_stderr(process: asyncio.subprocess.Process) -> None:
+        if process.stderr is None:
+            return
+        async for line in process.stderr:
+            logger.warning("ffmpeg: %s", line.decode(errors="replace").rstrip())
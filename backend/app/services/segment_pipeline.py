@@ -0,0 +1,233 @@
+"""HLS 세그먼트 파이프라인 (플레이리스트 감시 → 다운로드 → 전송)
+
+세 단계를 크기 제한 큐로 잇습니다.
+
+  watcher     플레이리스트를 예상 시각에 맞춰 다시 받고 새 세그먼트를 큐에 넣음
+  downloader  최대 N개를 동시에 다운로드하되, 결과는 플레이리스트 순서대로 넘김
+  sender      오디오 추출 후 순서대로 전송 (Deepgram WebSocket 등)
+
+느린 세그먼트 다운로드가 앞 세그먼트 전송이나 플레이리스트 폴링을 막지 않고,
+큐가 차면 앞 단계가 기다리므로 메모리는 제한됩니다.
+링 버퍼가 주어지면 sender는 이전 세션에서 처리되지 않은 세그먼트(replay)를 먼저 몰아 보내고,
+보내는 세그먼트를 전송 전에 링에 보관합니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Sequence
+
+import httpx
+
+from app.services.hls_parser import HlsPlaylistParser, HlsSegment
+from app.services.segment_ring import RingEntry, SegmentRing
+from app.services.ts_demux import TsAudioExtractor
+
+logger = logging.getLogger(__name__)
+
+# 플레이리스트 요청 실패 시 재시도 간격 (초)
+RETRY_INTERVAL = 2.0
+
+
+class _Stage:
+    """단계별 소요 시간 (초)"""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.last = seconds
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total / self.count * 1000, 1) if self.count else None,
+            "max_ms": round(self.max * 1000, 1),
+            "last_ms": round(self.last * 1000, 1),
+        }
+
+
+class SegmentPipeline:
+    """채널 1개의 HLS 세그먼트 파이프라인
+
+    Args:
+        channel_id: 로그/지표용 채널 ID
+        stream_url: m3u8 URL
+        parser: 채널의 플레이리스트 파서 (재연결 사이에도 유지)
+        http_client: 세그먼트 다운로드용 클라이언트
+        send: 오디오 바이트 전송 함수 (실패 시 예외 → run() 종료)
+        extractor: TS 오디오 추출기 (None이면 원본 전송)
+        downloads: 동시 다운로드 수
+        queue_size: 단계 사이 큐 크기
+        ring: 재연결 대비 세그먼트 링 버퍼 (보낸 세그먼트 보관)
+        replay: 새 세그먼트보다 먼저 다시 보낼 세그먼트 (SegmentRing.start_session())
+    """
+
+    def __init__(
+        self,
+        channel_id: str,
+        stream_url: str,
+        parser: HlsPlaylistParser,
+        http_client: httpx.AsyncClient,
+        send: Callable[[bytes], Awaitable[None]],
+        extractor: TsAudioExtractor | None = None,
+        downloads: int = 3,
+        queue_size: int = 8,
+        ring: SegmentRing | None = None,
+        replay: Sequence[RingEntry] = (),
+    ) -> None:
+        self.channel_id = channel_id
+        self.stream_url = stream_url
+        self.parser = parser
+        self.http_client = http_client
+        self.send = send
+        self.extractor = extractor
+        self.downloads = max(1, downloads)
+        self.ring = ring
+        self.replay = list(replay)
+        # (세그먼트, 발견 시각)
+        self._found: asyncio.Queue[tuple[HlsSegment, float]] = asyncio.Queue(queue_size)
+        # (세그먼트, 발견 시각, 다운로드 태스크) — 순서 유지
+        self._fetched: asyncio.Queue[
+            tuple[HlsSegment, float, asyncio.Task[bytes | None]]
+        ] = asyncio.Queue(queue_size)
+        self._slots = asyncio.Semaphore(self.downloads)
+        self._inflight: set[asyncio.Task[bytes | None]] = set()
+        # 지표
+        self.stages = {
+            name: _Stage()
+            for name in (
+                "poll", "queue_wait", "download", "extract", "send", "end_to_end", "replay",
+            )
+        }
+        self.segments_sent = 0
+        self.segments_replayed = 0
+        self.download_failures = 0
+        self.poll_failures = 0
+
+    async def run(self) -> None:
+        """세 단계를 실행합니다. 전송이 실패하면 예외로 끝납니다."""
+        tasks = [
+            asyncio.create_task(self._watch(), name=f"hls-watch-{self.channel_id}"),
+            asyncio.create_task(self._download(), name=f"hls-download-{self.channel_id}"),
+            asyncio.create_task(self._send(), name=f"hls-send-{self.channel_id}"),
+        ]
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                task.result()
+        finally:
+            # 진행 중이거나 큐에 남은 다운로드까지 정리
+            pending = [*tasks, *self._inflight]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def get_metrics(self) -> dict:
+        return {
+            "downloads": self.downloads,
+            "downloading": len(self._inflight),
+            "found_queue": self._found.qsize(),
+            "fetched_queue": self._fetched.qsize(),
+            "segments_sent": self.segments_sent,
+            "segments_replayed": self.segments_replayed,
+            "download_failures": self.download_failures,
+            "poll_failures": self.poll_failures,
+            "stages": {name: stage.to_dict() for name, stage in self.stages.items()},
+        }
+
+    # --- 단계 ---
+
+    async def _watch(self) -> None:
+        while True:
+            delay = RETRY_INTERVAL
+            try:
+                started = time.monotonic()
+                playlist = await self.parser.fetch_playlist(self.stream_url)
+                found = time.monotonic()
+                self.stages["poll"].add(found - started)
+                for segment in self.parser.get_new_segments(playlist):
+                    await self._found.put((segment, found))
+                # 다음 세그먼트 예상 시각에 맞춤 (큐 대기 시간은 자동으로 차감)
+                delay = self.parser.next_poll_delay()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.poll_failures += 1
+                logger.warning("Channel %s: poll failed: %s", self.channel_id, e)
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+    async def _download(self) -> None:
+        while True:
+            segment, found = await self._found.get()
+            await self._slots.acquire()
+            self.stages["queue_wait"].add(time.monotonic() - found)
+            task = asyncio.create_task(self._fetch(segment))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+            await self._fetched.put((segment, found, task))
+
+    async def _fetch(self, segment: HlsSegment) -> bytes | None:
+        started = time.monotonic()
+        try:
+            response = await self.http_client.get(segment.uri)
+            response.raise_for_status()
+            self.stages["download"].add(time.monotonic() - started)
+            return response.content
+        except Exception as e:
+            self.download_failures += 1
+            logger.warning(
+                "Channel %s: segment download failed: %s: %s",
+                self.channel_id,
+                segment.uri.split("/")[-1],
+                e,
+            )
+            return None
+        finally:
+            self._slots.release()
+
+    async def _send(self) -> None:
+        if self.replay:
+            # 이전 세션에서 처리되지 않은 오디오를 페이싱 없이 먼저 (그동안 새 세그먼트는 다운로드)
+            started = time.monotonic()
+            for entry in self.replay:
+                await self.send(entry.payload)
+                self.segments_replayed += 1
+            self.stages["replay"].add(time.monotonic() - started)
+            self.replay.clear()
+
+        while True:
+            segment, found, task = await self._fetched.get()
+            data = await task
+            if data is None:
+                continue
+
+            started = time.monotonic()
+            payload = self.extractor.extract(data) if self.extractor else data
+            sending = time.monotonic()
+            self.stages["extract"].add(sending - started)
+
+            logger.info(
+                "Channel %s: sending segment %s (%d bytes, %d downloaded)",
+                self.channel_id,
+                segment.uri.split("/")[-1],
+                len(payload),
+                len(data),
+            )
+            if self.ring is not None:
+                # 전송 전에 보관해야 전송 중 끊겨도 다음 세션에서 다시 보냄
+                self.ring.append(payload, segment.duration)
+            await self.send(payload)
+            done = time.monotonic()
+            self.stages["send"].add(done - sending)
+            self.stages["end_to_end"].add(done - found)
+            self.segments_sent += 1
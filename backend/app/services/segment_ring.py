@@ -0,0 +1,100 @@
+"""재연결 시 오디오 공백을 메우는 채널별 세그먼트 링 버퍼
+
+Deepgram으로 보낸 세그먼트 오디오를 최근 N개까지 보관하고, 확정 결과로 처리가 끝난
+스트림 시각(acked)을 기록합니다. 연결이 끊겼다가 다시 붙으면 acked 이후의 세그먼트를
+먼저 몰아서 다시 보내고, 이미 자막으로 내보낸 구간의 결과는 타임스탬프로 걸러냅니다.
+
+스트림 시각은 채널 STT 시작 후 보낸 세그먼트 길이(#EXTINF)의 누적입니다.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import deque
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RingEntry:
+    """보관 중인 세그먼트 오디오
+
+    Attributes:
+        start: 스트림 시각 (초)
+        duration: 길이 (초)
+        payload: Deepgram(또는 디코더)에 보낸 바이트
+    """
+
+    start: float
+    duration: float
+    payload: bytes
+
+    @property
+    def end(self) -> float:
+        return self.start + self.duration
+
+
+class SegmentRing:
+    """최근 세그먼트와 Deepgram 처리 완료 시각을 추적합니다.
+
+    Args:
+        max_segments: 보관할 세그먼트 수 (0이면 보관하지 않고 스트림 시각만 추적)
+    """
+
+    def __init__(self, max_segments: int = 10) -> None:
+        self._entries: deque[RingEntry] = deque(maxlen=max(0, max_segments))
+        self.end = 0.0  # 마지막으로 보관한 세그먼트의 끝 (스트림 시각)
+        self.acked = 0.0  # 확정 결과로 처리가 끝난 스트림 시각
+        self.session_base = 0.0  # 현재 Deepgram 세션의 0초에 해당하는 스트림 시각
+        # 지표
+        self.replays = 0
+        self.replayed_segments = 0
+        self.duplicates_dropped = 0
+
+    def append(self, payload: bytes, duration: float) -> RingEntry:
+        """보낼 세그먼트를 보관합니다 (전송 전에 호출해 전송 실패분도 재전송 대상)."""
+        entry = RingEntry(self.end, duration, payload)
+        self._entries.append(entry)
+        self.end = entry.end
+        return entry
+
+    def start_session(self) -> list[RingEntry]:
+        """새 Deepgram 세션을 시작하고 다시 보낼 세그먼트(acked 이후)를 반환합니다."""
+        replay = [entry for entry in self._entries if entry.end > self.acked]
+        self.session_base = replay[0].start if replay else self.end
+        if replay:
+            self.replays += 1
+            self.replayed_segments += len(replay)
+            logger.info(
+                "Replaying %d segments (%.1fs) from stream time %.1f",
+                len(replay),
+                self.end - self.session_base,
+                self.session_base,
+            )
+        return replay
+
+    def to_stream_time(self, session_seconds: float) -> float:
+        """현재 세션의 Deepgram 시각 → 스트림 시각"""
+        return self.session_base + session_seconds
+
+    def ack(self, stream_time: float) -> None:
+        """stream_time까지 처리가 끝났음을 기록합니다 (되돌아가지 않음)."""
+        if stream_time > self.acked:
+            self.acked = stream_time
+
+    def is_duplicate(self, start: float, end: float) -> bool:
+        """이미 처리한 구간의 결과인지 (중간 지점 기준)"""
+        return (start + end) / 2 < self.acked
+
+    def get_metrics(self) -> dict:
+        return {
+            "segments": len(self._entries),
+            "bytes": sum(len(entry.payload) for entry in self._entries),
+            "end": round(self.end, 2),
+            "acked": round(self.acked, 2),
+            "unacked_seconds": round(self.end - max(self.acked, self.session_base), 2),
+            "replays": self.replays,
+            "replayed_segments": self.replayed_segments,
+            "duplicates_dropped": self.duplicates_dropped,
+        }
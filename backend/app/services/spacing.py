@@ -0,0 +1,269 @@
+"""한국어 띄어쓰기 교정 서비스 (Kiwi 워커 풀 + 마이크로 배칭)
+
+Deepgram 한국어 스트리밍 결과는 띄어쓰기가 누락되므로 Kiwi.space()로 교정합니다.
+Kiwi는 동기 C++ 호출이라 이벤트 루프에서 직접 호출하면 모든 채널의 수신/브로드캐스트가 멈춥니다.
+(특히 인스턴스의 첫 호출은 모델 지연 로딩으로 1~2초 걸림)
+
+  - 워커 프로세스마다 Kiwi 인스턴스를 만들고 미리 한 번 호출해 워밍업
+    (Kiwi 모델 로딩은 GIL을 잡고 있어 스레드에서 실행해도 이벤트 루프가 멈춤)
+  - SPACING_EXECUTOR=thread: 스레드 풀 (워밍업 이후 호출은 GIL을 놓음, 프로세스 생성 불가 환경용)
+    데몬 프로세스(STT 워커)는 자식 프로세스를 만들 수 없으므로 설정과 관계없이 스레드 풀 사용
+  - space_many(): 여러 채널의 요청을 수 ms 동안 모아 Kiwi.space(iterable) 1회로 처리
+  - Kiwi 초기화/호출 실패 시 원문을 그대로 반환 (자막 전송은 계속)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import re
+import shutil
+import sys
+import multiprocessing
+import threading
+from collections.abc import Callable
+from concurrent.futures import BrokenExecutor, Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 워밍업 문장 (첫 호출의 모델 지연 로딩을 시작 시점에 미리 수행)
+_WARMUP_TEXT = "경기도의회제1차본회의를개의하겠습니다"
+
+_MULTI_SPACE = re.compile(r"\s{2,}")
+
+# 워커(프로세스/스레드)별 Kiwi 인스턴스
+_local = threading.local()
+
+
+def create_kiwi() -> Any:
+    """Kiwi 인스턴스를 생성합니다.
+
+    Windows에서 사용자명에 한글 등 비ASCII 문자가 포함된 경우
+    kiwipiepy C++ 엔진이 모델 파일을 열지 못하는 문제를 우회합니다.
+    기본 경로로 먼저 시도하고, 실패 시 모델을 ASCII-safe 경로로 복사합니다.
+    """
+    from kiwipiepy import Kiwi
+
+    try:
+        return Kiwi()
+    except Exception:
+        logger.warning("Kiwi default init failed (non-ASCII path?), copying model to safe path")
+
+    try:
+        import kiwipiepy_model
+
+        src = os.path.dirname(kiwipiepy_model.__file__)
+        # Windows의 %TEMP%도 비ASCII 경로일 수 있으므로 ASCII-safe 경로 사용
+        if sys.platform == "win32":
+            safe_dir = os.path.join("C:\\", "tmp", "kiwi_model")
+        else:
+            safe_dir = os.path.join("/tmp", "kiwi_model")
+        if not os.path.exists(safe_dir):
+            os.makedirs(os.path.dirname(safe_dir), exist_ok=True)
+            shutil.copytree(src, safe_dir)
+        return Kiwi(model_path=safe_dir)
+    except Exception:
+        logger.error("Kiwi init failed even with safe path, spacing will be disabled")
+        return None
+
+
+class SpacingService:
+    """Kiwi 띄어쓰기 교정 워커 풀
+
+    Args:
+        workers: Kiwi 인스턴스(워커) 수. 인스턴스당 메모리 약 450MB
+        batch_window: 요청을 모으는 시간 (초)
+        max_batch: 배치 최대 문장 수 (도달 시 즉시 처리)
+        executor: process | thread
+        kiwi_factory: Kiwi 생성 함수 (process 모드에서는 모듈 수준 함수)
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        batch_window: float | None = None,
+        max_batch: int | None = None,
+        executor: str | None = None,
+        kiwi_factory: Callable[[], Any] = create_kiwi,
+    ) -> None:
+        self.workers = max(1, workers if workers is not None else settings.spacing_workers)
+        self.batch_window = (
+            batch_window if batch_window is not None else settings.spacing_batch_window
+        )
+        self.max_batch = max(1, max_batch if max_batch is not None else settings.spacing_max_batch)
+        self.executor_kind = executor or settings.spacing_executor
+        self._kiwi_factory = kiwi_factory
+        self._executor: Executor | None = None
+        self._pending: list[tuple[str, asyncio.Future]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        # 지표
+        self.batches = 0
+        self.texts = 0
+        self.failures = 0
+        self.restarts = 0
+
+    def start(self) -> None:
+        """워커 풀을 만들고 Kiwi 인스턴스를 백그라운드에서 미리 로드합니다 (중복 호출 무시)."""
+        if self._executor is not None:
+            return
+        if self.executor_kind != "thread" and multiprocessing.current_process().daemon:
+            # 데몬 프로세스에서 ProcessPoolExecutor를 쓰면 워커 생성 시 AssertionError
+            logger.info("Spacing pool in daemon process, using thread executor")
+            self.executor_kind = "thread"
+        if self.executor_kind == "thread":
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers,
+                thread_name_prefix="kiwi",
+                initializer=_init_worker,
+                initargs=(self._kiwi_factory,),
+            )
+        else:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self._kiwi_factory,),
+            )
+        # 워커 수만큼 제출해 모든 워커가 생성/워밍업되도록 함
+        for _ in range(self.workers):
+            self._executor.submit(_space_batch, [_WARMUP_TEXT])
+        logger.info("Spacing pool started (%s, workers=%d)", self.executor_kind, self.workers)
+
+    async def stop(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._flush()
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+
+    async def space(self, text: str) -> str:
+        """문장 1개의 띄어쓰기를 교정합니다."""
+        return (await self.space_many([text]))[0]
+
+    async def space_many(self, texts: list[str]) -> list[str]:
+        """여러 문장의 띄어쓰기를 교정합니다.
+
+        같은 batch_window 안에 들어온 다른 채널의 요청과 함께 Kiwi 1회 호출로 처리합니다.
+        """
+        if not texts:
+            return []
+        self.start()
+        loop = asyncio.get_running_loop()
+        futures = []
+        for text in texts:
+            future = loop.create_future()
+            self._pending.append((text, future))
+            futures.append(future)
+
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_window, self._flush)
+        return list(await asyncio.gather(*futures))
+
+    def get_metrics(self) -> dict:
+        return {
+            "executor": self.executor_kind,
+            "workers": self.workers,
+            "batches": self.batches,
+            "texts": self.texts,
+            "avg_batch": round(self.texts / self.batches, 2) if self.batches else 0.0,
+            "pending": len(self._pending),
+            "failures": self.failures,
+            "restarts": self.restarts,
+        }
+
+    # --- 내부 ---
+
+    def _flush(self) -> None:
+        self._flush_handle = None
+        while self._pending:
+            batch = self._pending[: self.max_batch]
+            del self._pending[: self.max_batch]
+            texts = [text for text, _ in batch]
+            futures = [future for _, future in batch]
+            if self._executor is None:
+                _resolve(futures, texts)
+                continue
+            self.batches += 1
+            self.texts += len(texts)
+            executor = self._executor
+            try:
+                job = asyncio.wrap_future(executor.submit(_space_batch, texts))
+            except (BrokenExecutor, RuntimeError):
+                self._on_broken(executor)
+                _resolve(futures, texts)
+                continue
+            job.add_done_callback(
+                lambda done, e=executor, f=futures, t=texts: self._on_done(done, e, f, t)
+            )
+
+    def _on_done(
+        self,
+        done: asyncio.Future,
+        executor: Executor,
+        futures: list[asyncio.Future],
+        texts: list[str],
+    ) -> None:
+        if done.cancelled() or done.exception() is not None:
+            self.failures += 1
+            error = None if done.cancelled() else done.exception()
+            if error is not None:
+                logger.warning("kiwi.space() failed, using raw text: %r", error)
+            if isinstance(error, BrokenExecutor):
+                self._on_broken(executor)
+            _resolve(futures, texts)
+            return
+        _resolve(futures, done.result())
+
+    def _on_broken(self, executor: Executor) -> None:
+        """워커 프로세스가 죽으면 (Kiwi 크래시 등) 새 풀로 교체합니다."""
+        if self._executor is not executor:
+            return  # 이미 교체됨
+        self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+        self.restarts += 1
+        logger.error("Spacing pool broken, restarting (restarts=%d)", self.restarts)
+        self.start()
+
+
+def _init_worker(kiwi_factory: Callable[[], Any]) -> None:
+    try:
+        _local.kiwi = kiwi_factory()
+    except Exception:
+        logger.exception("Kiwi init failed, spacing will be disabled on this worker")
+        _local.kiwi = None
+
+
+def _space_batch(texts: list[str]) -> list[str]:
+    """워커: Kiwi 1회 호출로 배치를 교정합니다."""
+    kiwi = getattr(_local, "kiwi", None)
+    if kiwi is None:
+        return texts
+    spaced = kiwi.space(texts) if len(texts) > 1 else [kiwi.space(texts[0])]
+    # 연속 공백 정리 (kiwi가 과도한 공백을 삽입할 수 있음)
+    return [_MULTI_SPACE.sub(" ", s).strip() for s in spaced]
+
+
+def _resolve(futures: list[asyncio.Future], results: list[str]) -> None:
+    for future, result in zip(futures, results, strict=True):
+        if not future.done():
+            future.set_result(result)
+
+
+# 전역 싱글톤 인스턴스
+_spacing_service: SpacingService | None = None
+
+
+def get_spacing_service() -> SpacingService:
+    """SpacingService 싱글톤 인스턴스를 반환합니다."""
+    global _spacing_service
+    if _spacing_service is None:
+        _spacing_service = SpacingService()
+    return _spacing_service
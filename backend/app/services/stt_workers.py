@@ -0,0 +1,390 @@
+"""채널 STT 워커 프로세스 (채널별 샤딩)
+
+ChannelSttService 파이프라인(HLS 폴링, Deepgram WebSocket, Kiwi 띄어쓰기, JSON 파싱)을
+API 이벤트 루프와 분리된 워커 프로세스에서 실행합니다.
+CPU를 많이 쓰거나 죽는 채널(Kiwi C++ 크래시 포함)이 API를 멈추거나 함께 죽이지 않고,
+STT 처리량은 워커 수(코어 수)만큼 늘어납니다.
+
+구성:
+  SttWorkerSupervisor (웹 계층, STT_WORKER_PROCESSES > 0일 때 get_channel_stt_service())
+    - 채널을 워커에 배정 (load: 담당 채널이 가장 적은 워커 / hash: 채널 ID 해시)
+    - 명령 큐로 start/stop을 보내고, 이벤트 큐로 인터림/확정 자막을 받아
+      ConnectionManager 브로드캐스트와 OpenAI 교정 큐로 전달
+    - 죽은 워커는 백오프 후 재시작하고 담당 채널을 다시 시작
+  워커 프로세스 (_worker_main)
+    - 자체 이벤트 루프에서 ChannelSttService를 실행하고 결과를 이벤트 큐로 전달
+    - 사전 리로더를 함께 실행해 DB 사전 변경을 워커의 사전 교정에 반영
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import signal
+import threading
+import time
+import zlib
+from collections.abc import Callable
+from typing import Any
+
+from app.api.websocket import manager
+from app.core.config import settings
+from app.services.live_subtitle_store import get_live_subtitle_writer
+
+logger = logging.getLogger(__name__)
+
+# 워커 상태 확인 주기 (초)
+MONITOR_INTERVAL = 1.0
+# 워커가 보고하는 채널 디버그 정보 주기 (초)
+DEBUG_REPORT_INTERVAL = 5.0
+# 워커 재시작 최대 대기 (초)
+MAX_RESTART_DELAY = 30.0
+# 이 시간 이상 살아 있던 워커가 죽으면 재시작 대기를 초기화 (초)
+RESTART_RESET_AFTER = 60.0
+# 종료 시 워커 프로세스 대기 (초)
+SHUTDOWN_TIMEOUT = 5.0
+
+WorkerTarget = Callable[[int, Any, Any], None]
+
+
+class _WorkerHandle:
+    """워커 프로세스 1개와 담당 채널"""
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+        self.process: multiprocessing.process.BaseProcess | None = None
+        self.commands: Any = None
+        self.events: Any = None
+        # channel_id → stream_url (재시작 시 다시 시작할 채널)
+        self.channels: dict[str, str] = {}
+        self.debug: dict[str, dict] = {}
+        self.restarts = 0
+        self.started_at = 0.0
+        self.next_restart_at = 0.0
+
+    def is_alive(self) -> bool:
+        return self.process is not None and self.process.is_alive()
+
+
+class SttWorkerSupervisor:
+    """채널 STT를 워커 프로세스에 나눠 실행하는 supervisor
+
+    ChannelSttService와 같은 인터페이스(start/stop/stop_all/is_running/get_debug_info)를
+    제공하므로 AutoSttManager와 채널 API는 그대로 사용합니다.
+    """
+
+    def __init__(
+        self,
+        processes: int,
+        assignment: str | None = None,
+        worker_target: WorkerTarget | None = None,
+    ) -> None:
+        self._ctx = multiprocessing.get_context("spawn")
+        self._workers = [_WorkerHandle(i) for i in range(max(1, processes))]
+        self._assignment = assignment or settings.stt_worker_assignment
+        self._target = worker_target or _worker_main
+        self._inbox: asyncio.Queue | None = None
+        self._pump_task: asyncio.Task | None = None
+        self._monitor_task: asyncio.Task | None = None
+
+    # --- ChannelSttService 인터페이스 ---
+
+    async def start(self, channel_id: str, stream_url: str) -> None:
+        """채널을 워커에 배정하고 STT를 시작합니다 (실행 중이면 재시작)."""
+        if self._owner(channel_id) is not None:
+            await self.stop(channel_id)
+
+        if not settings.deepgram_api_key:
+            logger.error("Channel %s: Deepgram API key not configured", channel_id)
+            return
+
+        self._ensure_tasks()
+        worker = self._pick_worker(channel_id)
+        worker.channels[channel_id] = stream_url
+        if not worker.is_alive():
+            self._spawn(worker)
+        worker.commands.put(("start", channel_id, stream_url))
+        logger.info(
+            "Starting STT for channel %s on worker %d: %s", channel_id, worker.index, stream_url
+        )
+
+    async def stop(self, channel_id: str) -> None:
+        """채널 STT를 중지합니다."""
+        worker = self._owner(channel_id)
+        if worker is None:
+            return
+        worker.channels.pop(channel_id, None)
+        worker.debug.pop(channel_id, None)
+        if worker.is_alive():
+            worker.commands.put(("stop", channel_id))
+        # 자막 히스토리 정리 (방송 종료 시 이전 자막 초기화)
+        manager.clear_history(channel_id)
+        get_live_subtitle_writer().end_meeting(channel_id)
+        logger.info("Stopped STT for channel %s (worker %d)", channel_id, worker.index)
+
+    async def stop_all(self) -> None:
+        """모든 채널 STT를 중지하고 워커 프로세스를 종료합니다."""
+        channel_ids = [cid for w in self._workers for cid in w.channels]
+        for channel_id in channel_ids:
+            await self.stop(channel_id)
+
+        for task in (self._monitor_task, self._pump_task):
+            if task is not None and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._monitor_task = None
+        self._pump_task = None
+
+        await asyncio.gather(*(self._shutdown(w) for w in self._workers))
+        logger.info("Stopped all STT channels (%d) and workers", len(channel_ids))
+
+    def is_running(self, channel_id: str) -> bool:
+        worker = self._owner(channel_id)
+        return worker is not None and worker.is_alive()
+
+    def get_debug_info(self, channel_id: str) -> dict:
+        """워커가 보고한 채널 디버그 정보에 워커/웹 계층 정보를 더해 반환합니다."""
+        worker = self._owner(channel_id)
+        info: dict[str, Any] = {"channel_id": channel_id, "task_exists": worker is not None}
+        if worker is not None:
+            info.update(worker.debug.get(channel_id, {}))
+            info["worker"] = self._worker_info(worker)
+        info["active_ws_rooms"] = list(manager.active_connections.keys())
+        info["ws_queue"] = manager.get_queue_metrics(channel_id)
+        info["ws_interim"] = manager.get_interim_metrics(channel_id)
+        return info
+
+    def get_workers_info(self) -> list[dict]:
+        return [self._worker_info(w) for w in self._workers]
+
+    # --- 배정 ---
+
+    def _owner(self, channel_id: str) -> _WorkerHandle | None:
+        for worker in self._workers:
+            if channel_id in worker.channels:
+                return worker
+        return None
+
+    def _pick_worker(self, channel_id: str) -> _WorkerHandle:
+        if self._assignment == "hash":
+            return self._workers[zlib.crc32(channel_id.encode()) % len(self._workers)]
+        return min(self._workers, key=lambda w: (len(w.channels), w.index))
+
+    def _worker_info(self, worker: _WorkerHandle) -> dict:
+        return {
+            "index": worker.index,
+            "pid": worker.process.pid if worker.process else None,
+            "alive": worker.is_alive(),
+            "exitcode": worker.process.exitcode if worker.process else None,
+            "channels": sorted(worker.channels),
+            "restarts": worker.restarts,
+        }
+
+    # --- 워커 프로세스 관리 ---
+
+    def _ensure_tasks(self) -> None:
+        if self._inbox is None:
+            self._inbox = asyncio.Queue()
+        if self._pump_task is None or self._pump_task.done():
+            self._pump_task = asyncio.create_task(self._pump(), name="stt-worker-events")
+        if self._monitor_task is None or self._monitor_task.done():
+            self._monitor_task = asyncio.create_task(self._monitor(), name="stt-worker-monitor")
+
+    def _spawn(self, worker: _WorkerHandle) -> None:
+        if worker.events is not None:
+            worker.events.put(None)  # 이전 이벤트 리더 스레드 종료
+        worker.commands = self._ctx.Queue()
+        worker.events = self._ctx.Queue()
+        worker.process = self._ctx.Process(
+            target=self._target,
+            args=(worker.index, worker.commands, worker.events),
+            name=f"stt-worker-{worker.index}",
+            daemon=True,
+        )
+        worker.process.start()
+        worker.started_at = time.monotonic()
+        worker.debug.clear()
+
+        loop = asyncio.get_running_loop()
+        assert self._inbox is not None
+        threading.Thread(
+            target=_forward_queue,
+            args=(worker.events, loop, self._inbox, worker),
+            name=f"stt-worker-{worker.index}-events",
+            daemon=True,
+        ).start()
+        logger.info("STT worker %d started (pid=%s)", worker.index, worker.process.pid)
+
+    async def _shutdown(self, worker: _WorkerHandle) -> None:
+        process = worker.process
+        if process is None:
+            return
+        if process.is_alive():
+            worker.commands.put(("shutdown",))
+            await asyncio.to_thread(process.join, SHUTDOWN_TIMEOUT)
+            if process.is_alive():
+                logger.warning("STT worker %d did not exit, terminating", worker.index)
+                process.terminate()
+                await asyncio.to_thread(process.join, SHUTDOWN_TIMEOUT)
+        worker.events.put(None)
+        worker.process = None
+        worker.commands = None
+        worker.events = None
+
+    async def _monitor(self) -> None:
+        """죽은 워커를 감지해 재시작하고 담당 채널을 다시 시작합니다."""
+        while True:
+            await asyncio.sleep(MONITOR_INTERVAL)
+            now = time.monotonic()
+            for worker in self._workers:
+                if not worker.channels or worker.is_alive() or worker.process is None:
+                    continue
+                if worker.next_restart_at == 0.0:
+                    if now - worker.started_at > RESTART_RESET_AFTER:
+                        worker.restarts = 0
+                    delay = min(2.0 ** worker.restarts, MAX_RESTART_DELAY) - 1.0
+                    worker.next_restart_at = now + delay
+                    logger.error(
+                        "STT worker %d died (exitcode=%s, channels=%s), restarting in %.0fs",
+                        worker.index, worker.process.exitcode, sorted(worker.channels), delay,
+                    )
+                if now < worker.next_restart_at:
+                    continue
+                worker.next_restart_at = 0.0
+                worker.restarts += 1
+                self._spawn(worker)
+                for channel_id, stream_url in worker.channels.items():
+                    worker.commands.put(("start", channel_id, stream_url))
+
+    async def _pump(self) -> None:
+        """워커 이벤트를 순서대로 웹 계층에 전달합니다."""
+        # channel_stt는 Kiwi를 로드하므로 필요할 때 가져옴 (웹 계층에서는 이미 로드됨)
+        from app.services import channel_stt
+
+        assert self._inbox is not None
+        while True:
+            worker, event = await self._inbox.get()
+            op = event[0]
+            try:
+                if op == "debug":
+                    worker.debug = {
+                        cid: info for cid, info in event[1].items() if cid in worker.channels
+                    }
+                    continue
+                channel_id, data = event[1], event[2]
+                if channel_id not in worker.channels:
+                    continue  # 중지된 채널의 늦게 도착한 결과
+                if op == "interim":
+                    await manager.broadcast_interim_subtitle(channel_id, data)
+                elif op == "subtitle":
+                    await channel_stt.publish_subtitle(channel_id, data)
+            except Exception:
+                logger.exception("failed to handle STT worker event: %s", op)
+
+
+def _forward_queue(
+    events: Any, loop: asyncio.AbstractEventLoop, inbox: asyncio.Queue, worker: _WorkerHandle
+) -> None:
+    """워커 이벤트 큐 → supervisor 이벤트 루프 (리더 스레드)"""
+    while True:
+        try:
+            event = events.get()
+        except (EOFError, OSError):
+            return
+        if event is None:
+            return
+        try:
+            loop.call_soon_threadsafe(inbox.put_nowait, (worker, event))
+        except RuntimeError:
+            return  # 이벤트 루프 종료
+
+
+# --- 워커 프로세스 ---
+
+
+def _worker_main(index: int, commands: Any, events: Any) -> None:
+    """워커 프로세스 진입점"""
+    # Ctrl+C는 부모(uvicorn)가 처리하고 종료 명령으로 정리
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    logging.basicConfig(
+        level=logging.INFO,
+        format=f"%(levelname)s:     [stt-worker-{index}] %(name)s - %(message)s",
+    )
+    asyncio.run(_worker_loop(commands, events))
+
+
+def _make_worker_service(events: Any) -> Any:
+    from app.services.channel_stt import ChannelSttService
+
+    class _WorkerChannelSttService(ChannelSttService):
+        """결과를 웹 계층에 직접 브로드캐스트하지 않고 supervisor로 보내는 ChannelSttService"""
+
+        async def _publish_interim(self, channel_id: str, interim_data: dict) -> None:
+            events.put(("interim", channel_id, interim_data))
+
+        async def _publish_subtitle(self, channel_id: str, subtitle_data: dict) -> None:
+            events.put(("subtitle", channel_id, subtitle_data))
+
+        def _on_stopped(self, channel_id: str) -> None:
+            pass  # 히스토리 정리는 supervisor가 수행
+
+    return _WorkerChannelSttService()
+
+
+async def _worker_loop(commands: Any, events: Any) -> None:
+    from app.services.dictionary import get_dictionary_reloader
+
+    service = _make_worker_service(events)
+    # 사전 교정은 워커에서 수행하므로 DB 사전 변경도 워커 프로세스의 기본 사전에 반영
+    reloader = get_dictionary_reloader()
+    await reloader.start()
+    loop = asyncio.get_running_loop()
+    inbox: asyncio.Queue = asyncio.Queue()
+    threading.Thread(
+        target=_read_commands, args=(commands, loop, inbox), name="commands", daemon=True
+    ).start()
+
+    async def report_debug() -> None:
+        while True:
+            await asyncio.sleep(DEBUG_REPORT_INTERVAL)
+            events.put(("debug", {
+                cid: service.get_debug_info(cid) for cid in list(service._active_tasks)
+            }))
+
+    reporter = asyncio.create_task(report_debug())
+    try:
+        while True:
+            command = await inbox.get()
+            op = command[0]
+            if op == "start":
+                await service.start(command[1], command[2])
+            elif op == "stop":
+                await service.stop(command[1])
+            elif op == "shutdown":
+                break
+    finally:
+        reporter.cancel()
+        await service.stop_all()
+        await reloader.stop()
+        from app.services.spacing import get_spacing_service
+
+        await get_spacing_service().stop()
+
+
+def _read_commands(commands: Any, loop: asyncio.AbstractEventLoop, inbox: asyncio.Queue) -> None:
+    while True:
+        try:
+            command = commands.get()
+        except (EOFError, OSError):
+            command = ("shutdown",)
+        try:
+            loop.call_soon_threadsafe(inbox.put_nowait, command)
+        except RuntimeError:
+            return
+        if command[0] == "shutdown":
+            return
+
@@ -21,6 +21,7 @@ from openai import AsyncOpenAI
 
 from app.api.websocket import manager
 from app.core.config import settings
+from app.services.live_subtitle_store import get_live_subtitle_writer
 
 logger = logging.getLogger(__name__)
 
@@ -234,6 +235,8 @@ class SubtitleCorrectorService:
                     "id": sub_id,
                     "corrected_text": corrected,
                 })
+                # DB 반영은 저장 큐에서 배치로
+                get_live_subtitle_writer().enqueue_correction(sub_id, corrected)
 
         except Exception as e:
             logger.error("SubtitleCorrector: OpenAI API error: %s", e)
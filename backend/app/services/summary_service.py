@@ -16,6 +16,7 @@ import httpx
 from supabase import Client
 
 from app.core.config import settings
+from app.core.database import run_query
 
 logger = logging.getLogger(__name__)
 
@@ -200,12 +201,11 @@ async def generate_meeting_summary(
         ValueError: 자막이 없거나 API 키 미설정
     """
     # 1. 자막 조회 (시간순)
-    subtitle_resp = (
+    subtitle_resp = await run_query(
         supabase.table("subtitles")
         .select("*")
         .eq("meeting_id", meeting_id)
         .order("start_time")
-        .execute()
     )
     subtitles = subtitle_resp.data
 
@@ -215,12 +215,11 @@ async def generate_meeting_summary(
     # 2. 안건 조회 (테이블이 없을 수 있으므로 try/except)
     agendas: list[dict] | None = None
     try:
-        agenda_resp = (
+        agenda_resp = await run_query(
             supabase.table("meeting_agendas")
             .select("*")
             .eq("meeting_id", meeting_id)
             .order("order_num")
-            .execute()
         )
         if agenda_resp.data:
             agendas = agenda_resp.data
@@ -235,14 +234,14 @@ async def generate_meeting_summary(
 
     # 5. DB 저장 (upsert - 재생성 시 덮어쓰기)
     try:
-        supabase.table("meeting_summaries").upsert({
+        await run_query(supabase.table("meeting_summaries").upsert({
             "meeting_id": meeting_id,
             "summary_text": summary.summary_text,
             "agenda_summaries": summary.agenda_summaries,
             "key_decisions": summary.key_decisions,
             "action_items": summary.action_items,
             "model_used": summary.model_used,
-        }).execute()
+        }))
     except Exception as e:
         logger.error("요약 저장 실패: %s", e)
         # 저장 실패해도 요약 결과는 반환
@@ -263,11 +262,10 @@ async def get_summary(
     Returns:
         요약 dict 또는 None (없으면)
     """
-    resp = (
+    resp = await run_query(
         supabase.table("meeting_summaries")
         .select("*")
         .eq("meeting_id", meeting_id)
-        .execute()
     )
     if resp.data:
         return resp.data[0]
@@ -288,9 +286,9 @@ async def delete_summary(
         삭제 성공 여부
     """
     try:
-        supabase.table("meeting_summaries").delete().eq(
-            "meeting_id", meeting_id
-        ).execute()
+        await run_query(
+            supabase.table("meeting_summaries").delete().eq("meeting_id", meeting_id)
+        )
         return True
     except Exception as e:
         logger.error("요약 삭제 실패: %s", e)
@@ -7,7 +7,7 @@
 import re
 from dataclasses import dataclass
 
-from app.services.dictionary import DictionaryEntry, get_default_dictionary
+from app.services.dictionary import DictionaryEntry, DictionaryService, get_default_dictionary
 
 
 @dataclass
@@ -22,6 +22,17 @@ class TermIssue:
     position: int  # 텍스트 내 위치
 
 
+def _build_dictionary(extra_entries: list[DictionaryEntry] | None) -> DictionaryService:
+    """기본 사전(공유 싱글톤)에 추가 항목을 더한 사전을 반환합니다.
+
+    추가 항목이 있으면 싱글톤을 변경하지 않도록 복사본을 만듭니다.
+    """
+    dictionary = get_default_dictionary()
+    if not extra_entries:
+        return dictionary
+    return DictionaryService(entries=dictionary.get_entries() + list(extra_entries))
+
+
 def check_terminology(
     subtitles: list[dict],
     extra_entries: list[DictionaryEntry] | None = None,
@@ -35,10 +46,7 @@ def check_terminology(
     Returns:
         감지된 불일치 목록
     """
-    dictionary = get_default_dictionary()
-    if extra_entries:
-        for entry in extra_entries:
-            dictionary.add_entry(entry)
+    dictionary = _build_dictionary(extra_entries)
 
     issues: list[TermIssue] = []
     entries = dictionary.get_entries()
@@ -76,10 +84,7 @@ def apply_terminology_fix(
     Returns:
         [{"id": ..., "original_text": ..., "corrected_text": ..., "fixes": [...]}, ...]
     """
-    dictionary = get_default_dictionary()
-    if extra_entries:
-        for entry in extra_entries:
-            dictionary.add_entry(entry)
+    dictionary = _build_dictionary(extra_entries)
 
     results = []
     for subtitle in subtitles:
@@ -0,0 +1,262 @@
+"""MPEG-TS 오디오 추출 (HLS 세그먼트 → 오디오만)
+
+HLS 세그먼트(MPEG-TS)는 영상이 대부분이지만 Deepgram에는 오디오만 필요합니다.
+PAT/PMT를 해석해 오디오 엘리멘터리 스트림 PID를 찾고, 영상 패킷을 버린 뒤 전송합니다.
+
+출력 형식:
+  - ts: 오디오만 남긴 TS (PAT + 오디오 ES만 남긴 PMT + 오디오 패킷, 기존 컨테이너 유지)
+  - adts: PES 헤더를 벗긴 오디오 엘리멘터리 스트림 (ADTS 프레임 연속)
+    헤더 없이는 디코딩할 수 없는 스트림(LATM, MP3, AC-3 등)은 ts 출력으로 대체
+
+패킷 PID는 188바이트 간격 슬라이스로 한 번에 읽고, 오디오/PAT/PMT 패킷만 파이썬에서 처리합니다.
+PAT/PMT/오디오를 찾지 못하면 원본 세그먼트를 그대로 반환합니다.
+"""
+
+from __future__ import annotations
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+TS_PACKET_SIZE = 188
+SYNC_BYTE = 0x47
+PAT_PID = 0x0000
+NULL_PID = 0x1FFF
+
+# PMT stream_type → 오디오 코덱
+AUDIO_STREAM_TYPES = {
+    0x03: "mp3",  # MPEG-1 Audio
+    0x04: "mp3",  # MPEG-2 Audio
+    0x0F: "aac",  # AAC (ADTS)
+    0x11: "aac_latm",  # AAC (LATM)
+    0x81: "ac3",
+}
+# adts 출력이 가능한 코덱 (ADTS 헤더가 있는 AAC, stream_type 0x0F)
+ELEMENTARY_CODECS = {"aac"}
+
+
+def _crc32_table() -> list[int]:
+    table = []
+    for i in range(256):
+        crc = i << 24
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x04C11DB7) if crc & 0x80000000 else crc << 1
+        table.append(crc & 0xFFFFFFFF)
+    return table
+
+
+_CRC_TABLE = _crc32_table()
+
+
+def crc32_mpeg2(data: bytes) -> int:
+    """PSI 섹션용 CRC-32/MPEG-2"""
+    crc = 0xFFFFFFFF
+    for byte in data:
+        crc = ((crc << 8) & 0xFFFFFFFF) ^ _CRC_TABLE[((crc >> 24) ^ byte) & 0xFF]
+    return crc
+
+
+def _payload_offset(packet: bytes | memoryview) -> int | None:
+    """TS 패킷의 페이로드 시작 위치 (페이로드가 없으면 None)"""
+    control = (packet[3] >> 4) & 0x3
+    if not control & 0x1:
+        return None
+    offset = 4
+    if control & 0x2:
+        offset += 1 + packet[4]
+    return offset if offset < TS_PACKET_SIZE else None
+
+
+def _section(packet: bytes | memoryview) -> bytes | None:
+    """PSI 패킷(PUSI)에서 섹션 1개를 꺼냅니다."""
+    if not packet[1] & 0x40:
+        return None
+    offset = _payload_offset(packet)
+    if offset is None:
+        return None
+    offset += 1 + packet[offset]  # pointer_field
+    if offset + 3 > TS_PACKET_SIZE:
+        return None
+    length = ((packet[offset + 1] & 0x0F) << 8) | packet[offset + 2]
+    end = offset + 3 + length
+    if end > TS_PACKET_SIZE:
+        return None  # 여러 패킷에 걸친 섹션은 지원하지 않음 (PAT/PMT는 보통 1패킷)
+    return bytes(packet[offset:end])
+
+
+class TsAudioExtractor:
+    """채널 1개의 TS 세그먼트에서 오디오만 추출합니다.
+
+    PMT/오디오 PID는 세그먼트 사이에 유지되어 PAT/PMT가 없는 세그먼트도 처리합니다.
+    """
+
+    def __init__(self, output: str = "ts") -> None:
+        self.output = output
+        self.pmt_pid: int | None = None
+        self.audio_pid: int | None = None
+        self.codec: str | None = None
+        self._pmt_packet: bytes | None = None
+        self._pmt_cc = 0
+        # 지표
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.passthrough = 0
+
+    def extract(self, data: bytes) -> bytes:
+        """세그먼트 1개를 오디오만으로 줄입니다 (해석 실패 시 원본 반환)."""
+        self.bytes_in += len(data)
+        start = _find_sync(data)
+        if start is None:
+            return self._passthrough(data, "no sync")
+        view = memoryview(data)[start:]
+        count = len(view) // TS_PACKET_SIZE
+        view = view[: count * TS_PACKET_SIZE]
+
+        pids = [
+            ((hi & 0x1F) << 8) | lo
+            for hi, lo in zip(view[1::TS_PACKET_SIZE], view[2::TS_PACKET_SIZE], strict=True)
+        ]
+        if any(b != SYNC_BYTE for b in view[0::TS_PACKET_SIZE]):
+            return self._passthrough(data, "lost sync")
+
+        for i, pid in enumerate(pids):
+            if pid == PAT_PID or pid == self.pmt_pid:
+                self._parse_psi(pid, view[i * TS_PACKET_SIZE:(i + 1) * TS_PACKET_SIZE])
+
+        if self.audio_pid is None:
+            return self._passthrough(data, "no audio stream")
+
+        audio_pid = self.audio_pid
+        if self.output == "adts" and self.codec in ELEMENTARY_CODECS:
+            out = self._elementary_stream(view, pids, audio_pid)
+        else:
+            out = self._audio_only_ts(view, pids, audio_pid)
+        self.bytes_out += len(out)
+        return out
+
+    def get_metrics(self) -> dict:
+        return {
+            "output": self.output,
+            "codec": self.codec,
+            "audio_pid": self.audio_pid,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "ratio": round(self.bytes_out / self.bytes_in, 3) if self.bytes_in else None,
+            "passthrough": self.passthrough,
+        }
+
+    # --- 내부 ---
+
+    def _passthrough(self, data: bytes, reason: str) -> bytes:
+        self.passthrough += 1
+        self.bytes_out += len(data)
+        logger.debug("TS audio extraction skipped (%s), sending segment as-is", reason)
+        return data
+
+    def _parse_psi(self, pid: int, packet: memoryview) -> None:
+        section = _section(packet)
+        if section is None or len(section) < 12:
+            return
+        if crc32_mpeg2(section[:-4]) != int.from_bytes(section[-4:], "big"):
+            return
+        if pid == PAT_PID and section[0] == 0x00:
+            self._parse_pat(section)
+        elif section[0] == 0x02:
+            self._parse_pmt(section)
+
+    def _parse_pat(self, section: bytes) -> None:
+        # 첫 번째 프로그램(program_number != 0)의 PMT PID
+        for pos in range(8, len(section) - 4, 4):
+            program = (section[pos] << 8) | section[pos + 1]
+            if program != 0:
+                self.pmt_pid = ((section[pos + 2] & 0x1F) << 8) | section[pos + 3]
+                return
+
+    def _parse_pmt(self, section: bytes) -> None:
+        info_len = ((section[10] & 0x0F) << 8) | section[11]
+        pos = 12 + info_len
+        while pos + 5 <= len(section) - 4:
+            stream_type = section[pos]
+            pid = ((section[pos + 1] & 0x1F) << 8) | section[pos + 2]
+            es_info_len = ((section[pos + 3] & 0x0F) << 8) | section[pos + 4]
+            entry_end = pos + 5 + es_info_len
+            codec = AUDIO_STREAM_TYPES.get(stream_type)
+            if codec is not None:
+                if pid != self.audio_pid:
+                    logger.info("TS audio stream: pid=0x%04x codec=%s", pid, codec)
+                    if self.output == "adts" and codec not in ELEMENTARY_CODECS:
+                        logger.info("TS audio codec %s has no ADTS framing, sending TS", codec)
+                self.audio_pid = pid
+                self.codec = codec
+                self._pmt_packet = self._audio_only_pmt(section, section[pos:entry_end])
+                return
+            pos = entry_end
+
+    def _audio_only_pmt(self, section: bytes, audio_entry: bytes) -> bytes:
+        """오디오 ES 1개만 남긴 PMT 섹션 (PCR은 버린 영상 PID에 있으므로 PCR_PID 없음)"""
+        info_len = ((section[10] & 0x0F) << 8) | section[11]
+        body = bytearray(section[3:8])  # program_number, version, section numbers
+        body += bytes([0xE0 | (NULL_PID >> 8), NULL_PID & 0xFF])
+        body += section[10:12 + info_len]
+        body += audio_entry
+        length = len(body) + 4
+        new = bytes([0x02, 0xB0 | (length >> 8), length & 0xFF]) + bytes(body)
+        return new + crc32_mpeg2(new).to_bytes(4, "big")
+
+    def _pmt_ts_packet(self) -> bytes:
+        assert self._pmt_packet is not None and self.pmt_pid is not None
+        header = bytes([
+            SYNC_BYTE,
+            0x40 | (self.pmt_pid >> 8),
+            self.pmt_pid & 0xFF,
+            0x10 | self._pmt_cc,
+        ])
+        self._pmt_cc = (self._pmt_cc + 1) & 0x0F
+        payload = b"\x00" + self._pmt_packet
+        return header + payload + b"\xff" * (TS_PACKET_SIZE - 4 - len(payload))
+
+    def _audio_only_ts(self, view: memoryview, pids: list[int], audio_pid: int) -> bytes:
+        out = bytearray()
+        pmt_written = False
+        for i, pid in enumerate(pids):
+            if pid == audio_pid or pid == PAT_PID:
+                out += view[i * TS_PACKET_SIZE:(i + 1) * TS_PACKET_SIZE]
+                if pid == PAT_PID and self._pmt_packet is not None:
+                    out += self._pmt_ts_packet()
+                    pmt_written = True
+        if not pmt_written and self._pmt_packet is not None:
+            # PAT/PMT 없이 시작하는 세그먼트도 단독으로 디코딩되도록 앞에 PMT를 둠
+            out[0:0] = self._pmt_ts_packet()
+        return bytes(out)
+
+    @staticmethod
+    def _elementary_stream(view: memoryview, pids: list[int], audio_pid: int) -> bytes:
+        out = bytearray()
+        for i, pid in enumerate(pids):
+            if pid != audio_pid:
+                continue
+            packet = view[i * TS_PACKET_SIZE:(i + 1) * TS_PACKET_SIZE]
+            offset = _payload_offset(packet)
+            if offset is None:
+                continue
+            if packet[1] & 0x40:
+                # PES 시작: 00 00 01 | stream_id | length(2) | flags(2) | header_len | ...
+                pes = packet[offset:]
+                if len(pes) < 9 or pes[0:3] != b"\x00\x00\x01":
+                    continue
+                offset += 9 + pes[8]
+            out += packet[offset:]
+        return bytes(out)
+
+
+def _find_sync(data: bytes) -> int | None:
+    """연속된 두 패킷의 sync byte가 맞는 첫 위치"""
+    if len(data) < TS_PACKET_SIZE:
+        return None
+    limit = min(len(data) - TS_PACKET_SIZE, TS_PACKET_SIZE)
+    for start in range(max(limit, 0) + 1):
+        if data[start] == SYNC_BYTE and (
+            start + TS_PACKET_SIZE >= len(data) or data[start + TS_PACKET_SIZE] == SYNC_BYTE
+        ):
+            return start
+    return None
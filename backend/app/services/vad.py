@@ -0,0 +1,148 @@
+"""에너지 기반 무음 구간 차단 (Deepgram에 무음 전송 생략)
+
+위원회 채널은 방송중 상태로 긴 무음/정회 음악이 이어지는 경우가 많은데,
+Deepgram은 스트리밍한 분량만큼 과금합니다. PCM 프레임을 10ms 창으로 나눠 NumPy로
+한 번에 RMS(dBFS)를 계산하고, 말소리가 없는 프레임은 보내지 않습니다.
+
+  - 프리롤: 무음 중 마지막 PREROLL초는 보관했다가 말소리가 시작되면 먼저 보냄 (첫음절 보존)
+  - 행오버: 말소리가 끝난 뒤 HANGOVER초는 계속 보냄 (Deepgram endpointing이 무음을 보도록)
+  - 차단 중에는 KeepAlive를 보내 연결 유지
+  - Deepgram 타임스탬프(받은 오디오 기준)를 건너뛴 시간만큼 보정해 방송 시각으로 변환
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+WINDOW_MS = 10
+PREROLL = 0.3  # 초
+HANGOVER = 0.6  # 초 (Deepgram endpointing 300ms보다 길게)
+KEEPALIVE_INTERVAL = 5.0  # 차단 중 KeepAlive 간격 (초)
+_MAX_BREAKPOINTS = 512
+
+
+def frame_levels(frame: bytes, sample_rate: int = 16000) -> np.ndarray:
+    """s16le PCM 프레임의 10ms 창별 RMS 레벨 (dBFS)"""
+    samples = np.frombuffer(frame, dtype="<i2")
+    window = sample_rate * WINDOW_MS // 1000
+    count = len(samples) // window
+    if count == 0:
+        windows = samples.reshape(1, -1) if len(samples) else np.zeros((1, 1), dtype="<i2")
+    else:
+        windows = samples[: count * window].reshape(count, window)
+    power = np.mean(np.square(windows, dtype=np.float64), axis=1)
+    return 10 * np.log10(power / (32768.0 ** 2) + 1e-12)
+
+
+class SilenceGate:
+    """PCM 프레임 중 무음을 걸러 전송합니다.
+
+    Args:
+        send: 프레임 전송 함수
+        keepalive: KeepAlive 전송 함수 (기본: send로 KeepAlive JSON 전송)
+        threshold_db: 이 레벨(dBFS)을 넘는 10ms 창이 있으면 말소리 프레임
+        sample_rate: PCM 샘플레이트
+    """
+
+    def __init__(
+        self,
+        send: Callable[..., Awaitable[None]],
+        keepalive: Callable[[], Awaitable[None]] | None = None,
+        threshold_db: float = -45.0,
+        sample_rate: int = 16000,
+    ) -> None:
+        self._send = send
+        self._keepalive = keepalive or self._send_keepalive
+        self.threshold_db = threshold_db
+        self.sample_rate = sample_rate
+        self._preroll: deque[tuple[bytes, float]] = deque()
+        self._preroll_seconds = 0.0
+        self._hangover_left = 0.0
+        self._last_sent_at = time.monotonic()
+        # Deepgram 시각 → 그 시점까지 건너뛴 누적 시간
+        self._bp_times: list[float] = [0.0]
+        self._bp_offsets: list[float] = [0.0]
+        # 지표
+        self.sent_seconds = 0.0
+        self.skipped_seconds = 0.0
+        self.keepalives = 0
+        self.gated = False
+        self.last_level: float | None = None
+
+    async def send(self, frame: bytes) -> None:
+        """프레임 1개를 검사해 말소리(또는 행오버/프리롤)면 전송합니다."""
+        seconds = len(frame) / (self.sample_rate * 2)
+        levels = frame_levels(frame, self.sample_rate)
+        self.last_level = float(levels.max())
+        if self.last_level > self.threshold_db:
+            self._hangover_left = HANGOVER
+            if self.gated:
+                self.gated = False
+                logger.debug("VAD: speech resumed after %.1fs skipped", self.skipped_seconds)
+            # 보관해 둔 직전 무음부터
+            while self._preroll:
+                buffered, buffered_seconds = self._preroll.popleft()
+                await self._forward(buffered, buffered_seconds)
+            self._preroll_seconds = 0.0
+            await self._forward(frame, seconds)
+            return
+
+        if self._hangover_left > 1e-6:
+            self._hangover_left -= seconds
+            await self._forward(frame, seconds)
+            return
+
+        # 무음: 프리롤로 보관하고 넘치는 만큼 버림
+        self.gated = True
+        self._preroll.append((frame, seconds))
+        self._preroll_seconds += seconds
+        while self._preroll and self._preroll_seconds - self._preroll[0][1] >= PREROLL:
+            _, dropped = self._preroll.popleft()
+            self._preroll_seconds -= dropped
+            self.skipped_seconds += dropped
+        if time.monotonic() - self._last_sent_at >= KEEPALIVE_INTERVAL:
+            await self._keepalive()
+            self.keepalives += 1
+            self._last_sent_at = time.monotonic()
+
+    def to_stream_time(self, seconds: float) -> float:
+        """Deepgram 타임스탬프(받은 오디오 기준)를 건너뛴 시간을 더한 스트림 시각으로 변환"""
+        index = bisect.bisect_right(self._bp_times, seconds) - 1
+        return seconds + self._bp_offsets[max(index, 0)]
+
+    def get_metrics(self) -> dict:
+        return {
+            "threshold_db": self.threshold_db,
+            "gated": self.gated,
+            "sent_seconds": round(self.sent_seconds, 1),
+            "skipped_seconds": round(self.skipped_seconds, 1),
+            "keepalives": self.keepalives,
+            "last_level_db": round(self.last_level, 1) if self.last_level is not None else None,
+        }
+
+    # --- 내부 ---
+
+    async def _forward(self, frame: bytes, seconds: float) -> None:
+        if self.skipped_seconds != self._bp_offsets[-1]:
+            # 건너뛴 뒤 처음 보내는 프레임 → Deepgram 시각 sent_seconds부터 오프셋 증가
+            self._bp_times.append(self.sent_seconds)
+            self._bp_offsets.append(self.skipped_seconds)
+            if len(self._bp_times) > _MAX_BREAKPOINTS:
+                # 결과는 최근 오디오에 대한 것이므로 오래된 구간은 버림
+                del self._bp_times[: _MAX_BREAKPOINTS // 2]
+                del self._bp_offsets[: _MAX_BREAKPOINTS // 2]
+        await self._send(frame)
+        self.sent_seconds += seconds
+        self._last_sent_at = time.monotonic()
+
+    async def _send_keepalive(self) -> None:
+        await self._send(json.dumps({"type": "KeepAlive"}))
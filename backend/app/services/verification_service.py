@@ -11,12 +11,14 @@ import logging
 
 from supabase import Client
 
+from app.core.database import run_query
+
 logger = logging.getLogger(__name__)
 
 VALID_STATUSES = {"unverified", "verified", "flagged"}
 
 
-def get_verification_stats(supabase: Client, meeting_id: str) -> dict:
+async def get_verification_stats(supabase: Client, meeting_id: str) -> dict:
     """회의별 검증 통계 조회
 
     Returns:
@@ -30,11 +32,10 @@ def get_verification_stats(supabase: Client, meeting_id: str) -> dict:
     """
     try:
         # 전체 자막 조회 (verification_status 포함)
-        result = (
+        result = await run_query(
             supabase.table("subtitles")
             .select("id, verification_status", count="exact")
             .eq("meeting_id", meeting_id)
-            .execute()
         )
         rows = result.data or []
         total = len(rows)
@@ -74,7 +75,7 @@ def get_verification_stats(supabase: Client, meeting_id: str) -> dict:
         }
 
 
-def get_review_queue(
+async def get_review_queue(
     supabase: Client,
     meeting_id: str,
     confidence_threshold: float = 0.7,
@@ -94,14 +95,13 @@ def get_review_queue(
         }
     """
     try:
-        result = (
+        result = await run_query(
             supabase.table("subtitles")
             .select("*", count="exact")
             .eq("meeting_id", meeting_id)
             .neq("verification_status", "verified")
             .order("confidence", desc=False)
             .range(offset, offset + limit - 1)
-            .execute()
         )
         items = result.data or []
         total = result.count if result.count is not None else len(items)
@@ -122,7 +122,7 @@ def get_review_queue(
         }
 
 
-def update_verification_status(
+async def update_verification_status(
     supabase: Client,
     meeting_id: str,
     subtitle_id: str,
@@ -146,12 +146,11 @@ def update_verification_status(
         return None
 
     try:
-        result = (
+        result = await run_query(
             supabase.table("subtitles")
             .update({"verification_status": status})
             .eq("id", subtitle_id)
             .eq("meeting_id", meeting_id)
-            .execute()
         )
         if result.data:
             logger.info(
@@ -168,7 +167,7 @@ def update_verification_status(
         return None
 
 
-def batch_verify(
+async def batch_verify(
     supabase: Client,
     meeting_id: str,
     subtitle_ids: list[str],
@@ -197,7 +196,7 @@ def batch_verify(
     updated_items: list[dict] = []
 
     for subtitle_id in subtitle_ids:
-        result = update_verification_status(
+        result = await update_verification_status(
             supabase, meeting_id, subtitle_id, status
         )
         if result is not None:
@@ -0,0 +1,343 @@
+"""실시간 자막 → VOD 타임라인 정렬 (VOD 전체 재전사 대신 빈 구간만 재전사)
+
+방송 중 저장된 실시간 자막(live 회의의 subtitles)은 STT 스트림 시각 기준이고,
+VOD는 녹화 시작 기준입니다. 두 타임라인의 차이(offset = VOD 시각 - 실시간 시각)를 구한 뒤
+실시간 자막을 옮기고, 자막이 없는 긴 구간(재연결 공백 등)과 신뢰도가 낮은 자막 구간만
+ffmpeg로 잘라 Deepgram에 다시 보냅니다.
+
+  offset 추정: 실시간 자막이 가장 많은 구간의 VOD 오디오(PROBE_SECONDS)를 전사하고
+              글자열을 맞춰 (difflib 일치 블록) 시각 차이의 중앙값을 사용
+  재전사 구간: 자막 사이 공백 >= min_gap, 신뢰도 < min_confidence 자막
+              (경계는 실시간 자막 경계, 전사는 앞뒤 PAD초를 더해 요청)
+  병합: 재전사 구간 안(중간 지점 기준)의 실시간 자막은 버리고 재전사 결과로 대체
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import logging
+import re
+import statistics
+from difflib import SequenceMatcher
+from pathlib import Path
+
+from supabase import Client
+
+from app.core.database import run_query
+
+logger = logging.getLogger(__name__)
+
+# offset 추정용 VOD 전사 길이 (초)
+PROBE_SECONDS = 120.0
+# 실시간/VOD 타임라인 차이 탐색 범위 (초) — 실시간 STT는 방송 시작 직후 시작됨
+MAX_OFFSET = 900.0
+# offset 후보로 쓰는 최소 일치 글자 수 / 최소 후보 수
+MIN_MATCH_CHARS = 6
+MIN_MATCHES = 3
+# 재전사 요청 시 구간 앞뒤 여유 (초), 이보다 가까운 구간은 합침 (초)
+PAD = 1.0
+MERGE_DISTANCE = 5.0
+# 실시간 자막 조회 페이지 크기 (PostgREST 기본 최대 행 수)
+_PAGE_SIZE = 1000
+
+_NON_TEXT = re.compile(r"[\s.,?!·…\"'()\[\]]+")
+
+
+class ReconcileError(Exception):
+    """실시간 자막 재사용 불가 (전체 재전사로 폴백)"""
+
+
+# ─── 실시간 자막 조회 ───
+
+
+async def find_live_meeting(supabase: Client, meeting: dict) -> str | None:
+    """VOD 회의와 같은 날 같은 채널의 실시간 자막 회의 ID를 찾습니다.
+
+    live 회의 제목은 채널 이름(본회의, 의회운영위원회 등)이므로 VOD 제목에 포함된
+    가장 긴 채널 이름의 회의를 선택합니다. 같은 채널의 회의가 여러 개(차수별 재시작 등)면
+    VOD와 가장 많이 겹치는 회의를 고릅니다 (_overlap_key, 같으면 먼저 만들어진 회의).
+    """
+    if not meeting.get("meeting_date") or not meeting.get("title"):
+        return None
+    result = await run_query(
+        supabase.table("meetings")
+        .select("id, title, stream_url, created_at")
+        .eq("meeting_date", str(meeting["meeting_date"]))
+        .in_("status", ["live", "ended"])
+    )
+    candidates = [
+        row for row in result.data or []
+        if row.get("id") != meeting.get("id")
+        and row.get("stream_url")
+        and row.get("title")
+        and row["title"] in meeting["title"]
+    ]
+    if not candidates:
+        return None
+    longest = max(len(row["title"]) for row in candidates)
+    candidates = sorted(
+        (row for row in candidates if len(row["title"]) == longest),
+        key=lambda row: (row.get("created_at") or "", row["id"]),
+    )
+    if len(candidates) == 1:
+        return candidates[0]["id"]
+
+    duration = meeting.get("duration_seconds")
+    spans = [await _live_span(supabase, row["id"]) for row in candidates]
+    best = max(range(len(candidates)), key=lambda i: _overlap_key(spans[i], duration))
+    logger.info(
+        "live 회의 %d개 중 선택: %s (자막 길이 %.0fs, VOD %s초)",
+        len(candidates), candidates[best]["id"], spans[best], duration,
+    )
+    return candidates[best]["id"]
+
+
+async def _live_span(supabase: Client, meeting_id: str) -> float:
+    """live 회의의 마지막 자막 끝 시각 (초, 자막이 없으면 0)"""
+    result = await run_query(
+        supabase.table("subtitles")
+        .select("end_time")
+        .eq("meeting_id", meeting_id)
+        .order("end_time", desc=True)
+        .limit(1)
+    )
+    return float(result.data[0]["end_time"]) if result.data else 0.0
+
+
+def _overlap_key(span: float, duration: float | None) -> tuple[float, float]:
+    """VOD와 겹치는 정도 (클수록 우선)
+
+    두 타임라인이 모두 방송/녹화 시작(0초)부터라고 보면 겹침은 min(실시간 길이, VOD 길이)이고,
+    겹침이 같으면 길이가 VOD에 더 가까운 회의를 고릅니다. VOD 길이를 모르면 가장 긴 회의.
+    """
+    if not duration:
+        return span, 0.0
+    return min(span, float(duration)), -abs(span - float(duration))
+
+
+async def load_live_subtitles(supabase: Client, meeting_id: str) -> list[dict]:
+    """live 회의의 자막을 시작 시각 순으로 모두 읽습니다 (페이지 단위)."""
+    rows: list[dict] = []
+    while True:
+        result = await run_query(
+            supabase.table("subtitles")
+            .select("start_time, end_time, text, speaker, confidence")
+            .eq("meeting_id", meeting_id)
+            .order("start_time")
+            .range(len(rows), len(rows) + _PAGE_SIZE - 1)
+        )
+        page = result.data or []
+        rows.extend(page)
+        if len(page) < _PAGE_SIZE:
+            return rows
+
+
+# ─── 타임라인 정렬 ───
+
+
+def _normalize(text: str) -> str:
+    return _NON_TEXT.sub("", text)
+
+
+def _timed_chars(cues: list[dict]) -> tuple[str, list[float]]:
+    """자막을 공백/문장부호를 뺀 글자열과 글자별 추정 시각으로 펼칩니다."""
+    chars: list[str] = []
+    times: list[float] = []
+    for cue in cues:
+        text = _normalize(cue.get("text") or "")
+        if not text:
+            continue
+        start = float(cue.get("start_time", 0.0))
+        step = (float(cue.get("end_time", start)) - start) / len(text)
+        chars.append(text)
+        times.extend(start + step * (i + 0.5) for i in range(len(text)))
+    return "".join(chars), times
+
+
+def densest_window(live: list[dict], length: float = PROBE_SECONDS) -> float:
+    """실시간 자막 글자가 가장 많은 length초 구간의 시작 시각"""
+    starts = [float(row["start_time"]) for row in live]
+    sizes = [len(_normalize(row.get("text") or "")) for row in live]
+    best_start, best_size = starts[0] if starts else 0.0, -1
+    total, right = 0, 0
+    for left, start in enumerate(starts):
+        while right < len(starts) and starts[right] < start + length:
+            total += sizes[right]
+            right += 1
+        if total > best_size:
+            best_start, best_size = start, total
+        total -= sizes[left]
+    return best_start
+
+
+def estimate_offset(
+    live: list[dict],
+    probe: list[dict],
+    max_offset: float = MAX_OFFSET,
+) -> float | None:
+    """VOD 전사(probe, VOD 시각)와 실시간 자막의 글자열을 맞춰 offset을 추정합니다.
+
+    Returns:
+        VOD 시각 - 실시간 시각 (일치 블록이 MIN_MATCHES개 미만이면 None)
+    """
+    probe_text, probe_times = _timed_chars(probe)
+    if not probe_text:
+        return None
+    window_start = probe_times[0] - max_offset
+    window_end = probe_times[-1] + max_offset
+    starts = [float(row["start_time"]) for row in live]
+    window = live[bisect.bisect_left(starts, window_start):bisect.bisect_right(starts, window_end)]
+    live_text, live_times = _timed_chars(window)
+    if not live_text:
+        return None
+
+    matcher = SequenceMatcher(None, probe_text, live_text, autojunk=False)
+    candidates: list[float] = []
+    for block in matcher.get_matching_blocks():
+        if block.size < MIN_MATCH_CHARS:
+            continue
+        middle = block.size // 2
+        offset = probe_times[block.a + middle] - live_times[block.b + middle]
+        # 긴 일치일수록 가중치
+        candidates.extend([offset] * (block.size // MIN_MATCH_CHARS))
+    if len(candidates) < MIN_MATCHES:
+        return None
+    return statistics.median(candidates)
+
+
+def shift(live: list[dict], offset: float) -> list[dict]:
+    """실시간 자막을 VOD 타임라인으로 옮깁니다."""
+    return [
+        {
+            **row,
+            "start_time": float(row["start_time"]) + offset,
+            "end_time": float(row["end_time"]) + offset,
+        }
+        for row in live
+    ]
+
+
+# ─── 재전사 구간 ───
+
+
+def find_gaps(
+    live: list[dict],
+    duration: float,
+    min_gap: float,
+    min_confidence: float,
+) -> list[tuple[float, float]]:
+    """VOD 타임라인의 실시간 자막(live)에서 다시 전사할 구간을 찾습니다.
+
+    구간 경계는 실시간 자막의 끝/시작이므로, 경계의 실시간 자막은 중간 지점 기준으로
+    구간 밖에 남고 같은 발화의 재전사 결과도 구간 밖으로 걸러집니다 (분할이 달라도 누락 없음).
+
+    Returns:
+        겹치지 않는 (시작, 끝) 목록 (0~duration으로 제한)
+    """
+    spans: list[tuple[float, float]] = []
+    covered_until = 0.0
+    for row in sorted(live, key=lambda row: row["start_time"]):
+        start, end = float(row["start_time"]), float(row["end_time"])
+        if end <= 0 or start >= duration:
+            continue
+        confidence = row.get("confidence")
+        if confidence is not None and confidence < min_confidence:
+            spans.append((start, end))
+            continue
+        if start - covered_until >= min_gap:
+            spans.append((covered_until, start))
+        covered_until = max(covered_until, end)
+    if duration - covered_until >= min_gap:
+        spans.append((covered_until, duration))
+
+    gaps: list[tuple[float, float]] = []
+    for start, end in sorted(spans):
+        start, end = max(0.0, start), min(duration, end)
+        if gaps and start - gaps[-1][1] < MERGE_DISTANCE:
+            gaps[-1] = (gaps[-1][0], max(gaps[-1][1], end))
+        elif end > start:
+            gaps.append((start, end))
+    return gaps
+
+
+def padded(gap: tuple[float, float], duration: float) -> tuple[float, float]:
+    """재전사 요청 범위 (구간 앞뒤 PAD초, 발화가 구간 경계에서 잘리지 않도록)"""
+    return max(0.0, gap[0] - PAD), min(duration, gap[1] + PAD)
+
+
+def merge(
+    live: list[dict],
+    retranscribed: list[tuple[tuple[float, float], list[dict]]],
+) -> list[dict]:
+    """실시간 자막과 재전사 결과를 합칩니다 (구간 안은 재전사 결과 우선).
+
+    Args:
+        live: VOD 타임라인의 실시간 자막
+        retranscribed: (find_gaps 구간, 그 구간을 padded() 범위로 전사한 자막) 목록
+    """
+    gaps = [gap for gap, _ in retranscribed]
+
+    def in_gap(cue: dict) -> bool:
+        middle = (float(cue["start_time"]) + float(cue["end_time"])) / 2
+        index = bisect.bisect_right(gaps, (middle, float("inf"))) - 1
+        return index >= 0 and gaps[index][0] <= middle < gaps[index][1]
+
+    merged = [row for row in live if not in_gap(row)]
+    for (start, end), cues in retranscribed:
+        for cue in cues:
+            middle = (float(cue["start_time"]) + float(cue["end_time"])) / 2
+            if start <= middle < end:
+                merged.append(cue)
+    return sorted(merged, key=lambda cue: cue["start_time"])
+
+
+# ─── ffmpeg ───
+
+
+async def probe_duration(path: Path) -> float | None:
+    """ffprobe로 미디어 길이(초)를 읽습니다 (실패 시 None)."""
+    try:
+        process = await asyncio.create_subprocess_exec(
+            "ffprobe", "-v", "error",
+            "-show_entries", "format=duration",
+            "-of", "default=noprint_wrappers=1:nokey=1",
+            str(path),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+    except FileNotFoundError:
+        return None
+    stdout, _ = await process.communicate()
+    try:
+        return float(stdout.decode().strip())
+    except ValueError:
+        return None
+
+
+async def cut_audio(
+    path: Path, start: float, end: float, dest: Path, sample_rate: int = 16000
+) -> Path:
+    """MP4의 start~end 구간 오디오를 mono WAV 파일(dest)로 잘라냅니다.
+
+    긴 구간도 메모리에 올리지 않도록 ffmpeg가 파일로 직접 씁니다 (16kHz WAV ≈ 115 MB/시간).
+
+    Raises:
+        ReconcileError: ffmpeg가 없거나 실패한 경우
+    """
+    try:
+        process = await asyncio.create_subprocess_exec(
+            "ffmpeg", "-hide_banner", "-loglevel", "error", "-nostdin", "-y",
+            "-ss", f"{start:.3f}", "-t", f"{end - start:.3f}",
+            "-i", str(path),
+            "-vn", "-ac", "1", "-ar", str(sample_rate),
+            "-f", "wav", str(dest),
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+        )
+    except FileNotFoundError:
+        raise ReconcileError("FFmpeg not found") from None
+    _, stderr = await process.communicate()
+    if process.returncode != 0:
+        raise ReconcileError(f"FFmpeg cut failed: {stderr.decode(errors='replace')[:200]}")
+    return dest
@@ -0,0 +1,611 @@
+"""VOD STT 작업 큐 (vod_stt_jobs 테이블 + 제한된 워커 풀)
+
+POST /api/meetings/{id}/stt는 작업을 큐에 넣기만 하고, vod_stt_concurrency개의 워커가
+우선순위(클수록 먼저) → 등록 순으로 꺼내 처리합니다. 작업 행에는 마지막으로 완료한 단계를
+기록하므로 재시작/배포 후에는 남은 작업을 그 다음 단계부터 이어서 처리합니다.
+
+  queued ─ 워커 ─→ running: downloaded → uploaded → parsed → inserted ─→ completed
+                      │ 실패
+                      └→ queued (백오프 후 재시도, vod_stt_max_attempts회까지) → failed
+
+다운로드 파일과 Deepgram 응답은 vod_stt_work_dir의 {작업 ID}.mp4/.json에, 파싱된 자막은
+작업 행의 result에 남깁니다 (작업 폴더가 비어 있으면 그 이전 단계부터 다시 처리).
+vod_stt_jobs 테이블이 없거나 DB 쓰기에 실패하면 경고만 남기고 메모리에서 계속 처리합니다.
+
+여러 프로세스(uvicorn 워커, 여러 인스턴스)가 같은 테이블을 공유하므로 작업은 조건부 UPDATE
+(queued이거나 하트비트가 끊긴 running일 때만 running으로 변경)로 가져가고, 행을 바꾼
+프로세스만 처리합니다. 처리 중에는 vod_stt_heartbeat_interval마다 heartbeat_at을 갱신하고,
+vod_stt_stale_after 동안 갱신이 없는 running 작업은 다른 프로세스가 주기 조회로 이어받습니다.
+처리 중의 행 갱신은 모두 locked_by가 자신일 때만 적용되며, 하트비트/단계 저장에서 소유권을
+잃은 것을 알게 되면(또는 하트비트가 그만큼 실패하면) 즉시 처리를 중단합니다. 자막 저장 직전의
+parsed 단계 저장은 소유권이 확인되어야만 다음 단계로 넘어갑니다.
+같은 회의의 진행 중인 작업은 유니크 인덱스로 1개만 허용합니다 (VodSttJobConflictError).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import os
+import socket
+import tempfile
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+
+from app.core.config import settings
+from app.core.database import get_supabase_client, run_query
+from app.services.vod_stt_service import (
+    SttCheckpoint,
+    SttTaskStatus,
+    VodSttService,
+    discard_task,
+    finish_task,
+    get_task_by_id,
+    register_task,
+)
+
+logger = logging.getLogger(__name__)
+
+_TABLE = "vod_stt_jobs"
+_UNIQUE_VIOLATION = "23505"  # PostgreSQL unique_violation
+
+
+class VodSttJobConflictError(Exception):
+    """같은 회의의 작업이 이미 대기/처리 중일 때 발생"""
+
+
+class _OwnershipLostError(Exception):
+    """다른 프로세스가 작업을 가져감 (처리 중단)"""
+
+
+def _to_iso(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, UTC).isoformat()
+
+
+def _claimable(stale_before: float) -> str:
+    """가져갈 수 있는 작업 조건 (PostgREST or 필터): queued 또는 하트비트가 끊긴 running"""
+    cutoff = datetime.fromtimestamp(stale_before, UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return (
+        "status.eq.queued,"
+        "and(status.eq.running,heartbeat_at.is.null),"
+        f"and(status.eq.running,heartbeat_at.lt.{cutoff})"
+    )
+
+
+def _from_iso(value: str | None) -> float:
+    if not value:
+        return 0.0
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        return 0.0
+
+
+@dataclass
+class VodSttJob:
+    """VOD STT 작업 (vod_stt_jobs 행)"""
+
+    id: str
+    meeting_id: str
+    vod_url: str
+    live_meeting_id: str | None = None
+    offset_seconds: float | None = None
+    duration_hint: float | None = None
+    priority: int = 0
+    status: str = "queued"  # queued | running | completed | failed
+    stage: str | None = None  # 마지막 완료 단계
+    attempts: int = 0
+    next_run_at: float = 0.0  # epoch 초
+    error: str | None = None
+    result: dict | None = None  # parsed 단계 산출물
+
+    @classmethod
+    def from_row(cls, row: dict) -> VodSttJob:
+        return cls(
+            id=row["id"],
+            meeting_id=row["meeting_id"],
+            vod_url=row["vod_url"],
+            live_meeting_id=row.get("live_meeting_id"),
+            offset_seconds=row.get("offset_seconds"),
+            duration_hint=row.get("duration_hint"),
+            priority=row.get("priority") or 0,
+            status=row.get("status") or "queued",
+            stage=row.get("stage"),
+            attempts=row.get("attempts") or 0,
+            next_run_at=_from_iso(row.get("next_run_at")),
+            error=row.get("error"),
+            result=row.get("result"),
+        )
+
+    def to_row(self) -> dict:
+        return {
+            "id": self.id,
+            "meeting_id": self.meeting_id,
+            "vod_url": self.vod_url,
+            "live_meeting_id": self.live_meeting_id,
+            "offset_seconds": self.offset_seconds,
+            "duration_hint": self.duration_hint,
+            "priority": self.priority,
+            "status": self.status,
+            "stage": self.stage,
+            "attempts": self.attempts,
+            "next_run_at": _to_iso(self.next_run_at),
+            "error": self.error,
+        }
+
+
+class VodSttQueue:
+    """VOD STT 작업 큐와 워커 풀
+
+    Args:
+        concurrency: 동시에 처리하는 작업 수
+        max_attempts: 재시도 포함 최대 시도 횟수
+        work_dir: 다운로드/Deepgram 응답 보관 폴더
+    """
+
+    def __init__(
+        self,
+        concurrency: int | None = None,
+        max_attempts: int | None = None,
+        work_dir: Path | None = None,
+        service: VodSttService | None = None,
+    ) -> None:
+        self._concurrency = max(
+            1, concurrency if concurrency is not None else settings.vod_stt_concurrency
+        )
+        self._max_attempts = max(
+            1, max_attempts if max_attempts is not None else settings.vod_stt_max_attempts
+        )
+        self._work_dir = work_dir or Path(
+            settings.vod_stt_work_dir or Path(tempfile.gettempdir()) / "ggc-vod-stt"
+        )
+        self._service = service or VodSttService()
+        self._jobs: dict[str, VodSttJob] = {}  # 작업 ID → 대기/실행 중인 작업
+        self._ready: list[tuple[int, int, str]] = []  # (-우선순위, 순번, 작업 ID)
+        self._delayed: list[tuple[float, int, str]] = []  # (실행 시각, 순번, 작업 ID)
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._workers: list[asyncio.Task] = []  # type: ignore[type-arg]
+        self._poller: asyncio.Task | None = None  # type: ignore[type-arg]
+        self._interrupted: list[VodSttJob] = []  # 종료로 중단된 작업 (stop()에서 queued로 되돌림)
+        self._claimed: set[str] = set()  # DB에서 선점한 작업 ID (행 갱신 시 locked_by 조건)
+        self._lost: set[str] = set()  # 소유권을 잃어 중단하는 작업 ID
+        self._running = 0
+        self._worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        # 지표
+        self.completed = 0
+        self.failed = 0
+        self.retries = 0
+        self.resumed = 0
+        self.claim_conflicts = 0  # 다른 프로세스가 먼저 가져간 작업 수
+        self.lost_claims = 0  # 처리 중 소유권을 잃고 중단한 작업 수
+        self.last_error: str | None = None
+
+    async def start(self) -> None:
+        """남은 작업을 불러오고 워커를 시작합니다."""
+        if self._workers:
+            return
+        await self._load()
+        self._workers = [
+            asyncio.create_task(self._worker_loop(), name=f"vod-stt-worker-{i}")
+            for i in range(self._concurrency)
+        ]
+        self._poller = asyncio.create_task(self._poll_loop(), name="vod-stt-poller")
+        logger.info(
+            "VodSttQueue started (workers=%d, queued=%d, resumed=%d)",
+            self._concurrency,
+            len(self._jobs),
+            self.resumed,
+        )
+
+    async def stop(self) -> None:
+        """워커를 중지합니다. 실행 중이던 작업은 queued로 되돌려 이어서 처리되게 합니다."""
+        tasks = [*self._workers, *([self._poller] if self._poller else [])]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._workers = []
+        self._poller = None
+        # 하트비트가 끊길 때까지 기다리지 않고 다른 프로세스가 바로 가져갈 수 있게 함
+        for job in self._interrupted:
+            await self._save(job)
+            self._claimed.discard(job.id)
+        self._interrupted.clear()
+        logger.info("VodSttQueue stopped (pending=%d)", len(self._jobs))
+
+    async def submit(
+        self,
+        meeting_id: str,
+        vod_url: str,
+        *,
+        live_meeting_id: str | None = None,
+        offset_seconds: float | None = None,
+        duration_hint: float | None = None,
+        priority: int = 0,
+    ) -> SttTaskStatus:
+        """작업을 큐에 넣고 대기 상태의 태스크를 반환합니다.
+
+        Raises:
+            VodSttJobConflictError: 같은 회의의 작업이 이미 대기/처리 중인 경우
+        """
+        job = VodSttJob(
+            id=str(uuid.uuid4()),
+            meeting_id=meeting_id,
+            vod_url=vod_url,
+            live_meeting_id=live_meeting_id,
+            offset_seconds=offset_seconds,
+            duration_hint=duration_hint,
+            priority=priority,
+            next_run_at=time.time(),
+        )
+        # 저장을 기다리는 동안 _load()가 같은 행을 다시 넣지 않도록 먼저 등록
+        self._jobs[job.id] = job
+        try:
+            await run_query(get_supabase_client().table(_TABLE).insert(job.to_row()))
+        except Exception as e:
+            if getattr(e, "code", None) == _UNIQUE_VIOLATION:
+                del self._jobs[job.id]
+                raise VodSttJobConflictError(meeting_id) from e
+            logger.warning("VodSttQueue: %s 저장 실패 (%s): %s", _TABLE, job.id[:8], e)
+        task = self._register(job)
+        self._push(job)
+        return task
+
+    def get_metrics(self) -> dict:
+        return {
+            "workers": len(self._workers),
+            "running": self._running,
+            "queued": len(self._ready),
+            "delayed": len(self._delayed),
+            "completed": self.completed,
+            "failed": self.failed,
+            "retries": self.retries,
+            "resumed": self.resumed,
+            "claim_conflicts": self.claim_conflicts,
+            "lost_claims": self.lost_claims,
+            "last_error": self.last_error,
+        }
+
+    async def latest_job(self, meeting_id: str) -> dict | None:
+        """회의의 마지막 작업 행 (메모리의 태스크가 없을 때 상태 조회용)"""
+        try:
+            result = await run_query(
+                get_supabase_client().table(_TABLE)
+                .select("id, meeting_id, status, stage, attempts, error, updated_at")
+                .eq("meeting_id", meeting_id)
+                .order("created_at", desc=True)
+                .limit(1)
+            )
+        except Exception as e:
+            logger.debug("VodSttQueue: job lookup failed: %s", e)
+            return None
+        return result.data[0] if result.data else None
+
+    # ─── 스케줄링 ───
+
+    def _push(self, job: VodSttJob) -> None:
+        self._jobs[job.id] = job
+        if job.next_run_at > time.time():
+            heapq.heappush(self._delayed, (job.next_run_at, next(self._seq), job.id))
+        else:
+            heapq.heappush(self._ready, (-job.priority, next(self._seq), job.id))
+        self._wakeup.set()
+
+    def _pop_ready(self) -> VodSttJob | None:
+        now = time.time()
+        while self._delayed and self._delayed[0][0] <= now:
+            _, _, job_id = heapq.heappop(self._delayed)
+            job = self._jobs[job_id]
+            heapq.heappush(self._ready, (-job.priority, next(self._seq), job_id))
+        if not self._ready:
+            return None
+        _, _, job_id = heapq.heappop(self._ready)
+        return self._jobs[job_id]
+
+    async def _worker_loop(self) -> None:
+        while True:
+            job = self._pop_ready()
+            if job is None:
+                self._wakeup.clear()
+                delay = self._delayed[0][0] - time.time() if self._delayed else None
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except TimeoutError:
+                    pass
+                continue
+            self._running += 1
+            try:
+                await self._run(job)
+            except Exception as e:
+                logger.exception("VodSttQueue worker error: %s", e)
+            finally:
+                self._running -= 1
+
+    async def _poll_loop(self) -> None:
+        """다른 프로세스가 등록했거나 하트비트가 끊긴 작업을 주기적으로 불러옵니다."""
+        while True:
+            await asyncio.sleep(settings.vod_stt_heartbeat_interval)
+            await self._load()
+
+    # ─── 실행 ───
+
+    def _register(self, job: VodSttJob) -> SttTaskStatus:
+        task = SttTaskStatus(
+            task_id=job.id,
+            meeting_id=job.meeting_id,
+            status="pending",
+            message="대기 중",
+            error=job.error,
+        )
+        register_task(task)
+        return task
+
+    async def _claim(self, job: VodSttJob) -> bool:
+        """작업 행을 이 프로세스 소유의 running으로 바꿉니다 (다른 프로세스가 가져갔으면 False)."""
+        now = time.time()
+        try:
+            result = await run_query(
+                get_supabase_client().table(_TABLE)
+                .update({
+                    "status": "running",
+                    "locked_by": self._worker_id,
+                    "heartbeat_at": _to_iso(now),
+                })
+                .eq("id", job.id)
+                .or_(_claimable(now - settings.vod_stt_stale_after))
+            )
+        except Exception as e:
+            logger.warning("VodSttQueue: %s 선점 실패, 메모리에서 처리: %s", _TABLE, e)
+            return True
+        if not result.data:
+            return False
+        self._claimed.add(job.id)
+        # 다른 프로세스가 진행한 단계/시도 횟수를 이어받음
+        claimed = VodSttJob.from_row(result.data[0])
+        job.stage, job.attempts, job.result = claimed.stage, claimed.attempts, claimed.result
+        return True
+
+    async def _heartbeat(
+        self,
+        job: VodSttJob,
+        process: asyncio.Task,  # type: ignore[type-arg]
+    ) -> None:
+        """heartbeat_at을 갱신하고, 소유권을 잃었거나 잃었을 수 있으면 처리를 취소합니다."""
+        interval = settings.vod_stt_heartbeat_interval
+        last_beat = time.monotonic()
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                result = await run_query(
+                    get_supabase_client().table(_TABLE)
+                    .update({"heartbeat_at": _to_iso(time.time())})
+                    .eq("id", job.id)
+                    .eq("locked_by", self._worker_id)
+                )
+            except Exception as e:
+                logger.warning("VodSttQueue: 하트비트 실패 (%s): %s", job.id[:8], e)
+                # 다음 하트비트 전에 다른 프로세스가 이어받을 수 있으면 먼저 중단
+                if time.monotonic() - last_beat + interval < settings.vod_stt_stale_after:
+                    continue
+            else:
+                if result.data:
+                    last_beat = time.monotonic()
+                    continue
+            logger.warning("VodSttQueue: 작업 소유권을 잃음, 처리 중단 (%s)", job.id[:8])
+            self._lost.add(job.id)
+            process.cancel()
+            return
+
+    async def _run(self, job: VodSttJob) -> None:
+        if not await self._claim(job):
+            self.claim_conflicts += 1
+            logger.info("VOD STT 작업을 다른 프로세스가 처리 중: %s", job.id[:8])
+            self._abandon(job)
+            return
+        if job.id not in self._claimed:
+            await self._process(job)  # DB 없이 메모리에서 처리
+            return
+        process = asyncio.create_task(self._process(job))
+        heartbeat = asyncio.create_task(self._heartbeat(job, process))
+        try:
+            await process
+        except asyncio.CancelledError:
+            if job.id not in self._lost or not process.cancelled():
+                raise  # 종료 중
+            self._abandon(job)
+        finally:
+            heartbeat.cancel()
+            if job not in self._interrupted:
+                self._claimed.discard(job.id)
+
+    def _abandon(self, job: VodSttJob) -> None:
+        """다른 프로세스가 처리하는 작업을 메모리에서 버립니다 (작업 파일은 그 프로세스 몫)."""
+        if job.id in self._lost:
+            self._lost.discard(job.id)
+            self.lost_claims += 1
+        self._jobs.pop(job.id, None)
+        task = get_task_by_id(job.id)
+        if task is not None:
+            discard_task(task)
+
+    async def _process(self, job: VodSttJob) -> None:
+        job.status = "running"
+        job.attempts += 1
+        task = get_task_by_id(job.id) or self._register(job)
+        task.status = "running"
+        task.message = (
+            "처리 시작" if job.attempts == 1
+            else f"재시도 중 ({job.attempts}/{self._max_attempts})"
+        )
+        if not await self._save(job):
+            self._lost.add(job.id)
+            self._abandon(job)
+            return
+
+        result = job.result or {}
+        checkpoint = SttCheckpoint(
+            stage=job.stage,
+            mp4_path=self._work_dir / f"{job.id}.mp4",
+            response_path=self._work_dir / f"{job.id}.json",
+            subtitles=result.get("subtitles"),
+            duration=result.get("duration"),
+            reconcile=result.get("reconcile"),
+        )
+        self._work_dir.mkdir(parents=True, exist_ok=True)
+
+        async def on_stage(checkpoint: SttCheckpoint) -> None:
+            job.stage = checkpoint.stage
+            extra = None
+            if checkpoint.stage == "parsed":
+                job.result = {
+                    "subtitles": checkpoint.subtitles,
+                    "duration": checkpoint.duration,
+                    "reconcile": checkpoint.reconcile,
+                }
+                extra = {"result": job.result}
+            # 자막 저장(inserted) 전에는 소유권이 확인되어야 함
+            if not await self._save(job, extra=extra, verify=checkpoint.stage == "parsed"):
+                raise _OwnershipLostError(job.id)
+
+        supabase = get_supabase_client()
+        try:
+            await self._service.run(
+                task,
+                job.vod_url,
+                supabase,
+                live_meeting_id=job.live_meeting_id,
+                offset_seconds=job.offset_seconds,
+                duration_hint=job.duration_hint,
+                checkpoint=checkpoint,
+                on_stage=on_stage,
+                # 재시도는 중계 대신 임시 파일 경로 (다운로드 파일을 다음 시도에 재사용)
+                relay=False if job.attempts > 1 else None,
+            )
+        except asyncio.CancelledError:
+            if job.id in self._lost:
+                raise  # 소유권을 잃음 (_run에서 정리)
+            # 종료 중: 파일과 단계는 그대로 두고 다시 시작하면 이어서 처리
+            job.status = "queued"
+            task.status = "pending"
+            task.message = "대기 중"
+            self._push(job)
+            self._interrupted.append(job)
+            raise
+        except _OwnershipLostError:
+            logger.warning(
+                "VodSttQueue: 작업 소유권을 잃었거나 확인할 수 없음, 처리 중단 (%s)", job.id[:8]
+            )
+            self._lost.add(job.id)
+            self._abandon(job)
+            return
+        except Exception as e:
+            job.error = str(e) or type(e).__name__
+            self.last_error = job.error
+            if job.attempts < self._max_attempts:
+                delay = min(
+                    settings.vod_stt_retry_max,
+                    settings.vod_stt_retry_base * 2 ** (job.attempts - 1),
+                )
+                logger.warning(
+                    "VOD STT 실패, %.0f초 후 재시도 (%d/%d, stage=%s): %s",
+                    delay, job.attempts, self._max_attempts, job.stage, job.error,
+                )
+                job.status = "queued"
+                job.next_run_at = time.time() + delay
+                task.status = "pending"
+                task.error = job.error
+                task.message = f"재시도 대기 ({job.attempts}/{self._max_attempts})"
+                self.retries += 1
+                await self._save(job)
+                self._push(job)
+                return
+
+            logger.error("VOD STT 최종 실패 (%d회 시도): %s", job.attempts, job.error)
+            job.status = "failed"
+            self.failed += 1
+            finish_task(task, "failed", "처리 실패", error=job.error)
+            await self._save(job)
+            await self._service.restore_meeting_status(supabase, job.meeting_id)
+        else:
+            job.status = "completed"
+            self.completed += 1
+            # 자막은 subtitles 테이블에 있으므로 작업 행의 사본은 비움
+            job.result = None
+            await self._save(job, extra={"result": None})
+
+        checkpoint.discard_files()
+        self._jobs.pop(job.id, None)
+
+    # ─── 저장 ───
+
+    async def _load(self) -> None:
+        """queued 작업과 하트비트가 끊긴 running 작업(종료된 프로세스의 작업)을 불러옵니다."""
+        try:
+            result = await run_query(
+                get_supabase_client().table(_TABLE)
+                .select("*")
+                .or_(_claimable(time.time() - settings.vod_stt_stale_after))
+                .order("priority", desc=True)
+                .order("created_at")
+            )
+        except Exception as e:
+            logger.warning("VodSttQueue: %s 조회 실패, 메모리에서만 관리: %s", _TABLE, e)
+            return
+        for row in result.data or []:
+            job = VodSttJob.from_row(row)
+            if job.id in self._jobs:
+                continue
+            job.status = "queued"
+            if job.stage or job.attempts:
+                self.resumed += 1
+                logger.info(
+                    "VOD STT 작업 이어서 처리: %s (stage=%s, attempts=%d)",
+                    job.meeting_id, job.stage, job.attempts,
+                )
+            # 태스크는 선점에 성공했을 때 등록 (다른 프로세스가 가져가면 버림)
+            self._push(job)
+
+    async def _save(
+        self,
+        job: VodSttJob,
+        *,
+        extra: dict | None = None,
+        verify: bool = False,
+    ) -> bool:
+        """작업 행을 저장합니다.
+
+        DB에서 선점한 작업은 locked_by가 자신인 행만 갱신하고, 갱신된 행이 없으면
+        (다른 프로세스가 가져감) False를 반환합니다. 저장 실패는 경고만 남기고 True를 반환하며,
+        verify이면 소유권을 확인할 수 없으므로 False를 반환합니다.
+        """
+        row = job.to_row() | (extra or {})
+        if job.status == "running":
+            row |= {"locked_by": self._worker_id, "heartbeat_at": _to_iso(time.time())}
+        else:
+            row["locked_by"] = None
+        query = get_supabase_client().table(_TABLE).update(row).eq("id", job.id)
+        owned = job.id in self._claimed
+        if owned:
+            query = query.eq("locked_by", self._worker_id)
+        try:
+            result = await run_query(query)
+        except Exception as e:
+            logger.warning("VodSttQueue: %s 저장 실패 (%s): %s", _TABLE, job.id[:8], e)
+            return not (owned and verify)
+        return not owned or bool(result.data)
+
+
+# 싱글톤
+_queue: VodSttQueue | None = None
+
+
+def get_vod_stt_queue() -> VodSttQueue:
+    global _queue
+    if _queue is None:
+        _queue = VodSttQueue()
+    return _queue
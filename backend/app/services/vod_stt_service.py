@@ -2,15 +2,30 @@
 
 MP4 파일을 Deepgram Pre-recorded API에 직접 전달하여 자막을 생성합니다.
 ffmpeg 없이 동작하며, Deepgram이 오디오 추출/변환을 처리합니다.
+vod_stt_relay이면 다운로드 스트림을 임시 파일 없이 업로드 본문으로 바로 중계하고,
+vod_stt_audio_transcode이면 ffmpeg로 오디오만 압축(16kHz mono Opus/FLAC)해 업로드합니다.
+
+같은 회의의 실시간 자막이 저장되어 있으면 VOD 타임라인에 맞춰 재사용하고
+빈 구간/저신뢰 구간만 다시 전사합니다 (vod_reconcile, ffmpeg 필요 — 없으면 전체 전사).
+
+파이프라인은 단계(downloaded → uploaded → parsed → inserted)별 체크포인트로 나뉘어 있어
+작업 큐(vod_stt_queue)가 재시작 후 마지막 완료 단계부터 이어서 처리할 수 있습니다.
 
 인메모리 태스크 상태 관리를 포함합니다.
 """
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
+import shutil
 import tempfile
+import time
 import uuid
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -20,12 +35,49 @@ import httpx
 from supabase import Client
 
 from app.core.config import settings
+from app.core.database import run_query
+from app.services import vod_reconcile
 from app.services.dictionary import get_default_dictionary
 from app.services.vod_processor import VodDownloadError
+from app.services.vod_reconcile import ReconcileError
 
 logger = logging.getLogger(__name__)
 
 DEEPGRAM_API_URL = "https://api.deepgram.com/v1/listen"
+DEEPGRAM_PARAMS = {
+    "model": "nova-3",
+    "language": "ko",
+    "smart_format": "true",
+    "punctuate": "true",
+    "diarize": "true",
+    "utterances": "true",
+}
+# 실시간 자막 재사용 시 동시에 재전사하는 구간 수
+RECONCILE_CONCURRENCY = 3
+# KMS 서버는 Referer 헤더 필수
+_KMS_HEADERS = {"Referer": "https://kms.ggc.go.kr/"}
+# 긴 타임아웃: 전송 + Deepgram 서버 처리 시간
+_UPLOAD_TIMEOUT = httpx.Timeout(
+    connect=60.0,
+    read=3600.0,    # 1시간 (Deepgram 처리 대기)
+    write=1800.0,   # 30분 (대용량 파일 전송)
+    pool=60.0,
+)
+
+
+# 오디오 변환 형식: ffmpeg 출력 인자, Content-Type (16kHz mono 공통)
+AUDIO_FORMATS: dict[str, tuple[tuple[str, ...], str]] = {
+    "opus": (("-c:a", "libopus", "-b:a", "24k", "-application", "voip", "-f", "ogg"), "audio/ogg"),
+    "flac": (("-c:a", "flac", "-sample_fmt", "s16", "-f", "flac"), "audio/flac"),
+}
+
+
+class RelayUnavailableError(Exception):
+    """다운로드→업로드 중계 불가 (임시 파일 경로로 다시 처리)"""
+
+
+class TranscodeUnavailableError(Exception):
+    """오디오 변환 불가 (MP4 그대로 업로드)"""
 
 
 # ============================================================================
@@ -44,10 +96,89 @@ class SttTaskStatus:
     message: str = ""
     error: str | None = None
     created_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
-
-
-# 인메모리 태스크 저장소: meeting_id → SttTaskStatus
+    # 실시간 자막 재사용 결과 (재사용하지 않았으면 None)
+    reconcile: dict | None = None
+    # 단계별 소요 시간 (초): relay, download, reconcile, upload, parse, insert
+    timings: dict[str, float] = field(default_factory=dict)
+    # Deepgram 업로드: {format, source_bytes, upload_bytes, reduction}
+    upload: dict | None = None
+
+
+@contextmanager
+def _timed(task: SttTaskStatus, stage: str) -> Iterator[None]:
+    """블록 실행 시간을 task.timings[stage]에 더합니다."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        task.timings[stage] = round(task.timings.get(stage, 0.0) + elapsed, 3)
+
+
+def _record_upload(task: SttTaskStatus, fmt: str, source_bytes: int, upload_bytes: int) -> None:
+    task.upload = {
+        "format": fmt,
+        "source_bytes": source_bytes,
+        "upload_bytes": upload_bytes,
+        "reduction": round(source_bytes / upload_bytes, 1) if upload_bytes else None,
+    }
+
+
+# 인메모리 태스크 저장소: meeting_id → SttTaskStatus (task_id 색인 포함)
 _tasks: dict[str, SttTaskStatus] = {}
+_tasks_by_id: dict[str, SttTaskStatus] = {}
+# 끝난 태스크 (끝난 시각, 태스크) — vod_stt_task_ttl이 지나거나 상한을 넘으면 제거
+_finished: deque[tuple[float, SttTaskStatus]] = deque()
+MAX_FINISHED_TASKS = 200
+
+
+def register_task(task: SttTaskStatus) -> None:
+    """태스크를 등록합니다 (같은 회의의 이전 태스크는 대체)."""
+    _evict_finished()
+    previous = _tasks.get(task.meeting_id)
+    if previous is not None and previous is not task:
+        _tasks_by_id.pop(previous.task_id, None)
+    _tasks[task.meeting_id] = task
+    _tasks_by_id[task.task_id] = task
+
+
+def discard_task(task: SttTaskStatus) -> None:
+    """태스크를 제거합니다 (다른 프로세스가 처리하는 작업)."""
+    if _tasks.get(task.meeting_id) is task:
+        del _tasks[task.meeting_id]
+    if _tasks_by_id.get(task.task_id) is task:
+        del _tasks_by_id[task.task_id]
+
+
+def finish_task(
+    task: SttTaskStatus,
+    status: str,
+    message: str,
+    error: str | None = None,
+) -> None:
+    """태스크를 완료/실패로 표시하고 보관 기간 후 제거되도록 합니다."""
+    task.status = status
+    task.message = message
+    task.error = error
+    if status == "completed":
+        task.progress = 1.0
+    _finished.append((time.monotonic(), task))
+    _evict_finished()
+
+
+def _evict_finished() -> None:
+    now = time.monotonic()
+    while _finished and (
+        now - _finished[0][0] >= settings.vod_stt_task_ttl
+        or len(_finished) > MAX_FINISHED_TASKS
+    ):
+        _, task = _finished.popleft()
+        if task.status not in ("completed", "failed"):
+            continue  # 재시도로 다시 등록된 태스크
+        if _tasks.get(task.meeting_id) is task:
+            del _tasks[task.meeting_id]
+        if _tasks_by_id.get(task.task_id) is task:
+            del _tasks_by_id[task.task_id]
 
 
 def get_task_by_meeting(meeting_id: str) -> SttTaskStatus | None:
@@ -57,10 +188,10 @@ def get_task_by_meeting(meeting_id: str) -> SttTaskStatus | None:
 
 def get_task_by_id(task_id: str) -> SttTaskStatus | None:
     """task_id로 태스크 상태 조회"""
-    for task in _tasks.values():
-        if task.task_id == task_id:
-            return task
-    return None
+    task = _tasks_by_id.get(task_id)
+    if task is None or _tasks.get(task.meeting_id) is not task:
+        return None
+    return task
 
 
 def is_processing(meeting_id: str) -> bool:
@@ -69,6 +200,50 @@ def is_processing(meeting_id: str) -> bool:
     return task is not None and task.status in ("pending", "running")
 
 
+# ============================================================================
+# Checkpoint (단계별 재개)
+# ============================================================================
+
+
+@dataclass
+class SttCheckpoint:
+    """단계별 체크포인트
+
+    stage는 마지막으로 완료한 단계(downloaded | uploaded | parsed | inserted)이며,
+    그 단계의 산출물이 없으면 resume_stage()가 이전 단계로 되돌립니다.
+    mp4_path/response_path를 지정하면 다운로드 파일과 Deepgram 응답을 그 경로에 남깁니다.
+    """
+
+    stage: str | None = None
+    mp4_path: Path | None = None
+    response_path: Path | None = None
+    subtitles: list[dict] | None = None
+    duration: float | None = None
+    reconcile: dict | None = None
+
+    def resume_stage(self) -> str | None:
+        """산출물이 남아 있는 마지막 완료 단계"""
+        if self.stage == "inserted":
+            return "inserted"
+        if self.stage == "parsed" and self.subtitles is not None:
+            return "parsed"
+        if (
+            self.stage in ("parsed", "uploaded")
+            and self.response_path is not None
+            and self.response_path.exists()
+        ):
+            return "uploaded"
+        if self.stage is not None and self.mp4_path is not None and self.mp4_path.exists():
+            return "downloaded"
+        return None
+
+    def discard_files(self) -> None:
+        """다운로드 파일과 Deepgram 응답 파일을 지웁니다."""
+        for path in (self.mp4_path, self.response_path):
+            if path is not None:
+                path.unlink(missing_ok=True)
+
+
 # ============================================================================
 # VOD STT Service
 # ============================================================================
@@ -86,95 +261,356 @@ class VodSttService:
         meeting_id: str,
         vod_url: str,
         supabase: Client,
+        live_meeting_id: str | None = None,
+        offset_seconds: float | None = None,
+        duration_hint: float | None = None,
     ) -> None:
-        """VOD STT 전체 파이프라인 실행
+        """VOD STT 전체 파이프라인 실행 (작업 큐 없이 바로 실행, 실패해도 예외 없음)
 
         파이프라인:
         1. KMS에서 MP4 다운로드 → 임시 파일
         2. 임시 파일 → Deepgram API (MP4 직접 전송)
         3. Deepgram 응답 → 자막 파싱
         4. 자막 DB 저장
+
+        live_meeting_id가 있으면 2~3 대신 그 실시간 자막을 VOD 타임라인으로 옮기고
+        빈 구간만 전사합니다 (실패 시 전체 전사로 폴백).
+
+        Args:
+            live_meeting_id: 재사용할 실시간 자막의 회의 ID
+            offset_seconds: VOD 시각 - 실시간 시각 (없으면 VOD 일부를 전사해 추정)
+            duration_hint: VOD 길이 (ffprobe 실패 시 사용)
         """
         # 태스크 생성/등록
-        task_id = str(uuid.uuid4())
         task = SttTaskStatus(
-            task_id=task_id,
+            task_id=str(uuid.uuid4()),
             meeting_id=meeting_id,
             status="running",
             message="처리 시작",
         )
-        _tasks[meeting_id] = task
-
-        mp4_path: Path | None = None
+        register_task(task)
+        checkpoint = SttCheckpoint()
 
         try:
-            # 1. meeting 상태 → processing
-            self._update_task(task, 0.05, "회의 상태 업데이트 중")
-            await self._update_meeting_status(supabase, meeting_id, "processing")
+            await self.run(
+                task,
+                vod_url,
+                supabase,
+                live_meeting_id=live_meeting_id,
+                offset_seconds=offset_seconds,
+                duration_hint=duration_hint,
+                checkpoint=checkpoint,
+            )
+        except Exception as e:
+            logger.exception(f"VOD STT 처리 실패: {e}")
+            finish_task(task, "failed", "처리 실패", error=str(e) or type(e).__name__)
+            # 에러 시에도 meeting 상태 복원 시도
+            await self.restore_meeting_status(supabase, meeting_id)
+        finally:
+            # 임시 파일 정리
+            checkpoint.discard_files()
+
+    async def run(
+        self,
+        task: SttTaskStatus,
+        vod_url: str,
+        supabase: Client,
+        *,
+        live_meeting_id: str | None = None,
+        offset_seconds: float | None = None,
+        duration_hint: float | None = None,
+        checkpoint: SttCheckpoint | None = None,
+        on_stage: Callable[[SttCheckpoint], Awaitable[None]] | None = None,
+        relay: bool | None = None,
+    ) -> None:
+        """파이프라인을 단계별로 실행합니다 (실패 시 예외를 그대로 올림).
+
+        checkpoint의 마지막 완료 단계 다음부터 처리하고, 단계를 마칠 때마다
+        on_stage(checkpoint)를 호출합니다. 실패해도 체크포인트 파일은 지우지 않습니다.
 
-            # 2. VOD 다운로드 → 임시 파일
+        relay(기본 vod_stt_relay)이면 다운로드를 임시 파일 없이 Deepgram 업로드로 중계하고,
+        중계할 수 없으면 임시 파일 경로로 처리합니다. 실시간 자막 재사용은 파일이 필요하므로 제외.
+        오디오 변환(vod_stt_audio_transcode, ffmpeg 필요)을 쓰면 업로드가 훨씬 작으므로
+        중계 대신 임시 파일에서 오디오만 뽑아 보냅니다.
+        """
+        checkpoint = checkpoint if checkpoint is not None else SttCheckpoint()
+        meeting_id = task.meeting_id
+
+        async def complete(stage: str) -> None:
+            checkpoint.stage = stage
+            if on_stage is not None:
+                await on_stage(checkpoint)
+
+        resumed_from = stage = checkpoint.resume_stage()
+        if stage is not None:
+            logger.info(f"[{meeting_id}] {stage} 단계 이후부터 이어서 처리")
+            task.reconcile = checkpoint.reconcile
+
+        # 1. meeting 상태 → processing
+        self._update_task(task, 0.05, "회의 상태 업데이트 중")
+        await self._update_meeting_status(supabase, meeting_id, "processing")
+
+        # 2~3. VOD 다운로드 → Deepgram 중계 (임시 파일 없음)
+        dg_result: dict | None = None
+        transcode = settings.vod_stt_audio_transcode and shutil.which("ffmpeg") is not None
+        if relay is None:
+            relay = settings.vod_stt_relay
+        if stage is None and relay and not transcode and not live_meeting_id:
+            try:
+                with _timed(task, "relay"):
+                    dg_result = await self._relay_to_deepgram(vod_url, task)
+            except RelayUnavailableError as e:
+                logger.warning(f"[{meeting_id}] 중계 불가, 임시 파일로 처리: {e}")
+            else:
+                if checkpoint.response_path is not None:
+                    checkpoint.response_path.write_text(
+                        json.dumps(dg_result, ensure_ascii=False), encoding="utf-8"
+                    )
+                stage = "uploaded"
+                await complete(stage)
+
+        # 2. VOD 다운로드 → 임시 파일
+        if stage is None:
             self._update_task(task, 0.06, "VOD 다운로드 시작")
-            mp4_path = await self._download_to_file(vod_url, task)
-            file_mb = mp4_path.stat().st_size / (1024 * 1024)
+            with _timed(task, "download"):
+                checkpoint.mp4_path = await self._download_to_file(
+                    vod_url, task, dest=checkpoint.mp4_path
+                )
+            file_mb = checkpoint.mp4_path.stat().st_size / (1024 * 1024)
             logger.info(f"VOD 다운로드 완료: {file_mb:.0f} MB")
+            stage = "downloaded"
+            await complete(stage)
+
+        if stage in ("downloaded", "uploaded"):
+            subtitles: list[dict] | None = None
+            if live_meeting_id and stage == "downloaded":
+                try:
+                    with _timed(task, "reconcile"):
+                        subtitles, checkpoint.duration = await self._reconcile_with_live(
+                            meeting_id, checkpoint.mp4_path, supabase, live_meeting_id,
+                            offset_seconds, duration_hint, task,
+                        )
+                except ReconcileError as e:
+                    logger.warning(f"실시간 자막 재사용 불가, 전체 전사: {e}")
+                    task.reconcile = {"live_meeting_id": live_meeting_id, "error": str(e)}
+
+            if subtitles is None:
+                if dg_result is None and stage == "uploaded":
+                    dg_result = json.loads(checkpoint.response_path.read_text(encoding="utf-8"))
+                elif dg_result is None:
+                    # 3. MP4(또는 변환한 오디오) → Deepgram API 전송
+                    self._update_task(task, 0.2, "Deepgram 전송 시작")
+                    with _timed(task, "upload"):
+                        if transcode:
+                            try:
+                                dg_result = await self._send_audio_to_deepgram(
+                                    checkpoint.mp4_path, task
+                                )
+                            except TranscodeUnavailableError as e:
+                                logger.warning(f"[{meeting_id}] 오디오 변환 실패, MP4 전송: {e}")
+                        if dg_result is None:
+                            dg_result = await self._send_to_deepgram(checkpoint.mp4_path, task)
+                    if checkpoint.response_path is not None:
+                        checkpoint.response_path.write_text(
+                            json.dumps(dg_result, ensure_ascii=False), encoding="utf-8"
+                        )
+                        await complete("uploaded")
+
+                # 임시 파일 즉시 삭제
+                if checkpoint.mp4_path is not None:
+                    checkpoint.mp4_path.unlink(missing_ok=True)
+
+                # 4. Deepgram 응답 → 자막 파싱
+                self._update_task(task, 0.92, "자막 데이터 변환 중")
+                dictionary = get_default_dictionary()
+                with _timed(task, "parse"):
+                    subtitles = self._parse_deepgram_response(
+                        meeting_id, dg_result, dictionary
+                    )
+                logger.info(f"{len(subtitles)}개 자막 생성")
+
+                # duration 추출 (Deepgram 메타데이터)
+                checkpoint.duration = dg_result.get("metadata", {}).get("duration", 0)
+
+            checkpoint.subtitles = subtitles
+            checkpoint.reconcile = task.reconcile
+            stage = "parsed"
+            await complete(stage)
+            checkpoint.discard_files()
+
+        # 5. 자막 DB 저장
+        if stage == "parsed":
+            self._update_task(task, 0.95, "자막 저장 중")
+            with _timed(task, "insert"):
+                if resumed_from == "parsed":
+                    # 이전 시도가 저장 도중 끊겼을 수 있으므로 먼저 비움
+                    await run_query(
+                        supabase.table("subtitles").delete().eq("meeting_id", meeting_id)
+                    )
+                if checkpoint.subtitles:
+                    await self._insert_subtitles(supabase, checkpoint.subtitles)
+            await complete("inserted")
+
+        # 6. meeting 상태 → ended + duration
+        await self._update_meeting_status(
+            supabase,
+            meeting_id,
+            "ended",
+            duration_seconds=int(checkpoint.duration) if checkpoint.duration else None,
+        )
 
-            # 3. MP4 → Deepgram API 직접 전송 (ffmpeg 불필요)
-            self._update_task(task, 0.2, "Deepgram 전송 시작")
-            dg_result = await self._send_to_deepgram(mp4_path, task)
-
-            # 임시 파일 즉시 삭제
-            mp4_path.unlink(missing_ok=True)
-            mp4_path = None
+        # 완료
+        count = len(checkpoint.subtitles or [])
+        finish_task(task, "completed", f"완료 - {count}개 자막 생성")
+        logger.info(f"VOD STT 완료: {count}개 자막 (단계별 {task.timings}, 업로드 {task.upload})")
 
-            # 4. Deepgram 응답 → 자막 파싱
-            self._update_task(task, 0.92, "자막 데이터 변환 중")
-            dictionary = get_default_dictionary()
-            all_subtitles = self._parse_deepgram_response(
-                meeting_id, dg_result, dictionary
-            )
-            logger.info(f"{len(all_subtitles)}개 자막 생성")
+    # ─── 실시간 자막 재사용 ───
 
-            # duration 추출 (Deepgram 메타데이터)
-            duration = dg_result.get("metadata", {}).get("duration", 0)
+    async def _reconcile_with_live(
+        self,
+        meeting_id: str,
+        mp4_path: Path,
+        supabase: Client,
+        live_meeting_id: str,
+        offset_seconds: float | None,
+        duration_hint: float | None,
+        task: SttTaskStatus,
+    ) -> tuple[list[dict], float]:
+        """실시간 자막을 VOD 타임라인으로 옮기고 빈 구간만 전사합니다.
 
-            # 5. 자막 DB 저장
-            self._update_task(task, 0.95, "자막 저장 중")
-            if all_subtitles:
-                await self._insert_subtitles(supabase, all_subtitles)
+        Returns:
+            (VOD 회의 자막 목록, VOD 길이)
 
-            # 6. meeting 상태 → ended + duration
-            await self._update_meeting_status(
-                supabase,
-                meeting_id,
-                "ended",
-                duration_seconds=int(duration) if duration else None,
+        Raises:
+            ReconcileError: 실시간 자막이 없거나 정렬/구간 전사에 실패한 경우
+        """
+        self._update_task(task, 0.2, "실시간 자막 불러오는 중")
+        live = await vod_reconcile.load_live_subtitles(supabase, live_meeting_id)
+        if len(live) < vod_reconcile.MIN_MATCHES:
+            raise ReconcileError(f"실시간 자막 부족 ({len(live)}개)")
+
+        duration = await vod_reconcile.probe_duration(mp4_path) or duration_hint
+        if not duration:
+            raise ReconcileError("VOD 길이를 알 수 없음")
+
+        dictionary = get_default_dictionary()
+        probe_seconds = 0.0
+        if offset_seconds is None:
+            # 실시간 자막이 가장 많은 구간을 전사해 글자열로 맞춤 (방송 시작 ≈ 녹화 시작 가정)
+            self._update_task(task, 0.25, "타임라인 정렬 중")
+            probe_start = min(
+                max(0.0, vod_reconcile.densest_window(live)),
+                max(0.0, duration - vod_reconcile.PROBE_SECONDS),
+            )
+            probe_end = min(duration, probe_start + vod_reconcile.PROBE_SECONDS)
+            probe = await self._transcribe_range(
+                meeting_id, mp4_path, probe_start, probe_end, dictionary
             )
+            probe_seconds = probe_end - probe_start
+            offset_seconds = vod_reconcile.estimate_offset(live, probe)
+            if offset_seconds is None:
+                raise ReconcileError("실시간 자막과 VOD 전사가 일치하지 않음")
+        logger.info(f"실시간 자막 offset: {offset_seconds:+.1f}s ({len(live)}개)")
+
+        aligned = [
+            {**row, "meeting_id": meeting_id}
+            for row in vod_reconcile.shift(live, offset_seconds)
+            if row["end_time"] > 0 and row["start_time"] < duration
+        ]
+        gaps = vod_reconcile.find_gaps(
+            aligned,
+            duration,
+            min_gap=settings.vod_reconcile_min_gap,
+            min_confidence=settings.vod_reconcile_min_confidence,
+        )
 
-            # 완료
-            task.status = "completed"
-            task.progress = 1.0
-            task.message = f"완료 - {len(all_subtitles)}개 자막 생성"
-            logger.info(f"VOD STT 완료: {len(all_subtitles)}개 자막")
+        # 빈 구간 재전사 (동시 RECONCILE_CONCURRENCY개)
+        slots = asyncio.Semaphore(RECONCILE_CONCURRENCY)
+        done = 0
 
-        except Exception as e:
-            logger.exception(f"VOD STT 처리 실패: {e}")
-            task.status = "failed"
-            task.error = str(e) or type(e).__name__
-            task.message = "처리 실패"
+        async def transcribe(gap: tuple[float, float]) -> tuple[tuple[float, float], list[dict]]:
+            nonlocal done
+            async with slots:
+                cues = await self._transcribe_range(
+                    meeting_id, mp4_path, *vod_reconcile.padded(gap, duration), dictionary
+                )
+            done += 1
+            self._update_task(
+                task, 0.3 + 0.6 * done / len(gaps), f"빈 구간 전사 중 ({done}/{len(gaps)})"
+            )
+            return gap, cues
 
-            # 에러 시에도 meeting 상태 복원 시도
-            try:
-                await self._update_meeting_status(supabase, meeting_id, "ended")
-            except Exception:
-                pass
+        retranscribed = list(await asyncio.gather(*(transcribe(gap) for gap in gaps)))
+        subtitles = vod_reconcile.merge(aligned, retranscribed)
+
+        gap_seconds = sum(
+            end - start for start, end in (vod_reconcile.padded(gap, duration) for gap in gaps)
+        )
+        task.reconcile = {
+            "live_meeting_id": live_meeting_id,
+            "offset_seconds": round(offset_seconds, 2),
+            "live_subtitles": len(aligned),
+            "gaps": len(gaps),
+            "transcribed_seconds": round(gap_seconds + probe_seconds, 1),
+            "duration_seconds": round(duration, 1),
+            "saved_ratio": round(1 - (gap_seconds + probe_seconds) / duration, 3),
+        }
+        logger.info(f"실시간 자막 재사용: {task.reconcile}")
+        return subtitles, duration
 
+    async def _transcribe_range(
+        self,
+        meeting_id: str,
+        mp4_path: Path,
+        start: float,
+        end: float,
+        dictionary=None,
+    ) -> list[dict]:
+        """VOD의 start~end 구간만 전사해 VOD 시각 기준 자막으로 반환합니다."""
+        # 구간 오디오는 MP4 옆 임시 WAV 파일로 잘라 스트리밍 전송 (메모리에 올리지 않음)
+        with tempfile.NamedTemporaryFile(suffix=".wav", dir=mp4_path.parent, delete=False) as tmp:
+            wav_path = Path(tmp.name)
+        try:
+            await vod_reconcile.cut_audio(mp4_path, start, end, wav_path)
+            dg_result = await self._transcribe_audio(wav_path)
         finally:
-            # 임시 파일 정리
-            if mp4_path and mp4_path.exists():
-                mp4_path.unlink(missing_ok=True)
+            wav_path.unlink(missing_ok=True)
+        cues = self._parse_deepgram_response(meeting_id, dg_result, dictionary)
+        for cue in cues:
+            cue["start_time"] = float(cue["start_time"]) + start
+            cue["end_time"] = float(cue["end_time"]) + start
+        return cues
 
     # ─── Deepgram 통신 ───
 
+    @staticmethod
+    async def _transcribe_audio(audio_path: Path, content_type: str = "audio/wav") -> dict:
+        """구간 오디오 파일을 Deepgram Pre-recorded API로 전사합니다 (청크 단위 스트리밍)."""
+        headers = {
+            "Authorization": f"Token {settings.deepgram_api_key}",
+            "Content-Type": content_type,
+            "Content-Length": str(audio_path.stat().st_size),
+        }
+
+        async def stream_file():
+            with open(audio_path, "rb") as f:
+                while chunk := f.read(1024 * 1024):
+                    yield chunk
+
+        timeout = httpx.Timeout(connect=60.0, read=600.0, write=300.0, pool=60.0)
+        try:
+            async with httpx.AsyncClient(timeout=timeout) as client:
+                response = await client.post(
+                    DEEPGRAM_API_URL, params=DEEPGRAM_PARAMS, headers=headers, content=stream_file()
+                )
+        except httpx.HTTPError as e:
+            raise ReconcileError(f"Deepgram 요청 실패: {e}") from e
+        if response.status_code != 200:
+            raise ReconcileError(
+                f"Deepgram API 오류 (HTTP {response.status_code}): {response.text[:200]}"
+            )
+        return response.json()
+
     @staticmethod
     async def _send_to_deepgram(
         mp4_path: Path,
@@ -190,14 +626,7 @@ class VodSttService:
         """
         file_size = mp4_path.stat().st_size
 
-        params = {
-            "model": "nova-3",
-            "language": "ko",
-            "smart_format": "true",
-            "punctuate": "true",
-            "diarize": "true",
-            "utterances": "true",
-        }
+        params = dict(DEEPGRAM_PARAMS)
 
         headers = {
             "Authorization": f"Token {settings.deepgram_api_key}",
@@ -226,15 +655,7 @@ class VodSttService:
 
         logger.info(f"Deepgram API 전송 시작: {file_size / (1024*1024):.0f} MB")
 
-        # 긴 타임아웃: 전송 + Deepgram 서버 처리 시간
-        timeout = httpx.Timeout(
-            connect=60.0,
-            read=3600.0,    # 1시간 (Deepgram 처리 대기)
-            write=1800.0,   # 30분 (대용량 파일 전송)
-            pool=60.0,
-        )
-
-        async with httpx.AsyncClient(timeout=timeout) as client:
+        async with httpx.AsyncClient(timeout=_UPLOAD_TIMEOUT) as client:
             task.progress = 0.40
             task.message = "Deepgram 분석 중 (대기)..."
 
@@ -244,16 +665,172 @@ class VodSttService:
                 headers=headers,
                 content=stream_file(),
             )
+            _record_upload(task, "mp4", file_size, uploaded)
+            return VodSttService._deepgram_result(response)
+
+    @staticmethod
+    async def _send_audio_to_deepgram(mp4_path: Path, task: SttTaskStatus) -> dict:
+        """MP4에서 오디오만 16kHz mono로 압축하며 Deepgram에 스트리밍 전송
+
+        ffmpeg 1개 프로세스의 stdout을 그대로 업로드 본문으로 보냅니다 (중간 파일 없음).
+        영상 MP4 대비 업로드 크기가 수십 분의 1로 줄어듭니다 (Opus 24kbps ≈ 11 MB/시간).
+
+        Raises:
+            TranscodeUnavailableError: ffmpeg가 없거나 변환에 실패한 경우 (MP4로 다시 전송)
+        """
+        codec = settings.vod_stt_audio_codec
+        if codec not in AUDIO_FORMATS:
+            raise TranscodeUnavailableError(f"지원하지 않는 오디오 형식: {codec}")
+        output_args, content_type = AUDIO_FORMATS[codec]
+        try:
+            process = await asyncio.create_subprocess_exec(
+                "ffmpeg", "-hide_banner", "-loglevel", "error", "-nostdin",
+                "-i", str(mp4_path),
+                "-vn", "-ac", "1", "-ar", "16000",
+                *output_args, "pipe:1",
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except FileNotFoundError:
+            raise TranscodeUnavailableError("FFmpeg not found") from None
+        stderr_task = asyncio.create_task(process.stderr.read())
 
-            if response.status_code == 429:
-                raise Exception("Deepgram API rate limit 초과. 잠시 후 다시 시도해 주세요.")
-            if response.status_code != 200:
-                error_text = response.text[:500]
-                raise Exception(f"Deepgram API 오류 (HTTP {response.status_code}): {error_text}")
+        source_size = mp4_path.stat().st_size
+        uploaded = 0
+
+        async def stream_audio():
+            nonlocal uploaded
+            while chunk := await process.stdout.read(256 * 1024):
+                uploaded += len(chunk)
+                task.progress = 0.30
+                task.message = f"오디오 변환 전송 중 ({uploaded / (1024 * 1024):.1f} MB)"
+                yield chunk
+            if await process.wait() != 0:
+                stderr = (await stderr_task).decode(errors="replace")[:200]
+                raise TranscodeUnavailableError(f"FFmpeg 변환 실패: {stderr}")
+            task.progress = 0.40
+            task.message = "Deepgram 분석 중 (대기)..."
+
+        headers = {
+            "Authorization": f"Token {settings.deepgram_api_key}",
+            "Content-Type": content_type,
+        }
+        logger.info(f"오디오 변환 전송 시작 ({codec}): 원본 {source_size / (1024*1024):.0f} MB")
+        try:
+            async with httpx.AsyncClient(timeout=_UPLOAD_TIMEOUT) as client:
+                response = await client.post(
+                    DEEPGRAM_API_URL,
+                    params=dict(DEEPGRAM_PARAMS),
+                    headers=headers,
+                    content=stream_audio(),
+                )
+        finally:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            stderr_task.cancel()
+        _record_upload(task, codec, source_size, uploaded)
+        logger.info(
+            f"오디오 업로드 {uploaded / (1024*1024):.1f} MB "
+            f"(원본 대비 1/{task.upload['reduction']})"
+        )
+        return VodSttService._deepgram_result(response)
+
+    @staticmethod
+    async def _relay_to_deepgram(vod_url: str, task: SttTaskStatus) -> dict:
+        """KMS 다운로드 스트림을 임시 파일 없이 Deepgram 업로드 본문으로 중계
 
-            result = response.json()
-            logger.info("Deepgram API 응답 수신 완료")
-            return result
+        다운로드 태스크가 청크를 크기 제한 버퍼(vod_stt_relay_buffer_mb)에 넣고 업로드가
+        꺼내 보내므로, 업로드가 느리면 버퍼가 차서 다운로드도 멈춥니다 (backpressure).
+        진행률은 중계한 바이트 기준으로 6%~40% 구간에 매핑합니다.
+
+        Raises:
+            RelayUnavailableError: Content-Length가 없거나 중계 도중 연결이 끊긴 경우
+                (호출자는 임시 파일 경로로 다시 처리)
+        """
+        chunk_size = 512 * 1024
+        buffer: asyncio.Queue[bytes | BaseException | None] = asyncio.Queue(
+            max(1, settings.vod_stt_relay_buffer_mb * 1024 * 1024 // chunk_size)
+        )
+        # 업로드가 다운로드 속도를 정하므로 전체 제한 없이 읽기 대기만 제한
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=60.0, sock_read=300.0)
+
+        try:
+            async with aiohttp.ClientSession(timeout=timeout) as session:
+                async with session.get(vod_url, headers=_KMS_HEADERS) as response:
+                    if response.status != 200:
+                        raise VodDownloadError(f"VOD 다운로드 실패: HTTP {response.status}")
+                    total_size = response.content_length
+                    if not total_size:
+                        raise RelayUnavailableError("Content-Length 없음")
+
+                    async def pump() -> None:
+                        try:
+                            async for chunk in response.content.iter_chunked(chunk_size):
+                                await buffer.put(chunk)
+                        except Exception as e:
+                            await buffer.put(e)
+                        else:
+                            await buffer.put(None)
+
+                    relayed = 0
+
+                    async def body():
+                        nonlocal relayed
+                        while True:
+                            chunk = await buffer.get()
+                            if chunk is None:
+                                break
+                            if isinstance(chunk, BaseException):
+                                raise RelayUnavailableError(f"다운로드 중단: {chunk}") from chunk
+                            relayed += len(chunk)
+                            mb_done = relayed / (1024 * 1024)
+                            mb_total = total_size / (1024 * 1024)
+                            task.progress = 0.06 + (0.34 * relayed / total_size)
+                            task.message = f"VOD 중계 중 ({mb_done:.0f}/{mb_total:.0f} MB)"
+                            yield chunk
+                        if relayed != total_size:
+                            raise RelayUnavailableError(
+                                f"다운로드 크기 불일치 ({relayed}/{total_size} bytes)"
+                            )
+                        task.progress = 0.40
+                        task.message = "Deepgram 분석 중 (대기)..."
+
+                    headers = {
+                        "Authorization": f"Token {settings.deepgram_api_key}",
+                        "Content-Type": "video/mp4",
+                        "Content-Length": str(total_size),
+                    }
+                    logger.info(f"VOD → Deepgram 중계 시작: {total_size / (1024*1024):.0f} MB")
+                    pump_task = asyncio.create_task(pump())
+                    try:
+                        async with httpx.AsyncClient(timeout=_UPLOAD_TIMEOUT) as client:
+                            dg_response = await client.post(
+                                DEEPGRAM_API_URL,
+                                params=dict(DEEPGRAM_PARAMS),
+                                headers=headers,
+                                content=body(),
+                            )
+                    finally:
+                        pump_task.cancel()
+                        await asyncio.gather(pump_task, return_exceptions=True)
+        except (aiohttp.ClientError, httpx.TransportError, TimeoutError) as e:
+            raise RelayUnavailableError(f"중계 연결 오류: {e}") from e
+        _record_upload(task, "mp4", total_size, relayed)
+        return VodSttService._deepgram_result(dg_response)
+
+    @staticmethod
+    def _deepgram_result(response: httpx.Response) -> dict:
+        """Deepgram 응답 상태 확인 후 JSON 반환"""
+        if response.status_code == 429:
+            raise Exception("Deepgram API rate limit 초과. 잠시 후 다시 시도해 주세요.")
+        if response.status_code != 200:
+            error_text = response.text[:500]
+            raise Exception(f"Deepgram API 오류 (HTTP {response.status_code}): {error_text}")
+
+        result = response.json()
+        logger.info("Deepgram API 응답 수신 완료")
+        return result
 
     @staticmethod
     def _parse_deepgram_response(
@@ -383,24 +960,31 @@ class VodSttService:
         vod_url: str,
         task: SttTaskStatus,
         timeout_seconds: float = 1800.0,
+        dest: Path | None = None,
     ) -> Path:
         """VOD를 임시 파일에 스트리밍 다운로드 (메모리 절약)
 
         다운로드 진행률을 6%~18% 구간에 매핑합니다.
 
+        Args:
+            dest: 저장 경로 (없으면 임시 파일)
+
         Returns:
             다운로드된 임시 파일 경로
         """
         timeout = aiohttp.ClientTimeout(total=timeout_seconds)
-        # KMS 서버는 Referer 헤더 필수
-        headers = {"Referer": "https://kms.ggc.go.kr/"}
 
-        tmp = tempfile.NamedTemporaryFile(suffix=".mp4", delete=False)
-        tmp_path = Path(tmp.name)
+        if dest is None:
+            tmp = tempfile.NamedTemporaryFile(suffix=".mp4", delete=False)
+            tmp_path = Path(tmp.name)
+        else:
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            tmp = open(dest, "wb")
+            tmp_path = dest
 
         try:
             async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(vod_url, headers=headers) as response:
+                async with session.get(vod_url, headers=_KMS_HEADERS) as response:
                     if response.status != 200:
                         raise VodDownloadError(
                             f"VOD 다운로드 실패: HTTP {response.status}"
@@ -458,7 +1042,15 @@ class VodSttService:
         if duration_seconds is not None:
             data["duration_seconds"] = duration_seconds
 
-        supabase.table("meetings").update(data).eq("id", meeting_id).execute()
+        await run_query(supabase.table("meetings").update(data).eq("id", meeting_id))
+
+    @classmethod
+    async def restore_meeting_status(cls, supabase: Client, meeting_id: str) -> None:
+        """처리 실패 후 meeting 상태를 ended로 되돌립니다 (실패는 무시)."""
+        try:
+            await cls._update_meeting_status(supabase, meeting_id, "ended")
+        except Exception:
+            pass
 
     @staticmethod
     async def _insert_subtitles(
@@ -466,4 +1058,4 @@ class VodSttService:
         subtitles: list[dict],
     ) -> None:
         """Supabase REST로 자막 배치 삽입"""
-        supabase.table("subtitles").insert(subtitles).execute()
+        await run_query(supabase.table("subtitles").insert(subtitles))
@@ -0,0 +1,174 @@
+"""DB 호출 중 이벤트 루프 지연(lag) 벤치마크
+
+동시 API 부하 상황에서 이벤트 루프가 얼마나 멈추는지 측정합니다.
+PostgREST 왕복은 time.sleep()으로 블로킹하는 Mock 클라이언트로 재현합니다.
+
+  - blocking: 기존 방식 (async 핸들러 안에서 .execute() 직접 호출)
+  - executor: run_query() (DB 전용 스레드 풀에서 .execute() 실행)
+
+실행:
+    cd backend
+    python -m benchmarks.bench_db_event_loop_lag --requests 200 --concurrency 20 --latency 0.02
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from typing import Any
+
+os.environ.setdefault("SUPABASE_URL", "http://localhost")
+os.environ.setdefault("SUPABASE_KEY", "benchmark")
+
+import httpx  # noqa: E402
+
+from app.api import bills, exports, meetings, search, subtitles  # noqa: E402
+from app.core.database import get_supabase  # noqa: E402
+from app.main import app  # noqa: E402
+from app.services import history_tracker, summary_service, verification_service  # noqa: E402
+
+_PATCHED_MODULES = [
+    bills,
+    exports,
+    meetings,
+    search,
+    subtitles,
+    history_tracker,
+    summary_service,
+    verification_service,
+]
+
+
+class _Response:
+    def __init__(self, data: list, count: int | None = None):
+        self.data = data
+        self.count = count
+
+
+class _SlowQuery:
+    """execute() 시 latency초 동안 스레드를 블로킹하는 쿼리 빌더"""
+
+    def __init__(self, latency: float, rows: list[dict]):
+        self._latency = latency
+        self._rows = rows
+
+    def __getattr__(self, name: str) -> Any:
+        # select/eq/order/range/... 체이닝은 모두 self 반환
+        return lambda *args, **kwargs: self
+
+    def execute(self) -> _Response:
+        time.sleep(self._latency)
+        return _Response(self._rows, count=len(self._rows))
+
+
+class _SlowClient:
+    def __init__(self, latency: float, rows: list[dict]):
+        self._latency = latency
+        self._rows = rows
+
+    def table(self, name: str) -> _SlowQuery:
+        return _SlowQuery(self._latency, self._rows)
+
+
+async def _inline_execute(query: Any) -> Any:
+    """변경 전 동작: 이벤트 루프 스레드에서 .execute()를 직접 실행"""
+    return query.execute()
+
+
+async def _measure_lag(stop: asyncio.Event, samples: list[float], interval: float) -> None:
+    """interval마다 깨어나 예정 시각 대비 지연을 기록합니다."""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        samples.append(max(0.0, loop.time() - expected))
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+async def _run(mode: str, total: int, concurrency: int, latency: float) -> dict:
+    rows = [
+        {
+            "id": str(i),
+            "meeting_id": "m1",
+            "text": f"자막 {i}",
+            "start_time": float(i),
+            "end_time": float(i + 1),
+            "speaker": None,
+            "confidence": 0.9,
+        }
+        for i in range(20)
+    ]
+    client = _SlowClient(latency, rows)
+    app.dependency_overrides[get_supabase] = lambda: client
+
+    originals = {mod: mod.run_query for mod in _PATCHED_MODULES}
+    if mode == "blocking":
+        for mod in _PATCHED_MODULES:
+            mod.run_query = _inline_execute  # type: ignore[attr-defined]
+
+    samples: list[float] = []
+    stop = asyncio.Event()
+    sem = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+
+        async def one(i: int) -> None:
+            async with sem:
+                # 자막 목록 조회: count + data 2회 왕복
+                resp = await http.get("/api/meetings/m1/subtitles", params={"limit": 20})
+                resp.raise_for_status()
+
+        probe = asyncio.create_task(_measure_lag(stop, samples, 0.005))
+        started = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(total)))
+        elapsed = time.perf_counter() - started
+        stop.set()
+        await probe
+
+    for mod, fn in originals.items():
+        mod.run_query = fn  # type: ignore[attr-defined]
+    app.dependency_overrides.clear()
+
+    return {
+        "mode": mode,
+        "elapsed_s": elapsed,
+        "rps": total / elapsed,
+        "lag_p50_ms": statistics.median(samples) * 1000 if samples else 0.0,
+        "lag_p99_ms": _percentile(samples, 99) * 1000,
+        "lag_max_ms": max(samples) * 1000 if samples else 0.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.02, help="PostgREST 왕복 지연 (초)")
+    args = parser.parse_args()
+
+    print(
+        f"requests={args.requests} concurrency={args.concurrency} "
+        f"db_latency={args.latency * 1000:.0f}ms"
+    )
+    print(f"{'mode':<10} {'elapsed':>9} {'rps':>8} {'lag p50':>9} {'lag p99':>9} {'lag max':>9}")
+    for mode in ("blocking", "executor"):
+        r = asyncio.run(_run(mode, args.requests, args.concurrency, args.latency))
+        print(
+            f"{r['mode']:<10} {r['elapsed_s']:>8.2f}s {r['rps']:>8.1f} "
+            f"{r['lag_p50_ms']:>7.1f}ms {r['lag_p99_ms']:>7.1f}ms {r['lag_max_ms']:>7.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""DictionaryService.correct 마이크로 벤치마크
+
+사전 규모(기본 10,000 항목)에서 자막 1건 교정 비용을 비교합니다.
+
+  - naive: 항목마다 str.replace (변경 전 방식, O(항목 수 × 텍스트))
+  - aho-corasick: 컴파일된 오토마톤으로 1회 스캔
+
+실행:
+    cd backend
+    python -m benchmarks.bench_dictionary_correct --entries 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from app.services.dictionary import DictionaryEntry, DictionaryService
+
+_SYLLABLES = "가나다라마바사아자차카타파하거너더러머버서어저처커터퍼허고노도로모보소오조초"
+
+
+def _word(rng: random.Random, lo: int, hi: int) -> str:
+    return "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(lo, hi)))
+
+
+def _naive_correct(entries: dict[str, DictionaryEntry], text: str) -> str:
+    result = text
+    for wrong_text, entry in entries.items():
+        result = result.replace(wrong_text, entry.correct_text)
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=10_000)
+    parser.add_argument("--texts", type=int, default=2_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    entries = [
+        DictionaryEntry(_word(rng, 3, 8), _word(rng, 3, 8), "term") for _ in range(args.entries)
+    ]
+    # 자막 길이 (인터림/확정 자막 수준: 20~80자)
+    texts = [
+        " ".join(_word(rng, 2, 6) for _ in range(rng.randint(5, 15))) for _ in range(args.texts)
+    ]
+
+    service = DictionaryService(entries=entries)
+    started = time.perf_counter()
+    service.correct("워밍업")
+    compile_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    for text in texts:
+        service.correct(text)
+    ac_us = (time.perf_counter() - started) / len(texts) * 1e6
+
+    naive_entries = {e.wrong_text: e for e in entries}
+    sample = texts[: max(1, len(texts) // 10)]
+    started = time.perf_counter()
+    for text in sample:
+        _naive_correct(naive_entries, text)
+    naive_us = (time.perf_counter() - started) / len(sample) * 1e6
+
+    print(f"entries={args.entries} texts={args.texts}")
+    print(f"compile (once):      {compile_ms:10.1f} ms")
+    print(f"naive str.replace:   {naive_us:10.1f} us/text")
+    print(f"aho-corasick:        {ac_us:10.1f} us/text")
+    print(f"speedup:             {naive_us / ac_us:10.1f} x")
+
+
+if __name__ == "__main__":
+    main()
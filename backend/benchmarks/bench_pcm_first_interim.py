@@ -0,0 +1,165 @@
+"""세그먼트 통째 전송 vs PCM 프레임 전송: 첫 인터림까지 걸리는 시간
+
+로컬 가짜 Deepgram(WebSocket 서버)에 라이브 방송처럼 segment_seconds마다 세그먼트가
+도착하는 상황을 재현하고, 각 세그먼트 안의 발화 시작이 인터림으로 돌아올 때까지의 시간을
+세그먼트 도착 시각 기준으로 측정합니다.
+
+가짜 Deepgram 모델:
+  - 받은 오디오 길이(16kHz s16le 바이트 수)로 오디오 시각을 계산
+  - 오디오 interim_every초마다 인터림 1개 (Deepgram 인터림 주기와 비슷하게)
+  - eager: 받은 오디오를 즉시 처리 / realtime: 연결 후 1배속보다 빨리 처리하지 않음
+
+모드:
+  - segment: 세그먼트 PCM을 send 한 번으로 전송 (기존 방식)
+  - pcm lead=X: PcmStreamer로 frame_ms 프레임을 실시간 + X초까지 앞서 전송
+    (ffmpeg 대신 입력을 그대로 출력하는 디코더 프로세스 사용)
+
+실행:
+    cd backend
+    python -m benchmarks.bench_pcm_first_interim --segments 6 --model eager
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+os.environ.setdefault("SUPABASE_URL", "http://localhost")
+os.environ.setdefault("SUPABASE_KEY", "benchmark")
+
+from websockets.asyncio.client import connect  # noqa: E402
+from websockets.asyncio.server import serve  # noqa: E402
+from websockets.exceptions import ConnectionClosed  # noqa: E402
+
+from app.services.pcm_stream import PcmStreamer  # noqa: E402
+
+BYTES_PER_SECOND = 16000 * 2
+WORD_SECONDS = 0.3  # 발화 시작 후 인식에 필요한 오디오
+PASSTHROUGH = [
+    sys.executable,
+    "-c",
+    "import os\nwhile True:\n    d = os.read(0, 65536)\n    if not d: break\n    os.write(1, d)",
+]
+
+
+def _fake_deepgram(model: str, interim_every: float):
+    async def handler(ws) -> None:
+        received = 0
+        emitted = 0.0
+        started: float | None = None
+        try:
+            async for message in ws:
+                if isinstance(message, str):
+                    continue
+                if started is None:
+                    started = time.monotonic()
+                received += len(message)
+                audio_end = received / BYTES_PER_SECOND
+                while emitted + interim_every <= audio_end:
+                    emitted += interim_every
+                    if model == "realtime":
+                        wait = started + emitted - time.monotonic()
+                        if wait > 0:
+                            await asyncio.sleep(wait)
+                    await ws.send(json.dumps({"is_final": False, "audio_end": emitted}))
+        except ConnectionClosed:
+            pass
+
+    return handler
+
+
+async def _run(
+    mode: str,
+    lead: float,
+    segments: int,
+    segment_seconds: float,
+    model: str,
+    interim_every: float,
+    frame_ms: int,
+) -> list[float]:
+    rng = random.Random(7)
+    onsets = [rng.uniform(0, segment_seconds - WORD_SECONDS) for _ in range(segments)]
+    pcm = b"\x00" * int(segment_seconds * BYTES_PER_SECOND)
+
+    async with serve(_fake_deepgram(model, interim_every), "127.0.0.1", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        async with connect(f"ws://127.0.0.1:{port}", max_size=None) as ws:
+            arrived: list[float] = []
+            latencies: list[float] = []
+
+            async def receive() -> None:
+                pending = 0
+                async for message in ws:
+                    audio_end = json.loads(message)["audio_end"]
+                    now = time.monotonic()
+                    while pending < len(arrived):
+                        word_end = pending * segment_seconds + onsets[pending] + WORD_SECONDS
+                        if audio_end < word_end:
+                            break
+                        latencies.append(now - arrived[pending])
+                        pending += 1
+                    if pending == segments:
+                        return
+
+            receiver = asyncio.create_task(receive())
+            streamer = None
+            pump = None
+            if mode == "pcm":
+                streamer = PcmStreamer(ws.send, frame_ms=frame_ms, max_lead=lead,
+                                       command=PASSTHROUGH)
+                await streamer.start()
+                pump = asyncio.create_task(streamer.run())
+
+            t0 = time.monotonic()
+            for i in range(segments):
+                # 라이브: segment_seconds마다 완성된 세그먼트가 하나씩 도착
+                await asyncio.sleep(max(0.0, t0 + i * segment_seconds - time.monotonic()))
+                arrived.append(time.monotonic())
+                if streamer is not None:
+                    await streamer.feed(pcm)
+                else:
+                    await ws.send(pcm)
+
+            async with asyncio.timeout(segment_seconds * 4):
+                await receiver
+            if pump is not None and streamer is not None:
+                pump.cancel()
+                await asyncio.gather(pump, return_exceptions=True)
+                await streamer.close()
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--segments", type=int, default=6)
+    parser.add_argument("--segment-seconds", type=float, default=2.0)
+    parser.add_argument("--model", choices=["eager", "realtime"], default="eager")
+    parser.add_argument("--interim-every", type=float, default=1.0, help="인터림 주기 (오디오 초)")
+    parser.add_argument("--frame-ms", type=int, default=100)
+    args = parser.parse_args()
+
+    print(
+        f"segments={args.segments} x {args.segment_seconds:.1f}s model={args.model} "
+        f"interim_every={args.interim_every:.1f}s frame={args.frame_ms}ms"
+    )
+    print(f"{'mode':<16} {'first interim p50':>18} {'mean':>9} {'max':>9}")
+    for mode, lead in [("segment", 0.0), ("pcm", 0.0), ("pcm", 0.5), ("pcm", 2.0)]:
+        latencies = asyncio.run(
+            _run(mode, lead, args.segments, args.segment_seconds, args.model,
+                 args.interim_every, args.frame_ms)
+        )
+        label = mode if mode == "segment" else f"pcm lead={lead:.1f}"
+        print(
+            f"{label:<16} {statistics.median(latencies) * 1000:>16.0f}ms "
+            f"{statistics.mean(latencies) * 1000:>7.0f}ms {max(latencies) * 1000:>7.0f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""Kiwi 띄어쓰기 교정 중 이벤트 루프 지연(lag) 벤치마크
+
+채널 N개가 인터림/확정 자막을 내보낼 때 이벤트 루프가 얼마나 멈추는지 측정합니다.
+실제 Kiwi를 사용하며, 기본은 워밍업된 인스턴스로 시작합니다 (--cold: 첫 호출의 모델 로딩 포함).
+
+  - inline: 기존 방식 (채널 태스크에서 kiwi.space() 직접 호출)
+  - thread: SpacingService (SPACING_EXECUTOR=thread) + 채널 간 마이크로 배칭
+  - process: SpacingService (SPACING_EXECUTOR=process, 기본값) + 채널 간 마이크로 배칭
+
+실행:
+    cd backend
+    python -m benchmarks.bench_spacing_event_loop_lag --channels 18 --rate 4 --duration 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import random
+import re
+import statistics
+import time
+
+os.environ.setdefault("SUPABASE_URL", "http://localhost")
+os.environ.setdefault("SUPABASE_KEY", "benchmark")
+
+from app.services.spacing import SpacingService, create_kiwi  # noqa: E402
+
+_PHRASES = [
+    "경기도의회제{n}차본회의를개의하겠습니다",
+    "의사일정제{n}항경기도예산안을상정합니다",
+    "위원장님질의시간{n}분드리겠습니다",
+    "해당사업의집행률이{n}퍼센트에불과한이유를설명해주십시오",
+    "도민의안전을위한예산이{n}억원삭감되었습니다",
+]
+
+
+def _utterance(rng: random.Random) -> str:
+    """인터림처럼 발화가 누적되며 길어지는 띄어쓰기 없는 텍스트 (구 2~6개)"""
+    text = "".join(
+        rng.choice(_PHRASES).format(n=rng.randint(1, 99)) for _ in range(rng.randint(2, 6))
+    )
+    return text[: rng.randint(len(text) // 2, len(text))]
+
+
+async def _measure_lag(stop: asyncio.Event, samples: list[float], interval: float) -> None:
+    """interval마다 깨어나 예정 시각 대비 지연을 기록합니다."""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        samples.append(max(0.0, loop.time() - expected))
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+async def _run(mode: str, channels: int, rate: float, duration: float, cold: bool) -> dict:
+    kiwi = create_kiwi() if mode == "inline" else None
+    service = SpacingService(workers=1, executor=mode if kiwi is None else "thread")
+    if not cold:
+        # 첫 호출의 모델 지연 로딩은 측정에서 제외
+        if kiwi is not None:
+            kiwi.space("워밍업")
+        else:
+            await service.space("워밍업")
+
+    async def space(text: str) -> str:
+        if mode == "inline":
+            return re.sub(r"\s{2,}", " ", kiwi.space(text)).strip()
+        return await service.space(text)
+
+    processed = 0
+    latencies: list[float] = []
+    deadline = time.monotonic() + duration
+
+    async def channel(idx: int) -> None:
+        nonlocal processed
+        rng = random.Random(idx)
+        # 채널마다 시작 시점을 흩어 동시 도착을 현실적으로 분산
+        await asyncio.sleep(rng.random() / rate)
+        while time.monotonic() < deadline:
+            started = time.perf_counter()
+            await space(_utterance(rng))
+            latencies.append(time.perf_counter() - started)
+            processed += 1
+            await asyncio.sleep(1 / rate)
+
+    samples: list[float] = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_measure_lag(stop, samples, 0.005))
+    await asyncio.gather(*(channel(i) for i in range(channels)))
+    stop.set()
+    await probe
+    await service.stop()
+
+    return {
+        "mode": mode,
+        "texts": processed,
+        "spacing_p99_ms": _percentile(latencies, 99) * 1000,
+        "lag_p50_ms": statistics.median(samples) * 1000 if samples else 0.0,
+        "lag_p99_ms": _percentile(samples, 99) * 1000,
+        "lag_max_ms": max(samples) * 1000 if samples else 0.0,
+        "avg_batch": service.get_metrics()["avg_batch"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--channels", type=int, default=18)
+    parser.add_argument("--rate", type=float, default=4.0, help="채널당 초당 인터림 수")
+    parser.add_argument("--duration", type=float, default=10.0, help="측정 시간 (초)")
+    parser.add_argument(
+        "--cold", action="store_true", help="워밍업 없이 시작 (첫 호출의 모델 로딩 포함)"
+    )
+    args = parser.parse_args()
+
+    print(
+        f"channels={args.channels} rate={args.rate}/s duration={args.duration:.0f}s "
+        f"cold={args.cold}"
+    )
+    print(
+        f"{'mode':<8} {'texts':>6} {'space p99':>10} {'lag p50':>9} {'lag p99':>9} "
+        f"{'lag max':>9} {'batch':>6}"
+    )
+    for mode in ("inline", "thread", "process"):
+        r = asyncio.run(_run(mode, args.channels, args.rate, args.duration, args.cold))
+        print(
+            f"{r['mode']:<8} {r['texts']:>6} {r['spacing_p99_ms']:>8.1f}ms "
+            f"{r['lag_p50_ms']:>7.1f}ms {r['lag_p99_ms']:>7.1f}ms {r['lag_max_ms']:>7.1f}ms "
+            f"{r['avg_batch']:>6.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""WebSocket 브로드캐스트 직렬화 비용 벤치마크
+
+방 하나에 클라이언트 N명이 붙어 있을 때 브로드캐스트 1건당 CPU 시간을 측정합니다.
+두 모드 모두 같은 송신 큐/writer 경로를 지나고, 소켓 쓰기는 바이트 수만 세는 Mock입니다.
+
+  - per-client: 기존 방식 (writer마다 send_json → 클라이언트 수만큼 json.dumps)
+  - encode-once: 1회 직렬화 후 같은 문자열을 모든 writer가 send_text
+
+실행:
+    cd backend
+    python -m benchmarks.bench_ws_broadcast_encode --clients 10 100 500 --messages 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import time
+import uuid
+from datetime import UTC, datetime
+from typing import Any
+
+os.environ.setdefault("SUPABASE_URL", "http://localhost")
+os.environ.setdefault("SUPABASE_KEY", "benchmark")
+
+from app.api import websocket as ws_module  # noqa: E402
+from app.api.websocket import ConnectionManager  # noqa: E402
+
+
+class _PerClientFrame:
+    """text에 접근할 때마다 직렬화하는 프레임 (writer별 send_json 재현)"""
+
+    def __init__(self, message: dict[str, Any]) -> None:
+        self.type = message["type"]
+        self._message = message
+
+    @property
+    def text(self) -> str:
+        # starlette.websockets.WebSocket.send_json(mode="text")과 동일
+        return json.dumps(self._message, separators=(",", ":"), ensure_ascii=False)
+
+
+class _NullWebSocket:
+    """쓰기 대신 바이트 수만 세는 소켓"""
+
+    def __init__(self) -> None:
+        self.bytes_written = 0
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_text(self, data: str) -> None:
+        self.bytes_written += len(data)
+
+
+def _subtitle(i: int) -> dict[str, Any]:
+    return {
+        "subtitle": {
+            "id": str(uuid.uuid4()),
+            "meeting_id": "ch8",
+            "text": f"경기도의회 제{i}차 본회의를 개의하겠습니다. 의사일정 제1항을 상정합니다.",
+            "start_time": float(i),
+            "end_time": float(i) + 2.5,
+            "confidence": 0.93,
+            "speaker": "Speaker 1",
+            "created_at": datetime.now(UTC).isoformat(),
+        }
+    }
+
+
+async def _run(mode: str, clients: int, messages: list[dict[str, Any]]) -> float:
+    original = ws_module._encode
+    if mode == "per-client":
+        ws_module._encode = _PerClientFrame  # type: ignore[assignment]
+
+    cm = ConnectionManager(queue_size=len(messages) + 1)
+    sockets = [_NullWebSocket() for _ in range(clients)]
+    for ws in sockets:
+        await cm.connect(ws, "ch8")  # type: ignore[arg-type]
+
+    started = time.process_time()
+    for data in messages:
+        await cm.broadcast_subtitle("ch8", data)
+        # writer 태스크가 큐를 비울 때까지 양보
+        await asyncio.sleep(0)
+    while any(cm._senders[ws].pending for ws in sockets):  # type: ignore[index]
+        await asyncio.sleep(0)
+    elapsed = time.process_time() - started
+
+    for ws in sockets:
+        cm.disconnect(ws, "ch8")  # type: ignore[arg-type]
+    ws_module._encode = original
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, nargs="+", default=[10, 100, 500])
+    parser.add_argument("--messages", type=int, default=200)
+    args = parser.parse_args()
+
+    messages = [_subtitle(i) for i in range(args.messages)]
+    print(f"messages={args.messages}")
+    print(f"{'clients':>8} {'per-client':>14} {'encode-once':>14} {'speedup':>8}")
+    for clients in args.clients:
+        legacy = asyncio.run(_run("per-client", clients, messages))
+        shared = asyncio.run(_run("encode-once", clients, messages))
+        print(
+            f"{clients:>8} "
+            f"{legacy / args.messages * 1e6:>11.0f} µs "
+            f"{shared / args.messages * 1e6:>11.0f} µs "
+            f"{legacy / shared if shared else 0:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+-- =============================================================================
+-- 006_dictionary_reload.sql
+-- 용어 사전 DB 핫 리로드 지원
+-- 실행일: 2026-10-16
+-- =============================================================================
+
+-- =============================================================================
+-- 1. dictionary 테이블 확장 - 수정 시각
+-- =============================================================================
+ALTER TABLE dictionary ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ DEFAULT NOW();
+
+COMMENT ON COLUMN dictionary.updated_at IS '수정 시각';
+
+DROP TRIGGER IF EXISTS dictionary_updated_at ON dictionary;
+CREATE TRIGGER dictionary_updated_at
+  BEFORE UPDATE ON dictionary
+  FOR EACH ROW EXECUTE FUNCTION update_updated_at();
+
+-- =============================================================================
+-- 2. dictionary_version: 사전 변경 버전 (단일 행)
+-- =============================================================================
+-- 백엔드는 이 행의 version만 주기적으로 조회하고, 값이 바뀐 경우에만
+-- dictionary 전체를 다시 읽어 교정 오토마톤을 재컴파일합니다.
+CREATE TABLE IF NOT EXISTS dictionary_version (
+  id SMALLINT PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+  version BIGINT NOT NULL DEFAULT 0,
+  updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+COMMENT ON TABLE dictionary_version IS '용어 사전 변경 버전 (INSERT/UPDATE/DELETE 시 자동 증가)';
+
+INSERT INTO dictionary_version (id, version) VALUES (1, 0) ON CONFLICT (id) DO NOTHING;
+
+CREATE OR REPLACE FUNCTION bump_dictionary_version()
+RETURNS TRIGGER AS $$
+BEGIN
+  UPDATE dictionary_version SET version = version + 1, updated_at = NOW() WHERE id = 1;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS dictionary_version_bump ON dictionary;
+CREATE TRIGGER dictionary_version_bump
+  AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON dictionary
+  FOR EACH STATEMENT EXECUTE FUNCTION bump_dictionary_version();
+
+-- =============================================================================
+-- 3. 기본 의회 용어 (Deepgram 한국어 STT 오인식 보정)
+-- =============================================================================
+-- 백엔드 내장 사전(app/services/dictionary.py)과 동일한 항목입니다.
+-- 이후 운영자는 이 테이블에 행을 추가/수정하면 재배포 없이 반영됩니다.
+INSERT INTO dictionary (wrong_text, correct_text, category) VALUES
+  ('사내를 선포', '산회를 선포', 'term'),
+  ('사내 를 선포', '산회를 선포', 'term'),
+  ('사내선포', '산회 선포', 'term'),
+  ('사내합니다', '산회합니다', 'term'),
+  ('사내를', '산회를', 'term'),
+  ('사내 합니다', '산회합니다', 'term'),
+  ('개이합니다', '개의합니다', 'term'),
+  ('개이를 선포', '개의를 선포', 'term'),
+  ('정회를 선포', '정회를 선포', 'term'),
+  ('소개합니다', '속개합니다', 'term'),
+  ('속계합니다', '속개합니다', 'term'),
+  ('상정 하겠습니다', '상정하겠습니다', 'term'),
+  ('의안을 상정 합니다', '의안을 상정합니다', 'term'),
+  ('의결 하겠습니다', '의결하겠습니다', 'term'),
+  ('위원장 님', '위원장님', 'term'),
+  ('의원 님', '의원님', 'term'),
+  ('도지사 님', '도지사님', 'term'),
+  ('경기 도의회', '경기도의회', 'term'),
+  ('경기도 의회', '경기도의회', 'term'),
+  ('보건 복지 위원회', '보건복지위원회', 'term'),
+  ('질의 하겠습니다', '질의하겠습니다', 'term'),
+  ('답변 하겠습니다', '답변하겠습니다', 'term'),
+  ('출석을 부르겠습니다', '출석을 부르겠습니다', 'term')
+ON CONFLICT (wrong_text) DO NOTHING;
+
+-- =============================================================================
+-- 4. RLS 비활성화 (MVP - 내부 사용)
+-- =============================================================================
+ALTER TABLE dictionary_version DISABLE ROW LEVEL SECURITY;
+
+-- =============================================================================
+-- 마이그레이션 완료
+-- 검증: SELECT version FROM dictionary_version;
+-- =============================================================================
@@ -0,0 +1,58 @@
+-- =============================================================================
+-- 007_vod_stt_jobs.sql
+-- VOD STT 작업 큐 (재시작/배포 후 이어서 처리)
+-- 실행일: 2026-10-16
+-- =============================================================================
+
+-- =============================================================================
+-- 1. vod_stt_jobs: VOD STT 작업
+-- =============================================================================
+-- 백엔드는 시작 시 queued/running 작업을 다시 읽어 stage(마지막 완료 단계)부터 처리합니다.
+--   stage: NULL → downloaded → uploaded → parsed → inserted
+-- parsed 이후에는 파싱된 자막을 result에 보관하므로 Deepgram 전사를 다시 하지 않습니다.
+CREATE TABLE IF NOT EXISTS vod_stt_jobs (
+  id UUID DEFAULT gen_random_uuid() PRIMARY KEY,
+  meeting_id UUID NOT NULL REFERENCES meetings(id) ON DELETE CASCADE,
+  vod_url TEXT NOT NULL,
+  live_meeting_id UUID,                          -- 재사용할 실시간 자막 회의
+  offset_seconds DOUBLE PRECISION,               -- VOD 시각 - 실시간 자막 시각
+  duration_hint DOUBLE PRECISION,                -- 알려진 VOD 길이 (초)
+  priority INTEGER NOT NULL DEFAULT 0,           -- 클수록 먼저 처리
+  status VARCHAR(20) NOT NULL DEFAULT 'queued'
+    CHECK (status IN ('queued', 'running', 'completed', 'failed')),
+  stage VARCHAR(20)
+    CHECK (stage IN ('downloaded', 'uploaded', 'parsed', 'inserted')),
+  attempts INTEGER NOT NULL DEFAULT 0,
+  next_run_at TIMESTAMPTZ DEFAULT NOW(),         -- 재시도 대기 중이면 다음 실행 시각
+  error TEXT,
+  result JSONB,                                  -- {subtitles, duration, reconcile}
+  created_at TIMESTAMPTZ DEFAULT NOW(),
+  updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+COMMENT ON TABLE vod_stt_jobs IS 'VOD STT 작업 큐 (단계별 체크포인트)';
+COMMENT ON COLUMN vod_stt_jobs.stage IS '마지막 완료 단계 (downloaded, uploaded, parsed, inserted)';
+COMMENT ON COLUMN vod_stt_jobs.attempts IS '시작한 횟수 (재시도 포함)';
+COMMENT ON COLUMN vod_stt_jobs.result IS 'parsed 단계 산출물 (자막 목록, VOD 길이, 실시간 자막 재사용 결과)';
+
+-- 회의당 진행 중인 작업은 1개
+CREATE UNIQUE INDEX IF NOT EXISTS idx_vod_stt_jobs_active_meeting
+  ON vod_stt_jobs(meeting_id) WHERE status IN ('queued', 'running');
+
+CREATE INDEX IF NOT EXISTS idx_vod_stt_jobs_status
+  ON vod_stt_jobs(status, priority DESC, created_at);
+
+DROP TRIGGER IF EXISTS vod_stt_jobs_updated_at ON vod_stt_jobs;
+CREATE TRIGGER vod_stt_jobs_updated_at
+  BEFORE UPDATE ON vod_stt_jobs
+  FOR EACH ROW EXECUTE FUNCTION update_updated_at();
+
+-- =============================================================================
+-- 2. RLS 비활성화 (MVP - 내부 사용)
+-- =============================================================================
+ALTER TABLE vod_stt_jobs DISABLE ROW LEVEL SECURITY;
+
+-- =============================================================================
+-- 마이그레이션 완료
+-- 검증: SELECT status, stage, count(*) FROM vod_stt_jobs GROUP BY 1, 2;
+-- =============================================================================
@@ -0,0 +1,25 @@
+-- =============================================================================
+-- 008_vod_stt_job_claims.sql
+-- VOD STT 작업 선점/하트비트 (여러 프로세스가 같은 큐를 공유)
+-- 실행일: 2026-10-16
+-- =============================================================================
+
+-- =============================================================================
+-- 1. vod_stt_jobs 확장 - 처리 중인 프로세스와 하트비트
+-- =============================================================================
+-- 백엔드는 queued 작업(또는 heartbeat_at이 오래된 running 작업)을 조건부 UPDATE로
+-- running으로 바꾼 프로세스만 처리합니다. 처리 중에는 heartbeat_at을 주기적으로 갱신하고,
+-- VOD_STT_STALE_AFTER 동안 갱신이 없으면 프로세스가 죽은 것으로 보고 다른 프로세스가 이어받습니다.
+ALTER TABLE vod_stt_jobs ADD COLUMN IF NOT EXISTS locked_by TEXT;
+ALTER TABLE vod_stt_jobs ADD COLUMN IF NOT EXISTS heartbeat_at TIMESTAMPTZ;
+
+COMMENT ON COLUMN vod_stt_jobs.locked_by IS '처리 중인 프로세스 (호스트:PID:임의값)';
+COMMENT ON COLUMN vod_stt_jobs.heartbeat_at IS '처리 중인 프로세스의 마지막 하트비트';
+
+CREATE INDEX IF NOT EXISTS idx_vod_stt_jobs_heartbeat
+  ON vod_stt_jobs(heartbeat_at) WHERE status = 'running';
+
+-- =============================================================================
+-- 마이그레이션 완료
+-- 검증: SELECT id, status, locked_by, heartbeat_at FROM vod_stt_jobs WHERE status = 'running';
+-- =============================================================================
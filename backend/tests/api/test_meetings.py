@@ -5,13 +5,15 @@ TDD RED 단계: 테스트 먼저 작성
 
 import uuid
 from datetime import date
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
 
+from app.core.database import get_supabase
 from app.main import app
 from app.schemas.meeting import MeetingCreate, MeetingResponse, MeetingStatus
+from app.services.vod_stt_queue import VodSttJobConflictError
 
 
 client = TestClient(app)
@@ -245,6 +247,36 @@ class TestCreateMeeting:
         assert response.status_code == 422
 
 
+# =============================================================================
+# POST /api/meetings/{id}/stt - VOD STT 등록
+# =============================================================================
+
+class TestStartSttProcessing:
+    """POST /api/meetings/{id}/stt 테스트"""
+
+    def test_job_in_another_process_returns_409(self, sample_meeting_response: dict):
+        """다른 프로세스에 등록된 작업(유니크 인덱스 위반)이면 409를 반환한다"""
+        sample_meeting_response["vod_url"] = "https://example.com/vod.mp4"
+        meeting_id = sample_meeting_response["id"]
+        app.dependency_overrides[get_supabase] = lambda: MagicMock()
+
+        with patch("app.api.meetings.get_meeting_by_id_service") as mock_service, \
+                patch("app.api.meetings.find_live_meeting", AsyncMock(return_value=None)), \
+                patch("app.api.meetings.get_vod_stt_queue") as mock_queue:
+            mock_service.return_value = sample_meeting_response
+            mock_queue.return_value.submit = AsyncMock(
+                side_effect=VodSttJobConflictError(meeting_id)
+            )
+
+            response = client.post(f"/api/meetings/{meeting_id}/stt")
+
+            assert response.status_code == 409
+            assert "진행 중" in response.json()["detail"]
+            mock_queue.return_value.submit.assert_awaited_once()
+
+        app.dependency_overrides.clear()
+
+
 # =============================================================================
 # Schema 테스트
 # =============================================================================
@@ -0,0 +1 @@
+"""Core 테스트 모듈"""
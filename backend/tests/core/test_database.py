@@ -0,0 +1,67 @@
+"""run_query (DB 전용 스레드 풀) 테스트
+
+동기 Supabase .execute()가 이벤트 루프 밖에서 실행되는지 검증합니다.
+"""
+
+import asyncio
+import threading
+import time
+
+from app.core.database import run_query, shutdown_db_executor
+
+
+class _BlockingQuery:
+    """execute()가 동기적으로 블로킹되는 쿼리 빌더 스텁"""
+
+    def __init__(self, delay: float = 0.0, data: list | None = None):
+        self._delay = delay
+        self._data = data or []
+        self.thread_name: str | None = None
+
+    def execute(self):
+        self.thread_name = threading.current_thread().name
+        time.sleep(self._delay)
+        return self._data
+
+
+async def test_run_query_returns_execute_result():
+    """run_query는 execute()의 반환값을 그대로 돌려줘야 합니다."""
+    query = _BlockingQuery(data=[{"id": "1"}])
+    result = await run_query(query)
+    assert result == [{"id": "1"}]
+
+
+async def test_run_query_runs_off_event_loop_thread():
+    """execute()는 DB 전용 스레드에서 실행되어야 합니다."""
+    query = _BlockingQuery()
+    await run_query(query)
+    assert query.thread_name is not None
+    assert query.thread_name.startswith("db")
+    assert query.thread_name != threading.current_thread().name
+
+
+async def test_run_query_does_not_block_other_coroutines():
+    """느린 쿼리 실행 중에도 다른 코루틴이 진행되어야 합니다."""
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    tick_task = asyncio.create_task(ticker())
+    try:
+        await asyncio.gather(*(run_query(_BlockingQuery(delay=0.2)) for _ in range(4)))
+    finally:
+        tick_task.cancel()
+
+    # 0.2초 동안 10ms 틱이 여러 번 돌았어야 함 (블로킹이면 0~1회)
+    assert ticks >= 5
+
+
+async def test_shutdown_db_executor_recreates_on_next_use():
+    """shutdown 이후에도 다음 호출 시 풀이 재생성되어야 합니다."""
+    shutdown_db_executor()
+    result = await run_query(_BlockingQuery(data=[1]))
+    assert result == [1]
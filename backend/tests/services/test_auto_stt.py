@@ -9,6 +9,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from app.services.auto_stt import AutoSttManager, LIVESTATUS_BROADCASTING
+from app.services.broadcast_bus import InProcessBus
 
 
 @pytest.fixture
@@ -301,3 +302,62 @@ class TestManagerLifecycle:
         await disabled_manager.start()
 
         assert disabled_manager._monitor_task is None
+
+
+class _FollowerBus(InProcessBus):
+    """리더가 아닌 워커의 버스 (선출 결과는 테스트에서 _set_leader로 지정)"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.is_leader = False
+
+
+class TestLeadership:
+    """멀티 워커: 선출된 STT 생산자만 STT 실행."""
+
+    @pytest.fixture
+    def follower(self, mock_status_service, mock_stt_service):
+        bus = _FollowerBus()
+        with patch("app.services.auto_stt.settings") as mock_settings:
+            mock_settings.stt_auto_start = True
+            mock_settings.deepgram_api_key = "test-key"
+            mgr = AutoSttManager(
+                status_service=mock_status_service,
+                stt_service=mock_stt_service,
+                bus=bus,
+            )
+        return mgr, bus
+
+    async def test_follower_does_not_start_stt(
+        self, follower, mock_status_service, mock_stt_service
+    ):
+        """리더가 아니면 방송중 채널이 있어도 STT를 시작하지 않는다."""
+        mgr, _ = follower
+        mock_status_service.fetch_status = AsyncMock(return_value={"A011": 1})
+
+        await mgr.start()
+
+        assert mgr._monitor_task is None
+        assert await mgr.ensure_stt_for_live_channels() == []
+        mock_stt_service.start.assert_not_called()
+        await mgr.stop()
+
+    async def test_follows_leadership_changes(
+        self, follower, mock_status_service, mock_stt_service
+    ):
+        """리더가 되면 방송중 채널 STT를 시작하고, 리더를 잃으면 모두 중지한다."""
+        mgr, bus = follower
+        mock_status_service.fetch_status = AsyncMock(return_value={"A011": 1})
+        await mgr.start()
+
+        bus._set_leader(True)
+        await mgr._leadership_task
+        mock_stt_service.start.assert_called_once()
+        assert mgr._monitor_task is not None and not mgr._monitor_task.done()
+
+        bus._set_leader(False)
+        await mgr._leadership_task
+        mock_stt_service.stop_all.assert_called_once()
+        assert mgr._monitor_task is None
+
+        await mgr.stop()
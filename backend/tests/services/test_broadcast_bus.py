@@ -0,0 +1,257 @@
+"""자막 브로드캐스트 버스 테스트"""
+
+import asyncio
+import json
+from collections.abc import Callable
+
+import pytest
+
+from app.api.websocket import ConnectionManager
+from app.services.broadcast_bus import (
+    BroadcastBroker,
+    BroadcastBus,
+    BrokerBus,
+    InProcessBus,
+    create_broadcast_bus,
+    parse_bus_url,
+)
+
+
+class _RecordingWebSocket:
+    def __init__(self) -> None:
+        self.sent: list[dict] = []
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_text(self, data: str) -> None:
+        self.sent.append(json.loads(data))
+
+
+async def _wait_for(condition: Callable[[], bool], timeout: float = 2.0) -> None:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not condition():
+        if loop.time() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.01)
+
+
+def _item(sub_id: str) -> dict:
+    return {"subtitle": {"id": sub_id, "text": f"자막 {sub_id}"}}
+
+
+def _history_ids(cm: ConnectionManager, room: str) -> list[str]:
+    return [item["subtitle"]["id"] for item in cm.subtitle_history.get(room, ())]
+
+
+class TestBusUrl:
+    """버스 주소 파싱"""
+
+    def test_parse_unix(self) -> None:
+        assert parse_bus_url("unix:///tmp/bus.sock") == ("unix", "/tmp/bus.sock")
+
+    def test_parse_tcp(self) -> None:
+        assert parse_bus_url("tcp://127.0.0.1:6390") == ("tcp", ("127.0.0.1", 6390))
+
+    def test_invalid_url(self) -> None:
+        with pytest.raises(ValueError):
+            parse_bus_url("redis://localhost")
+
+    def test_create_bus(self) -> None:
+        assert isinstance(create_broadcast_bus(""), InProcessBus)
+        assert isinstance(create_broadcast_bus("unix:///tmp/bus.sock"), BrokerBus)
+
+
+class TestInProcessBus:
+    """프로세스 내부 버스"""
+
+    async def test_publish_applies_immediately(self) -> None:
+        cm = ConnectionManager(bus=InProcessBus())
+        await cm.broadcast_subtitle("ch1", _item("s1"))
+
+        assert _history_ids(cm, "ch1") == ["s1"]
+
+    def test_interface_is_abstract(self) -> None:
+        with pytest.raises(TypeError):
+            BroadcastBus()
+
+    def test_single_process_is_leader(self) -> None:
+        assert InProcessBus().is_leader
+
+
+class TestBroker:
+    """브로커를 통한 워커 간 전달"""
+
+    @pytest.fixture
+    async def broker(self, tmp_path):
+        broker = BroadcastBroker(f"unix://{tmp_path}/bus.sock", replay_size=100)
+        await broker.start()
+        yield broker
+        await broker.stop()
+
+    async def _worker(self, broker: BroadcastBroker) -> ConnectionManager:
+        cm = ConnectionManager(bus=BrokerBus(broker.url, reconnect_delay=0.01))
+        await cm.start()
+        await _wait_for(lambda: cm.bus.connected)
+        return cm
+
+    async def test_events_reach_every_worker_with_same_seq(self, broker) -> None:
+        """한 워커가 발행한 자막을 모든 워커가 같은 seq로 전송한다"""
+        a = await self._worker(broker)
+        b = await self._worker(broker)
+        ws_a, ws_b = _RecordingWebSocket(), _RecordingWebSocket()
+        await a.connect(ws_a, "ch1")
+        await b.connect(ws_b, "ch1")
+
+        await a.broadcast_subtitle("ch1", _item("s1"))
+        await b.broadcast_interim_subtitle("ch1", {"text": "인터림"})
+        await b.broadcast_corrected_subtitle("ch1", {"id": "s1", "corrected_text": "교정"})
+        await _wait_for(lambda: len(ws_a.sent) == 3 and len(ws_b.sent) == 3)
+
+        assert ws_a.sent == ws_b.sent
+        assert [m["type"] for m in ws_a.sent] == [
+            "subtitle_created", "subtitle_interim", "subtitle_corrected",
+        ]
+        assert ws_a.sent[2]["seq"] == ws_a.sent[0]["seq"] + 1
+        assert a.subtitle_history["ch1"].get("s1")["subtitle"]["text"] == "교정"
+        assert b.subtitle_history["ch1"].get("s1")["subtitle"]["text"] == "교정"
+
+        await a.stop()
+        await b.stop()
+
+    async def test_late_worker_replays_history(self, broker) -> None:
+        """나중에 뜬 워커도 보관 이벤트로 같은 히스토리와 seq를 갖는다"""
+        a = await self._worker(broker)
+        for i in range(3):
+            await a.broadcast_subtitle("ch1", _item(f"s{i}"))
+        await _wait_for(lambda: len(_history_ids(a, "ch1")) == 3)
+
+        b = await self._worker(broker)
+        await _wait_for(lambda: len(_history_ids(b, "ch1")) == 3)
+
+        assert _history_ids(b, "ch1") == ["s0", "s1", "s2"]
+        assert b._last_seq["ch1"] == a._last_seq["ch1"]
+
+        await a.stop()
+        await b.stop()
+
+    async def test_clear_history_propagates(self, broker) -> None:
+        a = await self._worker(broker)
+        b = await self._worker(broker)
+        await a.broadcast_subtitle("ch1", _item("s1"))
+        await _wait_for(lambda: _history_ids(b, "ch1") == ["s1"])
+
+        b.clear_history("ch1")
+        await _wait_for(lambda: "ch1" not in a.subtitle_history)
+
+        c = await self._worker(broker)
+        await asyncio.sleep(0.05)
+        assert "ch1" not in c.subtitle_history
+
+        for cm in (a, b, c):
+            await cm.stop()
+
+    async def test_reconnect_does_not_resend_to_clients(self, broker) -> None:
+        """브로커 재접속 시 재생된 이벤트는 히스토리만 다시 쌓고 클라이언트에 다시 보내지 않는다"""
+        a = await self._worker(broker)
+        ws = _RecordingWebSocket()
+        await a.connect(ws, "ch1")
+        await a.broadcast_subtitle("ch1", _item("s1"))
+        await _wait_for(lambda: len(ws.sent) == 1)
+
+        # 브로커 쪽에서 연결을 끊어 재접속 유도
+        for writer in list(broker._subscribers):
+            writer.close()
+        await _wait_for(lambda: not a.bus.connected)
+        await _wait_for(lambda: a.bus.connected)
+        await _wait_for(lambda: _history_ids(a, "ch1") == ["s1"])
+
+        await a.broadcast_subtitle("ch1", _item("s2"))
+        await _wait_for(lambda: len(ws.sent) == 2)
+        await asyncio.sleep(0.05)
+
+        assert [m["payload"]["subtitle"]["id"] for m in ws.sent] == ["s1", "s2"]
+        assert _history_ids(a, "ch1") == ["s1", "s2"]
+
+        await a.stop()
+
+    async def test_publish_while_disconnected_is_sent_after_connect(self, tmp_path) -> None:
+        """브로커가 늦게 떠도 보관해둔 이벤트를 접속 후 전송한다"""
+        url = f"unix://{tmp_path}/late.sock"
+        cm = ConnectionManager(bus=BrokerBus(url, reconnect_delay=0.01))
+        await cm.start()
+        await cm.broadcast_subtitle("ch1", _item("s1"))
+
+        broker = BroadcastBroker(url)
+        await broker.start()
+        await _wait_for(lambda: _history_ids(cm, "ch1") == ["s1"])
+
+        await cm.stop()
+        await broker.stop()
+
+
+class TestLeaderElection:
+    """브로커를 통한 STT 생산자 선출"""
+
+    @pytest.fixture
+    async def broker(self, tmp_path):
+        broker = BroadcastBroker(f"unix://{tmp_path}/bus.sock")
+        await broker.start()
+        yield broker
+        await broker.stop()
+
+    async def _candidate(self, broker: BroadcastBroker) -> tuple[BrokerBus, list[bool]]:
+        bus = BrokerBus(broker.url, reconnect_delay=0.01)
+        changes: list[bool] = []
+        bus.set_leader_handler(changes.append)
+        await bus.start()
+        await _wait_for(lambda: bus.connected)
+        return bus, changes
+
+    async def test_one_leader_and_handover(self, broker) -> None:
+        """후보 중 하나만 리더가 되고, 리더가 끊기면 다음 후보가 이어받는다"""
+        a, a_changes = await self._candidate(broker)
+        await _wait_for(lambda: a.is_leader)
+        b, b_changes = await self._candidate(broker)
+        observer = BrokerBus(broker.url, reconnect_delay=0.01)  # 선출에 참여하지 않는 워커
+        await observer.start()
+        await _wait_for(lambda: observer.connected)
+        await asyncio.sleep(0.05)
+
+        assert (a.is_leader, b.is_leader, observer.is_leader) == (True, False, False)
+
+        await a.stop()
+        await _wait_for(lambda: b.is_leader)
+
+        assert a_changes == [True, False]
+        assert b_changes == [True]
+        assert not observer.is_leader
+
+        await b.stop()
+        await observer.stop()
+
+    async def test_late_claim_after_connect(self, broker) -> None:
+        """접속한 뒤에 핸들러를 등록해도 선출에 참여한다"""
+        bus = BrokerBus(broker.url, reconnect_delay=0.01)
+        await bus.start()
+        await _wait_for(lambda: bus.connected)
+
+        bus.set_leader_handler(lambda leader: None)
+        await _wait_for(lambda: bus.is_leader)
+
+        await bus.stop()
+
+    async def test_leadership_is_dropped_while_disconnected(self, broker) -> None:
+        """브로커와 끊기면 바로 리더를 내려놓고, 재접속하면 다시 요청한다"""
+        a, changes = await self._candidate(broker)
+        await _wait_for(lambda: a.is_leader)
+
+        for writer in list(broker._subscribers):
+            writer.close()
+        await _wait_for(lambda: changes[-2:] == [False, True])
+
+        assert changes == [True, False, True]
+        assert len(broker._candidates) == 1
+
+        await a.stop()
@@ -0,0 +1,191 @@
+"""DictionaryService 테스트
+
+Aho-Corasick 기반 leftmost-longest 교정 동작을 검증합니다.
+"""
+
+from unittest.mock import patch
+
+from app.services.dictionary import (
+    DictionaryEntry,
+    DictionaryReloader,
+    DictionaryService,
+    get_default_dictionary,
+)
+
+
+def _service(*pairs: tuple[str, str]) -> DictionaryService:
+    return DictionaryService(entries=[DictionaryEntry(w, c) for w, c in pairs])
+
+
+class TestCorrect:
+    """correct() 테스트"""
+
+    def test_empty_text(self):
+        assert _service(("a", "b")).correct("") == ""
+
+    def test_empty_dictionary_returns_text(self):
+        assert DictionaryService().correct("경기 도의회") == "경기 도의회"
+
+    def test_replaces_all_occurrences(self):
+        service = _service(("의원 님", "의원님"))
+        assert service.correct("의원 님 그리고 의원 님") == "의원님 그리고 의원님"
+
+    def test_longest_match_wins_regardless_of_order(self):
+        """짧은 항목이 먼저 등록돼도 더 긴 항목이 우선해야 합니다."""
+        short_first = _service(("사내를", "산회를"), ("사내를 선포", "산회를 선포"))
+        long_first = _service(("사내를 선포", "산회를 선포"), ("사내를", "산회를"))
+        text = "사내를 선포합니다"
+        assert short_first.correct(text) == "산회를 선포합니다"
+        assert long_first.correct(text) == "산회를 선포합니다"
+
+    def test_leftmost_match_wins_on_overlap(self):
+        """겹치는 후보 중 더 왼쪽에서 시작하는 항목이 우선해야 합니다."""
+        service = _service(("abc", "X"), ("bcde", "Y"))
+        assert service.correct("abcde") == "Xde"
+
+    def test_replacement_is_not_rescanned(self):
+        """치환 결과가 다른 항목에 의해 다시 치환되지 않아야 합니다."""
+        service = _service(("가", "나"), ("나", "다"))
+        assert service.correct("가나") == "나다"
+
+    def test_identity_entry_protects_longer_phrase(self):
+        """wrong == correct 항목은 더 짧은 오인식 규칙으로부터 구문을 보호합니다."""
+        service = _service(("소개합니다", "속개합니다"), ("다시 소개합니다", "다시 소개합니다"))
+        assert service.correct("다시 소개합니다") == "다시 소개합니다"
+        assert service.correct("회의를 소개합니다") == "회의를 속개합니다"
+
+    def test_default_dictionary(self):
+        dictionary = get_default_dictionary()
+        assert dictionary.correct("경기 도의회 위원장 님") == "경기도의회 위원장님"
+
+
+class TestRecompile:
+    """항목 변경 시 재컴파일 테스트"""
+
+    def test_add_entry_takes_effect(self):
+        service = _service(("a", "b"))
+        assert service.correct("ac") == "bc"
+        service.add_entry(DictionaryEntry("c", "d"))
+        assert service.correct("ac") == "bd"
+
+    def test_remove_entry_takes_effect(self):
+        service = _service(("a", "b"), ("c", "d"))
+        assert service.correct("ac") == "bd"
+        assert service.remove_entry("c") is True
+        assert service.correct("ac") == "bc"
+
+    def test_clear_takes_effect(self):
+        service = _service(("a", "b"))
+        service.correct("a")
+        service.clear()
+        assert service.correct("a") == "a"
+
+    def test_matcher_reused_without_changes(self):
+        service = _service(("a", "b"))
+        service.correct("a")
+        matcher = service._matcher
+        service.correct("aa")
+        assert service._matcher is matcher
+
+
+# == 기본 사전 싱글톤 / DB 리로드 테스트 ==================================
+
+
+class _Resp:
+    def __init__(self, data: list):
+        self.data = data
+        self.count = None
+
+
+class _Query:
+    def __init__(self, data: list):
+        self._data = data
+
+    def select(self, *args, **kwargs):
+        return self
+
+    def eq(self, *args, **kwargs):
+        return self
+
+    def limit(self, *args, **kwargs):
+        return self
+
+    def execute(self):
+        return _Resp(self._data)
+
+
+class _Supabase:
+    """dictionary_version / dictionary 테이블만 흉내내는 클라이언트"""
+
+    def __init__(self, version: int, rows: list[dict]):
+        self.version = version
+        self.rows = rows
+        self.dictionary_reads = 0
+
+    def table(self, name: str) -> _Query:
+        if name == "dictionary_version":
+            return _Query([{"version": self.version}])
+        self.dictionary_reads += 1
+        return _Query(self.rows)
+
+
+class TestDefaultDictionary:
+    """get_default_dictionary() 테스트"""
+
+    def test_returns_singleton(self):
+        assert get_default_dictionary() is get_default_dictionary()
+
+
+class TestDictionaryReloader:
+    """DictionaryReloader 테스트"""
+
+    async def test_reload_applies_db_rows_in_place(self):
+        dictionary = _service(("사내를", "산회를"))
+        supabase = _Supabase(
+            1, [{"wrong_text": "본희의", "correct_text": "본회의", "category": "term"}]
+        )
+
+        with patch("app.services.dictionary.get_supabase_client", return_value=supabase):
+            reloader = DictionaryReloader(dictionary=dictionary, interval=60)
+            assert await reloader.reload_if_changed() is True
+
+        # 같은 인스턴스에 반영 (모듈 전역 참조 유지)
+        assert dictionary.correct("본희의 개의") == "본회의 개의"
+        # 내장 사전 항목도 유지
+        assert dictionary.correct("사내를 선포") == "산회를 선포"
+        assert reloader.version == 1
+
+    async def test_unchanged_version_skips_reload(self):
+        dictionary = DictionaryService()
+        supabase = _Supabase(3, [])
+
+        with patch("app.services.dictionary.get_supabase_client", return_value=supabase):
+            reloader = DictionaryReloader(dictionary=dictionary, interval=60)
+            assert await reloader.reload_if_changed() is True
+            assert await reloader.reload_if_changed() is False
+
+        assert supabase.dictionary_reads == 1
+
+    async def test_version_change_triggers_reload(self):
+        dictionary = DictionaryService()
+        supabase = _Supabase(1, [])
+
+        with patch("app.services.dictionary.get_supabase_client", return_value=supabase):
+            reloader = DictionaryReloader(dictionary=dictionary, interval=60)
+            await reloader.reload_if_changed()
+            assert dictionary.correct("조려안") == "조려안"
+
+            supabase.version = 2
+            supabase.rows = [{"wrong_text": "조려안", "correct_text": "조례안", "category": "term"}]
+            assert await reloader.reload_if_changed() is True
+
+        assert dictionary.correct("조려안") == "조례안"
+
+    async def test_db_row_overrides_builtin_entry(self):
+        dictionary = DictionaryService()
+        supabase = _Supabase(1, [{"wrong_text": "소개합니다", "correct_text": "소개합니다"}])
+
+        with patch("app.services.dictionary.get_supabase_client", return_value=supabase):
+            await DictionaryReloader(dictionary=dictionary, interval=60).reload_if_changed()
+
+        assert dictionary.correct("위원을 소개합니다") == "위원을 소개합니다"
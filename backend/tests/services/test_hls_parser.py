@@ -0,0 +1,372 @@
+"""HLS 플레이리스트 파서 테스트 (렌디션 선택, 미디어 시퀀스 추적)"""
+
+from datetime import UTC, datetime
+
+import httpx
+
+from app.services.hls_parser import (
+    HlsPlaylistParser,
+    parse_attributes,
+    parse_media_playlist,
+)
+
+BASE = "https://stream01.cdn.gov-ntruss.com/live/ch1/playlist.m3u8"
+
+ABR_MASTER = """#EXTM3U
+#EXT-X-VERSION:3
+#EXT-X-STREAM-INF:BANDWIDTH=5000000,RESOLUTION=1920x1080,CODECS="avc1.640028,mp4a.40.2"
+1080p/index.m3u8
+#EXT-X-STREAM-INF:BANDWIDTH=800000,RESOLUTION=640x360,CODECS="avc1.4d401e,mp4a.40.2"
+360p/index.m3u8
+#EXT-X-STREAM-INF:BANDWIDTH=2500000,RESOLUTION=1280x720,CODECS="avc1.4d401f,mp4a.40.2"
+720p/index.m3u8
+"""
+
+
+class TestParseAttributes:
+    def test_quoted_values_with_commas(self) -> None:
+        attrs = parse_attributes(
+            '#EXT-X-STREAM-INF:BANDWIDTH=800000,CODECS="avc1.4d401e,mp4a.40.2",AUDIO="aac"'
+        )
+        assert attrs == {"BANDWIDTH": "800000", "CODECS": "avc1.4d401e,mp4a.40.2", "AUDIO": "aac"}
+
+
+class TestRenditionSelection:
+    def test_lowest_bandwidth_variant(self) -> None:
+        parser = HlsPlaylistParser()
+
+        url = parser._extract_media_playlist(ABR_MASTER, BASE)
+
+        assert url == "https://stream01.cdn.gov-ntruss.com/live/ch1/360p/index.m3u8"
+        assert parser.rendition is not None
+        assert parser.rendition["kind"] == "lowest"
+
+    def test_audio_only_variant_preferred(self) -> None:
+        master = ABR_MASTER + (
+            '#EXT-X-STREAM-INF:BANDWIDTH=1200000,CODECS="mp4a.40.2"\n'
+            "audio/index.m3u8\n"
+        )
+        parser = HlsPlaylistParser()
+
+        url = parser._extract_media_playlist(master, BASE)
+
+        assert url is not None and url.endswith("/audio/index.m3u8")
+        assert parser.rendition["kind"] == "audio"
+
+    def test_audio_media_rendition_preferred(self) -> None:
+        master = """#EXTM3U
+#EXT-X-MEDIA:TYPE=AUDIO,GROUP-ID="aac",NAME="English",LANGUAGE="en",DEFAULT=NO,URI="audio/en.m3u8"
+#EXT-X-MEDIA:TYPE=AUDIO,GROUP-ID="aac",NAME="Korean",LANGUAGE="ko",DEFAULT=YES,URI="audio/ko.m3u8"
+#EXT-X-MEDIA:TYPE=SUBTITLES,GROUP-ID="subs",NAME="ko",URI="subs/ko.m3u8"
+#EXT-X-STREAM-INF:BANDWIDTH=400000,CODECS="avc1.4d401e,mp4a.40.2",AUDIO="aac"
+low/index.m3u8
+"""
+        parser = HlsPlaylistParser()
+
+        url = parser._extract_media_playlist(master, BASE)
+
+        assert url == "https://stream01.cdn.gov-ntruss.com/live/ch1/audio/ko.m3u8"
+        assert parser.rendition["LANGUAGE"] == "ko"
+
+    def test_variant_without_bandwidth_is_last_resort(self) -> None:
+        master = "#EXTM3U\n#EXT-X-STREAM-INF:RESOLUTION=640x360\na.m3u8\n"
+        master += "#EXT-X-STREAM-INF:BANDWIDTH=900000\nb.m3u8\n"
+        parser = HlsPlaylistParser()
+
+        assert parser._extract_media_playlist(master, BASE).endswith("/b.m3u8")
+
+    async def test_fetch_playlist_follows_selected_rendition(self) -> None:
+        requested: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requested.append(str(request.url))
+            if request.url.path.endswith("playlist.m3u8"):
+                return httpx.Response(200, text=ABR_MASTER)
+            return httpx.Response(200, text="#EXTM3U\n#EXTINF:2.0,\nseg1.ts\n")
+
+        parser = HlsPlaylistParser()
+        parser._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        playlist = await parser.fetch_playlist(BASE)
+        await parser.fetch_playlist(BASE)
+        await parser.close()
+
+        assert [s.uri for s in playlist.segments] == [
+            "https://stream01.cdn.gov-ntruss.com/live/ch1/360p/seg1.ts"
+        ]
+        # 마스터는 처음 한 번만 요청
+        assert requested == [BASE] + [
+            "https://stream01.cdn.gov-ntruss.com/live/ch1/360p/index.m3u8"
+        ] * 2
+
+    async def test_fmp4_audio_rendition_falls_back_to_variant(self) -> None:
+        """fMP4 오디오 렌디션은 세그먼트만으로 디코딩할 수 없으므로 TS 변형을 쓴다"""
+        master = """#EXTM3U
+#EXT-X-MEDIA:TYPE=AUDIO,GROUP-ID="aac",NAME="Korean",DEFAULT=YES,URI="audio/ko.m3u8"
+#EXT-X-STREAM-INF:BANDWIDTH=400000,CODECS="avc1.4d401e,mp4a.40.2",AUDIO="aac"
+low/index.m3u8
+"""
+        fmp4 = '#EXTM3U\n#EXT-X-MAP:URI="init.mp4"\n#EXTINF:2.0,\nseg1.m4s\n'
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("playlist.m3u8"):
+                return httpx.Response(200, text=master)
+            if request.url.path.endswith("ko.m3u8"):
+                return httpx.Response(200, text=fmp4)
+            return httpx.Response(200, text="#EXTM3U\n#EXTINF:2.0,\nseg1.ts\n")
+
+        parser = HlsPlaylistParser()
+        parser._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        playlist = await parser.fetch_playlist(BASE)
+        await parser.close()
+
+        assert playlist.container == "ts"
+        assert playlist.segments[0].uri.endswith("/low/seg1.ts")
+        assert parser.rendition["kind"] == "lowest"
+
+    def test_segment_container(self) -> None:
+        packed = parse_media_playlist("#EXTM3U\n#EXTINF:2.0,\nseg1.aac?token=x\n", BASE)
+        ts = parse_media_playlist("#EXTM3U\n#EXTINF:2.0,\nchunk_1\n", BASE)
+
+        assert packed.container == "aac"
+        assert ts.container == "ts"
+
+
+def _live(first: int, count: int, prefix: str = "seg") -> str:
+    lines = ["#EXTM3U", "#EXT-X-TARGETDURATION:2", f"#EXT-X-MEDIA-SEQUENCE:{first}"]
+    for seq in range(first, first + count):
+        lines += ["#EXTINF:2.000,", f"{prefix}{seq}.ts"]
+    return "\n".join(lines) + "\n"
+
+
+def _names(segments) -> list[str]:
+    return [s.uri.rsplit("/", 1)[-1] for s in segments]
+
+
+class TestParseMediaPlaylist:
+    def test_tags_are_parsed(self) -> None:
+        text = """#EXTM3U
+#EXT-X-TARGETDURATION:4
+#EXT-X-MEDIA-SEQUENCE:120
+#EXT-X-DISCONTINUITY-SEQUENCE:3
+#EXT-X-PROGRAM-DATE-TIME:2024-05-01T10:00:00.000Z
+#EXTINF:3.975,
+a.ts
+#EXT-X-DISCONTINUITY
+#EXTINF:4.0,live
+b.ts
+#EXT-X-ENDLIST
+"""
+        playlist = parse_media_playlist(text, BASE)
+
+        assert playlist.media_sequence == 120
+        assert playlist.target_duration == 4
+        assert playlist.discontinuity_sequence == 3
+        assert playlist.ended
+        a, b = playlist.segments
+        assert (a.sequence, a.duration, a.discontinuity) == (120, 3.975, False)
+        assert a.program_date_time == datetime(2024, 5, 1, 10, tzinfo=UTC)
+        assert (b.sequence, b.duration, b.discontinuity) == (121, 4.0, True)
+        assert b.program_date_time is None
+
+
+class TestSequenceTracking:
+    def test_sliding_window(self) -> None:
+        parser = HlsPlaylistParser()
+
+        first = parser.get_new_segments(parse_media_playlist(_live(10, 3), BASE))
+        same = parser.get_new_segments(parse_media_playlist(_live(10, 3), BASE))
+        slid = parser.get_new_segments(parse_media_playlist(_live(11, 4), BASE))
+
+        assert _names(first) == ["seg10.ts", "seg11.ts", "seg12.ts"]
+        assert same == []
+        assert _names(slid) == ["seg13.ts", "seg14.ts"]
+
+    def test_state_stays_constant_over_long_broadcast(self) -> None:
+        parser = HlsPlaylistParser()
+        for first in range(0, 5000):
+            new = parser.get_new_segments(parse_media_playlist(_live(first, 5), BASE))
+            assert len(new) == (5 if first == 0 else 1)
+
+        assert parser.get_metrics()["next_sequence"] == 5004
+
+    def test_skipped_segments_are_counted(self) -> None:
+        parser = HlsPlaylistParser()
+        parser.get_new_segments(parse_media_playlist(_live(0, 3), BASE))
+
+        new = parser.get_new_segments(parse_media_playlist(_live(7, 3), BASE))
+
+        assert _names(new) == ["seg7.ts", "seg8.ts", "seg9.ts"]
+        assert parser.skipped == 4
+
+    def test_sequence_rewind_is_restart(self) -> None:
+        parser = HlsPlaylistParser()
+        parser.get_new_segments(parse_media_playlist(_live(500, 3), BASE))
+
+        new = parser.get_new_segments(parse_media_playlist(_live(0, 2, prefix="r"), BASE))
+
+        assert _names(new) == ["r0.ts", "r1.ts"]
+        assert parser.restarts == 1
+
+    def test_same_sequence_with_new_uris_is_restart(self) -> None:
+        """인코더 재시작으로 시퀀스 번호가 겹쳐도 URI가 다르면 새 세그먼트"""
+        parser = HlsPlaylistParser()
+        parser.get_new_segments(parse_media_playlist(_live(0, 3), BASE))
+
+        new = parser.get_new_segments(parse_media_playlist(_live(0, 4, prefix="r"), BASE))
+
+        assert _names(new) == ["r0.ts", "r1.ts", "r2.ts", "r3.ts"]
+        assert parser.restarts == 1
+
+    def test_missing_media_sequence_resyncs_by_uri(self) -> None:
+        """MEDIA-SEQUENCE 없이 창만 미는 서버도 중복 없이 처리"""
+        parser = HlsPlaylistParser()
+
+        def window(names: list[str]) -> str:
+            return "#EXTM3U\n" + "".join(f"#EXTINF:2,\n{n}\n" for n in names)
+
+        parser.get_new_segments(parse_media_playlist(window(["a.ts", "b.ts"]), BASE))
+        new = parser.get_new_segments(parse_media_playlist(window(["b.ts", "c.ts"]), BASE))
+
+        assert _names(new) == ["c.ts"]
+        assert parser.restarts == 0
+
+    def test_discontinuities_are_counted(self) -> None:
+        parser = HlsPlaylistParser()
+        text = _live(0, 1) + "#EXT-X-DISCONTINUITY\n#EXTINF:2,\nseg1.ts\n"
+
+        parser.get_new_segments(parse_media_playlist(text, BASE))
+
+        assert parser.discontinuities == 1
+
+    async def test_unchanged_playlist_is_not_reparsed(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, text=_live(0, 3))
+
+        parser = HlsPlaylistParser()
+        parser._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        first = await parser.fetch_playlist(BASE)
+        second = await parser.fetch_playlist(BASE)
+        await parser.close()
+
+        assert second is first
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _serve(bodies: list[str], requested: list[httpx.URL]) -> httpx.AsyncClient:
+    """요청마다 bodies를 차례로 응답 (마지막 응답은 반복)"""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url)
+        return httpx.Response(200, text=bodies[min(len(requested), len(bodies)) - 1])
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class TestPollScheduling:
+    async def test_reload_aligned_to_next_segment(self, monkeypatch) -> None:
+        clock = _Clock()
+        monkeypatch.setattr("app.services.hls_parser.time.monotonic", clock)
+        requested: list[httpx.URL] = []
+        parser = HlsPlaylistParser()
+        parser._client = _serve([_live(0, 3).replace("2.000", "6.000")], requested)
+
+        await parser.fetch_playlist(BASE)
+        clock.now += 1.5  # 세그먼트 다운로드/전송에 걸린 시간
+
+        assert parser.next_poll_delay() == 4.5
+        await parser.close()
+
+    async def test_unchanged_playlist_backs_off(self, monkeypatch) -> None:
+        clock = _Clock()
+        monkeypatch.setattr("app.services.hls_parser.time.monotonic", clock)
+        requested: list[httpx.URL] = []
+        parser = HlsPlaylistParser()
+        parser._client = _serve([_live(0, 3).replace("TARGETDURATION:2", "TARGETDURATION:6")],
+                                requested)
+
+        delays = []
+        for _ in range(5):
+            await parser.fetch_playlist(BASE)
+            delays.append(parser.next_poll_delay())
+            clock.now += delays[-1]
+        await parser.close()
+
+        # 갱신 직후 세그먼트 길이(2초) → 0.5초부터 두 배씩, TARGETDURATION 절반(3초)까지
+        assert delays == [2.0, 0.5, 1.0, 2.0, 3.0]
+
+    def test_unknown_target_duration_uses_default(self) -> None:
+        assert HlsPlaylistParser().next_poll_delay() == 2.0
+
+
+LL_HLS = """#EXTM3U
+#EXT-X-TARGETDURATION:4
+#EXT-X-SERVER-CONTROL:CAN-BLOCK-RELOAD=YES,PART-HOLD-BACK=1.0
+#EXT-X-PART-INF:PART-TARGET=0.5
+#EXT-X-MEDIA-SEQUENCE:{first}
+{body}"""
+
+
+def _ll(first: int, full: int, parts: int) -> str:
+    """완성 세그먼트 full개 (마지막 것은 부분 목록 포함) + 진행 중 세그먼트의 부분 parts개"""
+    lines = []
+    for seq in range(first, first + full):
+        if seq == first + full - 1:
+            lines += [f'#EXT-X-PART:DURATION=0.5,URI="p{seq}.{i}.ts"' for i in range(8)]
+        lines += ["#EXTINF:4.0,", f"s{seq}.ts"]
+    seq = first + full
+    lines += [f'#EXT-X-PART:DURATION=0.5,URI="p{seq}.{i}.ts"' for i in range(parts)]
+    return LL_HLS.format(first=first, body="\n".join(lines) + "\n")
+
+
+class TestLowLatencyHls:
+    def test_parts_are_parsed(self) -> None:
+        playlist = parse_media_playlist(_ll(10, 2, 3), BASE)
+
+        assert playlist.can_block_reload
+        assert playlist.part_target == 0.5
+        assert [(p.sequence, p.part) for p in playlist.parts][-3:] == [(12, 0), (12, 1), (12, 2)]
+        assert playlist.parts[0].sequence == 11
+
+    def test_parts_delivered_before_segment_completes(self) -> None:
+        parser = HlsPlaylistParser()
+
+        first = parser.get_new_segments(parse_media_playlist(_ll(10, 2, 3), BASE))
+        more = parser.get_new_segments(parse_media_playlist(_ll(10, 2, 5), BASE))
+        # s12가 완성되면 이미 보낸 부분(0~4) 이후만
+        done = parser.get_new_segments(parse_media_playlist(_ll(10, 3, 1), BASE))
+
+        assert _names(first) == ["s10.ts", "s11.ts", "p12.0.ts", "p12.1.ts", "p12.2.ts"]
+        assert _names(more) == ["p12.3.ts", "p12.4.ts"]
+        assert _names(done) == ["p12.5.ts", "p12.6.ts", "p12.7.ts", "p13.0.ts"]
+
+    def test_parts_ignored_when_disabled(self) -> None:
+        parser = HlsPlaylistParser(ll_hls=False)
+
+        new = parser.get_new_segments(parse_media_playlist(_ll(10, 2, 3), BASE))
+
+        assert _names(new) == ["s10.ts", "s11.ts"]
+
+    async def test_blocking_reload_requests_next_part(self) -> None:
+        requested: list[httpx.URL] = []
+        parser = HlsPlaylistParser()
+        parser._client = _serve([_ll(10, 2, 3), _ll(10, 2, 4)], requested)
+
+        await parser.fetch_playlist(BASE)
+        assert parser.next_poll_delay() == 0.0
+        await parser.fetch_playlist(BASE)
+        await parser.close()
+
+        assert "_HLS_msn" not in requested[0].params
+        assert requested[1].params["_HLS_msn"] == "12"
+        assert requested[1].params["_HLS_part"] == "3"
+        assert parser.get_metrics()["blocking_requests"] == 1
@@ -0,0 +1,96 @@
+"""인터림 자막 증분 처리 테스트"""
+
+import pytest
+
+from app.services import channel_stt
+from app.services.channel_stt import _InterimProcessor
+from app.services.dictionary import DictionaryEntry, DictionaryService
+
+
+class _FakeSpacing:
+    """입력을 기록하고 '|'를 공백으로 바꾸는 띄어쓰기 서비스"""
+
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    async def space_many(self, texts: list[str]) -> list[str]:
+        self.calls.append(list(texts))
+        return [text.replace("|", " ").strip() for text in texts]
+
+
+@pytest.fixture
+def spacing(monkeypatch) -> _FakeSpacing:
+    fake = _FakeSpacing()
+    monkeypatch.setattr(channel_stt, "get_spacing_service", lambda: fake)
+    monkeypatch.setattr(
+        channel_stt,
+        "_dictionary",
+        DictionaryService([DictionaryEntry("개이합니다", "개의합니다", "term")]),
+    )
+    return fake
+
+
+class TestInterimProcessor:
+    async def test_only_changed_tail_is_processed(self, spacing) -> None:
+        """안정 구간은 한 번만 처리하고 이후에는 끝부분만 처리한다"""
+        p = _InterimProcessor()
+
+        assert await p.process("경기도의회 제3차") == "경기도의회 제3차"
+        assert await p.process("경기도의회 제3차 본회의를 개이합니다") == (
+            "경기도의회 제3차 본회의를 개의합니다"
+        )
+        assert await p.process("경기도의회 제3차 본회의를 개이합니다 의사|일정") == (
+            "경기도의회 제3차 본회의를 개의합니다 의사 일정"
+        )
+
+        assert spacing.calls == [
+            ["경기도의회 제3차"],
+            ["경기도의회 제3차 ", "본회의를 개이합니다"],
+            ["본회의를 ", "개이합니다 의사|일정"],
+        ]
+        metrics = p.get_metrics()
+        assert metrics["chars_processed"] < metrics["chars_received"]
+
+    async def test_duplicate_interim_is_suppressed(self, spacing) -> None:
+        p = _InterimProcessor()
+
+        assert await p.process("안녕하세요 여러분") is not None
+        assert await p.process("안녕하세요 여러분") is None
+        assert len(spacing.calls) == 1
+        assert p.get_metrics()["duplicates"] == 1
+
+    async def test_same_output_is_suppressed(self, spacing) -> None:
+        """원문이 달라도 처리 결과가 같으면 다시 보내지 않는다"""
+        p = _InterimProcessor()
+
+        assert await p.process("의사|일정") == "의사 일정"
+        assert await p.process("의사 일정") is None
+
+    async def test_revised_prefix_restarts_from_scratch(self, spacing) -> None:
+        """Deepgram이 앞부분을 고치면 캐시를 버리고 전체를 다시 처리한다"""
+        p = _InterimProcessor()
+        await p.process("사내를 선포 합니다 지금")
+
+        assert await p.process("산회를 선포 합니다 지금") == "산회를 선포 합니다 지금"
+        assert spacing.calls[-1] == ["산회를 선포 ", "합니다 지금"]
+
+    async def test_reset_starts_new_utterance(self, spacing) -> None:
+        p = _InterimProcessor()
+        await p.process("첫 번째 발화 입니다")
+        p.reset()
+
+        assert await p.process("첫 번째 발화 입니다") == "첫 번째 발화 입니다"
+
+    async def test_term_across_stable_boundary_is_corrected(self, spacing, monkeypatch) -> None:
+        """사전 용어가 안정 구간과 끝부분에 걸쳐도 교정한다"""
+        monkeypatch.setattr(
+            channel_stt,
+            "_dictionary",
+            DictionaryService([DictionaryEntry("행정 사무 감사", "행정사무감사", "term")]),
+        )
+        p = _InterimProcessor()
+
+        text = await p.process("경기도의회 행정 사무 감사를")
+
+        assert spacing.calls == [["경기도의회 행정 ", "사무 감사를"]]
+        assert text == "경기도의회 행정사무감사를"
@@ -0,0 +1,254 @@
+"""실시간 자막 write-behind 저장 테스트"""
+
+import asyncio
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import live_subtitle_store
+from app.services.live_subtitle_store import LiveSubtitleWriter
+
+
+class _Query:
+    def __init__(self, db: "_FakeSupabase", table: str) -> None:
+        self.db = db
+        self.table = table
+        self.op = "select"
+        self.payload = None
+        self.filters: dict = {}
+
+    def select(self, *_):
+        return self
+
+    def insert(self, payload):
+        self.op, self.payload = "insert", payload
+        return self
+
+    def upsert(self, payload, on_conflict=None):
+        self.op, self.payload = "upsert", payload
+        return self
+
+    def update(self, payload):
+        self.op, self.payload = "update", payload
+        return self
+
+    def eq(self, key, value):
+        self.filters[key] = value
+        return self
+
+    def order(self, *_, **__):
+        return self
+
+    def limit(self, *_):
+        return self
+
+    def execute(self):
+        return self.db.execute(self)
+
+
+class _UniqueViolationError(Exception):
+    code = "23505"
+
+
+class _FakeSupabase:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, str, object]] = []
+        self.meetings: list[dict] = []
+        self.subtitle_ids: set[str] = set()
+        self.fail = 0  # 다음 N번의 subtitles 쓰기 실패
+        self.lose_response = 0  # 다음 N번의 subtitles INSERT는 커밋 후 응답 유실
+
+    def table(self, name: str) -> _Query:
+        return _Query(self, name)
+
+    def execute(self, query: _Query):
+        if query.table == "subtitles" and self.fail:
+            self.fail -= 1
+            raise RuntimeError("PostgREST 503")
+        if query.table == "subtitles" and query.op == "insert":
+            ids = {row["id"] for row in query.payload}
+            if ids & self.subtitle_ids:
+                raise _UniqueViolationError("duplicate key value violates subtitles_pkey")
+            self.subtitle_ids |= ids
+        self.calls.append((query.table, query.op, query.payload))
+        if query.table == "subtitles" and query.op == "insert" and self.lose_response:
+            self.lose_response -= 1
+            raise TimeoutError("read timeout")
+        if query.table == "meetings" and query.op == "select":
+            rows = [
+                m for m in self.meetings
+                if all(m.get(k) == v for k, v in query.filters.items())
+            ]
+            return SimpleNamespace(data=[{"id": m["id"]} for m in rows[:1]])
+        if query.table == "meetings" and query.op == "insert":
+            row = {"id": str(uuid.uuid4()), **query.payload}
+            self.meetings.append(row)
+            return SimpleNamespace(data=[row])
+        return SimpleNamespace(data=[])
+
+    def ops(self, table: str, op: str) -> list:
+        return [payload for t, o, payload in self.calls if t == table and o == op]
+
+
+@pytest.fixture
+def db(monkeypatch) -> _FakeSupabase:
+    fake = _FakeSupabase()
+    monkeypatch.setattr(live_subtitle_store, "get_supabase_client", lambda: fake)
+    monkeypatch.setattr(live_subtitle_store, "RETRY_BASE", 0.01)
+    return fake
+
+
+def _writer(**kwargs) -> LiveSubtitleWriter:
+    writer = LiveSubtitleWriter(**{"batch_size": 50, "flush_interval": 0.05, **kwargs})
+    writer._enabled = True
+    return writer
+
+
+def _subtitle(text: str) -> dict:
+    return {
+        "id": str(uuid.uuid4()),
+        "meeting_id": "ch14",
+        "text": text,
+        "start_time": 1.0,
+        "end_time": 2.0,
+        "confidence": 0.9,
+        "speaker": None,
+        "created_at": "2026-10-16T00:00:00+00:00",
+    }
+
+
+async def _wait(condition, timeout: float = 2.0) -> None:
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0.01)
+
+
+class TestLiveSubtitleWriter:
+    async def test_rows_are_batched_under_live_meeting(self, db) -> None:
+        writer = _writer()
+        await writer.start()
+        try:
+            for i in range(5):
+                writer.enqueue("ch14", _subtitle(f"자막 {i}"))
+            await _wait(lambda: writer.rows_written == 5)
+        finally:
+            await writer.stop()
+
+        inserts = db.ops("subtitles", "insert")
+        assert len(inserts) == 1
+        assert [row["text"] for row in inserts[0]] == [f"자막 {i}" for i in range(5)]
+        meeting = db.meetings[0]
+        assert meeting["status"] == "live"
+        assert meeting["title"] == "본회의"
+        assert {row["meeting_id"] for row in inserts[0]} == {meeting["id"]}
+
+    async def test_existing_live_meeting_is_reused(self, db) -> None:
+        writer = _writer()
+        await writer._write_batch([("insert", "ch14", _subtitle("첫 자막"))])
+        restarted = _writer()
+        await restarted._write_batch([("insert", "ch14", _subtitle("재시작 후"))])
+
+        assert len(db.meetings) == 1
+        assert len(db.ops("meetings", "insert")) == 1
+
+    async def test_failed_batch_is_retried(self, db) -> None:
+        db.fail = 2
+        writer = _writer()
+
+        await writer._write_batch([("insert", "ch14", _subtitle("재시도"))])
+
+        assert writer.retries == 2
+        assert writer.rows_written == 1
+        assert writer.failed == 0
+        assert len(db.ops("subtitles", "insert")) == 1
+
+    async def test_retry_after_lost_response_is_not_a_failure(self, db) -> None:
+        """커밋 후 응답을 잃은 배치의 재시도(기본 키 중복)는 저장된 것으로 보고 이어서 처리한다"""
+        db.lose_response = 1
+        writer = _writer()
+        subtitle = _subtitle("커밋됨")
+        await writer._write_batch([("insert", "ch14", subtitle)])
+        assert writer.rows_written == 1 and writer.failed == 0
+
+        db.lose_response = 1
+        late = _subtitle("마지막 자막")
+        await writer._write_batch([
+            ("insert", "ch14", late),
+            ("correct", subtitle["id"], "교정됨"),
+            ("end", "ch14"),
+        ])
+
+        assert writer.retries == 2
+        assert writer.failed == 0
+        assert writer.rows_written == 2
+        assert len(db.ops("subtitles", "insert")) == 2  # 커밋된 INSERT만 기록됨
+        assert db.ops("subtitles", "upsert")[0][0]["text"] == "교정됨"
+        assert db.ops("meetings", "update")[0]["status"] == "ended"
+
+    async def test_gives_up_after_max_attempts(self, db) -> None:
+        db.fail = 100
+        writer = _writer()
+
+        await writer._write_batch([("insert", "ch14", _subtitle("실패"))])
+
+        assert writer.failed == 1
+        assert writer.retries == live_subtitle_store.MAX_ATTEMPTS - 1
+        assert "503" in writer.last_error
+
+    async def test_corrections_are_batched(self, db) -> None:
+        writer = _writer()
+        first, second, pending = _subtitle("개이"), _subtitle("산해"), _subtitle("속게")
+        await writer._write_batch([
+            ("insert", "ch14", first), ("insert", "ch14", second),
+        ])
+
+        await writer._write_batch([
+            ("correct", first["id"], "개의"),
+            ("correct", second["id"], "산회"),
+            ("insert", "ch14", pending),
+            ("correct", pending["id"], "속개"),
+        ])
+
+        # 저장 전 자막의 교정은 INSERT에 반영, 저장된 자막은 UPSERT 1회
+        assert db.ops("subtitles", "insert")[-1][0]["text"] == "속개"
+        upserts = db.ops("subtitles", "upsert")
+        assert len(upserts) == 1
+        assert [(row["id"], row["text"]) for row in upserts[0]] == [
+            (first["id"], "개의"), (second["id"], "산회"),
+        ]
+        assert db.ops("subtitles", "update") == []
+
+    async def test_end_meeting_after_pending_rows(self, db) -> None:
+        writer = _writer()
+        await writer.start()
+        writer.enqueue("ch14", _subtitle("마지막 자막"))
+        writer.end_meeting("ch14")
+        await writer.stop()
+
+        tables = [(table, op) for table, op, _ in db.calls]
+        assert tables.index(("subtitles", "insert")) < tables.index(("meetings", "update"))
+        assert db.ops("meetings", "update")[0]["status"] == "ended"
+
+    def test_full_queue_drops_without_blocking(self, db) -> None:
+        writer = _writer(queue_size=2)
+
+        for i in range(5):
+            writer.enqueue("ch14", _subtitle(str(i)))
+
+        assert writer.get_metrics()["queued"] == 2
+        assert writer.dropped == 3
+
+    async def test_stop_saves_batch_being_collected(self, db) -> None:
+        """워커가 큐에서 꺼내 모으던 배치도 종료 시 저장한다 (회의가 live로 남지 않음)"""
+        writer = _writer(flush_interval=10.0)
+        await writer.start()
+        writer.enqueue("ch14", _subtitle("마지막 자막"))
+        writer.end_meeting("ch14")
+        await _wait(lambda: writer._queue.empty())  # 워커의 배치로 옮겨짐
+
+        await writer.stop()
+
+        assert [row["text"] for row in db.ops("subtitles", "insert")[0]] == ["마지막 자막"]
+        assert db.ops("meetings", "update")[0]["status"] == "ended"
+        assert writer.get_metrics()["queued"] == 0
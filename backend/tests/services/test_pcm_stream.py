@@ -0,0 +1,129 @@
+"""PCM 프레임 스트리밍 테스트
+
+ffmpeg 대신 stdin을 그대로 stdout으로 내보내는 디코더로 프레이밍/페이싱을 검증합니다.
+"""
+
+import asyncio
+import sys
+import time
+
+import pytest
+
+from app.services.pcm_stream import PcmStreamer, PcmStreamError, ffmpeg_pcm_command
+
+# 입력 바이트를 그대로 PCM으로 간주
+PASSTHROUGH = [
+    sys.executable,
+    "-c",
+    "import os\nwhile True:\n    d = os.read(0, 65536)\n    if not d: break\n    os.write(1, d)",
+]
+# 20ms @ 16kHz s16le
+FRAME = 640
+
+
+class _Sink:
+    def __init__(self) -> None:
+        self.frames: list[bytes] = []
+        self.times: list[float] = []
+
+    async def __call__(self, frame: bytes) -> None:
+        self.frames.append(frame)
+        self.times.append(time.monotonic())
+
+
+async def _stream(streamer: PcmStreamer, sink: _Sink, data: bytes) -> None:
+    await streamer.start()
+    task = asyncio.create_task(streamer.run())
+    try:
+        await streamer.feed(data)
+        async with asyncio.timeout(3):
+            while sum(map(len, sink.frames)) < len(data):
+                await asyncio.sleep(0.005)
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        await streamer.close()
+
+
+class TestPcmStreamer:
+    async def test_frames_preserve_audio_in_order(self) -> None:
+        sink = _Sink()
+        streamer = PcmStreamer(sink, frame_ms=20, max_lead=10, command=PASSTHROUGH)
+        data = bytes(range(256)) * 25  # 6400 bytes = 10 frames
+
+        await _stream(streamer, sink, data)
+
+        assert [len(f) for f in sink.frames] == [FRAME] * 10
+        assert b"".join(sink.frames) == data
+        assert streamer.get_metrics()["seconds_sent"] == pytest.approx(0.2)
+
+    async def test_frames_are_paced_to_real_time(self) -> None:
+        sink = _Sink()
+        streamer = PcmStreamer(sink, frame_ms=20, max_lead=0, command=PASSTHROUGH)
+
+        await _stream(streamer, sink, b"\x00" * FRAME * 10)
+
+        # 0.2초 분량 → 첫 프레임 즉시, 마지막 프레임은 0.18초 뒤
+        span = sink.times[-1] - sink.times[0]
+        assert 0.15 <= span < 0.4
+        assert streamer.first_frame_delay is not None
+
+    async def test_lead_allows_sending_ahead(self) -> None:
+        sink = _Sink()
+        streamer = PcmStreamer(sink, frame_ms=20, max_lead=1.0, command=PASSTHROUGH)
+
+        await _stream(streamer, sink, b"\x00" * FRAME * 10)
+
+        assert sink.times[-1] - sink.times[0] < 0.1
+
+    async def test_late_audio_resyncs_instead_of_bursting(self) -> None:
+        sink = _Sink()
+        streamer = PcmStreamer(sink, frame_ms=20, max_lead=0, command=PASSTHROUGH)
+        streamer._anchor = time.monotonic() - 5  # 5초 전에 시작했는데 아직 0초 분량만 보냄
+
+        await _stream(streamer, sink, b"\x00" * FRAME * 5)
+
+        assert streamer.resyncs == 1
+        assert sink.times[-1] - sink.times[0] >= 0.07
+
+    async def test_burst_skips_pacing_then_resumes(self) -> None:
+        sink = _Sink()
+        streamer = PcmStreamer(sink, frame_ms=20, max_lead=0, command=PASSTHROUGH)
+        streamer.burst(0.1)  # 재전송분 5프레임
+
+        await _stream(streamer, sink, b"\x00" * FRAME * 10)
+
+        # 앞 5프레임은 즉시, 나머지 5프레임은 실시간 (마지막은 약 0.1초 뒤)
+        assert sink.times[4] - sink.times[0] < 0.05
+        assert 0.07 <= sink.times[-1] - sink.times[4] < 0.3
+        assert streamer.resyncs == 0
+
+    async def test_decoder_exit_raises(self) -> None:
+        streamer = PcmStreamer(_Sink(), command=[sys.executable, "-c", "pass"])
+        await streamer.start()
+
+        with pytest.raises(PcmStreamError):
+            async with asyncio.timeout(3):
+                await streamer.run()
+        with pytest.raises(PcmStreamError):
+            await streamer.feed(b"\x00")
+        await streamer.close()
+
+    async def test_missing_ffmpeg(self) -> None:
+        streamer = PcmStreamer(_Sink(), command=["/nonexistent/ffmpeg"])
+
+        with pytest.raises(PcmStreamError, match="FFmpeg not found"):
+            await streamer.start()
+
+    def test_ffmpeg_command(self) -> None:
+        command = ffmpeg_pcm_command(16000, "aac")
+
+        assert command[0] == "ffmpeg"
+        assert command[command.index("-f") + 1] == "aac"
+        assert command[-5:] == ["-ar", "16000", "-f", "s16le", "pipe:1"]
+
+    def test_ffmpeg_command_probes_unknown_format(self) -> None:
+        command = ffmpeg_pcm_command(16000, None)
+
+        assert command.count("-f") == 1  # 출력 형식만 지정
+        assert command[command.index("-i") + 1] == "pipe:0"
@@ -0,0 +1,116 @@
+"""HLS 세그먼트 파이프라인 테스트"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.services.hls_parser import HlsPlaylistParser
+from app.services.segment_pipeline import SegmentPipeline
+
+BASE = "https://stream01.cdn.gov-ntruss.com/live/ch1/index.m3u8"
+PLAYLIST = "#EXTM3U\n#EXT-X-TARGETDURATION:2\n#EXT-X-MEDIA-SEQUENCE:0\n" + "".join(
+    f"#EXTINF:2.0,\nseg{i}.ts\n" for i in range(6)
+)
+
+
+class _Origin:
+    """플레이리스트와 세그먼트를 지연과 함께 응답하는 가짜 CDN"""
+
+    def __init__(self, delays: dict[str, float], fail: set[str] = frozenset()) -> None:
+        self.delays = delays
+        self.fail = fail
+        self.active = 0
+        self.max_active = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        name = request.url.path.rsplit("/", 1)[-1]
+        if name.endswith(".m3u8"):
+            return httpx.Response(200, text=PLAYLIST)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delays.get(name, 0.01))
+        finally:
+            self.active -= 1
+        if name in self.fail:
+            return httpx.Response(404)
+        return httpx.Response(200, content=name.encode())
+
+
+def _pipeline(origin: _Origin, send, downloads: int = 3) -> SegmentPipeline:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(origin))
+    parser = HlsPlaylistParser()
+    parser._client = client
+    return SegmentPipeline("ch1", BASE, parser, client, send, downloads=downloads)
+
+
+async def _run_until(pipeline: SegmentPipeline, count: int, timeout: float = 2.0) -> None:
+    task = asyncio.create_task(pipeline.run())
+    async with asyncio.timeout(timeout):
+        while pipeline.segments_sent < count:
+            await asyncio.sleep(0.005)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+
+class TestSegmentPipeline:
+    async def test_downloads_overlap_and_order_is_kept(self) -> None:
+        origin = _Origin({"seg0.ts": 0.15, "seg1.ts": 0.05})
+        sent: list[bytes] = []
+
+        async def send(data: bytes) -> None:
+            sent.append(data)
+
+        pipeline = _pipeline(origin, send)
+        started = time.monotonic()
+        await _run_until(pipeline, 6)
+        elapsed = time.monotonic() - started
+
+        assert sent == [f"seg{i}.ts".encode() for i in range(6)]
+        assert origin.max_active == 3
+        # 순차 다운로드면 0.15 + 0.05 + 4 * 0.01 = 0.24초 이상
+        assert elapsed < 0.24
+        stages = pipeline.get_metrics()["stages"]
+        assert stages["download"]["count"] == 6
+        assert stages["end_to_end"]["max_ms"] >= 150
+
+    async def test_slow_send_overlaps_with_downloads(self) -> None:
+        """전송 중에도 다음 세그먼트 다운로드가 진행된다"""
+        origin = _Origin({})
+        downloaded_while_sending: list[int] = []
+
+        async def send(data: bytes) -> None:
+            await asyncio.sleep(0.03)
+            downloaded_while_sending.append(pipeline.stages["download"].count)
+
+        pipeline = _pipeline(origin, send)
+        await _run_until(pipeline, 3)
+
+        assert downloaded_while_sending[0] >= 3
+
+    async def test_failed_download_is_skipped(self) -> None:
+        origin = _Origin({}, fail={"seg2.ts"})
+        sent: list[bytes] = []
+
+        async def send(data: bytes) -> None:
+            sent.append(data)
+
+        pipeline = _pipeline(origin, send)
+        await _run_until(pipeline, 5)
+
+        assert b"seg2.ts" not in sent
+        assert sent == sorted(sent)
+        assert pipeline.download_failures == 1
+
+    async def test_send_failure_ends_run(self) -> None:
+        async def send(data: bytes) -> None:
+            raise ConnectionError("deepgram closed")
+
+        pipeline = _pipeline(_Origin({}), send)
+
+        with pytest.raises(ConnectionError):
+            async with asyncio.timeout(2):
+                await pipeline.run()
+        assert pipeline.get_metrics()["downloading"] == 0
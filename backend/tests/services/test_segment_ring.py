@@ -0,0 +1,174 @@
+"""재연결 세그먼트 재전송/중복 자막 제거 테스트"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from app.services import channel_stt
+from app.services.channel_stt import ChannelSttService
+from app.services.hls_parser import HlsPlaylistParser
+from app.services.segment_pipeline import SegmentPipeline
+from app.services.segment_ring import SegmentRing
+
+BASE = "https://stream01.cdn.gov-ntruss.com/live/ch1/index.m3u8"
+
+
+class TestSegmentRing:
+    def test_replays_only_unacked_tail(self) -> None:
+        ring = SegmentRing(max_segments=10)
+        for i in range(4):
+            ring.append(f"seg{i}".encode(), 2.0)
+        ring.ack(4.5)  # seg2 중간까지 확정
+
+        replay = ring.start_session()
+
+        assert [entry.payload for entry in replay] == [b"seg2", b"seg3"]
+        assert ring.session_base == 4.0
+        assert ring.to_stream_time(1.0) == 5.0
+        assert ring.get_metrics()["replayed_segments"] == 2
+
+    def test_bounded_and_nothing_to_replay_when_acked(self) -> None:
+        ring = SegmentRing(max_segments=2)
+        for _ in range(5):
+            ring.append(b"x" * 10, 2.0)
+
+        assert ring.get_metrics()["segments"] == 2
+        assert ring.get_metrics()["bytes"] == 20
+
+        ring.ack(10.0)
+        ring.ack(3.0)  # 되돌아가지 않음
+        assert ring.start_session() == []
+        assert ring.session_base == 10.0
+
+    def test_disabled_still_tracks_stream_time(self) -> None:
+        ring = SegmentRing(max_segments=0)
+        ring.append(b"seg0", 2.0)
+        ring.append(b"seg1", 2.0)
+
+        assert ring.start_session() == []
+        assert ring.to_stream_time(0.5) == 4.5
+
+
+class TestPipelineReplay:
+    async def test_replay_is_sent_before_new_segments(self) -> None:
+        playlist = (
+            "#EXTM3U\n#EXT-X-TARGETDURATION:2\n#EXT-X-MEDIA-SEQUENCE:0\n"
+            "#EXTINF:2.0,\nseg0.ts\n#EXTINF:2.0,\nseg1.ts\n"
+        )
+
+        async def origin(request: httpx.Request) -> httpx.Response:
+            name = request.url.path.rsplit("/", 1)[-1]
+            if name.endswith(".m3u8"):
+                return httpx.Response(200, text=playlist)
+            return httpx.Response(200, content=name.encode())
+
+        ring = SegmentRing()
+        ring.append(b"old0", 2.0)
+        ring.append(b"old1", 2.0)
+        ring.ack(2.0)
+        sent: list[bytes] = []
+
+        async def send(payload: bytes) -> None:
+            sent.append(payload)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(origin))
+        parser = HlsPlaylistParser()
+        parser._client = client
+        pipeline = SegmentPipeline(
+            "ch1", BASE, parser, client, send, ring=ring, replay=ring.start_session()
+        )
+        task = asyncio.create_task(pipeline.run())
+        async with asyncio.timeout(2):
+            while pipeline.segments_sent < 2:
+                await asyncio.sleep(0.005)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        await client.aclose()
+
+        assert sent[:3] == [b"old1", b"seg0.ts", b"seg1.ts"]
+        assert pipeline.segments_replayed == 1
+        # 새로 보낸 세그먼트는 링에 이어서 보관
+        assert ring.end == 8.0
+
+
+class _FakeSpacing:
+    async def space(self, text: str) -> str:
+        return text
+
+    async def space_many(self, texts: list[str]) -> list[str]:
+        return texts
+
+
+class _FakeDeepgram:
+    """미리 정한 메시지를 보내고 끝나는 Deepgram 연결"""
+
+    def __init__(self, messages: list[dict]) -> None:
+        self.messages = messages
+
+    def __aiter__(self):
+        return self._iter()
+
+    async def _iter(self):
+        for message in self.messages:
+            yield json.dumps(message)
+
+
+def _final(start: float, words: list[tuple[str, float, float]]) -> dict:
+    end = max(w[2] for w in words)
+    return {
+        "type": "Results",
+        "is_final": True,
+        "start": start,
+        "duration": end - start,
+        "channel": {"alternatives": [{
+            "transcript": " ".join(w[0] for w in words),
+            "words": [
+                {"punctuated_word": text, "start": s, "end": e, "confidence": 0.9}
+                for text, s, e in words
+            ],
+        }]},
+    }
+
+
+@pytest.fixture
+def service(monkeypatch) -> ChannelSttService:
+    monkeypatch.setattr(channel_stt, "get_spacing_service", lambda: _FakeSpacing())
+    svc = ChannelSttService()
+    svc.published = []
+
+    async def publish(channel_id: str, data: dict) -> None:
+        svc.published.append(data["subtitle"])
+
+    monkeypatch.setattr(svc, "_publish_subtitle", publish)
+    return svc
+
+
+class TestDuplicateSuppression:
+    async def test_replayed_audio_does_not_repeat_subtitles(self, service) -> None:
+        ring = SegmentRing()
+        service._rings["ch1"] = ring
+        for i in range(3):
+            ring.append(f"seg{i}".encode(), 2.0)
+        ring.start_session()
+
+        # 세션 1: 0~2.6초 확정 후 끊김 (4~6초 세그먼트는 결과 없음)
+        await service._receive_transcripts("ch1", _FakeDeepgram([
+            _final(0.0, [("의사일정", 0.2, 1.0), ("보고합니다.", 1.1, 2.6)]),
+        ]))
+        assert ring.acked == pytest.approx(2.6)
+
+        # 세션 2: seg1(2~4초)부터 다시 보냄 → Deepgram 0초 = 스트림 2초
+        replay = ring.start_session()
+        assert [entry.payload for entry in replay] == [b"seg1", b"seg2"]
+        await service._receive_transcripts("ch1", _FakeDeepgram([
+            _final(0.0, [("보고합니다.", 0.0, 0.6), ("다음은", 0.8, 1.5)]),
+            _final(1.5, [("안건입니다.", 2.5, 3.6)]),
+        ]))
+
+        texts = [subtitle["text"] for subtitle in service.published]
+        assert texts == ["의사일정 보고합니다.", "다음은 안건입니다."]
+        assert service.published[1]["start_time"] == pytest.approx(2.8)
+        assert service.published[1]["end_time"] == pytest.approx(5.6)
+        assert ring.duplicates_dropped == 1
@@ -0,0 +1,162 @@
+"""Kiwi 띄어쓰기 교정 워커 풀 테스트"""
+
+import asyncio
+import os
+import threading
+
+import pytest
+
+from app.services.spacing import SpacingService
+
+
+class _FakeKiwi:
+    """입력 배치를 기록하고 글자 사이에 공백을 넣는 Kiwi"""
+
+    def __init__(self, calls: list, fail: bool = False) -> None:
+        self._calls = calls
+        self._fail = fail
+
+    def space(self, text):
+        if self._fail:
+            raise RuntimeError("kiwi crashed")
+        batch = [text] if isinstance(text, str) else list(text)
+        self._calls.append((threading.current_thread().name, batch))
+        spaced = [t.replace("|", "  ") for t in batch]
+        return spaced[0] if isinstance(text, str) else iter(spaced)
+
+
+class _ProcessKiwi:
+    """프로세스 모드 테스트용 Kiwi ("crash"가 들어오면 워커 프로세스 종료)"""
+
+    def space(self, text):
+        batch = [text] if isinstance(text, str) else list(text)
+        if "crash" in batch:
+            os._exit(1)
+        spaced = [f"{t}@{os.getpid()}" for t in batch]
+        return spaced[0] if isinstance(text, str) else iter(spaced)
+
+
+def _process_kiwi() -> _ProcessKiwi:
+    return _ProcessKiwi()
+
+
+@pytest.fixture
+async def make_service():
+    services: list[SpacingService] = []
+
+    def factory(calls: list, fail: bool = False, **kwargs) -> SpacingService:
+        kwargs.setdefault("workers", 1)
+        kwargs.setdefault("batch_window", 0.01)
+        kwargs.setdefault("max_batch", 64)
+        kwargs.setdefault("executor", "thread")
+        service = SpacingService(kiwi_factory=lambda: _FakeKiwi(calls, fail), **kwargs)
+        service.start()
+        services.append(service)
+        return service
+
+    yield factory
+    for service in services:
+        await service.stop()
+
+
+async def _warmed(calls: list) -> None:
+    """start()가 제출한 워밍업 호출을 기다린 뒤 기록을 비웁니다."""
+    while not calls:
+        await asyncio.sleep(0.005)
+    calls.clear()
+
+
+class TestSpacingService:
+    async def test_requests_from_channels_are_batched(self, make_service) -> None:
+        """같은 배치 구간의 여러 채널 요청을 Kiwi 1회 호출로 처리한다"""
+        calls: list = []
+        service = make_service(calls)
+        await _warmed(calls)
+
+        results = await asyncio.gather(
+            service.space("a|b"),
+            service.space_many(["c", "d|e"]),
+            service.space("f"),
+        )
+
+        assert results == ["a b", ["c", "d e"], "f"]
+        assert len(calls) == 1
+        thread_name, batch = calls[0]
+        assert batch == ["a|b", "c", "d|e", "f"]
+        assert thread_name.startswith("kiwi")
+        assert thread_name != threading.current_thread().name
+        assert service.get_metrics()["avg_batch"] == 4.0
+
+    async def test_full_batch_is_flushed_immediately(self, make_service) -> None:
+        calls: list = []
+        service = make_service(calls, max_batch=2, batch_window=10.0)
+        await _warmed(calls)
+
+        results = await asyncio.wait_for(service.space_many(["a", "b", "c", "d"]), 1.0)
+
+        assert results == ["a", "b", "c", "d"]
+        assert [batch for _, batch in calls] == [["a", "b"], ["c", "d"]]
+
+    async def test_failure_returns_raw_text(self, make_service) -> None:
+        service = make_service([], fail=True)
+
+        assert await service.space("원문|그대로") == "원문|그대로"
+        assert service.get_metrics()["failures"] >= 1
+
+    async def test_kiwi_unavailable_returns_raw_text(self) -> None:
+        service = SpacingService(
+            workers=1, batch_window=0.0, executor="thread", kiwi_factory=lambda: None
+        )
+        try:
+            assert await service.space_many(["가나", "다라"]) == ["가나", "다라"]
+        finally:
+            await service.stop()
+
+    async def test_event_loop_keeps_running_while_spacing(self) -> None:
+        """Kiwi 호출이 오래 걸려도 이벤트 루프는 멈추지 않는다"""
+        release = threading.Event()
+
+        class _SlowKiwi:
+            def space(self, text):
+                release.wait(1.0)
+                return text
+
+        service = SpacingService(
+            workers=1, batch_window=0.0, executor="thread", kiwi_factory=_SlowKiwi
+        )
+        try:
+            pending = asyncio.ensure_future(service.space("느린 문장"))
+            ticks = 0
+            for _ in range(5):
+                await asyncio.sleep(0.01)
+                ticks += 1
+            assert ticks == 5 and not pending.done()
+            release.set()
+            assert await pending == "느린 문장"
+        finally:
+            release.set()
+            await service.stop()
+
+    async def test_process_pool_runs_outside_api_process(self) -> None:
+        service = SpacingService(
+            workers=1, batch_window=0.0, executor="process", kiwi_factory=_process_kiwi
+        )
+        try:
+            result = await service.space("문장")
+            text, pid = result.split("@")
+            assert text == "문장"
+            assert int(pid) != os.getpid()
+        finally:
+            await service.stop()
+
+    async def test_crashed_worker_process_is_replaced(self) -> None:
+        """워커 프로세스가 죽으면 원문을 반환하고 새 풀로 계속 처리한다"""
+        service = SpacingService(
+            workers=1, batch_window=0.0, executor="process", kiwi_factory=_process_kiwi
+        )
+        try:
+            assert await service.space("crash") == "crash"
+            assert service.get_metrics()["restarts"] == 1
+            assert (await service.space("문장")).startswith("문장@")
+        finally:
+            await service.stop()
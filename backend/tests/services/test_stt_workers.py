@@ -0,0 +1,181 @@
+"""채널 STT 워커 프로세스 supervisor 테스트"""
+
+import asyncio
+import os
+import queue
+from collections.abc import Callable
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services import stt_workers
+from app.services.stt_workers import SttWorkerSupervisor
+
+
+def _echo_worker(index: int, commands, events) -> None:
+    """ChannelSttService 대신 실행되는 가짜 워커 (spawn 대상이라 모듈 수준 함수)
+
+    stream_url이 파일 경로이고 파일이 없으면 파일을 만들고 비정상 종료합니다 (크래시 재현).
+    """
+    while True:
+        command = commands.get()
+        if command[0] == "shutdown":
+            return
+        if command[0] != "start":
+            continue
+        _, channel_id, stream_url = command
+        if stream_url.startswith("/") and not os.path.exists(stream_url):
+            open(stream_url, "w").close()
+            os._exit(3)
+        events.put(("interim", channel_id, {"text": "인터림", "channel_id": channel_id}))
+        events.put(("subtitle", channel_id, {"subtitle": {"id": channel_id, "worker": index}}))
+        events.put(("debug", {channel_id: {"channel_id": channel_id, "pid": os.getpid()}}))
+
+
+async def _wait_for(condition: Callable[[], bool], timeout: float = 20.0) -> None:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not condition():
+        if loop.time() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.05)
+
+
+@pytest.fixture
+def web_tier(monkeypatch):
+    """워커 이벤트를 받는 웹 계층 (브로드캐스트/교정 큐 대신 기록)"""
+    fake_manager = MagicMock()
+    fake_manager.broadcast_interim_subtitle = AsyncMock()
+    fake_manager.active_connections = {}
+    fake_manager.get_queue_metrics.return_value = {}
+    publish = AsyncMock()
+    monkeypatch.setattr(stt_workers, "manager", fake_manager)
+    # channel_stt는 문자열 경로로 패치 (spawn된 워커가 이 모듈을 가져올 때 Kiwi 로드 방지)
+    monkeypatch.setattr("app.services.channel_stt.publish_subtitle", publish)
+    monkeypatch.setattr(stt_workers.settings, "deepgram_api_key", "test-key")
+    monkeypatch.setattr(stt_workers, "MONITOR_INTERVAL", 0.05)
+    return fake_manager, publish
+
+
+class TestAssignment:
+    """채널 → 워커 배정"""
+
+    def test_hash_assignment_is_stable(self) -> None:
+        sup = SttWorkerSupervisor(4, assignment="hash")
+        first = [sup._pick_worker(f"ch{i}").index for i in range(20)]
+        again = [SttWorkerSupervisor(4, assignment="hash")._pick_worker(f"ch{i}").index
+                 for i in range(20)]
+
+        assert first == again
+        assert len(set(first)) > 1
+
+    def test_load_assignment_picks_least_loaded(self) -> None:
+        sup = SttWorkerSupervisor(3, assignment="load")
+        for i in range(7):
+            sup._pick_worker(f"ch{i}").channels[f"ch{i}"] = "url"
+
+        assert sorted(len(w.channels) for w in sup._workers) == [2, 2, 3]
+
+    async def test_start_without_api_key_is_noop(self, monkeypatch) -> None:
+        monkeypatch.setattr(stt_workers.settings, "deepgram_api_key", "")
+        sup = SttWorkerSupervisor(1)
+        await sup.start("ch1", "url")
+
+        assert not sup.is_running("ch1")
+        assert sup._workers[0].process is None
+
+
+class TestWorkerProcesses:
+    """워커 프로세스 실행/재시작"""
+
+    async def test_events_are_forwarded_to_web_tier(self, web_tier) -> None:
+        fake_manager, publish = web_tier
+        sup = SttWorkerSupervisor(2, assignment="load", worker_target=_echo_worker)
+        try:
+            await sup.start("ch1", "http://hls/ch1")
+            await sup.start("ch2", "http://hls/ch2")
+            await _wait_for(lambda: publish.await_count == 2)
+
+            workers = {c.args[1]["subtitle"]["id"]: c.args[1]["subtitle"]["worker"]
+                       for c in publish.await_args_list}
+            assert workers == {"ch1": 0, "ch2": 1}
+            assert fake_manager.broadcast_interim_subtitle.await_count == 2
+            assert sup.is_running("ch1") and sup.is_running("ch2")
+
+            await _wait_for(lambda: "pid" in sup.get_debug_info("ch1"))
+            info = sup.get_debug_info("ch1")
+            assert info["pid"] == info["worker"]["pid"]
+            assert info["worker"]["channels"] == ["ch1"]
+        finally:
+            await sup.stop_all()
+
+        assert not sup.is_running("ch1")
+        assert all(w.process is None for w in sup._workers)
+        fake_manager.clear_history.assert_any_call("ch1")
+
+    async def test_crashed_worker_is_restarted_with_its_channels(self, web_tier, tmp_path) -> None:
+        """워커가 죽으면 재시작하고 담당 채널을 다시 시작한다"""
+        _, publish = web_tier
+        sup = SttWorkerSupervisor(1, worker_target=_echo_worker)
+        crash_marker = str(tmp_path / "crashed")
+        try:
+            await sup.start("ch1", crash_marker)
+            await _wait_for(lambda: publish.await_count == 1)
+
+            assert os.path.exists(crash_marker)
+            assert sup._workers[0].restarts == 1
+            assert sup.is_running("ch1")
+        finally:
+            await sup.stop_all()
+
+    async def test_events_of_stopped_channel_are_dropped(self, web_tier) -> None:
+        _, publish = web_tier
+        sup = SttWorkerSupervisor(1, worker_target=_echo_worker)
+        try:
+            await sup.start("ch1", "http://hls/ch1")
+            await sup.stop("ch1")
+            await sup.start("ch2", "http://hls/ch2")
+            await _wait_for(lambda: publish.await_count >= 1)
+            await asyncio.sleep(0.2)
+
+            assert [c.args[0] for c in publish.await_args_list] == ["ch2"]
+        finally:
+            await sup.stop_all()
+
+    async def test_real_worker_runs_with_default_spacing_executor(
+        self, web_tier, monkeypatch
+    ) -> None:
+        """기본 설정(SPACING_EXECUTOR=process)으로 실제 워커를 띄워도 워커가 죽지 않는다
+
+        데몬 워커는 자식 프로세스를 만들 수 없으므로 Kiwi 풀이 스레드 풀로 바뀌어야 함
+        """
+        monkeypatch.setenv("DEEPGRAM_API_KEY", "test-key")  # spawn된 워커의 settings
+        monkeypatch.setenv("SPACING_EXECUTOR", "process")
+        sup = SttWorkerSupervisor(1)
+        try:
+            await sup.start("ch1", "http://127.0.0.1:9/live/playlist.m3u8")
+            await _wait_for(lambda: "spacing" in sup.get_debug_info("ch1"), timeout=30.0)
+
+            info = sup.get_debug_info("ch1")
+            assert info["spacing"]["executor"] == "thread"
+            assert info["worker"]["alive"]
+            assert sup._workers[0].restarts == 0
+        finally:
+            await sup.stop_all()
+
+
+class TestWorkerLoop:
+    """워커 프로세스 이벤트 루프 (프로세스 안에서 실행되는 부분을 직접 실행)"""
+
+    async def test_dictionary_reloader_runs_in_worker(self, monkeypatch) -> None:
+        reloader = MagicMock()
+        reloader.start = AsyncMock()
+        reloader.stop = AsyncMock()
+        monkeypatch.setattr("app.services.dictionary.get_dictionary_reloader", lambda: reloader)
+        commands: queue.Queue = queue.Queue()
+        commands.put(("shutdown",))
+
+        await stt_workers._worker_loop(commands, queue.Queue())
+
+        reloader.start.assert_awaited_once()
+        reloader.stop.assert_awaited_once()
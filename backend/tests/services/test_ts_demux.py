@@ -0,0 +1,225 @@
+"""MPEG-TS 오디오 추출 테스트
+
+방송 HLS 세그먼트와 같은 구성(H.264 + AAC-LC ADTS, 영상 PID에 PCR, 적응 필드 스터핑)의
+세그먼트를 만들어 검증합니다.
+"""
+
+import random
+
+from app.services.ts_demux import (
+    TS_PACKET_SIZE,
+    TsAudioExtractor,
+    _section,
+    crc32_mpeg2,
+)
+
+PMT_PID = 0x1000
+VIDEO_PID = 0x0100
+AUDIO_PID = 0x0101
+
+
+class _Muxer:
+    """테스트용 TS 세그먼트 생성기 (PID별 continuity counter 유지)"""
+
+    def __init__(self) -> None:
+        self._cc: dict[int, int] = {}
+
+    def _header(self, pid: int, pusi: bool, adaptation: bool, payload: bool) -> bytes:
+        cc = self._cc.get(pid, 0)
+        if payload:
+            self._cc[pid] = (cc + 1) & 0x0F
+        control = (0x2 if adaptation else 0) | (0x1 if payload else 0)
+        return bytes([0x47, (0x40 if pusi else 0) | (pid >> 8), pid & 0xFF, (control << 4) | cc])
+
+    def psi(self, pid: int, section: bytes) -> bytes:
+        payload = b"\x00" + section
+        return self._header(pid, True, False, True) + payload + b"\xff" * (184 - len(payload))
+
+    def pes(self, pid: int, stream_id: int, data: bytes, pcr: int | None = None) -> bytes:
+        """PES 1개를 TS 패킷들로 나눕니다 (마지막 패킷은 적응 필드로 스터핑)."""
+        header = bytes([0x80, 0x80, 5]) + b"\x21\x00\x01\x00\x01"  # PTS만
+        length = len(header) + len(data) if stream_id != 0xE0 else 0
+        pes = b"\x00\x00\x01" + bytes([stream_id]) + length.to_bytes(2, "big") + header + data
+        out = bytearray()
+        pos = 0
+        first = True
+        while pos < len(pes):
+            adaptation = b""
+            if first and pcr is not None:
+                adaptation = bytes([0x10]) + pcr.to_bytes(6, "big")
+            room = 184 - (1 + len(adaptation) if adaptation else 0)
+            chunk = pes[pos:pos + room]
+            if len(chunk) < room:
+                # 스터핑: 적응 필드 길이를 늘려 패킷을 채움
+                fill = 184 - len(chunk) - 1
+                adaptation = (adaptation or b"\x00") + b"\xff" * (fill - len(adaptation or b"\x00"))
+            packet = self._header(pid, first, bool(adaptation), True)
+            if adaptation:
+                packet += bytes([len(adaptation)]) + adaptation
+            packet += chunk
+            assert len(packet) == TS_PACKET_SIZE
+            out += packet
+            pos += len(chunk)
+            first = False
+        return bytes(out)
+
+
+def _section_with_crc(body: bytes) -> bytes:
+    return body + crc32_mpeg2(body).to_bytes(4, "big")
+
+
+def _pat() -> bytes:
+    body = bytes([0x00, 0xB0, 13, 0x00, 0x01, 0xC1, 0x00, 0x00, 0x00, 0x01])
+    body += bytes([0xE0 | (PMT_PID >> 8), PMT_PID & 0xFF])
+    return _section_with_crc(body)
+
+
+def _pmt(audio_type: int = 0x0F) -> bytes:
+    lang = bytes([0x0A, 4]) + b"kor\x00"
+    entries = bytes([0x1B, 0xE0 | (VIDEO_PID >> 8), VIDEO_PID & 0xFF, 0xF0, 0x00])
+    audio = bytes([audio_type, 0xE0 | (AUDIO_PID >> 8), AUDIO_PID & 0xFF, 0xF0, len(lang)])
+    entries += audio + lang
+    length = 9 + len(entries) + 4
+    body = bytes([0x02, 0xB0 | (length >> 8), length & 0xFF, 0x00, 0x01, 0xC1, 0x00, 0x00])
+    body += bytes([0xE0 | (VIDEO_PID >> 8), VIDEO_PID & 0xFF, 0xF0, 0x00]) + entries
+    return _section_with_crc(body)
+
+
+def _adts_frame(rng: random.Random) -> bytes:
+    """AAC-LC 48kHz 스테레오 ADTS 프레임"""
+    raw = bytes(rng.getrandbits(8) for _ in range(rng.randint(200, 400)))
+    length = 7 + len(raw)
+    header = bytes([
+        0xFF, 0xF1,
+        (1 << 6) | (3 << 2) | (2 >> 2),
+        ((2 & 3) << 6) | (length >> 11),
+        (length >> 3) & 0xFF,
+        ((length & 7) << 5) | 0x1F,
+        0xFC,
+    ])
+    return header + raw
+
+
+def _segment(
+    mux: _Muxer, seed: int, frames: int = 60, with_psi: bool = True, audio_type: int = 0x0F
+) -> tuple[bytes, bytes]:
+    """(TS 세그먼트, 들어 있는 ADTS 스트림)"""
+    rng = random.Random(seed)
+    out = bytearray()
+    adts = bytearray()
+    if with_psi:
+        out += mux.psi(0x0000, _pat()) + mux.psi(PMT_PID, _pmt(audio_type))
+    for i in range(frames):
+        video = bytes(rng.getrandbits(8) for _ in range(rng.randint(4000, 12000)))
+        out += mux.pes(VIDEO_PID, 0xE0, video, pcr=i * 1800)
+        if i % 2 == 0:
+            audio = _adts_frame(rng) + _adts_frame(rng)
+            adts += audio
+            out += mux.pes(AUDIO_PID, 0xC0, audio)
+    return bytes(out), bytes(adts)
+
+
+def _pids(data: bytes) -> list[int]:
+    return [
+        ((data[i + 1] & 0x1F) << 8) | data[i + 2] for i in range(0, len(data), TS_PACKET_SIZE)
+    ]
+
+
+class TestTsAudioExtractor:
+    def test_audio_only_ts_keeps_audio_packets(self) -> None:
+        segment, _ = _segment(_Muxer(), seed=1)
+        extractor = TsAudioExtractor(output="ts")
+
+        out = extractor.extract(segment)
+
+        assert extractor.audio_pid == AUDIO_PID
+        assert extractor.codec == "aac"
+        assert set(_pids(out)) == {0x0000, PMT_PID, AUDIO_PID}
+        audio_in = [
+            segment[i:i + TS_PACKET_SIZE]
+            for i in range(0, len(segment), TS_PACKET_SIZE)
+            if _pids(segment[i:i + 4])[0] == AUDIO_PID
+        ]
+        audio_out = [
+            out[i:i + TS_PACKET_SIZE]
+            for i in range(0, len(out), TS_PACKET_SIZE)
+            if _pids(out[i:i + 4])[0] == AUDIO_PID
+        ]
+        assert audio_out == audio_in
+        # 영상이 대부분인 세그먼트 → 10배 이상 감소
+        assert len(out) * 10 < len(segment)
+
+    def test_rewritten_pmt_lists_only_audio(self) -> None:
+        segment, _ = _segment(_Muxer(), seed=2, frames=4)
+        out = TsAudioExtractor(output="ts").extract(segment)
+
+        pmt = _section(memoryview(out)[TS_PACKET_SIZE:2 * TS_PACKET_SIZE])
+        assert pmt is not None
+        assert crc32_mpeg2(pmt[:-4]) == int.from_bytes(pmt[-4:], "big")
+        assert ((pmt[8] & 0x1F) << 8) | pmt[9] == 0x1FFF  # PCR_PID 없음
+
+        # 결과를 다시 해석하면 같은 오디오 스트림 하나만 보임
+        again = TsAudioExtractor(output="ts")
+        assert again.extract(out) == out
+        assert again.audio_pid == AUDIO_PID
+
+    def test_adts_output_is_elementary_stream(self) -> None:
+        segment, adts = _segment(_Muxer(), seed=3)
+        extractor = TsAudioExtractor(output="adts")
+
+        assert extractor.extract(segment) == adts
+        assert extractor.get_metrics()["ratio"] < 0.1
+
+    def test_adts_output_falls_back_to_ts_for_non_adts_audio(self) -> None:
+        """LATM AAC(0x11)는 PES를 벗기면 디코딩할 수 없으므로 오디오만 남긴 TS로 보낸다"""
+        segment, _ = _segment(_Muxer(), seed=8, frames=4, audio_type=0x11)
+        extractor = TsAudioExtractor(output="adts")
+
+        out = extractor.extract(segment)
+
+        assert extractor.codec == "aac_latm"
+        assert out == TsAudioExtractor(output="ts").extract(segment)
+        assert set(_pids(out)) == {0x0000, PMT_PID, AUDIO_PID}
+
+    def test_state_carries_over_segments_without_psi(self) -> None:
+        """PAT/PMT 없는 다음 세그먼트도 이전 세그먼트의 PID로 처리한다"""
+        mux = _Muxer()
+        first, _ = _segment(mux, seed=4, frames=4)
+        second, adts = _segment(mux, seed=5, frames=4, with_psi=False)
+
+        ts = TsAudioExtractor(output="ts")
+        ts.extract(first)
+        out = ts.extract(second)
+        assert _pids(out)[0] == PMT_PID
+        assert set(_pids(out)) == {PMT_PID, AUDIO_PID}
+
+        es = TsAudioExtractor(output="adts")
+        es.extract(first)
+        assert es.extract(second) == adts
+
+    def test_leading_garbage_is_skipped(self) -> None:
+        segment, adts = _segment(_Muxer(), seed=6, frames=4)
+        extractor = TsAudioExtractor(output="adts")
+
+        assert extractor.extract(b"\x00\x12\x34" + segment) == adts
+
+    def test_unparseable_segment_is_passed_through(self) -> None:
+        extractor = TsAudioExtractor()
+        garbage = bytes(range(256)) * 4
+
+        assert extractor.extract(garbage) == garbage
+        assert extractor.extract(b"") == b""
+        assert extractor.get_metrics()["passthrough"] == 2
+
+    def test_segment_without_audio_is_passed_through(self) -> None:
+        segment, _ = _segment(_Muxer(), seed=7, frames=2)
+        video_only = b"".join(
+            segment[i:i + TS_PACKET_SIZE]
+            for i in range(0, len(segment), TS_PACKET_SIZE)
+            if _pids(segment[i:i + 4])[0] == VIDEO_PID
+        )
+
+        assert TsAudioExtractor().extract(video_only) == video_only
+
+    def test_crc32_mpeg2(self) -> None:
+        assert crc32_mpeg2(b"123456789") == 0x0376E6E7
@@ -0,0 +1,106 @@
+"""무음 구간 차단(VAD) 테스트"""
+
+import json
+
+import numpy as np
+import pytest
+
+from app.services import vad
+from app.services.vad import SilenceGate, frame_levels
+
+RATE = 16000
+
+
+def _tone(seconds: float = 0.1, amplitude: float = 0.3) -> bytes:
+    t = np.arange(int(RATE * seconds)) / RATE
+    return (np.sin(2 * np.pi * 440 * t) * amplitude * 32767).astype("<i2").tobytes()
+
+
+def _silence(seconds: float = 0.1) -> bytes:
+    rng = np.random.default_rng(0)
+    noise = rng.normal(0, 3, int(RATE * seconds))  # 약 -80 dBFS 잡음
+    return noise.astype("<i2").tobytes()
+
+
+class _Sink:
+    def __init__(self) -> None:
+        self.frames: list[bytes] = []
+        self.texts: list[dict] = []
+
+    async def __call__(self, message) -> None:
+        if isinstance(message, str):
+            self.texts.append(json.loads(message))
+        else:
+            self.frames.append(message)
+
+
+class TestFrameLevels:
+    def test_levels_per_window(self) -> None:
+        levels = frame_levels(_tone(0.05) + _silence(0.05))
+
+        assert levels.shape == (10,)
+        assert (levels[:5] > -15).all()
+        assert (levels[5:] < -60).all()
+
+
+class TestSilenceGate:
+    async def test_silence_is_skipped_and_counted(self) -> None:
+        sink = _Sink()
+        gate = SilenceGate(sink)
+
+        for _ in range(10):
+            await gate.send(_tone())
+        for _ in range(50):
+            await gate.send(_silence())
+
+        metrics = gate.get_metrics()
+        # 말소리 1초 + 행오버 0.6초만 전송, 프리롤 0.3초는 보관 중
+        assert len(sink.frames) == 16
+        assert metrics["skipped_seconds"] == pytest.approx(5.0 - 0.6 - 0.3)
+        assert metrics["gated"]
+
+    async def test_preroll_is_sent_when_speech_resumes(self) -> None:
+        sink = _Sink()
+        gate = SilenceGate(sink)
+        quiet = [_silence() for _ in range(20)]
+
+        for frame in quiet:
+            await gate.send(frame)
+        await gate.send(_tone())
+
+        # 마지막 무음 0.3초 + 말소리
+        assert sink.frames[:3] == quiet[-3:]
+        assert len(sink.frames) == 4
+        assert not gate.gated
+
+    async def test_timestamps_map_back_to_stream_time(self) -> None:
+        sink = _Sink()
+        gate = SilenceGate(sink)
+
+        for _ in range(10):  # 0.0 ~ 1.0 말소리
+            await gate.send(_tone())
+        for _ in range(40):  # 1.0 ~ 5.0 무음 (1.6 ~ 4.7 건너뜀)
+            await gate.send(_silence())
+        for _ in range(10):  # 5.0 ~ 6.0 말소리
+            await gate.send(_tone())
+
+        assert gate.skipped_seconds == pytest.approx(3.1)
+        # Deepgram은 1.9초부터 프리롤(4.7~)을 받음
+        assert gate.to_stream_time(0.5) == pytest.approx(0.5)
+        assert gate.to_stream_time(1.5) == pytest.approx(1.5)
+        assert gate.to_stream_time(2.2 + 0.1) == pytest.approx(5.4)
+
+    async def test_keepalive_while_gated(self, monkeypatch) -> None:
+        sink = _Sink()
+        gate = SilenceGate(sink)
+        now = [1000.0]
+        monkeypatch.setattr(vad.time, "monotonic", lambda: now[0])
+        gate._last_sent_at = now[0]
+
+        for _ in range(120):  # 12초 무음
+            await gate.send(_silence())
+            now[0] += 0.1
+
+        assert sink.frames == []
+        assert sink.texts == [{"type": "KeepAlive"}, {"type": "KeepAlive"}]
+        assert gate.keepalives == 2
@@ -98,10 +98,10 @@ class _MockSupabase:
 class TestGetVerificationStats:
     """get_verification_stats 함수 테스트"""
 
-    def test_empty_meeting_returns_zeros(self):
+    async def test_empty_meeting_returns_zeros(self):
         """자막이 없는 회의는 모든 값이 0이어야 합니다."""
         supabase = _MockSupabase(data=[])
-        result = get_verification_stats(supabase, "meeting-1")
+        result = await get_verification_stats(supabase, "meeting-1")
 
         assert result["total"] == 0
         assert result["verified"] == 0
@@ -109,7 +109,7 @@ class TestGetVerificationStats:
         assert result["flagged"] == 0
         assert result["progress"] == 0.0
 
-    def test_all_unverified(self):
+    async def test_all_unverified(self):
         """모든 자막이 미검증이면 unverified = total, progress = 0"""
         mid = "meeting-2"
         rows = [
@@ -118,7 +118,7 @@ class TestGetVerificationStats:
             _make_subtitle(mid, "unverified"),
         ]
         supabase = _MockSupabase(data=rows)
-        result = get_verification_stats(supabase, mid)
+        result = await get_verification_stats(supabase, mid)
 
         assert result["total"] == 3
         assert result["verified"] == 0
@@ -126,7 +126,7 @@ class TestGetVerificationStats:
         assert result["flagged"] == 0
         assert result["progress"] == 0.0
 
-    def test_mixed_statuses(self):
+    async def test_mixed_statuses(self):
         """다양한 상태가 혼합된 경우 정확한 통계를 반환해야 합니다."""
         mid = "meeting-3"
         rows = [
@@ -137,7 +137,7 @@ class TestGetVerificationStats:
             _make_subtitle(mid, "unverified"),
         ]
         supabase = _MockSupabase(data=rows)
-        result = get_verification_stats(supabase, mid)
+        result = await get_verification_stats(supabase, mid)
 
         assert result["total"] == 5
         assert result["verified"] == 3
@@ -145,7 +145,7 @@ class TestGetVerificationStats:
         assert result["flagged"] == 1
         assert result["progress"] == pytest.approx(0.6)
 
-    def test_all_verified_progress_is_one(self):
+    async def test_all_verified_progress_is_one(self):
         """모든 자막이 검증되면 progress가 1.0이어야 합니다."""
         mid = "meeting-4"
         rows = [
@@ -153,18 +153,18 @@ class TestGetVerificationStats:
             _make_subtitle(mid, "verified"),
         ]
         supabase = _MockSupabase(data=rows)
-        result = get_verification_stats(supabase, mid)
+        result = await get_verification_stats(supabase, mid)
 
         assert result["total"] == 2
         assert result["verified"] == 2
         assert result["progress"] == pytest.approx(1.0)
 
-    def test_exception_returns_safe_defaults(self):
+    async def test_exception_returns_safe_defaults(self):
         """예외 발생 시 안전한 기본값을 반환해야 합니다."""
         supabase = MagicMock()
         supabase.table.side_effect = Exception("DB connection error")
 
-        result = get_verification_stats(supabase, "meeting-err")
+        result = await get_verification_stats(supabase, "meeting-err")
 
         assert result["total"] == 0
         assert result["progress"] == 0.0
@@ -176,17 +176,17 @@ class TestGetVerificationStats:
 class TestGetReviewQueue:
     """get_review_queue 함수 테스트"""
 
-    def test_empty_queue(self):
+    async def test_empty_queue(self):
         """리뷰할 자막이 없으면 빈 items를 반환해야 합니다."""
         supabase = _MockSupabase(data=[])
-        result = get_review_queue(supabase, "meeting-1")
+        result = await get_review_queue(supabase, "meeting-1")
 
         assert result["items"] == []
         assert result["total"] == 0
         assert result["limit"] == 50
         assert result["offset"] == 0
 
-    def test_returns_items_with_pagination(self):
+    async def test_returns_items_with_pagination(self):
         """자막 목록과 페이지네이션 정보를 반환해야 합니다."""
         mid = "meeting-5"
         rows = [
@@ -194,27 +194,27 @@ class TestGetReviewQueue:
             _make_subtitle(mid, "flagged", confidence=0.6),
         ]
         supabase = _MockSupabase(data=rows)
-        result = get_review_queue(supabase, mid, limit=10, offset=0)
+        result = await get_review_queue(supabase, mid, limit=10, offset=0)
 
         assert len(result["items"]) == 2
         assert result["total"] == 2
         assert result["limit"] == 10
         assert result["offset"] == 0
 
-    def test_custom_limit_and_offset(self):
+    async def test_custom_limit_and_offset(self):
         """사용자 정의 limit/offset이 반영되어야 합니다."""
         supabase = _MockSupabase(data=[])
-        result = get_review_queue(supabase, "m1", limit=20, offset=5)
+        result = await get_review_queue(supabase, "m1", limit=20, offset=5)
 
         assert result["limit"] == 20
         assert result["offset"] == 5
 
-    def test_exception_returns_safe_defaults(self):
+    async def test_exception_returns_safe_defaults(self):
         """예외 발생 시 안전한 기본값을 반환해야 합니다."""
         supabase = MagicMock()
         supabase.table.side_effect = Exception("DB error")
 
-        result = get_review_queue(supabase, "meeting-err")
+        result = await get_review_queue(supabase, "meeting-err")
 
         assert result["items"] == []
         assert result["total"] == 0
@@ -226,55 +226,55 @@ class TestGetReviewQueue:
 class TestUpdateVerificationStatus:
     """update_verification_status 함수 테스트"""
 
-    def test_valid_status_verified(self):
+    async def test_valid_status_verified(self):
         """'verified' 상태로 변경 시 업데이트된 행을 반환해야 합니다."""
         mid = "meeting-6"
         sid = str(uuid.uuid4())
         updated_row = _make_subtitle(mid, "verified", subtitle_id=sid)
 
         supabase = _MockSupabase(data=[updated_row])
-        result = update_verification_status(supabase, mid, sid, "verified")
+        result = await update_verification_status(supabase, mid, sid, "verified")
 
         assert result is not None
         assert result["id"] == sid
         assert result["verification_status"] == "verified"
 
-    def test_valid_status_flagged(self):
+    async def test_valid_status_flagged(self):
         """'flagged' 상태로 변경 시 업데이트된 행을 반환해야 합니다."""
         mid = "meeting-7"
         sid = str(uuid.uuid4())
         updated_row = _make_subtitle(mid, "flagged", subtitle_id=sid)
 
         supabase = _MockSupabase(data=[updated_row])
-        result = update_verification_status(supabase, mid, sid, "flagged")
+        result = await update_verification_status(supabase, mid, sid, "flagged")
 
         assert result is not None
         assert result["verification_status"] == "flagged"
 
-    def test_invalid_status_returns_none(self):
+    async def test_invalid_status_returns_none(self):
         """잘못된 상태값은 None을 반환해야 합니다."""
         supabase = _MockSupabase(data=[])
-        result = update_verification_status(
+        result = await update_verification_status(
             supabase, "m1", "s1", "invalid_status"
         )
 
         assert result is None
 
-    def test_nonexistent_subtitle_returns_none(self):
+    async def test_nonexistent_subtitle_returns_none(self):
         """존재하지 않는 자막 ID는 None을 반환해야 합니다."""
         supabase = _MockSupabase(data=[])
-        result = update_verification_status(
+        result = await update_verification_status(
             supabase, "m1", "nonexistent-id", "verified"
         )
 
         assert result is None
 
-    def test_exception_returns_none(self):
+    async def test_exception_returns_none(self):
         """예외 발생 시 None을 반환해야 합니다."""
         supabase = MagicMock()
         supabase.table.side_effect = Exception("DB error")
 
-        result = update_verification_status(supabase, "m1", "s1", "verified")
+        result = await update_verification_status(supabase, "m1", "s1", "verified")
 
         assert result is None
 
@@ -289,15 +289,15 @@ class TestUpdateVerificationStatus:
 class TestBatchVerify:
     """batch_verify 함수 테스트"""
 
-    def test_empty_ids_returns_zero(self):
+    async def test_empty_ids_returns_zero(self):
         """빈 ID 목록은 updated=0을 반환해야 합니다."""
         supabase = _MockSupabase(data=[])
-        result = batch_verify(supabase, "m1", [])
+        result = await batch_verify(supabase, "m1", [])
 
         assert result["updated"] == 0
         assert result["items"] == []
 
-    def test_batch_verify_multiple(self):
+    async def test_batch_verify_multiple(self):
         """여러 자막을 일괄 검증해야 합니다."""
         mid = "meeting-8"
         sid1 = str(uuid.uuid4())
@@ -312,32 +312,32 @@ class TestBatchVerify:
 
         # batch_verify calls update_verification_status for each ID
         # With our mock, each call returns the same data (row1)
-        result = batch_verify(supabase, mid, [sid1, sid2, sid3])
+        result = await batch_verify(supabase, mid, [sid1, sid2, sid3])
 
         assert result["updated"] == 3
         assert len(result["items"]) == 3
 
-    def test_batch_verify_with_flagged_status(self):
+    async def test_batch_verify_with_flagged_status(self):
         """'flagged' 상태로 일괄 변경이 가능해야 합니다."""
         mid = "meeting-9"
         sid = str(uuid.uuid4())
         row = _make_subtitle(mid, "flagged", subtitle_id=sid)
 
         supabase = _MockSupabase(data=[row])
-        result = batch_verify(supabase, mid, [sid], status="flagged")
+        result = await batch_verify(supabase, mid, [sid], status="flagged")
 
         assert result["updated"] == 1
         assert len(result["items"]) == 1
 
-    def test_batch_verify_invalid_status(self):
+    async def test_batch_verify_invalid_status(self):
         """잘못된 상태값은 updated=0을 반환해야 합니다."""
         supabase = _MockSupabase(data=[])
-        result = batch_verify(supabase, "m1", ["s1", "s2"], status="bad")
+        result = await batch_verify(supabase, "m1", ["s1", "s2"], status="bad")
 
         assert result["updated"] == 0
         assert result["items"] == []
 
-    def test_batch_verify_partial_failure(self):
+    async def test_batch_verify_partial_failure(self):
         """일부 업데이트 실패 시 성공한 것만 포함해야 합니다."""
         mid = "meeting-10"
         sid1 = str(uuid.uuid4())
@@ -359,14 +359,14 @@ class TestBatchVerify:
         supabase = MagicMock()
         supabase.table = mock_table
 
-        result = batch_verify(supabase, mid, [sid1, sid2])
+        result = await batch_verify(supabase, mid, [sid1, sid2])
 
         # Each update_verification_status call does 1 table() call
         # sid1 -> call 1 (odd, success), sid2 -> call 2 (even, fail)
         assert result["updated"] == 1
         assert len(result["items"]) == 1
 
-    def test_batch_verify_default_status_is_verified(self):
+    async def test_batch_verify_default_status_is_verified(self):
         """기본 상태가 'verified'여야 합니다."""
         mid = "meeting-11"
         sid = str(uuid.uuid4())
@@ -374,6 +374,6 @@ class TestBatchVerify:
 
         supabase = _MockSupabase(data=[row])
         # Don't pass status explicitly
-        result = batch_verify(supabase, mid, [sid])
+        result = await batch_verify(supabase, mid, [sid])
 
         assert result["updated"] == 1
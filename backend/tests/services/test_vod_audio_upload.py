@@ -0,0 +1,130 @@
+"""오디오 변환 업로드 테스트 (가짜 ffmpeg 실행 파일 + 로컬 Deepgram 서버)"""
+
+import json
+import os
+import stat
+import sys
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from app.services import vod_stt_service
+from app.services.vod_stt_service import VodSttService, _tasks
+
+AUDIO = b"OggS" * 1024  # 가짜 ffmpeg 출력 4 KB
+SOURCE_SIZE = 400 * 1024
+
+_FAKE_FFMPEG = f"""#!{sys.executable}
+import json, os, sys
+with open(os.environ["FAKE_FFMPEG_ARGS"], "w") as f:
+    json.dump(sys.argv[1:], f)
+if os.environ.get("FAKE_FFMPEG_FAIL"):
+    sys.stderr.write("Invalid data found when processing input")
+    sys.exit(1)
+sys.stdout.buffer.write({AUDIO!r})
+"""
+
+
+@pytest.fixture
+async def deepgram(monkeypatch):
+    received: dict = {}
+
+    async def listen(request: web.Request) -> web.Response:
+        received["content_type"] = request.headers.get("Content-Type")
+        received["body"] = await request.read()
+        return web.json_response({
+            "metadata": {"duration": 3600.0},
+            "results": {"utterances": [
+                {"speaker": 0, "transcript": "개의합니다", "start": 0.0, "end": 1.0,
+                 "confidence": 0.9},
+            ]},
+        })
+
+    app = web.Application(client_max_size=SOURCE_SIZE * 2)
+    app.router.add_post("/listen", listen)
+    server = TestServer(app)
+    await server.start_server()
+    monkeypatch.setattr(vod_stt_service, "DEEPGRAM_API_URL", str(server.make_url("/listen")))
+    monkeypatch.setattr(vod_stt_service.settings, "deepgram_api_key", "test-key")
+    monkeypatch.setattr(vod_stt_service.settings, "vod_stt_audio_transcode", True)
+    yield received
+    await server.close()
+
+
+@pytest.fixture
+def ffmpeg(monkeypatch, tmp_path):
+    """PATH 맨 앞에 가짜 ffmpeg를 둡니다 (받은 인자를 파일로 남김)."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    script = bin_dir / "ffmpeg"
+    script.write_text(_FAKE_FFMPEG)
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    args_file = tmp_path / "ffmpeg_args.json"
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}")
+    monkeypatch.setenv("FAKE_FFMPEG_ARGS", str(args_file))
+    return args_file
+
+
+@pytest.fixture(autouse=True)
+def clear_tasks():
+    _tasks.clear()
+    yield
+    _tasks.clear()
+
+
+def _mp4(tmp_path):
+    mp4 = tmp_path / "vod.mp4"
+    mp4.write_bytes(b"\0" * SOURCE_SIZE)
+    return mp4
+
+
+class TestAudioUpload:
+    async def test_audio_is_uploaded_instead_of_video(self, deepgram, ffmpeg, tmp_path) -> None:
+        with patch.object(VodSttService, "_download_to_file",
+                          AsyncMock(return_value=_mp4(tmp_path))), \
+                patch.object(VodSttService, "_insert_subtitles", AsyncMock()) as insert:
+            await VodSttService().process("m1", "http://example.com/v.mp4", MagicMock())
+
+        task = _tasks["m1"]
+        assert task.status == "completed"
+        assert deepgram["body"] == AUDIO
+        assert deepgram["content_type"] == "audio/ogg"
+        args = json.loads(ffmpeg.read_text())
+        assert args[args.index("-ar") + 1] == "16000" and args[args.index("-ac") + 1] == "1"
+        assert "-vn" in args and args[-1] == "pipe:1"
+        assert task.upload == {
+            "format": "opus",
+            "source_bytes": SOURCE_SIZE,
+            "upload_bytes": len(AUDIO),
+            "reduction": 100.0,
+        }
+        assert {"download", "upload", "parse", "insert"} <= task.timings.keys()
+        assert [cue["text"] for cue in insert.call_args[0][1]] == ["개의합니다"]
+
+    async def test_failed_transcode_uploads_mp4(self, deepgram, ffmpeg, tmp_path,
+                                                monkeypatch) -> None:
+        monkeypatch.setenv("FAKE_FFMPEG_FAIL", "1")
+
+        with patch.object(VodSttService, "_download_to_file",
+                          AsyncMock(return_value=_mp4(tmp_path))), \
+                patch.object(VodSttService, "_insert_subtitles", AsyncMock()):
+            await VodSttService().process("m1", "http://example.com/v.mp4", MagicMock())
+
+        task = _tasks["m1"]
+        assert task.status == "completed"
+        assert deepgram["content_type"] == "video/mp4"
+        assert len(deepgram["body"]) == SOURCE_SIZE
+        assert task.upload["format"] == "mp4"
+        assert task.upload["reduction"] == 1.0
+
+    async def test_without_ffmpeg_uploads_mp4(self, deepgram, tmp_path, monkeypatch) -> None:
+        monkeypatch.setenv("PATH", str(tmp_path))
+
+        with patch.object(VodSttService, "_download_to_file",
+                          AsyncMock(return_value=_mp4(tmp_path))), \
+                patch.object(VodSttService, "_insert_subtitles", AsyncMock()):
+            await VodSttService().process("m1", "http://example.com/v.mp4", MagicMock())
+
+        assert _tasks["m1"].upload["format"] == "mp4"
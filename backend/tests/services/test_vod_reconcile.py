@@ -0,0 +1,298 @@
+"""실시간 자막 → VOD 정렬/부분 재전사 테스트"""
+
+import random
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.services import vod_reconcile
+from app.services.vod_reconcile import (
+    densest_window,
+    estimate_offset,
+    find_gaps,
+    merge,
+)
+from app.services.vod_stt_service import VodSttService, _tasks
+
+# VOD 타임라인의 실제 발화 (시작, 끝, 텍스트)
+SPEECH = [
+    (10.0, 14.0, "지금부터 제383회 경기도의회 임시회 제3차 본회의를 개의하겠습니다."),
+    (15.0, 19.0, "의사일정 제1항 경기도 조례 일부개정조례안을 상정합니다."),
+    (20.0, 24.0, "제안설명은 회의록에 게재하는 것으로 갈음하겠습니다."),
+    (25.0, 29.0, "다음은 의사일정 제2항 예산안 심사보고를 상정합니다."),
+    (30.0, 34.0, "예산결산특별위원장 나오셔서 보고해 주시기 바랍니다."),
+    (60.0, 64.0, "이상으로 보고를 마치겠습니다. 감사합니다."),
+    (65.0, 69.0, "질의 토론을 종결하고 표결하도록 하겠습니다."),
+]
+# 이후 580초까지 5초마다 서로 다른 발화
+_rng = random.Random(3)
+SPEECH += [
+    (t, t + 4.0, "".join(chr(0xAC00 + _rng.randrange(11172)) for _ in range(16)))
+    for t in range(100, 585, 5)
+]
+
+
+def _live(offset: float) -> list[dict]:
+    """실시간 자막: VOD보다 offset초 늦게 시작한 스트림 시각, 문장 분할이 다름"""
+    rows = []
+    for start, end, text in SPEECH:
+        if 60 <= start < 100:
+            continue  # 재연결 공백 (60~100초 자막 없음)
+        middle = len(text) // 2
+        half = (end - start) / 2
+        rows.append({"start_time": start - offset, "end_time": start + half - offset,
+                     "text": text[:middle], "confidence": 0.9, "speaker": "화자 1"})
+        rows.append({"start_time": start + half - offset, "end_time": end - offset,
+                     "text": text[middle:], "confidence": 0.9, "speaker": "화자 1"})
+    return rows
+
+
+def _vod_cues(start: float, end: float) -> list[dict]:
+    return [
+        {"start_time": s, "end_time": e, "text": text, "confidence": 0.95, "speaker": "화자 1"}
+        for s, e, text in SPEECH
+        if start <= (s + e) / 2 < end
+    ]
+
+
+class TestAlignment:
+    def test_offset_recovered_with_different_segmentation(self) -> None:
+        live = _live(offset=-37.5)  # 실시간 STT가 녹화보다 37.5초 늦게 시작
+        probe = _vod_cues(0, 40)
+
+        offset = estimate_offset(live, probe)
+
+        assert offset == pytest.approx(-37.5, abs=1.0)
+
+    def test_unrelated_text_does_not_align(self) -> None:
+        live = [{"start_time": i * 5.0, "end_time": i * 5.0 + 4, "text": "가나다라마바사아자차"}
+                for i in range(10)]
+
+        assert estimate_offset(live, _vod_cues(0, 40)) is None
+
+    def test_densest_window(self) -> None:
+        live = [{"start_time": 0.0, "end_time": 1.0, "text": "네"}] + _live(0)
+
+        assert densest_window(live, length=30) == 10.0
+
+
+class TestGaps:
+    def test_reconnect_hole_and_low_confidence(self) -> None:
+        live = [
+            {"start_time": 0.0, "end_time": 10.0, "confidence": 0.9},
+            {"start_time": 11.0, "end_time": 20.0, "confidence": 0.3},
+            {"start_time": 20.0, "end_time": 30.0, "confidence": 0.9},
+            {"start_time": 60.0, "end_time": 70.0, "confidence": 0.9},
+        ]
+
+        gaps = find_gaps(live, duration=100.0, min_gap=15.0, min_confidence=0.6)
+
+        # 저신뢰 11~20, 공백 30~60, 끝 70~100
+        assert gaps == [(11.0, 20.0), (30.0, 60.0), (70.0, 100.0)]
+        assert vod_reconcile.padded(gaps[-1], 100.0) == (69.0, 100.0)
+
+    def test_close_spans_are_merged(self) -> None:
+        live = [
+            {"start_time": 0.0, "end_time": 5.0, "confidence": 0.2},
+            {"start_time": 7.0, "end_time": 9.0, "confidence": 0.2},
+            {"start_time": 9.0, "end_time": 20.0, "confidence": 0.9},
+        ]
+
+        assert find_gaps(live, 20.0, min_gap=15.0, min_confidence=0.6) == [(0.0, 9.0)]
+
+    def test_merge_prefers_retranscribed_inside_gaps(self) -> None:
+        live = [
+            {"start_time": 0.0, "end_time": 4.0, "text": "실시간 1"},
+            {"start_time": 10.0, "end_time": 12.0, "text": "실시간 저신뢰"},
+            {"start_time": 20.0, "end_time": 24.0, "text": "실시간 2"},
+        ]
+        retranscribed = [((9.0, 13.0), [
+            {"start_time": 3.0, "end_time": 4.0, "text": "여유 구간 중복"},
+            {"start_time": 10.0, "end_time": 12.0, "text": "재전사"},
+        ])]
+
+        texts = [cue["text"] for cue in merge(live, retranscribed)]
+
+        assert texts == ["실시간 1", "재전사", "실시간 2"]
+
+
+@pytest.fixture(autouse=True)
+def clear_tasks():
+    _tasks.clear()
+    yield
+    _tasks.clear()
+
+
+def _fake_vod(monkeypatch, live: list[dict]) -> list[tuple[float, float]]:
+    """ffmpeg/Deepgram 대신 구간 정보를 그대로 넘겨 SPEECH에서 자막을 만드는 가짜"""
+    ranges: list[tuple[float, float]] = []
+
+    async def cut_audio(path, start, end, dest, sample_rate=16000):
+        ranges.append((start, end))
+        dest.write_text(f"{start}:{end}")
+        return dest
+
+    async def transcribe_audio(audio_path, content_type="audio/wav"):
+        start, end = map(float, audio_path.read_text().split(":"))
+        return {"results": {"utterances": [
+            {"start": s - start, "end": e - start, "transcript": text,
+             "confidence": 0.95, "speaker": 0}
+            for s, e, text in SPEECH if start <= (s + e) / 2 < end
+        ]}}
+
+    monkeypatch.setattr(vod_reconcile, "load_live_subtitles", AsyncMock(return_value=live))
+    monkeypatch.setattr(vod_reconcile, "probe_duration", AsyncMock(return_value=600.0))
+    monkeypatch.setattr(vod_reconcile, "cut_audio", cut_audio)
+    monkeypatch.setattr(VodSttService, "_transcribe_audio", staticmethod(transcribe_audio))
+    return ranges
+
+
+class TestVodSttReconcile:
+    async def test_only_gaps_are_transcribed(self, monkeypatch, tmp_path) -> None:
+        ranges = _fake_vod(monkeypatch, _live(offset=-5.0))
+        mp4 = tmp_path / "vod.mp4"
+        mp4.write_bytes(b"mp4")
+        supabase = MagicMock()
+
+        with patch.object(VodSttService, "_download_to_file", AsyncMock(return_value=mp4)), \
+                patch.object(VodSttService, "_send_to_deepgram", AsyncMock()) as full, \
+                patch.object(VodSttService, "_insert_subtitles", AsyncMock()) as insert:
+            await VodSttService().process(
+                "vod-1", "http://example.com/v.mp4", supabase, live_meeting_id="live-1",
+            )
+
+        task = _tasks["vod-1"]
+        assert task.status == "completed"
+        assert not full.called
+        assert task.reconcile["offset_seconds"] == pytest.approx(-5.0, abs=1.0)
+        # 정렬용 구간 + 재연결 공백/끝 구간만 전사
+        assert ranges[1:] == [(33.0, 101.0), (583.0, 600.0)]
+        assert task.reconcile["transcribed_seconds"] == pytest.approx(120 + 68 + 17)
+        assert task.reconcile["saved_ratio"] > 0.6
+
+        saved = insert.call_args[0][1]
+        texts = [cue["text"] for cue in saved]
+        # 재연결 공백 발화는 재전사로 채워지고, 나머지는 실시간 자막 그대로 (중복 없음)
+        assert SPEECH[5][2] in texts and SPEECH[6][2] in texts
+        assert len(texts) == len(set(texts))
+        assert sum(1 for cue in saved if cue["confidence"] == 0.9) == 2 * (len(SPEECH) - 2)
+        assert {cue["meeting_id"] for cue in saved} == {"vod-1"}
+        assert list(tmp_path.glob("*.wav")) == []  # 구간 오디오 임시 파일 정리
+
+    async def test_falls_back_to_full_transcription(self, monkeypatch, tmp_path) -> None:
+        _fake_vod(monkeypatch, [])
+        mp4 = tmp_path / "vod.mp4"
+        mp4.write_bytes(b"mp4")
+
+        with patch.object(VodSttService, "_download_to_file", AsyncMock(return_value=mp4)), \
+                patch.object(VodSttService, "_send_to_deepgram", AsyncMock(return_value={
+                    "metadata": {"duration": 90.0},
+                    "results": {"utterances": []},
+                })) as full, \
+                patch.object(VodSttService, "_insert_subtitles", AsyncMock()):
+            await VodSttService().process(
+                "vod-1", "http://example.com/v.mp4", MagicMock(), live_meeting_id="live-1",
+            )
+
+        assert full.called
+        assert _tasks["vod-1"].status == "completed"
+        assert "실시간 자막 부족" in _tasks["vod-1"].reconcile["error"]
+
+
+class _Query:
+    def __init__(self, db: "_FakeSupabase", table: str) -> None:
+        self.db = db
+        self.table = table
+        self.filters: dict = {}
+
+    def select(self, *_):
+        return self
+
+    def eq(self, key, value):
+        self.filters[key] = value
+        return self
+
+    def in_(self, key, values):
+        self.filters[key] = tuple(values)
+        return self
+
+    def order(self, *_, **__):
+        return self
+
+    def limit(self, *_):
+        return self
+
+    def execute(self):
+        if self.table == "meetings":
+            return SimpleNamespace(data=self.db.meetings)
+        span = self.db.spans.get(self.filters["meeting_id"])
+        return SimpleNamespace(data=[{"end_time": span}] if span is not None else [])
+
+
+class _FakeSupabase:
+    def __init__(self, meetings: list[dict], spans: dict[str, float]) -> None:
+        self.meetings = meetings
+        self.spans = spans  # 회의 ID → 마지막 자막 끝 시각
+
+    def table(self, name: str) -> _Query:
+        return _Query(self, name)
+
+
+def _live_meeting(meeting_id: str, title: str, created_at: str) -> dict:
+    return {"id": meeting_id, "title": title, "stream_url": "https://hls/ch14.m3u8",
+            "created_at": created_at}
+
+
+class TestFindLiveMeeting:
+    VOD = {"id": "vod-1", "title": "제383회 본회의", "meeting_date": "2026-10-16"}
+
+    async def test_longest_channel_name_wins(self) -> None:
+        db = _FakeSupabase([
+            _live_meeting("a", "회의", "2026-10-16T01:00:00+00:00"),
+            _live_meeting("b", "본회의", "2026-10-16T02:00:00+00:00"),
+        ], {})
+
+        assert await vod_reconcile.find_live_meeting(db, self.VOD) == "b"
+
+    async def test_session_overlapping_vod_most_is_chosen(self) -> None:
+        """같은 채널의 live 회의가 여러 개면 VOD와 가장 많이 겹치는 회의"""
+        db = _FakeSupabase([
+            _live_meeting("morning", "본회의", "2026-10-16T01:00:00+00:00"),
+            _live_meeting("short", "본회의", "2026-10-16T03:00:00+00:00"),
+            _live_meeting("long", "본회의", "2026-10-16T05:00:00+00:00"),
+        ], {"morning": 3700.0, "short": 600.0, "long": 9000.0})
+
+        chosen = await vod_reconcile.find_live_meeting(db, {**self.VOD, "duration_seconds": 3600})
+        longest = await vod_reconcile.find_live_meeting(db, self.VOD)
+
+        # 겹침(min(길이, 3600초))은 morning = long > short, 같으면 길이가 VOD에 가까운 회의
+        assert chosen == "morning"
+        assert longest == "long"
+
+    async def test_ties_pick_earliest_session(self) -> None:
+        db = _FakeSupabase([
+            _live_meeting("later", "본회의", "2026-10-16T05:00:00+00:00"),
+            _live_meeting("earlier", "본회의", "2026-10-16T01:00:00+00:00"),
+        ], {})
+
+        assert await vod_reconcile.find_live_meeting(db, self.VOD) == "earlier"
+
+
+def test_probe_duration_without_ffprobe(monkeypatch) -> None:
+    monkeypatch.setenv("PATH", "")
+
+    import asyncio
+
+    assert asyncio.run(vod_reconcile.probe_duration(Path("missing.mp4"))) is None
+
+
+def test_cut_audio_without_ffmpeg(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("PATH", "")
+
+    import asyncio
+
+    with pytest.raises(vod_reconcile.ReconcileError, match="FFmpeg not found") as error:
+        asyncio.run(vod_reconcile.cut_audio(tmp_path / "v.mp4", 0.0, 1.0, tmp_path / "c.wav"))
+    assert error.value.__suppress_context__
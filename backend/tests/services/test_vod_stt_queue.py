@@ -0,0 +1,546 @@
+"""VOD STT 작업 큐 테스트 (동시 처리 제한, 우선순위, 재시도, 재시작 후 이어서 처리)"""
+
+import asyncio
+import json
+import re
+import time
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services import vod_stt_queue, vod_stt_service
+from app.services.vod_stt_queue import VodSttJobConflictError, VodSttQueue
+from app.services.vod_stt_service import (
+    SttTaskStatus,
+    VodSttService,
+    _tasks,
+    finish_task,
+    get_task_by_id,
+    register_task,
+)
+
+
+class _Query:
+    def __init__(self, db: "_FakeSupabase", table: str) -> None:
+        self.db = db
+        self.table = table
+        self.op = "select"
+        self.payload = None
+        self.filters: dict = {}
+
+    def select(self, *_):
+        return self
+
+    def insert(self, payload):
+        self.op, self.payload = "insert", payload
+        return self
+
+    def update(self, payload):
+        self.op, self.payload = "update", payload
+        return self
+
+    def delete(self):
+        self.op = "delete"
+        return self
+
+    def eq(self, key, value):
+        self.filters[key] = value
+        return self
+
+    def in_(self, key, values):
+        self.filters[key] = tuple(values)
+        return self
+
+    def or_(self, filters):
+        self.filters["or"] = filters
+        return self
+
+    def order(self, *_, **__):
+        return self
+
+    def limit(self, *_):
+        return self
+
+    def execute(self):
+        return self.db.execute(self)
+
+
+class _UniqueViolationError(Exception):
+    code = "23505"
+
+
+class _FakeSupabase:
+    """vod_stt_jobs를 흉내 내는 DB (여러 큐가 공유하면 여러 프로세스)"""
+
+    def __init__(self) -> None:
+        self.jobs: dict[str, dict] = {}
+        self.calls: list[tuple[str, str, object]] = []
+
+    def table(self, name: str) -> _Query:
+        return _Query(self, name)
+
+    @staticmethod
+    def _matches(row: dict, filters: dict) -> bool:
+        for key, value in filters.items():
+            if key == "or":
+                # queued 또는 heartbeat_at이 기준보다 오래된(없는) running
+                cutoff = datetime.fromisoformat(re.search(r"heartbeat_at\.lt\.([^)]+)", value)[1])
+                heartbeat = row.get("heartbeat_at")
+                if not (row["status"] == "queued" or row["status"] == "running" and (
+                    heartbeat is None or datetime.fromisoformat(heartbeat) < cutoff
+                )):
+                    return False
+            elif row.get(key) != value:
+                return False
+        return True
+
+    def execute(self, query: _Query):
+        self.calls.append((query.table, query.op, query.payload))
+        if query.table != "vod_stt_jobs":
+            return SimpleNamespace(data=[])
+        if query.op == "insert":
+            row = query.payload
+            if any(job["meeting_id"] == row["meeting_id"]
+                   and job["status"] in ("queued", "running") for job in self.jobs.values()):
+                raise _UniqueViolationError("idx_vod_stt_jobs_active_meeting")
+            self.jobs[row["id"]] = dict(row)
+            return SimpleNamespace(data=[dict(row)])
+        rows = [row for row in self.jobs.values() if self._matches(row, query.filters)]
+        if query.op == "update":
+            for row in rows:
+                row.update(query.payload)
+        return SimpleNamespace(data=[dict(row) for row in rows])
+
+    def ops(self, table: str, op: str) -> list:
+        return [payload for t, o, payload in self.calls if t == table and o == op]
+
+
+class _FakeService:
+    """run()이 gate가 열릴 때까지 기다리는 가짜 서비스"""
+
+    def __init__(self, fail_times: int = 0) -> None:
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.fail_times = fail_times
+        self.started: list[str] = []
+        self.active = 0
+        self.max_active = 0
+        self.restored: list[str] = []
+
+    async def run(self, task, vod_url, supabase, **kwargs) -> None:
+        self.started.append(task.meeting_id)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await self.gate.wait()
+            if self.fail_times:
+                self.fail_times -= 1
+                raise RuntimeError("KMS 503")
+            finish_task(task, "completed", "완료")
+        finally:
+            self.active -= 1
+
+    async def restore_meeting_status(self, supabase, meeting_id) -> None:
+        self.restored.append(meeting_id)
+
+
+class _StagedService(_FakeService):
+    """gate가 열리면 parsed 단계를 저장한 뒤 자막을 저장하는 가짜 서비스"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.inserted: list[str] = []
+        self.cancelled = 0
+
+    async def run(self, task, vod_url, supabase, checkpoint=None, on_stage=None, **kwargs):
+        self.started.append(task.meeting_id)
+        try:
+            await self.gate.wait()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        checkpoint.stage = "parsed"
+        await on_stage(checkpoint)
+        self.inserted.append(task.meeting_id)
+        finish_task(task, "completed", "완료")
+
+
+@pytest.fixture(autouse=True)
+def clear_tasks():
+    _tasks.clear()
+    yield
+    _tasks.clear()
+
+
+@pytest.fixture
+def db(monkeypatch) -> _FakeSupabase:
+    fake = _FakeSupabase()
+    monkeypatch.setattr(vod_stt_queue, "get_supabase_client", lambda: fake)
+    monkeypatch.setattr(vod_stt_queue.settings, "vod_stt_retry_base", 0.01)
+    return fake
+
+
+async def _wait(condition, timeout: float = 2.0) -> None:
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0.01)
+
+
+class TestScheduling:
+    async def test_concurrency_is_bounded(self, db, tmp_path) -> None:
+        service = _FakeService()
+        service.gate.clear()
+        queue = VodSttQueue(concurrency=2, work_dir=tmp_path, service=service)
+        await queue.start()
+        try:
+            for i in range(5):
+                await queue.submit(f"m{i}", "http://example.com/v.mp4")
+            await _wait(lambda: len(service.started) == 2)
+            await asyncio.sleep(0.05)
+            assert len(service.started) == 2
+            assert _tasks["m4"].status == "pending"
+
+            service.gate.set()
+            await _wait(lambda: queue.completed == 5)
+        finally:
+            await queue.stop()
+
+        assert service.max_active == 2
+        assert {row["status"] for row in db.jobs.values()} == {"completed"}
+
+    async def test_higher_priority_runs_first(self, db, tmp_path) -> None:
+        service = _FakeService()
+        service.gate.clear()
+        queue = VodSttQueue(concurrency=1, work_dir=tmp_path, service=service)
+        await queue.start()
+        try:
+            await queue.submit("first", "http://example.com/1.mp4")
+            await _wait(lambda: service.started == ["first"])
+            await queue.submit("low", "http://example.com/2.mp4", priority=-1)
+            await queue.submit("normal", "http://example.com/3.mp4")
+            await queue.submit("urgent", "http://example.com/4.mp4", priority=5)
+            service.gate.set()
+            await _wait(lambda: queue.completed == 4)
+        finally:
+            await queue.stop()
+
+        assert service.started == ["first", "urgent", "normal", "low"]
+
+    async def test_failed_job_is_retried_with_backoff(self, db, tmp_path) -> None:
+        service = _FakeService(fail_times=1)
+        queue = VodSttQueue(concurrency=1, work_dir=tmp_path, service=service)
+        await queue.start()
+        try:
+            task = await queue.submit("m1", "http://example.com/v.mp4")
+            await _wait(lambda: queue.completed == 1)
+        finally:
+            await queue.stop()
+
+        assert queue.retries == 1
+        assert db.jobs[task.task_id]["attempts"] == 2
+        assert _tasks["m1"].status == "completed"
+
+    async def test_gives_up_after_max_attempts(self, db, tmp_path) -> None:
+        service = _FakeService(fail_times=10)
+        queue = VodSttQueue(concurrency=1, max_attempts=2, work_dir=tmp_path, service=service)
+        await queue.start()
+        try:
+            task = await queue.submit("m1", "http://example.com/v.mp4")
+            await _wait(lambda: queue.failed == 1)
+        finally:
+            await queue.stop()
+
+        row = db.jobs[task.task_id]
+        assert (row["status"], row["attempts"], row["error"]) == ("failed", 2, "KMS 503")
+        assert _tasks["m1"].status == "failed"
+        assert service.restored == ["m1"]
+
+
+def _job_row(job_id: str, stage: str | None, result: dict | None = None) -> dict:
+    return {
+        "id": job_id,
+        "meeting_id": "vod-1",
+        "vod_url": "http://example.com/v.mp4",
+        "priority": 0,
+        "status": "running",  # 이전 프로세스가 처리 중 종료됨
+        "stage": stage,
+        "attempts": 1,
+        "next_run_at": "2026-10-16T00:00:00+00:00",
+        "result": result,
+    }
+
+
+class TestResume:
+    async def test_resumes_after_parsed_without_transcribing(self, db, tmp_path) -> None:
+        subtitles = [{"meeting_id": "vod-1", "text": "개의합니다", "start_time": 1.0,
+                      "end_time": 2.0, "confidence": 0.9, "speaker": "화자 1"}]
+        db.jobs["job-1"] = _job_row(
+            "job-1", "parsed", {"subtitles": subtitles, "duration": 3600.0, "reconcile": None}
+        )
+        queue = VodSttQueue(concurrency=1, work_dir=tmp_path)
+
+        with patch.object(VodSttService, "_download_to_file", AsyncMock()) as download, \
+                patch.object(VodSttService, "_send_to_deepgram", AsyncMock()) as deepgram:
+            await queue.start()
+            try:
+                await _wait(lambda: queue.completed == 1)
+            finally:
+                await queue.stop()
+
+        assert queue.resumed == 1
+        assert not download.called and not deepgram.called
+        # 이전 시도의 저장분을 지우고 다시 저장
+        assert db.ops("subtitles", "delete")
+        assert db.ops("subtitles", "insert") == [subtitles]
+        meeting_updates = db.ops("meetings", "update")
+        assert meeting_updates[-1]["status"] == "ended"
+        assert meeting_updates[-1]["duration_seconds"] == 3600
+        assert db.jobs["job-1"]["status"] == "completed"
+        assert db.jobs["job-1"]["attempts"] == 2
+
+    async def test_resumes_from_saved_deepgram_response(self, db, tmp_path) -> None:
+        (tmp_path / "job-2.json").write_text(json.dumps({
+            "metadata": {"duration": 10.0},
+            "results": {"utterances": [
+                {"speaker": 0, "transcript": "산회합니다", "start": 0.0, "end": 1.0,
+                 "confidence": 0.9},
+            ]},
+        }), encoding="utf-8")
+        db.jobs["job-2"] = _job_row("job-2", "uploaded")
+        queue = VodSttQueue(concurrency=1, work_dir=tmp_path)
+
+        with patch.object(VodSttService, "_download_to_file", AsyncMock()) as download, \
+                patch.object(VodSttService, "_send_to_deepgram", AsyncMock()) as deepgram:
+            await queue.start()
+            try:
+                await _wait(lambda: queue.completed == 1)
+            finally:
+                await queue.stop()
+
+        assert not download.called and not deepgram.called
+        assert [row["text"] for row in db.ops("subtitles", "insert")[0]] == ["산회합니다"]
+        stages = [p.get("stage") for p in db.ops("vod_stt_jobs", "update")]
+        assert stages[-3:] == ["parsed", "inserted", "inserted"]
+        assert not (tmp_path / "job-2.json").exists()
+
+    async def test_missing_download_restarts_from_scratch(self, db, tmp_path) -> None:
+        db.jobs["job-3"] = _job_row("job-3", "downloaded")  # 작업 폴더가 비워진 배포
+        queue = VodSttQueue(concurrency=1, work_dir=tmp_path)
+
+        async def download(vod_url, task, dest=None):
+            dest.write_bytes(b"mp4")
+            return dest
+
+        with patch.object(VodSttService, "_download_to_file", side_effect=download), \
+                patch.object(VodSttService, "_send_to_deepgram", AsyncMock(return_value={
+                    "metadata": {"duration": 5.0}, "results": {"utterances": []},
+                })):
+            await queue.start()
+            try:
+                await _wait(lambda: queue.completed == 1)
+            finally:
+                await queue.stop()
+
+        stages = [p.get("stage") for p in db.ops("vod_stt_jobs", "update")]
+        # 선점 → 시작 저장 → 단계별 저장
+        assert stages[2:5] == ["downloaded", "uploaded", "parsed"]
+        assert list(tmp_path.iterdir()) == []
+
+
+def _iso_ago(seconds: float) -> str:
+    return datetime.fromtimestamp(time.time() - seconds, UTC).isoformat()
+
+
+class TestMultiProcess:
+    """같은 vod_stt_jobs를 공유하는 여러 큐 (uvicorn 워커/인스턴스)"""
+
+    @pytest.fixture(autouse=True)
+    def fast_heartbeat(self, monkeypatch) -> None:
+        monkeypatch.setattr(vod_stt_queue.settings, "vod_stt_heartbeat_interval", 0.02)
+        monkeypatch.setattr(vod_stt_queue.settings, "vod_stt_stale_after", 60.0)
+
+    async def test_job_runs_once_across_queues(self, db, tmp_path) -> None:
+        first, second = _FakeService(), _FakeService()
+        submitter = VodSttQueue(concurrency=1, work_dir=tmp_path, service=first)
+        other = VodSttQueue(concurrency=1, work_dir=tmp_path, service=second)
+
+        task = await submitter.submit("m1", "http://example.com/v.mp4")
+        await other.start()
+        try:
+            await _wait(lambda: other.completed == 1)
+            await submitter.start()
+            await _wait(lambda: submitter.claim_conflicts == 1)
+        finally:
+            await other.stop()
+            await submitter.stop()
+
+        assert (first.started, second.started) == ([], ["m1"])
+        row = db.jobs[task.task_id]
+        assert (row["status"], row["attempts"], row["locked_by"]) == ("completed", 1, None)
+
+    async def test_stale_running_job_is_reclaimed(self, db, tmp_path) -> None:
+        db.jobs["dead"] = _job_row("dead", "downloaded") | {
+            "meeting_id": "m-dead", "locked_by": "host:1:dead", "heartbeat_at": _iso_ago(600),
+        }
+        db.jobs["alive"] = _job_row("alive", "downloaded") | {
+            "meeting_id": "m-alive", "locked_by": "host:2:alive", "heartbeat_at": _iso_ago(1),
+        }
+        service = _FakeService()
+        service.gate.clear()
+        queue = VodSttQueue(concurrency=2, work_dir=tmp_path, service=service)
+        await queue.start()
+        try:
+            await _wait(lambda: service.started == ["m-dead"])
+            first_beat = db.jobs["dead"]["heartbeat_at"]
+            await _wait(lambda: db.jobs["dead"]["heartbeat_at"] != first_beat)
+            assert db.jobs["dead"]["locked_by"] == queue._worker_id
+            service.gate.set()
+            await _wait(lambda: queue.completed == 1)
+        finally:
+            await queue.stop()
+
+        assert service.started == ["m-dead"]
+        assert db.jobs["dead"]["attempts"] == 2
+        assert db.jobs["alive"]["locked_by"] == "host:2:alive"
+
+    async def test_stop_releases_running_job(self, db, tmp_path) -> None:
+        service = _FakeService()
+        service.gate.clear()
+        queue = VodSttQueue(concurrency=1, work_dir=tmp_path, service=service)
+        await queue.start()
+        task = await queue.submit("m1", "http://example.com/v.mp4")
+        await _wait(lambda: service.started == ["m1"])
+        await queue.stop()
+
+        row = db.jobs[task.task_id]
+        assert (row["status"], row["locked_by"]) == ("queued", None)
+
+    async def test_duplicate_submit_raises_conflict(self, db, tmp_path) -> None:
+        db.jobs["other"] = _job_row("other", None) | {
+            "meeting_id": "m1", "heartbeat_at": _iso_ago(1),
+        }
+        queue = VodSttQueue(concurrency=1, work_dir=tmp_path, service=_FakeService())
+
+        with pytest.raises(VodSttJobConflictError):
+            await queue.submit("m1", "http://example.com/v.mp4")
+
+        assert "m1" not in _tasks
+        assert queue.get_metrics()["queued"] == 0
+
+    async def test_job_taken_over_while_running_is_cancelled(
+        self, db, tmp_path, monkeypatch
+    ) -> None:
+        """하트비트가 끊긴 사이 다른 큐가 가져가면 먼저 처리하던 큐는 처리를 중단한다"""
+        monkeypatch.setattr(vod_stt_queue.settings, "vod_stt_heartbeat_interval", 0.2)
+        first, second = _StagedService(), _StagedService()
+        first.gate.clear()
+        slow = VodSttQueue(concurrency=1, work_dir=tmp_path, service=first)
+        other = VodSttQueue(concurrency=1, work_dir=tmp_path, service=second)
+        await slow.start()
+        try:
+            task = await slow.submit("m1", "http://example.com/v.mp4")
+            await _wait(lambda: first.started == ["m1"])
+            db.jobs[task.task_id]["heartbeat_at"] = _iso_ago(600)  # 하트비트가 늦어짐
+
+            await other.start()
+            await _wait(lambda: other.completed == 1)
+            await _wait(lambda: slow.lost_claims == 1)
+        finally:
+            await other.stop()
+            await slow.stop()
+
+        assert (first.cancelled, first.inserted, second.inserted) == (1, [], ["m1"])
+        row = db.jobs[task.task_id]
+        assert (row["status"], row["locked_by"]) == ("completed", None)
+        assert slow.get_metrics()["running"] == 0 and not slow._jobs
+
+    async def test_ownership_is_checked_before_inserting(
+        self, db, tmp_path, monkeypatch
+    ) -> None:
+        """하트비트로 알아채기 전이라도 자막 저장 전 parsed 저장에서 소유권을 확인한다"""
+        monkeypatch.setattr(vod_stt_queue.settings, "vod_stt_heartbeat_interval", 60.0)
+        first, second = _StagedService(), _StagedService()
+        first.gate.clear()
+        slow = VodSttQueue(concurrency=1, work_dir=tmp_path, service=first)
+        other = VodSttQueue(concurrency=1, work_dir=tmp_path, service=second)
+        await slow.start()
+        try:
+            task = await slow.submit("m1", "http://example.com/v.mp4")
+            await _wait(lambda: first.started == ["m1"])
+            db.jobs[task.task_id]["heartbeat_at"] = _iso_ago(600)
+            await other.start()
+            await _wait(lambda: other.completed == 1)
+
+            first.gate.set()
+            await _wait(lambda: slow.lost_claims == 1)
+        finally:
+            await other.stop()
+            await slow.stop()
+
+        assert (first.inserted, second.inserted) == ([], ["m1"])
+        assert slow.completed == 0
+        row = db.jobs[task.task_id]
+        assert (row["status"], row["stage"], row["locked_by"]) == ("completed", "parsed", None)
+
+    async def test_failing_heartbeat_stops_before_job_goes_stale(
+        self, db, tmp_path, monkeypatch
+    ) -> None:
+        """하트비트가 계속 실패하면 다른 프로세스가 이어받기 전에 처리를 중단한다"""
+        monkeypatch.setattr(vod_stt_queue.settings, "vod_stt_heartbeat_interval", 0.05)
+        monkeypatch.setattr(vod_stt_queue.settings, "vod_stt_stale_after", 0.2)
+        run_query = vod_stt_queue.run_query
+
+        async def slow_heartbeat(query):
+            if query.op == "update" and set(query.payload) == {"heartbeat_at"}:
+                raise TimeoutError("statement timeout")
+            return await run_query(query)
+
+        monkeypatch.setattr(vod_stt_queue, "run_query", slow_heartbeat)
+        service = _StagedService()
+        service.gate.clear()
+        queue = VodSttQueue(concurrency=1, work_dir=tmp_path, service=service)
+        await queue.start()
+        try:
+            await queue.submit("m1", "http://example.com/v.mp4")
+            await _wait(lambda: queue.lost_claims == 1)
+        finally:
+            await queue.stop()
+
+        assert (service.cancelled, service.inserted) == (1, [])
+
+    async def test_poll_during_submit_does_not_duplicate_job(
+        self, db, tmp_path, monkeypatch
+    ) -> None:
+        """등록 저장을 기다리는 사이 주기 조회가 돌아도 작업은 한 번만 들어간다"""
+        queue = VodSttQueue(concurrency=1, work_dir=tmp_path, service=_FakeService())
+        run_query = vod_stt_queue.run_query
+
+        async def run_query_then_poll(query):
+            result = await run_query(query)
+            if query.op == "insert":
+                await queue._load()
+            return result
+
+        monkeypatch.setattr(vod_stt_queue, "run_query", run_query_then_poll)
+
+        await queue.submit("m1", "http://example.com/v.mp4")
+
+        assert queue.get_metrics()["queued"] == 1
+        assert len(queue._jobs) == 1
+
+
+class TestTaskRegistry:
+    def test_lookup_by_id_and_eviction(self, monkeypatch) -> None:
+        monkeypatch.setattr(vod_stt_service.settings, "vod_stt_task_ttl", 0.0)
+        done = SttTaskStatus(task_id="t1", meeting_id="m1")
+        register_task(done)
+        assert get_task_by_id("t1") is done
+
+        finish_task(done, "completed", "완료")
+        register_task(SttTaskStatus(task_id="t2", meeting_id="m2", status="running"))
+
+        assert get_task_by_id("t1") is None
+        assert "m1" not in _tasks
+        assert get_task_by_id("t2").meeting_id == "m2"
@@ -0,0 +1,135 @@
+"""KMS 다운로드 → Deepgram 업로드 중계 테스트 (로컬 aiohttp 서버 사용)"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from app.services import vod_stt_service
+from app.services.vod_stt_service import (
+    RelayUnavailableError,
+    SttTaskStatus,
+    VodSttService,
+    _tasks,
+)
+
+VOD_SIZE = 32 * 1024 * 1024
+
+
+class _Servers:
+    """가짜 KMS(GET /vod.mp4)와 가짜 Deepgram(POST /listen)"""
+
+    def __init__(self) -> None:
+        self.payload = bytes(range(256)) * (VOD_SIZE // 256)
+        self.mode = "ok"  # ok | chunked | broken
+        self.received: bytes = b""
+        self.content_length: str | None = None
+        self.served = 0  # KMS가 보낸 바이트
+        self.served_before_read: int | None = None  # Deepgram이 읽기 시작할 때까지 보낸 바이트
+
+    async def vod(self, request: web.Request) -> web.StreamResponse:
+        response = web.StreamResponse()
+        if self.mode != "chunked":
+            response.content_length = len(self.payload)
+        await response.prepare(request)
+        for i in range(0, len(self.payload), 64 * 1024):
+            if self.mode == "broken" and i >= len(self.payload) // 2:
+                request.transport.close()
+                return response
+            await response.write(self.payload[i:i + 64 * 1024])
+            self.served += 64 * 1024
+        await response.write_eof()
+        return response
+
+    async def listen(self, request: web.Request) -> web.Response:
+        self.content_length = request.headers.get("Content-Length")
+        await asyncio.sleep(0.3)  # 업로드가 막힌 동안 다운로드도 멈춰야 함
+        self.served_before_read = self.served
+        self.received = b"".join([chunk async for chunk in request.content.iter_any()])
+        return web.json_response({
+            "metadata": {"duration": 12.0},
+            "results": {"utterances": [
+                {"speaker": 0, "transcript": "개의합니다", "start": 0.0, "end": 1.0,
+                 "confidence": 0.9},
+            ]},
+        })
+
+
+@pytest.fixture
+async def servers(monkeypatch):
+    state = _Servers()
+    app = web.Application()
+    app.router.add_get("/vod.mp4", state.vod)
+    app.router.add_post("/listen", state.listen)
+    server = TestServer(app)
+    await server.start_server()
+    monkeypatch.setattr(vod_stt_service, "DEEPGRAM_API_URL", str(server.make_url("/listen")))
+    monkeypatch.setattr(vod_stt_service.settings, "vod_stt_relay_buffer_mb", 1)
+    monkeypatch.setattr(vod_stt_service.settings, "deepgram_api_key", "test-key")
+    state.url = str(server.make_url("/vod.mp4"))
+    yield state
+    await server.close()
+
+
+@pytest.fixture(autouse=True)
+def clear_tasks():
+    _tasks.clear()
+    yield
+    _tasks.clear()
+
+
+class TestRelay:
+    async def test_stream_is_relayed_without_temp_file(self, servers) -> None:
+        task = SttTaskStatus(task_id="t1", meeting_id="m1")
+
+        result = await VodSttService._relay_to_deepgram(servers.url, task)
+
+        assert servers.received == servers.payload
+        assert servers.content_length == str(VOD_SIZE)
+        assert result["metadata"]["duration"] == 12.0
+        assert task.progress == pytest.approx(0.40)
+        # 업로드가 멈춘 동안 버퍼(1MB)와 소켓 버퍼만큼만 받고 다운로드도 멈춤 (backpressure)
+        assert servers.served_before_read < VOD_SIZE // 2
+
+    async def test_unknown_length_is_not_relayed(self, servers) -> None:
+        servers.mode = "chunked"
+
+        with pytest.raises(RelayUnavailableError, match="Content-Length"):
+            await VodSttService._relay_to_deepgram(servers.url, SttTaskStatus("t1", "m1"))
+
+    async def test_broken_download_is_not_relayed(self, servers) -> None:
+        servers.mode = "broken"
+
+        with pytest.raises(RelayUnavailableError):
+            await VodSttService._relay_to_deepgram(servers.url, SttTaskStatus("t1", "m1"))
+
+
+class TestProcessWithRelay:
+    async def test_relay_skips_download(self, servers, monkeypatch) -> None:
+        monkeypatch.setattr(vod_stt_service.settings, "vod_stt_relay", True)
+
+        with patch.object(VodSttService, "_download_to_file", AsyncMock()) as download, \
+                patch.object(VodSttService, "_insert_subtitles", AsyncMock()) as insert:
+            await VodSttService().process("m1", servers.url, MagicMock())
+
+        assert not download.called
+        assert [cue["text"] for cue in insert.call_args[0][1]] == ["개의합니다"]
+        assert _tasks["m1"].status == "completed"
+
+    async def test_falls_back_to_temp_file(self, servers, monkeypatch, tmp_path) -> None:
+        monkeypatch.setattr(vod_stt_service.settings, "vod_stt_relay", True)
+        servers.mode = "chunked"
+        mp4 = tmp_path / "vod.mp4"
+        mp4.write_bytes(b"mp4")
+
+        with patch.object(VodSttService, "_download_to_file", AsyncMock(return_value=mp4)), \
+                patch.object(VodSttService, "_send_to_deepgram", AsyncMock(return_value={
+                    "metadata": {"duration": 3.0}, "results": {"utterances": []},
+                })) as upload, \
+                patch.object(VodSttService, "_insert_subtitles", AsyncMock()):
+            await VodSttService().process("m1", servers.url, MagicMock())
+
+        assert upload.called
+        assert _tasks["m1"].status == "completed"
@@ -0,0 +1,177 @@
+"""인터림 자막 전송 제한 / 델타 인코딩 테스트"""
+
+import asyncio
+import json
+from typing import Any
+
+from app.api.websocket import ConnectionManager
+
+
+class _FakeWebSocket:
+    def __init__(self, blocked: bool = False) -> None:
+        self.sent: list[dict[str, Any]] = []
+        self._gate = asyncio.Event()
+        if not blocked:
+            self._gate.set()
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_text(self, data: str) -> None:
+        await self._gate.wait()
+        self.sent.append(json.loads(data))
+
+    def unblock(self) -> None:
+        self._gate.set()
+
+
+async def _drain() -> None:
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+def _interim(text: str) -> dict[str, Any]:
+    return {"text": text, "channel_id": "ch1"}
+
+
+class TestInterimDelta:
+    """직전 인터림을 이어 쓰면 추가된 부분만 전송"""
+
+    async def test_extension_is_sent_as_delta(self) -> None:
+        cm = ConnectionManager(interim_rate=0)
+        ws = _FakeWebSocket()
+        await cm.connect(ws, "ch1")
+
+        await cm.broadcast_interim_subtitle("ch1", _interim("경기도의회"))
+        await cm.broadcast_interim_subtitle("ch1", _interim("경기도의회 본회의를"))
+        await cm.broadcast_interim_subtitle("ch1", _interim("경기도 의회"))
+        await _drain()
+
+        assert ws.sent == [
+            {"type": "subtitle_interim", "iseq": 1, "payload": _interim("경기도의회")},
+            {
+                "type": "subtitle_interim_delta",
+                "iseq": 2,
+                "base": 1,
+                "payload": {"channel_id": "ch1", "append": " 본회의를"},
+            },
+            # 앞부분이 바뀌면 전체 전송
+            {"type": "subtitle_interim", "iseq": 3, "payload": _interim("경기도 의회")},
+        ]
+        assert cm.get_interim_metrics("ch1")["deltas"] == 1
+
+    async def test_unchanged_interim_is_not_resent(self) -> None:
+        cm = ConnectionManager(interim_rate=0)
+        ws = _FakeWebSocket()
+        await cm.connect(ws, "ch1")
+
+        await cm.broadcast_interim_subtitle("ch1", _interim("안녕하세요"))
+        await cm.broadcast_interim_subtitle("ch1", _interim("안녕하세요"))
+        await _drain()
+
+        assert len(ws.sent) == 1
+
+    async def test_client_without_base_gets_full_text(self) -> None:
+        """기준 인터림을 받지 못한 새 클라이언트는 델타 대신 전체 텍스트를 받는다"""
+        cm = ConnectionManager(interim_rate=0)
+        early = _FakeWebSocket()
+        await cm.connect(early, "ch1")
+        await cm.broadcast_interim_subtitle("ch1", _interim("의사일정"))
+        await _drain()
+
+        late = _FakeWebSocket()
+        await cm.connect(late, "ch1")
+        await cm.broadcast_interim_subtitle("ch1", _interim("의사일정 제1항"))
+        await _drain()
+
+        assert early.sent[-1]["type"] == "subtitle_interim_delta"
+        assert late.sent == [
+            {"type": "subtitle_interim", "iseq": 2, "payload": _interim("의사일정 제1항")},
+        ]
+
+    async def test_dropped_base_falls_back_to_full_text(self) -> None:
+        """큐에서 기준 델타가 버려지면 다음 델타를 전체 텍스트로 보낸다"""
+        cm = ConnectionManager(queue_size=1, send_timeout=30, interim_rate=0)
+        ws = _FakeWebSocket(blocked=True)
+        await cm.connect(ws, "ch1")
+
+        await cm.broadcast_interim_subtitle("ch1", _interim("가"))  # 전송 중에 멈춤
+        await _drain()
+        await cm.broadcast_interim_subtitle("ch1", _interim("가나"))  # 큐 대기
+        await cm.broadcast_interim_subtitle("ch1", _interim("가나다"))  # "가나" 버림
+        ws.unblock()
+        await _drain()
+
+        assert [(m["type"], m["iseq"]) for m in ws.sent] == [
+            ("subtitle_interim", 1),
+            ("subtitle_interim", 3),
+        ]
+        assert ws.sent[1]["payload"]["text"] == "가나다"
+
+    async def test_final_subtitle_restarts_chain(self) -> None:
+        cm = ConnectionManager(interim_rate=0)
+        ws = _FakeWebSocket()
+        await cm.connect(ws, "ch1")
+
+        await cm.broadcast_interim_subtitle("ch1", _interim("가나"))
+        await cm.broadcast_subtitle("ch1", {"subtitle": {"id": "s1", "text": "가나다."}})
+        await cm.broadcast_interim_subtitle("ch1", _interim("가나다라"))
+        await _drain()
+
+        assert [m["type"] for m in ws.sent] == [
+            "subtitle_interim", "subtitle_created", "subtitle_interim",
+        ]
+
+
+class TestInterimThrottle:
+    """방별 초당 인터림 전송 수 제한"""
+
+    async def test_burst_is_coalesced_to_latest(self) -> None:
+        cm = ConnectionManager(interim_rate=20)
+        ws = _FakeWebSocket()
+        await cm.connect(ws, "ch1")
+
+        for text in ["가", "가나", "가나다", "가나다라", "가나다라마"]:
+            await cm.broadcast_interim_subtitle("ch1", _interim(text))
+        await _drain()
+        assert len(ws.sent) == 1
+
+        await asyncio.sleep(0.08)
+        await _drain()
+
+        assert len(ws.sent) == 2
+        assert ws.sent[1]["type"] == "subtitle_interim_delta"
+        assert ws.sent[1]["payload"]["append"] == "나다라마"
+        metrics = cm.get_interim_metrics("ch1")
+        assert metrics["sent"] == 2
+        assert metrics["coalesced"] == 3
+
+    async def test_final_subtitle_discards_pending_interim(self) -> None:
+        cm = ConnectionManager(interim_rate=20)
+        ws = _FakeWebSocket()
+        await cm.connect(ws, "ch1")
+
+        await cm.broadcast_interim_subtitle("ch1", _interim("가"))
+        await cm.broadcast_interim_subtitle("ch1", _interim("가나"))
+        await cm.broadcast_subtitle("ch1", {"subtitle": {"id": "s1", "text": "가나다."}})
+        await asyncio.sleep(0.08)
+        await _drain()
+
+        assert [m["type"] for m in ws.sent] == ["subtitle_interim", "subtitle_created"]
+
+    async def test_rate_is_configurable_per_room(self) -> None:
+        cm = ConnectionManager(interim_rate=20)
+        cm.set_interim_rate("ch2", 0)
+        ws1, ws2 = _FakeWebSocket(), _FakeWebSocket()
+        await cm.connect(ws1, "ch1")
+        await cm.connect(ws2, "ch2")
+
+        for text in ["가", "나", "다"]:
+            await cm.broadcast_interim_subtitle("ch1", _interim(text))
+            await cm.broadcast_interim_subtitle("ch2", _interim(text))
+        await _drain()
+
+        assert len(ws1.sent) == 1
+        assert len(ws2.sent) == 3
+        assert cm.get_interim_rate("ch2") == 0
+        assert cm.get_interim_rate("ch1") == 20
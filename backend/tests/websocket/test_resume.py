@@ -0,0 +1,155 @@
+"""WebSocket 재접속 이어받기(?since=<seq>) 테스트"""
+
+import asyncio
+import json
+import uuid
+
+from fastapi.testclient import TestClient
+
+from app.api.websocket import ConnectionManager, manager
+from app.main import app
+
+
+class _RecordingWebSocket:
+    def __init__(self) -> None:
+        self.sent: list[dict] = []
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_text(self, data: str) -> None:
+        self.sent.append(json.loads(data))
+
+
+async def _drain() -> None:
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+def _item(sub_id: str) -> dict:
+    return {"subtitle": {"id": sub_id, "text": f"자막 {sub_id}"}}
+
+
+async def _connect(cm: ConnectionManager, room: str, since: int | None = None):
+    ws = _RecordingWebSocket()
+    await cm.connect(ws, room, since=since)
+    await _drain()
+    return ws
+
+
+class TestSequence:
+    """방별 seq 부여"""
+
+    async def test_events_have_increasing_seq(self) -> None:
+        cm = ConnectionManager()
+        ws = await _connect(cm, "ch1")
+
+        await cm.broadcast_subtitle("ch1", _item("s1"))
+        await cm.broadcast_interim_subtitle("ch1", {"text": "인터림"})
+        await cm.broadcast_corrected_subtitle("ch1", {"id": "s1", "corrected_text": "교정"})
+        await cm.broadcast_subtitle("ch1", _item("s2"))
+        await _drain()
+
+        seqs = [m.get("seq") for m in ws.sent]
+        assert seqs[1] is None  # 인터림은 seq 없음
+        sequenced = [seqs[0], seqs[2], seqs[3]]
+        assert sequenced == sorted(sequenced)
+        assert sequenced[2] - sequenced[0] == 2
+
+    async def test_rooms_are_sequenced_independently(self) -> None:
+        cm = ConnectionManager()
+        await cm.broadcast_subtitle("ch1", _item("a"))
+        await cm.broadcast_subtitle("ch1", _item("b"))
+        await cm.broadcast_subtitle("ch2", _item("c"))
+
+        ws = await _connect(cm, "ch2")
+        snapshot = ws.sent[0]
+        assert snapshot["type"] == "subtitle_history"
+        assert [s["id"] for s in snapshot["payload"]["subtitles"]] == ["c"]
+
+
+class TestResume:
+    """since 이후 이벤트만 재전송"""
+
+    async def test_resume_sends_only_missed_events(self) -> None:
+        """놓친 생성/교정 이벤트만 순서대로 받는다"""
+        cm = ConnectionManager()
+        first = await _connect(cm, "ch1")
+        await cm.broadcast_subtitle("ch1", _item("s1"))
+        await _drain()
+        last_seen = first.sent[-1]["seq"]
+        cm.disconnect(first, "ch1")
+
+        await cm.broadcast_subtitle("ch1", _item("s2"))
+        await cm.broadcast_corrected_subtitle("ch1", {"id": "s1", "corrected_text": "교정"})
+
+        ws = await _connect(cm, "ch1", since=last_seen)
+
+        assert [m["type"] for m in ws.sent] == ["subtitle_created", "subtitle_corrected"]
+        assert [m["seq"] for m in ws.sent] == [last_seen + 1, last_seen + 2]
+        assert ws.sent[0]["payload"]["subtitle"]["id"] == "s2"
+
+    async def test_resume_up_to_date_sends_nothing(self) -> None:
+        cm = ConnectionManager()
+        await cm.broadcast_subtitle("ch1", _item("s1"))
+        snapshot = (await _connect(cm, "ch1")).sent[0]
+
+        ws = await _connect(cm, "ch1", since=snapshot["seq"])
+
+        assert ws.sent == []
+
+    async def test_gap_larger_than_log_falls_back_to_snapshot(self) -> None:
+        """로그 범위를 벗어난 since는 전체 스냅샷으로 대체한다"""
+        cm = ConnectionManager(history_size=2)
+        await cm.broadcast_subtitle("ch1", _item("s0"))
+        since = (await _connect(cm, "ch1")).sent[0]["seq"]
+        for i in range(1, 10):
+            await cm.broadcast_subtitle("ch1", _item(f"s{i}"))
+
+        ws = await _connect(cm, "ch1", since=since)
+
+        assert len(ws.sent) == 1
+        assert ws.sent[0]["type"] == "subtitle_history"
+        assert ws.sent[0]["seq"] == since + 9
+        assert [s["id"] for s in ws.sent[0]["payload"]["subtitles"]] == ["s8", "s9"]
+
+    async def test_since_ahead_of_server_falls_back_to_snapshot(self) -> None:
+        """서버 재시작 등으로 since가 현재 seq보다 크면 스냅샷을 보낸다"""
+        cm = ConnectionManager()
+        await cm.broadcast_subtitle("ch1", _item("s1"))
+
+        ws = await _connect(cm, "ch1", since=2**52)
+
+        assert [m["type"] for m in ws.sent] == ["subtitle_history"]
+
+    async def test_seq_keeps_increasing_after_clear_history(self) -> None:
+        cm = ConnectionManager()
+        await cm.broadcast_subtitle("ch1", _item("s1"))
+        before = (await _connect(cm, "ch1")).sent[0]["seq"]
+
+        cm.clear_history("ch1")
+        await cm.broadcast_subtitle("ch1", _item("s2"))
+
+        ws = await _connect(cm, "ch1", since=before - 1)
+        assert ws.sent[0]["type"] == "subtitle_history"
+        assert ws.sent[0]["seq"] == before + 1
+
+
+def test_endpoint_accepts_since_query() -> None:
+    """엔드포인트가 ?since= 쿼리로 이어받기를 지원한다"""
+    room = f"test-{uuid.uuid4()}"
+    asyncio.run(manager.broadcast_subtitle(room, _item("s1")))
+    asyncio.run(manager.broadcast_subtitle(room, _item("s2")))
+    first_seq = manager._last_seq[room] - 1
+
+    try:
+        with TestClient(app).websocket_connect(
+            f"/ws/meetings/{room}/subtitles?since={first_seq}"
+        ) as ws:
+            message = ws.receive_json()
+    finally:
+        manager.clear_history(room)
+
+    assert message["type"] == "subtitle_created"
+    assert message["seq"] == first_seq + 1
+    assert message["payload"]["subtitle"]["id"] == "s2"
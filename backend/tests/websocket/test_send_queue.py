@@ -0,0 +1,217 @@
+"""WebSocket 클라이언트별 송신 큐 테스트"""
+
+import asyncio
+import json
+from typing import Any
+
+from app.api.websocket import ConnectionManager
+
+
+class _FakeWebSocket:
+    """send_text 완료 시점을 제어할 수 있는 WebSocket"""
+
+    def __init__(self, blocked: bool = False) -> None:
+        self.sent: list[dict[str, Any]] = []
+        self.closed_code: int | None = None
+        self._gate = asyncio.Event()
+        if not blocked:
+            self._gate.set()
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_text(self, data: str) -> None:
+        await self._gate.wait()
+        self.sent.append(json.loads(data))
+
+    async def close(self, code: int = 1000) -> None:
+        self.closed_code = code
+
+    def unblock(self) -> None:
+        self._gate.set()
+
+
+async def _drain() -> None:
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+async def _stalled_client(cm: ConnectionManager, room: str) -> _FakeWebSocket:
+    """첫 메시지 전송에서 멈춘 클라이언트를 만듭니다 (큐는 비어 있는 상태)."""
+    ws = _FakeWebSocket(blocked=True)
+    await cm.connect(ws, room)
+    await cm.broadcast_interim_subtitle(room, {"text": "in-flight"})
+    await _drain()
+    return ws
+
+
+class TestSlowConsumer:
+    """느린 클라이언트 격리"""
+
+    async def test_slow_client_does_not_block_others(self) -> None:
+        """멈춘 클라이언트가 있어도 다른 클라이언트는 모두 수신한다"""
+        cm = ConnectionManager(queue_size=16, send_timeout=30)
+        slow = _FakeWebSocket(blocked=True)
+        fast = _FakeWebSocket()
+        await cm.connect(slow, "ch1")
+        await cm.connect(fast, "ch1")
+
+        for i in range(5):
+            await asyncio.wait_for(cm.broadcast_subtitle("ch1", {"id": str(i)}), 0.1)
+        await _drain()
+
+        assert [m["payload"]["id"] for m in fast.sent] == ["0", "1", "2", "3", "4"]
+        assert slow.sent == []
+        assert cm.get_queue_metrics("ch1")["queued_max"] == 4
+
+        slow.unblock()
+        await _drain()
+        assert len(slow.sent) == 5
+
+    async def test_full_queue_drops_oldest_interim_first(self) -> None:
+        """큐가 가득 차면 가장 오래된 인터림을 버리고 확정 자막은 유지한다"""
+        cm = ConnectionManager(queue_size=2, send_timeout=30, interim_rate=0)
+        ws = await _stalled_client(cm, "ch1")
+
+        await cm.broadcast_interim_subtitle("ch1", {"text": "a"})
+        await cm.broadcast_subtitle("ch1", {"id": "1"})
+        await cm.broadcast_subtitle("ch1", {"id": "2"})
+
+        metrics = cm.get_queue_metrics("ch1")
+        assert metrics["dropped_interims"] == 1
+        assert metrics["evicted_clients"] == 0
+        assert ws in cm.active_connections["ch1"]
+
+        ws.unblock()
+        await _drain()
+        assert [m["type"] for m in ws.sent] == [
+            "subtitle_interim", "subtitle_created", "subtitle_created",
+        ]
+
+    async def test_full_queue_drops_new_interim_when_only_finals_queued(self) -> None:
+        """확정 자막만 쌓여 있으면 새 인터림을 버린다"""
+        cm = ConnectionManager(queue_size=1, send_timeout=30, interim_rate=0)
+        ws = await _stalled_client(cm, "ch1")
+
+        await cm.broadcast_subtitle("ch1", {"id": "1"})
+        await cm.broadcast_interim_subtitle("ch1", {"text": "b"})
+
+        assert cm.get_queue_metrics("ch1")["dropped_interims"] == 1
+        assert ws in cm.active_connections["ch1"]
+
+    async def test_full_queue_of_finals_evicts_client(self) -> None:
+        """버릴 인터림이 없으면 느린 클라이언트 연결을 종료한다"""
+        cm = ConnectionManager(queue_size=1, send_timeout=30)
+        ws = await _stalled_client(cm, "ch1")
+
+        await cm.broadcast_subtitle("ch1", {"id": "1"})
+        await cm.broadcast_subtitle("ch1", {"id": "2"})
+        await _drain()
+
+        assert "ch1" not in cm.active_connections
+        assert ws.closed_code == 1013
+        assert cm.get_queue_metrics("ch1")["evicted_clients"] == 1
+
+    async def test_disconnect_policy_evicts_immediately(self) -> None:
+        """disconnect 정책은 인터림이라도 큐가 가득 차면 연결을 종료한다"""
+        cm = ConnectionManager(
+            queue_size=1, send_timeout=30, full_queue_policy="disconnect", interim_rate=0
+        )
+        await _stalled_client(cm, "ch1")
+
+        await cm.broadcast_interim_subtitle("ch1", {"text": "a"})
+        await cm.broadcast_interim_subtitle("ch1", {"text": "b"})
+
+        assert "ch1" not in cm.active_connections
+
+    async def test_send_timeout_evicts_client(self) -> None:
+        """전송이 제한 시간을 넘기면 연결을 종료한다"""
+        cm = ConnectionManager(queue_size=16, send_timeout=0.01)
+        ws = _FakeWebSocket(blocked=True)
+        await cm.connect(ws, "ch1")
+
+        await cm.broadcast_subtitle("ch1", {"id": "1"})
+        await asyncio.sleep(0.05)
+        await _drain()
+
+        assert "ch1" not in cm.active_connections
+        assert ws.closed_code == 1013
+
+
+class TestQueueMetrics:
+    """방별 큐 지표"""
+
+    async def test_metrics_for_empty_room(self) -> None:
+        cm = ConnectionManager()
+        assert cm.get_queue_metrics("none") == {
+            "clients": 0,
+            "queued_total": 0,
+            "queued_max": 0,
+            "queue_size": cm.queue_size,
+            "dropped_interims": 0,
+            "evicted_clients": 0,
+        }
+
+    async def test_all_metrics_lists_rooms(self) -> None:
+        cm = ConnectionManager()
+        await cm.connect(_FakeWebSocket(), "ch1")
+        await cm.connect(_FakeWebSocket(), "ch2")
+
+        metrics = cm.get_all_queue_metrics()
+        assert set(metrics) == {"ch1", "ch2"}
+        assert metrics["ch1"]["clients"] == 1
+
+    async def test_disconnect_cancels_writer(self) -> None:
+        cm = ConnectionManager()
+        ws = _FakeWebSocket()
+        await cm.connect(ws, "ch1")
+        task = cm._senders[ws].task
+
+        cm.disconnect(ws, "ch1")
+        await _drain()
+
+        assert task is not None and task.cancelled()
+
+
+class TestEncodeOnce:
+    """브로드캐스트당 1회 직렬화"""
+
+    async def test_broadcast_serializes_once(self, monkeypatch) -> None:
+        """클라이언트 수와 무관하게 메시지를 한 번만 직렬화한다"""
+        from app.api import websocket as ws_module
+
+        calls = []
+        original = ws_module._encode
+        monkeypatch.setattr(ws_module, "_encode", lambda m: calls.append(m) or original(m))
+
+        cm = ConnectionManager()
+        clients = [_FakeWebSocket() for _ in range(20)]
+        for client in clients:
+            await cm.connect(client, "ch1")
+
+        await cm.broadcast_interim_subtitle("ch1", {"text": "안녕하세요"})
+        await _drain()
+
+        assert len(calls) == 1
+        assert all(
+            c.sent == [{"type": "subtitle_interim", "iseq": 1, "payload": {"text": "안녕하세요"}}]
+            for c in clients
+        )
+
+    async def test_history_frame_is_reused_until_changed(self) -> None:
+        """히스토리 프레임은 변경 전까지 재사용하고, 교정되면 다시 만든다"""
+        cm = ConnectionManager()
+        await cm.broadcast_subtitle("ch1", {"subtitle": {"id": "s1", "text": "원문"}})
+
+        first = cm._history_frame("ch1")
+        assert cm._history_frame("ch1") is first
+
+        await cm.broadcast_corrected_subtitle("ch1", {"id": "s1", "corrected_text": "교정"})
+        second = cm._history_frame("ch1")
+        assert second is not first
+        assert json.loads(second.text)["payload"]["subtitles"][0]["text"] == "교정"
+
+        ws = _FakeWebSocket()
+        await cm.connect(ws, "ch1")
+        await _drain()
+        assert ws.sent[0]["type"] == "subtitle_history"
@@ -0,0 +1,98 @@
+"""자막 히스토리 링 버퍼 테스트"""
+
+import json
+
+from app.api.websocket import ConnectionManager, _RoomHistory
+
+
+def _item(sub_id: str, text: str = "자막") -> dict:
+    return {"subtitle": {"id": sub_id, "text": text}}
+
+
+class TestRoomHistory:
+    """_RoomHistory 링 버퍼"""
+
+    def test_evicts_oldest_and_index(self) -> None:
+        """가득 차면 가장 오래된 항목과 색인을 함께 제거한다"""
+        history = _RoomHistory(3)
+        for i in range(5):
+            history.append(_item(f"s{i}"))
+
+        assert [item["subtitle"]["id"] for item in history] == ["s2", "s3", "s4"]
+        assert history.get("s0") is None
+        assert history.get("s1") is None
+        assert history.get("s4") is not None
+
+    def test_duplicate_id_keeps_newest(self) -> None:
+        """같은 id가 다시 들어오면 최신 항목을 색인하고, 옛 항목이 밀려나도 유지한다"""
+        history = _RoomHistory(2)
+        old = _item("s1", "old")
+        new = _item("s1", "new")
+        history.append(old)
+        history.append(new)
+        history.append(_item("s2"))
+
+        assert history.get("s1") is new
+
+    def test_resize_shrinks_from_oldest(self) -> None:
+        history = _RoomHistory(5)
+        for i in range(5):
+            history.append(_item(f"s{i}"))
+
+        history.resize(2)
+
+        assert history.maxlen == 2
+        assert [item["subtitle"]["id"] for item in history] == ["s3", "s4"]
+        assert history.get("s2") is None
+        history.append(_item("s5"))
+        assert history.get("s3") is None
+
+
+class TestManagerHistory:
+    """ConnectionManager 히스토리 크기/교정"""
+
+    async def test_default_history_size(self) -> None:
+        cm = ConnectionManager(history_size=3)
+        for i in range(10):
+            await cm.broadcast_subtitle("ch1", _item(f"s{i}"))
+
+        assert len(cm.subtitle_history["ch1"]) == 3
+
+    async def test_per_room_history_size(self) -> None:
+        """방별 히스토리 크기를 따로 지정할 수 있다"""
+        cm = ConnectionManager(history_size=3)
+        cm.set_history_size("ch8", 1000)
+        for i in range(500):
+            await cm.broadcast_subtitle("ch8", _item(f"s{i}"))
+            await cm.broadcast_subtitle("ch1", _item(f"s{i}"))
+
+        assert len(cm.subtitle_history["ch8"]) == 500
+        assert len(cm.subtitle_history["ch1"]) == 3
+
+        cm.set_history_size("ch8", 10)
+        assert len(cm.subtitle_history["ch8"]) == 10
+        assert cm.get_history_size("ch8") == 10
+
+    async def test_correction_uses_index(self) -> None:
+        """교정은 id 색인으로 히스토리 항목을 갱신하고 스냅샷에 반영된다"""
+        cm = ConnectionManager(history_size=100)
+        for i in range(50):
+            await cm.broadcast_subtitle("ch1", _item(f"s{i}", f"원문{i}"))
+
+        await cm.broadcast_corrected_subtitle("ch1", {"id": "s10", "corrected_text": "교정"})
+
+        subtitle = cm.subtitle_history["ch1"].get("s10")["subtitle"]
+        assert subtitle == {
+            "id": "s10", "text": "교정", "original_text": "원문10", "is_corrected": True,
+        }
+        snapshot = json.loads(cm._history_frame("ch1").text)["payload"]["subtitles"]
+        assert snapshot[10]["text"] == "교정"
+
+    async def test_correction_for_evicted_subtitle_is_ignored(self) -> None:
+        cm = ConnectionManager(history_size=2)
+        for i in range(3):
+            await cm.broadcast_subtitle("ch1", _item(f"s{i}"))
+
+        await cm.broadcast_corrected_subtitle("ch1", {"id": "s0", "corrected_text": "교정"})
+
+        assert [item["subtitle"]["text"] for item in cm.subtitle_history["ch1"]] == ["자막", "자막"]
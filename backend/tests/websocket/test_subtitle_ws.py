@@ -1,5 +1,6 @@
 """WebSocket 자막 실시간 스트리밍 테스트 - TDD"""
 
+import asyncio
 import uuid
 import json
 from datetime import datetime, timezone
@@ -12,6 +13,12 @@ from app.main import app
 from app.api.websocket import ConnectionManager, manager
 
 
+async def _drain() -> None:
+    """클라이언트별 writer 태스크가 송신 큐를 비울 때까지 이벤트 루프를 양보"""
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
 class TestConnectionManager:
     """ConnectionManager 클래스 테스트"""
 
@@ -122,9 +129,9 @@ class TestSubtitleBroadcast:
 
         # Mock WebSocket 생성
         mock_ws1 = MagicMock()
-        mock_ws1.send_json = MagicMock()
+        mock_ws1.send_text = MagicMock()
         mock_ws2 = MagicMock()
-        mock_ws2.send_json = MagicMock()
+        mock_ws2.send_text = MagicMock()
 
         # 연결 추가
         await cm.connect(mock_ws1, meeting_id)
@@ -132,14 +139,20 @@ class TestSubtitleBroadcast:
 
         # 브로드캐스트
         await cm.broadcast_subtitle(meeting_id, sample_subtitle_payload)
+        await _drain()
 
         # 두 클라이언트 모두에게 메시지가 전송되었는지 확인
         expected_message = {
             "type": "subtitle_created",
             "payload": sample_subtitle_payload,
         }
-        mock_ws1.send_json.assert_called_once_with(expected_message)
-        mock_ws2.send_json.assert_called_once_with(expected_message)
+        mock_ws1.send_text.assert_called_once()
+        mock_ws2.send_text.assert_called_once()
+        sent = json.loads(mock_ws1.send_text.call_args.args[0])
+        assert isinstance(sent.pop("seq"), int)
+        assert sent == expected_message
+        # 같은 직렬화 결과를 모든 클라이언트가 공유
+        assert mock_ws1.send_text.call_args.args[0] is mock_ws2.send_text.call_args.args[0]
 
     @pytest.mark.asyncio
     async def test_broadcast_subtitle_only_to_same_meeting(
@@ -153,9 +166,9 @@ class TestSubtitleBroadcast:
 
         # Mock WebSocket 생성
         mock_ws1 = MagicMock()
-        mock_ws1.send_json = MagicMock()
+        mock_ws1.send_text = MagicMock()
         mock_ws2 = MagicMock()
-        mock_ws2.send_json = MagicMock()
+        mock_ws2.send_text = MagicMock()
 
         # 다른 회의에 각각 연결
         await cm.connect(mock_ws1, meeting_id_1)
@@ -164,10 +177,11 @@ class TestSubtitleBroadcast:
         # meeting_id_1에만 브로드캐스트
         sample_subtitle_payload["meeting_id"] = str(meeting_id_1)
         await cm.broadcast_subtitle(meeting_id_1, sample_subtitle_payload)
+        await _drain()
 
         # meeting_id_1의 클라이언트만 메시지를 받아야 함
-        mock_ws1.send_json.assert_called_once()
-        mock_ws2.send_json.assert_not_called()
+        mock_ws1.send_text.assert_called_once()
+        mock_ws2.send_text.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_disconnect_removes_connection(
@@ -177,7 +191,7 @@ class TestSubtitleBroadcast:
         cm = ConnectionManager()
 
         mock_ws = MagicMock()
-        mock_ws.send_json = MagicMock()
+        mock_ws.send_text = MagicMock()
 
         # 연결 후 연결 해제
         await cm.connect(mock_ws, meeting_id)
@@ -241,12 +255,13 @@ class TestWebSocketMessageFormat:
 
         def capture_message(msg):
             nonlocal sent_message
-            sent_message = msg
+            sent_message = json.loads(msg)
 
-        mock_ws.send_json = MagicMock(side_effect=capture_message)
+        mock_ws.send_text = MagicMock(side_effect=capture_message)
 
         await cm.connect(mock_ws, meeting_id)
         await cm.broadcast_subtitle(meeting_id, sample_subtitle_payload)
+        await _drain()
 
         assert sent_message is not None
         assert "type" in sent_message
@@ -264,12 +279,13 @@ class TestWebSocketMessageFormat:
 
         def capture_message(msg):
             nonlocal sent_message
-            sent_message = msg
+            sent_message = json.loads(msg)
 
-        mock_ws.send_json = MagicMock(side_effect=capture_message)
+        mock_ws.send_text = MagicMock(side_effect=capture_message)
 
         await cm.connect(mock_ws, meeting_id)
         await cm.broadcast_subtitle(meeting_id, sample_subtitle_payload)
+        await _drain()
 
         assert sent_message is not None
         assert "payload" in sent_message
@@ -293,6 +293,39 @@ describe('useSubtitleWebSocket', () => {
 
       expect(result.current.subtitles).toHaveLength(0);
     });
+
+    it('should append interim deltas to the matching base interim', async () => {
+      const { result } = renderHook(() =>
+        useSubtitleWebSocket({ meetingId: 'meeting-1' })
+      );
+
+      const ws = MockWebSocket.getLastInstance();
+
+      act(() => {
+        ws!.simulateOpen();
+        ws!.simulateMessage({ type: 'subtitle_interim', iseq: 1, payload: { text: '경기도의회' } });
+        ws!.simulateMessage({
+          type: 'subtitle_interim_delta',
+          iseq: 2,
+          base: 1,
+          payload: { append: ' 본회의를' },
+        });
+      });
+
+      expect(result.current.interimText).toBe('경기도의회 본회의를');
+
+      // 기준이 맞지 않는 델타는 무시
+      act(() => {
+        ws!.simulateMessage({
+          type: 'subtitle_interim_delta',
+          iseq: 4,
+          base: 3,
+          payload: { append: ' 개의합니다' },
+        });
+      });
+
+      expect(result.current.interimText).toBe('경기도의회 본회의를');
+    });
   });
 
   describe('Error handling', () => {
@@ -365,6 +398,62 @@ describe('useSubtitleWebSocket', () => {
       expect(MockWebSocket.instances.length).toBe(initialInstanceCount + 1);
     });
 
+    it('should resume from the last received seq on reconnect', async () => {
+      renderHook(() =>
+        useSubtitleWebSocket({ meetingId: 'meeting-1' })
+      );
+
+      const ws1 = MockWebSocket.getLastInstance();
+      expect(ws1!.url).toBe(`${mockWsUrl}/ws/meetings/meeting-1/subtitles`);
+
+      act(() => {
+        ws1!.simulateOpen();
+        ws1!.simulateMessage({
+          type: 'subtitle_created',
+          seq: 42,
+          payload: { subtitle: mockSubtitle },
+        });
+        ws1!.simulateMessage({ type: 'subtitle_interim', payload: { text: '미리보기' } });
+      });
+
+      act(() => {
+        ws1!.simulateClose(1006, false);
+      });
+
+      act(() => {
+        jest.advanceTimersByTime(1000);
+      });
+
+      expect(MockWebSocket.lastUrl).toBe(
+        `${mockWsUrl}/ws/meetings/meeting-1/subtitles?since=42`
+      );
+    });
+
+    it('should reconnect when the server asks to try again later (1013)', async () => {
+      const { result } = renderHook(() =>
+        useSubtitleWebSocket({ meetingId: 'meeting-1' })
+      );
+
+      const ws1 = MockWebSocket.getLastInstance();
+      const initialInstanceCount = MockWebSocket.instances.length;
+
+      act(() => {
+        ws1!.simulateOpen();
+      });
+
+      act(() => {
+        ws1!.simulateClose(1013, true);
+      });
+
+      expect(result.current.connectionStatus).toBe('connecting');
+
+      act(() => {
+        jest.advanceTimersByTime(1000);
+      });
+
+      expect(MockWebSocket.instances.length).toBe(initialInstanceCount + 1);
+    });
+
     it('should use exponential backoff for subsequent reconnect attempts', async () => {
       renderHook(() =>
         useSubtitleWebSocket({ meetingId: 'meeting-1' })
@@ -7,6 +7,7 @@
  * - WebSocket 연결 관리 (/ws/meetings/{id}/subtitles)
  * - subtitle_created 이벤트 처리
  * - 자동 재연결 (exponential backoff)
+ * - 재연결 시 마지막 seq 이후 이벤트만 이어받기 (?since=<seq>)
  * - 연결 상태 관리
  * - 자막 배열 상태 관리
  */
@@ -81,8 +82,22 @@ interface SubtitleCorrectedEvent {
   };
 }
 
+interface SubtitleInterimDeltaEvent {
+  type: 'subtitle_interim_delta';
+  iseq: number;
+  /** 이어 붙일 기준 인터림 순번 */
+  base: number;
+  payload: {
+    append: string;
+  };
+}
+
 interface WebSocketMessage {
   type: string;
+  /** 방별 이벤트 순번 (subtitle_created/corrected/history, interim은 없음) */
+  seq?: number;
+  /** 방별 인터림 순번 (subtitle_interim/subtitle_interim_delta) */
+  iseq?: number;
   payload: unknown;
 }
 
@@ -95,13 +110,20 @@ const RECONNECT_CONFIG = {
   backoffMultiplier: 2,
 };
 
+/**
+ * 서버가 느린 클라이언트를 끊을 때 쓰는 close code (Try Again Later) - 재연결 대상
+ */
+const CLOSE_CODE_TRY_AGAIN_LATER = 1013;
+
 /**
  * WebSocket URL 생성
  * meeting UUID와 channel ID 모두 동일 경로 사용
+ * since가 있으면 그 이후 놓친 이벤트만 받음 (범위를 벗어나면 서버가 전체 히스토리 전송)
  */
-function getWebSocketUrl(meetingId: string): string {
+function getWebSocketUrl(meetingId: string, since: number | null = null): string {
   const wsBaseUrl = process.env.NEXT_PUBLIC_WS_URL || 'ws://localhost:8000';
-  return `${wsBaseUrl}/ws/meetings/${meetingId}/subtitles`;
+  const url = `${wsBaseUrl}/ws/meetings/${meetingId}/subtitles`;
+  return since === null ? url : `${url}?since=${since}`;
 }
 
 /**
@@ -144,6 +166,9 @@ export function useSubtitleWebSocket(
   const isMountedRef = useRef(true);
   const onSubtitleRef = useRef(onSubtitle);
   const delayTimersRef = useRef<NodeJS.Timeout[]>([]);
+  const lastSeqRef = useRef<number | null>(null);
+  // 마지막으로 받은 인터림 (델타를 이어 붙일 기준)
+  const interimRef = useRef<{ iseq: number | null; text: string }>({ iseq: null, text: '' });
 
   // Update onSubtitle ref when it changes
   useEffect(() => {
@@ -187,7 +212,7 @@ export function useSubtitleWebSocket(
 
     clearReconnectTimeout();
 
-    const url = getWebSocketUrl(meetingId);
+    const url = getWebSocketUrl(meetingId, lastSeqRef.current);
     const ws = new WebSocket(url);
     wsRef.current = ws;
     setConnectionStatus('connecting');
@@ -203,6 +228,9 @@ export function useSubtitleWebSocket(
 
       try {
         const message: WebSocketMessage = JSON.parse(event.data);
+        if (typeof message.seq === 'number') {
+          lastSeqRef.current = message.seq;
+        }
 
         if (message.type === 'subtitle_history') {
           // 접속 시 서버에서 보내주는 이전 자막 히스토리 (일괄 수신, 지연 없음)
@@ -212,8 +240,18 @@ export function useSubtitleWebSocket(
         } else if (message.type === 'subtitle_interim') {
           // STT interim (미확정) 텍스트 - 즉시 표시 (displayDelay 미적용)
           const interim = message.payload as { text: string };
+          interimRef.current = { iseq: message.iseq ?? null, text: interim.text };
           setInterimText(interim.text);
           setLastActivityTime(Date.now());
+        } else if (message.type === 'subtitle_interim_delta') {
+          // 직전 인터림에 이어지는 부분만 수신 → 기준이 맞을 때만 이어 붙임
+          const delta = message as SubtitleInterimDeltaEvent;
+          if (interimRef.current.iseq === delta.base) {
+            const text = interimRef.current.text + delta.payload.append;
+            interimRef.current = { iseq: delta.iseq, text };
+            setInterimText(text);
+            setLastActivityTime(Date.now());
+          }
         } else if (message.type === 'subtitle_created') {
           // 실시간 자막 수신
           const subtitleEvent = message as SubtitleCreatedEvent;
@@ -265,8 +303,10 @@ export function useSubtitleWebSocket(
       // 이미 교체된 연결의 close 이벤트이면 무시
       if (wsRef.current !== ws) return;
 
-      // 수동 해제가 아니고 비정상 종료인 경우 재연결 시도
-      if (!isManualDisconnectRef.current && !event.wasClean) {
+      // 수동 해제가 아니고 비정상 종료(또는 서버의 재접속 요청)인 경우 재연결 시도
+      const shouldReconnect =
+        !event.wasClean || event.code === CLOSE_CODE_TRY_AGAIN_LATER;
+      if (!isManualDisconnectRef.current && shouldReconnect) {
         setConnectionStatus('connecting');
         const delay = getReconnectDelay();
         reconnectAttemptRef.current += 1;
@@ -327,6 +367,8 @@ export function useSubtitleWebSocket(
     isManualDisconnectRef.current = false;
 
     // meetingId 변경 시 자막 초기화
+    lastSeqRef.current = null;
+    interimRef.current = { iseq: null, text: '' };
     setSubtitles([]);
     setInterimText('');
     setLastActivityTime(null);